@@ -93,10 +93,13 @@ TOOL_ROUTING: dict[str, MCPServerType] = {
     "list_policy_documents": MCPServerType.POLICY_KB,
     "list_policy_revisions": MCPServerType.POLICY_KB,
     "ingest_policy_revision": MCPServerType.POLICY_KB,
+    "get_ingestion_status": MCPServerType.POLICY_KB,
     "remove_policy_revision": MCPServerType.POLICY_KB,
     # Cycle route tools [cycle-route-assessment:FR-001]
     "get_site_boundary": MCPServerType.CYCLE_ROUTE,
     "assess_cycle_route": MCPServerType.CYCLE_ROUTE,
+    "assess_cycle_routes_batch": MCPServerType.CYCLE_ROUTE,
+    "screen_destinations": MCPServerType.CYCLE_ROUTE,
 }
 
 
@@ -134,14 +137,18 @@ class MCPClientManager:
                 base_url=policy_kb_url or os.getenv("POLICY_KB_URL", "http://policy-kb:3003"),
                 tools=[
                     "search_policy", "get_policy_section", "list_policy_documents",
-                    "list_policy_revisions", "ingest_policy_revision", "remove_policy_revision",
+                    "list_policy_revisions", "ingest_policy_revision", "get_ingestion_status",
+                    "remove_policy_revision",
                 ],
             ),
             # Implements [cycle-route-assessment:FR-001] - Cycle route MCP server
             MCPServerType.CYCLE_ROUTE: MCPServerConfig(
                 server_type=MCPServerType.CYCLE_ROUTE,
                 base_url=cycle_route_url or os.getenv("CYCLE_ROUTE_URL", "http://cycle-route-mcp:3004"),
-                tools=["get_site_boundary", "assess_cycle_route"],
+                tools=[
+                    "get_site_boundary", "assess_cycle_route", "assess_cycle_routes_batch",
+                    "screen_destinations",
+                ],
             ),
         }
 
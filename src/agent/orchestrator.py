@@ -29,7 +29,6 @@ Implements:
 """
 
 import asyncio
-import hashlib
 import json
 import os
 import time
@@ -52,10 +51,33 @@ from src.agent.prompts.verification_prompt import build_verification_prompt
 from src.agent.review_schema import KeyDocumentItem, ReviewStructure
 from src.api.schemas import KeyDocument
 from src.mcp_servers.cherwell_scraper.filters import DocumentFilter
+from src.shared.hashing import sha256_file
 from src.shared.storage import LocalStorageBackend, StorageBackend, StorageUploadError
 
 logger = structlog.get_logger(__name__)
 
+# Timeout for one assess_cycle_routes_batch call: destinations run concurrently,
+# but Overpass calls are rate limited, so allow extra time per destination
+ROUTE_BATCH_TIMEOUT_SECONDS = 120.0
+ROUTE_BATCH_TIMEOUT_PER_DESTINATION = 15.0
+
+# Destinations per assess_cycle_routes_batch call (the tool's MAX_BATCH_DESTINATIONS);
+# longer destination lists are assessed in consecutive batches
+ROUTE_BATCH_MAX_DESTINATIONS = 25
+
+# Destinations further than this by bicycle from the site (Valhalla matrix
+# time) are screened out before the detailed route assessment
+ROUTE_PRESCREEN_MAX_CYCLE_MINUTES = 30.0
+ROUTE_PRESCREEN_TIMEOUT_SECONDS = 30.0
+
+# How screen_destinations reasons read in the route evidence
+PRESCREEN_REASON_TEXT = {
+    None: "shortlisted for assessment",
+    "too_far": "not assessed (beyond cycling range)",
+    "beyond_shortlist": "not assessed (beyond shortlist)",
+    "unreachable": "not assessed (no cycle route found)",
+}
+
 
 @dataclass
 class ApplicationMetadata:
@@ -83,6 +105,8 @@ class DocumentIngestionResult:
     document_metadata: dict[str, dict[str, Any]] = field(default_factory=dict)
     # Implements [document-type-detection:FR-003] - Track image-based docs separately
     skipped_documents: list[dict[str, Any]] = field(default_factory=list)
+    # Maps file_path to SHA256 hex digest computed at download time
+    file_hashes: dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -177,6 +201,7 @@ class AgentOrchestrator:
         self._initialized = False
         # Implements [cycle-route-assessment:FR-008] - Route assessment data
         self._route_assessments: list[dict[str, Any]] = []
+        self._route_prescreen: dict[str, Any] | None = None
         self._site_boundary: dict[str, Any] | None = None
 
         # Implements [review-workflow-redesign:NFR-001] - Configurable filter model
@@ -718,16 +743,16 @@ class AgentOrchestrator:
                 continue
             s3_key = file_path.removeprefix(output_dir + "/")
 
-            # Compute file hash
+            # Use the hash computed at download time; only rehash if missing
             file_hash = ""
-            try:
-                sha = hashlib.sha256()
-                with open(file_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(8192), b""):
-                        sha.update(chunk)
-                file_hash = f"sha256:{sha.hexdigest()}"
-            except OSError:
-                pass
+            digest = dl.get("file_hash")
+            if not digest:
+                try:
+                    digest = sha256_file(file_path)
+                except OSError:
+                    digest = None
+            if digest:
+                file_hash = f"sha256:{digest}"
 
             manifest_entries.append({
                 "document_id": dl.get("document_id", ""),
@@ -842,6 +867,7 @@ class AgentOrchestrator:
                         "document_id": doc_id,
                         "file_path": local_path,
                         "file_size": Path(local_path).stat().st_size,
+                        "file_hash": manifest_entry.get("file_hash", "").removeprefix("sha256:") or None,
                         "success": True,
                         "description": desc,
                         "document_type": doc.get("document_type"),
@@ -892,6 +918,7 @@ class AgentOrchestrator:
                         "document_id": doc_id,
                         "file_path": file_path,
                         "file_size": result.get("file_size"),
+                        "file_hash": result.get("file_hash"),
                         "success": True,
                         "description": desc,
                         "document_type": doc.get("document_type"),
@@ -972,6 +999,11 @@ class AgentOrchestrator:
             document_paths=[d.get("file_path") for d in downloaded if d.get("file_path")],
             failed_documents=failed,
             document_metadata=document_metadata,
+            file_hashes={
+                d["file_path"]: d["file_hash"]
+                for d in downloaded
+                if d.get("file_path") and d.get("file_hash")
+            },
         )
 
         logger.info(
@@ -1014,13 +1046,17 @@ class AgentOrchestrator:
             """Ingest a single document, respecting the semaphore."""
             nonlocal ingested_count, failed_count, skipped_count
             async with semaphore:
+                arguments = {
+                    "file_path": doc_path,
+                    "application_ref": self._application_ref,
+                }
+                file_hash = self._ingestion_result.file_hashes.get(doc_path)
+                if file_hash:
+                    arguments["file_hash"] = file_hash
                 try:
                     result = await self._mcp_client.call_tool(
                         "ingest_document",
-                        {
-                            "file_path": doc_path,
-                            "application_ref": self._application_ref,
-                        },
+                        arguments,
                         timeout=float(os.getenv("INGEST_TIMEOUT", "600")),
                     )
 
@@ -1284,9 +1320,12 @@ class AgentOrchestrator:
         Implements [cycle-route-assessment:NFR-002] - Graceful failure handling
         Implements [cycle-route-assessment:NFR-005] - Review completes even if assessment fails
 
-        Looks up site boundary via ArcGIS, then assesses routes to each
-        configured destination using the cycle-route MCP server. Results
-        are stored as evidence context for the LLM review generation.
+        Looks up site boundary via ArcGIS, pre-screens the configured
+        destinations by cycle time with one screen_destinations call, then
+        assesses the shortlisted routes with assess_cycle_routes_batch calls
+        of up to ROUTE_BATCH_MAX_DESTINATIONS destinations each. Results and
+        the pre-screen are stored as evidence context for the LLM review
+        generation.
         """
         # Check if cycle-route MCP is available
         if not self._mcp_client or not self._mcp_client.is_connected(
@@ -1405,51 +1444,33 @@ class AgentOrchestrator:
             )
             return
 
-        # Step 3: Assess route to each destination
+        # Step 3: Drop destinations beyond cycling range before the expensive assessment
+        destinations = await self._prescreen_destinations(centroid, destinations)
+        if not destinations:
+            logger.info(
+                "No destinations within cycling range",
+                review_id=self._review_id,
+            )
+            return
+
+        # Step 4: Assess routes to the shortlisted destinations in concurrent batches
         await self._progress.update_sub_progress(
             f"Assessing routes to {len(destinations)} destinations"
         )
 
-        for i, dest in enumerate(destinations):
-            dest_name = dest.get("name", "Destination")
-            await self._progress.update_sub_progress(
-                f"Route {i + 1}/{len(destinations)}: {dest_name}",
-                current=i + 1,
-                total=len(destinations),
-            )
-
-            try:
-                route_result = await self._mcp_client.call_tool(
-                    "assess_cycle_route",
-                    {
-                        "origin_lon": centroid["lon"],
-                        "origin_lat": centroid["lat"],
-                        "destination_lon": dest["lon"],
-                        "destination_lat": dest["lat"],
-                        "destination_name": dest_name,
-                    },
-                    timeout=120.0,
-                )
-
+        for start in range(0, len(destinations), ROUTE_BATCH_MAX_DESTINATIONS):
+            batch = destinations[start : start + ROUTE_BATCH_MAX_DESTINATIONS]
+            for route_result in await self._assess_route_batch(centroid, batch):
                 if route_result.get("status") == "success":
-                    route_result["destination_id"] = dest["id"]
                     self._route_assessments.append(route_result)
                 else:
                     logger.warning(
                         "Route assessment returned error",
                         review_id=self._review_id,
-                        destination=dest_name,
+                        destination=route_result.get("destination"),
                         error=route_result.get("message"),
                     )
 
-            except (MCPToolError, MCPConnectionError) as e:
-                logger.warning(
-                    "Route assessment failed for destination",
-                    review_id=self._review_id,
-                    destination=dest_name,
-                    error=str(e),
-                )
-
         logger.info(
             "Route assessment phase complete",
             review_id=self._review_id,
@@ -1457,6 +1478,184 @@ class AgentOrchestrator:
             destinations_total=len(destinations),
         )
 
+    async def _assess_route_batch(
+        self,
+        centroid: dict[str, float],
+        destinations: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Assess routes to up to ROUTE_BATCH_MAX_DESTINATIONS destinations in one call.
+
+        Implements [cycle-route-assessment:NFR-002] - Graceful failure handling
+
+        Returns:
+            The per-destination results of one assess_cycle_routes_batch call,
+            or an empty list if the call failed.
+        """
+        try:
+            batch_result = await self._mcp_client.call_tool(
+                "assess_cycle_routes_batch",
+                {
+                    "origin_lon": centroid["lon"],
+                    "origin_lat": centroid["lat"],
+                    "destinations": [
+                        {
+                            "id": dest["id"],
+                            "name": dest.get("name", "Destination"),
+                            "lon": dest["lon"],
+                            "lat": dest["lat"],
+                        }
+                        for dest in destinations
+                    ],
+                    # Route lines stay encoded until the routes JSON is written
+                    "geometry_format": "polyline",
+                },
+                timeout=ROUTE_BATCH_TIMEOUT_SECONDS
+                + ROUTE_BATCH_TIMEOUT_PER_DESTINATION * len(destinations),
+            )
+        except (MCPToolError, MCPConnectionError) as e:
+            logger.warning(
+                "Route assessment batch failed",
+                review_id=self._review_id,
+                destinations=len(destinations),
+                error=str(e),
+            )
+            batch_result = {"status": "error", "message": str(e)}
+
+        if batch_result.get("status") != "success":
+            logger.warning(
+                "Route assessment batch returned error",
+                review_id=self._review_id,
+                error=batch_result.get("message"),
+            )
+
+        return batch_result.get("routes", [])
+
+    async def _prescreen_destinations(
+        self,
+        centroid: dict[str, float],
+        destinations: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Shortlist destinations by cycle time from the site centroid.
+
+        Implements [cycle-route-assessment:FR-008] - Route assessment in pipeline (pre-screen)
+        Implements [cycle-route-assessment:NFR-002] - Graceful failure handling
+
+        One screen_destinations call asks Valhalla's matrix for the cycle time
+        to every destination. Destinations with no route or beyond
+        ROUTE_PRESCREEN_MAX_CYCLE_MINUTES are dropped and the rest are
+        assessed nearest first. If screening fails every destination is
+        assessed, as before the pre-screen existed; _phase_assess_routes
+        splits them into batches of ROUTE_BATCH_MAX_DESTINATIONS.
+
+        Returns:
+            The destinations to assess, nearest first.
+        """
+        await self._progress.update_sub_progress(
+            f"Screening {len(destinations)} destinations by cycle time"
+        )
+
+        try:
+            screen = await self._mcp_client.call_tool(
+                "screen_destinations",
+                {
+                    "origin_lon": centroid["lon"],
+                    "origin_lat": centroid["lat"],
+                    "destinations": [
+                        {
+                            "id": dest["id"],
+                            "name": dest.get("name", "Destination"),
+                            "lon": dest["lon"],
+                            "lat": dest["lat"],
+                        }
+                        for dest in destinations
+                    ],
+                    "max_cycle_minutes": ROUTE_PRESCREEN_MAX_CYCLE_MINUTES,
+                },
+                timeout=ROUTE_PRESCREEN_TIMEOUT_SECONDS,
+            )
+        except (MCPToolError, MCPConnectionError) as e:
+            screen = {"status": "error", "message": str(e)}
+
+        if screen.get("status") != "success":
+            logger.warning(
+                "Destination pre-screen failed, assessing all destinations",
+                review_id=self._review_id,
+                error=screen.get("message"),
+            )
+            return destinations
+
+        self._route_prescreen = screen
+        shortlisted = [
+            destinations[entry["index"]]
+            for entry in screen.get("destinations", [])
+            if entry.get("shortlisted")
+        ]
+
+        logger.info(
+            "Destinations pre-screened",
+            review_id=self._review_id,
+            destinations_total=len(destinations),
+            shortlisted=len(shortlisted),
+        )
+        return shortlisted
+
+    @staticmethod
+    def _shortest_route_score(route: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Get the shortest route's LTN 1/20 score for one route assessment.
+
+        The assessed score when shortest and safest are the same route, the
+        shortest_route_score scored from shared infrastructure data, or None
+        when the shortest route was only measured.
+        """
+        if route.get("same_route", True):
+            return route.get("score", {})
+        return route.get("shortest_route_score")
+
+    def _shortest_route_summary(self, route: dict[str, Any]) -> dict[str, Any]:
+        """Shortest route distance, LTN 1/20 score and rating for the route narrative."""
+        score = self._shortest_route_score(route)
+        return {
+            "distance_m": route.get("shortest_route_distance_m", route.get("distance_m", 0)),
+            "ltn_score": score.get("score", 0) if score is not None else None,
+            "rating": score.get("rating") if score is not None else None,
+        }
+
+    def _shortest_route_score_text(self, route: dict[str, Any]) -> str:
+        """Evidence suffix for the shortest route line of a route that differs from the safest."""
+        score = self._shortest_route_score(route)
+        if score is None:
+            return " (not assessed)"
+        return f", LTN 1/20 score: {score.get('score', 0)}/100 ({score.get('rating', 'unknown')})"
+
+    def _build_prescreen_evidence(self) -> str | None:
+        """
+        Describe the destination pre-screen for the route evidence.
+
+        Lists every screened destination with its matrix cycle time and
+        distance and whether it was assessed. Returns None without a pre-screen.
+        """
+        if not self._route_prescreen:
+            return None
+
+        lines = [
+            "### Destination pre-screen",
+            f"Cycle times from the site by Valhalla matrix; destinations over "
+            f"{self._route_prescreen.get('max_cycle_minutes', ROUTE_PRESCREEN_MAX_CYCLE_MINUTES):g} "
+            f"minutes are not assessed.",
+        ]
+        for entry in self._route_prescreen.get("destinations", []):
+            name = entry.get("destination", "Unknown")
+            if entry.get("reachable"):
+                detail = f"{entry.get('cycle_minutes')} min, {entry.get('distance_m')}m"
+            else:
+                detail = "no route"
+            reason = PRESCREEN_REASON_TEXT.get(entry.get("screen_reason"), "not assessed")
+            lines.append(f"- {name}: {detail} -- {reason}")
+        return "\n".join(lines)
+
     def _build_evidence_context(self) -> tuple[str, str, str, str, str, str]:
         """
         Build the evidence context strings used by both the structure and report calls.
@@ -1540,7 +1739,9 @@ class AgentOrchestrator:
                 if same_route:
                     route_lines.append("**Shortest & safest route (same):**")
                 else:
-                    route_lines.append(f"**Shortest route:** {shortest_dist}m (not assessed)")
+                    route_lines.append(
+                        f"**Shortest route:** {shortest_dist}m{self._shortest_route_score_text(ra)}"
+                    )
                     route_lines.append("**Safest route:**")
 
                 route_lines.append(f"- Distance: {distance}m, LTN 1/20 score: {score_val}/100 ({rating})")
@@ -1586,6 +1787,10 @@ class AgentOrchestrator:
 
             route_evidence_text = "\n".join(route_lines)
 
+        prescreen_text = self._build_prescreen_evidence()
+        if prescreen_text:
+            route_evidence_text = f"{route_evidence_text}\n\n{prescreen_text}"
+
         return app_summary, ingested_docs_text, app_evidence_text, policy_evidence_text, plans_submitted_text, route_evidence_text
 
     def _build_route_evidence_summary(self) -> str:
@@ -1596,8 +1801,10 @@ class AgentOrchestrator:
         breakdown as percentages, parallel detection upgrade count, issue
         counts by severity, and top 5 highest-severity issues.
         """
+        prescreen_text = self._build_prescreen_evidence()
         if not self._route_assessments:
-            return "No cycling route assessments were performed."
+            no_routes = "No cycling route assessments were performed."
+            return f"{no_routes}\n\n{prescreen_text}" if prescreen_text else no_routes
 
         summary_lines = []
         for ra in self._route_assessments:
@@ -1617,7 +1824,9 @@ class AgentOrchestrator:
             if same_route:
                 summary_lines.append("**Shortest & safest (same route):**")
             else:
-                summary_lines.append(f"**Shortest route:** {shortest_dist}m (not assessed)")
+                summary_lines.append(
+                    f"**Shortest route:** {shortest_dist}m{self._shortest_route_score_text(ra)}"
+                )
                 summary_lines.append("**Safest route:**")
 
             summary_lines.append(f"- Distance: {distance}m, LTN 1/20 score: {score_val}/100 ({rating})")
@@ -1670,6 +1879,9 @@ class AgentOrchestrator:
                         f"  - [{issue.get('severity', 'unknown')}] {issue.get('problem', '')}"
                     )
 
+        if prescreen_text:
+            summary_lines.extend(["", prescreen_text])
+
         return "\n".join(summary_lines)
 
     def _backfill_key_documents(
@@ -1956,11 +2168,7 @@ Be concise and evidence-based. Cite specific policy references."""
                     "destinations": [
                         {
                             "destination_name": ra.get("destination", "Unknown"),
-                            "shortest_route_summary": {
-                                "distance_m": ra.get("shortest_route_distance_m", ra.get("distance_m", 0)),
-                                "ltn_score": ra.get("score", {}).get("score", 0) if ra.get("same_route", True) else None,
-                                "rating": ra.get("score", {}).get("rating") if ra.get("same_route", True) else None,
-                            },
+                            "shortest_route_summary": self._shortest_route_summary(ra),
                             "safest_route_summary": {
                                 "distance_m": ra.get("distance_m", 0),
                                 "ltn_score": ra.get("score", {}).get("score", 0),
@@ -72,12 +72,14 @@ async def get_effective_date_resolver() -> EffectiveDateResolver:
     """
     Get the EffectiveDateResolver instance.
 
-    Creates the resolver on first call.
+    Creates the resolver on first call. It subscribes to the registry's
+    invalidation channel so revisions changed by the policy-kb server or the
+    worker are picked up without polling.
     """
     global _effective_date_resolver
     if _effective_date_resolver is None:
         registry = await get_policy_registry()
-        _effective_date_resolver = EffectiveDateResolver(registry)
+        _effective_date_resolver = EffectiveDateResolver(registry, subscribe=True)
     return _effective_date_resolver
 
 
@@ -9,6 +9,7 @@ Implements [policy-knowledge-base:FR-009] - Get effective snapshot
 Implements [policy-knowledge-base:FR-010] - Update revision metadata
 Implements [policy-knowledge-base:FR-011] - Delete revision
 Implements [policy-knowledge-base:FR-012] - Re-index revision
+Implements [policy-knowledge-base:FR-003] - Bulk ingestion status and progress stream
 """
 
 import contextlib
@@ -19,6 +20,8 @@ from typing import Any
 
 import structlog
 from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
 
 from src.api.dependencies import ArqPoolDep, EffectiveDateResolverDep, PolicyRegistryDep
 from src.api.schemas import (
@@ -32,17 +35,27 @@ from src.api.schemas import (
     UpdatePolicyRequest,
 )
 from src.api.schemas.policy import (
+    BulkRevisionStatusResponse,
     PolicyRevisionDetail,
     RevisionCreateResponse,
     RevisionDeleteResponse,
     RevisionStatus,
+    RevisionStatusEntry,
     RevisionStatusResponse,
     UpdateRevisionRequest,
 )
+from src.shared.ingestion_progress import (
+    ProgressStreamLimiter,
+    pending_progress,
+    revision_progress,
+    stream_ingestion_progress,
+    stream_limiter,
+)
 from src.shared.policy_registry import (
     CannotDeleteSoleRevisionError,
     PolicyAlreadyExistsError,
     PolicyNotFoundError,
+    PolicyRegistry,
     RevisionNotFoundError,
     RevisionOverlapError,
 )
@@ -547,26 +560,171 @@ async def get_revision_status(
             ),
         )
 
-    # Progress details would come from the ingestion job
-    # For now, return basic status info
-    progress = None
-    if revision.status == RevisionStatus.PROCESSING:
-        progress = {
-            "phase": "pending",
-            "percent_complete": 0,
-            "chunks_processed": 0,
-        }
-    elif revision.status == RevisionStatus.ACTIVE:
-        progress = {
-            "phase": "complete",
-            "percent_complete": 100,
-            "chunks_processed": revision.chunk_count or 0,
-        }
+    # Progress is published by the ingestion worker
+    snapshot = await registry.get_ingestion_progress(source, revision_id)
 
     return RevisionStatusResponse(
         revision_id=revision_id,
         status=revision.status,
-        progress=progress,
+        progress=revision_progress(revision, snapshot),
+    )
+
+
+# Revisions one bulk status request or progress stream may cover
+MAX_TRACKED_REVISIONS = 500
+
+
+async def _resolve_revision_keys(
+    registry: PolicyRegistry, revisions: list[str], sources: list[str]
+) -> list[tuple[str, str]]:
+    """
+    Turn revision=SOURCE:revision_id and source=SOURCE parameters into keys.
+
+    Raises:
+        HTTPException: 422 if a key is malformed, nothing was requested or
+            too many revisions would be covered.
+    """
+    keys: list[tuple[str, str]] = []
+    for value in revisions:
+        source, sep, revision_id = value.partition(":")
+        if not sep or not source or not revision_id:
+            raise HTTPException(
+                status_code=422,
+                detail=make_error_response(
+                    code="invalid_revision_key",
+                    message=f"Expected SOURCE:revision_id, got '{value}'",
+                    details={"revision": value},
+                ),
+            )
+        keys.append((source, revision_id))
+    keys.extend(await registry.list_revision_keys(sources))
+    keys = list(dict.fromkeys(keys))
+
+    if not keys:
+        raise HTTPException(
+            status_code=422,
+            detail=make_error_response(
+                code="no_revisions_requested",
+                message="Pass at least one revision=SOURCE:revision_id or source=SOURCE "
+                "with revisions",
+                details={"revisions": revisions, "sources": sources},
+            ),
+        )
+    if len(keys) > MAX_TRACKED_REVISIONS:
+        raise HTTPException(
+            status_code=422,
+            detail=make_error_response(
+                code="too_many_revisions",
+                message=f"At most {MAX_TRACKED_REVISIONS} revisions can be requested at once",
+                details={"requested": len(keys)},
+            ),
+        )
+    return keys
+
+
+@router.get(
+    "/policies/ingestion/status",
+    response_model=BulkRevisionStatusResponse,
+    responses={
+        422: {"model": ErrorResponse, "description": "Invalid or empty revision selection"},
+    },
+)
+async def get_bulk_revision_status(
+    registry: PolicyRegistryDep,
+    revision: list[str] = Query(default=[], description="SOURCE:revision_id, repeatable"),
+    source: list[str] = Query(default=[], description="All revisions of a source, repeatable"),
+) -> BulkRevisionStatusResponse:
+    """
+    Get the ingestion status of many revisions in one Redis round trip.
+
+    Implements [policy-knowledge-base:FR-003] - Bulk ingestion status
+    """
+    keys = await _resolve_revision_keys(registry, revision, source)
+    statuses = await registry.get_ingestion_statuses(keys)
+
+    entries = []
+    not_found = []
+    for (rev_source, revision_id), (record, snapshot) in zip(keys, statuses, strict=True):
+        if record is None:
+            not_found.append(f"{rev_source}:{revision_id}")
+            continue
+        entries.append(
+            RevisionStatusEntry(
+                source=rev_source,
+                revision_id=revision_id,
+                status=record.status,
+                progress=revision_progress(record, snapshot),
+            )
+        )
+
+    return BulkRevisionStatusResponse(revisions=entries, not_found=not_found)
+
+
+class ProgressStreamResponse(StreamingResponse):
+    """
+    Event stream response holding a progress stream slot.
+
+    The slot is freed once the response has been sent, or has failed to
+    send, or when the response is discarded without being sent at all.
+    """
+
+    def __init__(self, content: Any, limiter: ProgressStreamLimiter, **kwargs: Any) -> None:
+        """
+        Args:
+            content: Async iterator of Server-Sent Events.
+            limiter: Limiter a slot was acquired from for this response.
+            **kwargs: Passed to StreamingResponse.
+        """
+        super().__init__(content, **kwargs)
+        self._release_slot = limiter.hold(self)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._release_slot()
+
+
+@router.get(
+    "/policies/ingestion/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Progress events"},
+        422: {"model": ErrorResponse, "description": "Invalid or empty revision selection"},
+        503: {"model": ErrorResponse, "description": "Too many open progress streams"},
+    },
+)
+async def stream_revision_progress(
+    registry: PolicyRegistryDep,
+    revision: list[str] = Query(default=[], description="SOURCE:revision_id, repeatable"),
+    source: list[str] = Query(default=[], description="All revisions of a source, repeatable"),
+) -> StreamingResponse:
+    """
+    Stream ingestion progress for many revisions as Server-Sent Events.
+
+    Implements [policy-knowledge-base:FR-003] - Ingestion progress stream
+
+    Sends a snapshot event per revision, then progress events as the worker
+    publishes them, then a done event once every revision has finished.
+    """
+    keys = await _resolve_revision_keys(registry, revision, source)
+
+    if not stream_limiter.try_acquire():
+        raise HTTPException(
+            status_code=503,
+            detail=make_error_response(
+                code="too_many_streams",
+                message="Too many progress streams are open; retry later or poll "
+                "/policies/ingestion/status",
+                details=None,
+            ),
+        )
+
+    return ProgressStreamResponse(
+        stream_ingestion_progress(registry, keys),
+        limiter=stream_limiter,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
@@ -804,6 +962,9 @@ async def reindex_revision(
         status=RevisionStatus.PROCESSING,
     )
 
+    # Clear the previous run's progress before the worker reports again
+    await registry.publish_ingestion_progress(source, revision_id, pending_progress())
+
     # Enqueue reindex job
     job = await arq_pool.enqueue_job(
         "ingest_policy_revision",
@@ -824,9 +985,5 @@ async def reindex_revision(
     return RevisionStatusResponse(
         revision_id=revision_id,
         status=RevisionStatus.PROCESSING,
-        progress={
-            "phase": "pending",
-            "percent_complete": 0,
-            "chunks_processed": 0,
-        },
+        progress=pending_progress(),
     )
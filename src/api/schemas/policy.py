@@ -243,6 +243,24 @@ class RevisionStatusResponse(BaseModel):
     progress: dict[str, Any] | None = Field(default=None, description="Processing progress")
 
 
+class RevisionStatusEntry(BaseModel):
+    """Status of one revision in a bulk status response."""
+
+    source: str
+    revision_id: str
+    status: RevisionStatus
+    progress: dict[str, Any] | None = Field(default=None, description="Processing progress")
+
+
+class BulkRevisionStatusResponse(BaseModel):
+    """Response for GET /api/v1/policies/ingestion/status."""
+
+    revisions: list[RevisionStatusEntry]
+    not_found: list[str] = Field(
+        default_factory=list, description="Requested SOURCE:revision_id keys with no revision"
+    )
+
+
 class RevisionDeleteResponse(BaseModel):
     """Response for DELETE /api/v1/policies/{source}/revisions/{revision_id}."""
 
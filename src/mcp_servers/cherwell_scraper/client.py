@@ -10,6 +10,7 @@ Implements:
 """
 
 import asyncio
+import hashlib
 import os
 import time
 from pathlib import Path
@@ -17,6 +18,8 @@ from pathlib import Path
 import httpx
 import structlog
 
+from src.mcp_servers.cherwell_scraper.models import DownloadedFile
+
 logger = structlog.get_logger(__name__)
 
 
@@ -71,6 +74,7 @@ class CherwellClient:
     MAX_RETRIES = 3
     INITIAL_BACKOFF = 1.0
     BACKOFF_MULTIPLIER = 2.0
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024  # bytes per streamed read
 
     # User agent identifying the scraper
     USER_AGENT = "BBug-Planning-Reporter/1.0 (Planning Application Review Bot; +https://github.com/example/bbug)"
@@ -318,18 +322,21 @@ class CherwellClient:
         self,
         url: str,
         output_path: Path,
-    ) -> int:
+    ) -> DownloadedFile:
         """
         Download a document to local storage.
 
         Implements [foundation-api:FR-011] - Download documents
 
+        The SHA256 digest is computed as the file streams to disk so that
+        downstream consumers never need to re-read it to hash it.
+
         Args:
             url: Document URL to download
             output_path: Local path to save the file
 
         Returns:
-            File size in bytes
+            DownloadedFile with size in bytes and SHA256 digest
 
         Raises:
             CherwellClientError: If download fails
@@ -353,9 +360,11 @@ class CherwellClient:
                 response.raise_for_status()
 
                 total_size = 0
+                sha256 = hashlib.sha256()
                 with open(output_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                    async for chunk in response.aiter_bytes(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
+                        sha256.update(chunk)
                         total_size += len(chunk)
 
                 logger.info(
@@ -364,7 +373,7 @@ class CherwellClient:
                     output_path=str(output_path),
                     size_bytes=total_size,
                 )
-                return total_size
+                return DownloadedFile(size_bytes=total_size, sha256=sha256.hexdigest())
 
         except httpx.HTTPStatusError as e:
             raise CherwellClientError(
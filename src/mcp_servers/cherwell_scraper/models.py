@@ -122,6 +122,17 @@ class DocumentInfo:
         }
 
 
+@dataclass
+class DownloadedFile:
+    """A document written to local storage by CherwellClient.download_document."""
+
+    size_bytes: int
+    """Size of the downloaded file in bytes"""
+
+    sha256: str
+    """SHA256 hex digest, computed while the file streamed to disk"""
+
+
 @dataclass
 class DownloadResult:
     """Result of downloading a document."""
@@ -151,6 +162,9 @@ class DownloadResult:
     url: str | None = None
     """Original download URL from portal"""
 
+    file_hash: str | None = None
+    """SHA256 hex digest of the downloaded file"""
+
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
         return {
@@ -162,4 +176,5 @@ class DownloadResult:
             "description": self.description,
             "document_type": self.document_type,
             "url": self.url,
+            "file_hash": self.file_hash,
         }
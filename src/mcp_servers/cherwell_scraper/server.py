@@ -370,12 +370,13 @@ class CherwellScraperMCP:
                 counter += 1
 
         async with self._get_client() as client:
-            file_size = await client.download_document(input.document_url, output_path)
+            downloaded = await client.download_document(input.document_url, output_path)
 
             return {
                 "status": "success",
                 "file_path": str(output_path),
-                "file_size": file_size,
+                "file_size": downloaded.size_bytes,
+                "file_hash": downloaded.sha256,
             }
 
     async def _download_all_documents(
@@ -468,16 +469,17 @@ class CherwellScraperMCP:
                 output_path = output_dir / filename
 
                 try:
-                    file_size = await client.download_document(doc.url, output_path)
+                    downloaded = await client.download_document(doc.url, output_path)
                     downloads.append(
                         DownloadResult(
                             document_id=doc.document_id,
                             file_path=str(output_path),
-                            file_size=file_size,
+                            file_size=downloaded.size_bytes,
                             success=True,
                             description=doc.description,
                             document_type=doc.document_type,
                             url=doc.url,
+                            file_hash=downloaded.sha256,
                         ).to_dict()
                     )
                 except CherwellClientError as e:
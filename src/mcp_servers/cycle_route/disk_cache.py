@@ -0,0 +1,210 @@
+"""
+Disk-backed JSON cache with TTL and size-capped LRU eviction.
+
+Implements [cycle-route-assessment:NFR-003] - Rate limiting for public services (cached re-use)
+
+Shared by the Overpass response cache and the route assessment cache.
+Entries are keyed by the SHA-256 of a key text (whitespace collapsed) and
+live at {cache_dir}/{hash[:2]}/{hash}.json.gz. They are written to a
+temporary file then atomically renamed, so a crash never leaves a partial
+entry. Reads touch an entry's mtime, which drives least-recently-used
+eviction once the cache grows past its size cap.
+"""
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class DiskJSONCache:
+    """
+    Gzip JSON entries on disk with TTL, optional stale window and LRU size cap.
+
+    Subclasses set CACHE_FORMAT (stored in every entry) and bump
+    CACHE_FORMAT_VERSION when the shape of the cached data changes; entries
+    of another format or version are treated as misses.
+    """
+
+    CACHE_FORMAT = "json"
+    CACHE_FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            cache_dir: Directory for cache files (created on first write).
+            ttl_seconds: Seconds an entry is fresh.
+            stale_seconds: Further seconds an entry is returned as "stale"
+                before it becomes a miss.
+            max_bytes: Total size of entries on disk before LRU eviction.
+        """
+        self._cache_dir = Path(cache_dir)
+        self._ttl_seconds = ttl_seconds
+        self._stale_seconds = stale_seconds
+        self._max_bytes = max_bytes
+        # path -> (size on disk, last use); built from a directory scan on first use
+        self._index: dict[Path, tuple[int, float]] | None = None
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the cache directory."""
+        return self._cache_dir
+
+    @staticmethod
+    def key_hash(key: str) -> str:
+        """SHA-256 of the key text with whitespace collapsed."""
+        return hashlib.sha256(" ".join(key.split()).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key_hash: str) -> Path:
+        return self._cache_dir / key_hash[:2] / f"{key_hash}.json.gz"
+
+    def _ensure_index(self) -> dict[Path, tuple[int, float]]:
+        if self._index is None:
+            index = {}
+            for path in self._cache_dir.glob("*/*.json.gz"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                index[path] = (stat.st_size, stat.st_mtime)
+            self._index = index
+        return self._index
+
+    def read(self, key: str) -> tuple[Any, str]:
+        """
+        Look up a key.
+
+        Returns:
+            Tuple of (data or None, state) where state is "fresh", "stale"
+            or "miss".
+        """
+        data, state, _ = self.read_with_size(key)
+        return data, state
+
+    def read_with_size(self, key: str) -> tuple[Any, str, int]:
+        """
+        Look up a key and report the entry's size on disk.
+
+        Returns:
+            Tuple of (data or None, state, compressed size in bytes or 0 on
+            a miss) where state is "fresh", "stale" or "miss".
+        """
+        path = self._entry_path(self.key_hash(key))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as stream:
+                entry = json.load(stream)
+        except FileNotFoundError:
+            return None, "miss", 0
+        except (OSError, ValueError) as e:
+            logger.warning("Unreadable cache entry", path=str(path), error=str(e))
+            self._remove(path)
+            return None, "miss", 0
+
+        if (
+            entry.get("format") != self.CACHE_FORMAT
+            or entry.get("version") != self.CACHE_FORMAT_VERSION
+        ):
+            self._remove(path)
+            return None, "miss", 0
+
+        age = time.time() - entry["fetched_at"]
+        if age > self._ttl_seconds + self._stale_seconds:
+            self._remove(path)
+            return None, "miss", 0
+
+        # Mark as recently used for LRU eviction
+        now = time.time()
+        with self._lock:
+            index = self._ensure_index()
+            size = 0
+            if path in index:
+                size = index[path][0]
+                index[path] = (size, now)
+        with contextlib.suppress(OSError):
+            os.utime(path, (now, now))
+        return entry["data"], "fresh" if age <= self._ttl_seconds else "stale", size
+
+    def write(self, key: str, data: Any) -> None:
+        """Store data, then evict least recently used entries over the size cap."""
+        key_hash = self.key_hash(key)
+        path = self._entry_path(key_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "format": self.CACHE_FORMAT,
+            "version": self.CACHE_FORMAT_VERSION,
+            "key_hash": key_hash,
+            "fetched_at": time.time(),
+            "data": data,
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as stream:
+                stream.write(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            index = self._ensure_index()
+            index[path] = (path.stat().st_size, time.time())
+            total = sum(size for size, _ in index.values())
+            if total <= self._max_bytes:
+                return
+            for victim, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+                if total <= self._max_bytes:
+                    break
+                if victim == path:
+                    continue
+                victim.unlink(missing_ok=True)
+                del index[victim]
+                total -= size
+                self.evictions += 1
+
+    def _remove(self, path: Path) -> None:
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            if self._index is not None:
+                self._index.pop(path, None)
+
+    def clear(self) -> int:
+        """Delete every entry. Returns the number removed."""
+        with self._lock:
+            paths = list(self._ensure_index())
+            for path in paths:
+                path.unlink(missing_ok=True)
+            self._index = {}
+        return len(paths)
+
+    def stats(self) -> dict[str, Any]:
+        """Get the cache's size on disk and settings."""
+        with self._lock:
+            index = self._ensure_index()
+            entries = len(index)
+            size_bytes = sum(size for size, _ in index.values())
+        return {
+            "entries": entries,
+            "size_bytes": size_bytes,
+            "max_bytes": self._max_bytes,
+            "ttl_seconds": self._ttl_seconds,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,103 @@
+"""
+Array-backed geometry kernels for OSM ways.
+
+Implements [cycle-route-assessment:FR-002] - Route infrastructure analysis (way geometry)
+
+Overpass returns way geometry as lists of {lat, lon} dicts. Each way's
+points are converted once into a contiguous (n, 2) float64 array of
+[lat, lon], and distances and bearings are computed by NumPy kernels over
+whole arrays. Way lengths for a full Overpass response are computed in one
+pass over the concatenated points of all ways.
+
+The formulas match the scalar ones they replace (haversine on a sphere of
+radius 6,371km, initial great-circle bearing), so results agree to within
+floating point rounding.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+EARTH_RADIUS_M = 6_371_000.0
+
+
+def coordinates_array(geometry: Sequence[dict]) -> np.ndarray:
+    """
+    Convert Overpass geometry to a contiguous (n, 2) float64 array of [lat, lon].
+
+    Points missing lat or lon (Overpass emits null for unresolved nodes) are
+    dropped.
+    """
+    points = [(pt["lat"], pt["lon"]) for pt in geometry if pt and "lat" in pt and "lon" in pt]
+    if not points:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.array(points, dtype=np.float64)
+
+
+def haversine_m(
+    lat1: np.ndarray | float,
+    lon1: np.ndarray | float,
+    lat2: np.ndarray | float,
+    lon2: np.ndarray | float,
+) -> np.ndarray:
+    """Element-wise haversine distance in metres between degree coordinates."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = phi2 - phi1
+    dlam = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlam / 2) ** 2
+    return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def bearing_deg(
+    lat1: np.ndarray | float,
+    lon1: np.ndarray | float,
+    lat2: np.ndarray | float,
+    lon2: np.ndarray | float,
+) -> np.ndarray:
+    """Element-wise initial compass bearing (0-360 degrees) from point 1 to point 2."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dlam = np.radians(np.subtract(lon2, lon1))
+    x = np.sin(dlam) * np.cos(phi2)
+    y = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(dlam)
+    return np.degrees(np.arctan2(x, y)) % 360
+
+
+def path_length_m(coords: np.ndarray) -> float:
+    """Length in metres of a (n, 2) [lat, lon] polyline; 0 for fewer than 2 points."""
+    if len(coords) < 2:
+        return 0.0
+    return float(
+        haversine_m(coords[:-1, 0], coords[:-1, 1], coords[1:, 0], coords[1:, 1]).sum()
+    )
+
+
+def path_lengths_m(paths: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Lengths in metres of many [lat, lon] polylines in one vectorised pass.
+
+    Args:
+        paths: (n_i, 2) arrays from coordinates_array.
+
+    Returns:
+        float64 array with one length per path (0 for fewer than 2 points).
+    """
+    if not paths:
+        return np.zeros(0, dtype=np.float64)
+    counts = np.fromiter((len(p) for p in paths), dtype=np.intp, count=len(paths))
+    coords = np.concatenate(paths)
+    if len(coords) < 2:
+        return np.zeros(len(paths), dtype=np.float64)
+
+    steps = haversine_m(coords[:-1, 0], coords[:-1, 1], coords[1:, 0], coords[1:, 1])
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    # Steps joining the last point of one path to the first of the next are not part of either
+    joins = ends[:-1] - 1
+    steps[joins[(joins >= 0) & (joins < len(steps))]] = 0.0
+
+    cumulative = np.concatenate(([0.0], np.cumsum(steps)))
+    last = np.clip(ends - 1, 0, len(coords) - 1)
+    first = np.clip(starts, 0, len(coords) - 1)
+    return np.where(counts >= 2, cumulative[last] - cumulative[first], 0.0)
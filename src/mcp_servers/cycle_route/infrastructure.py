@@ -19,8 +19,17 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
+import numpy as np
 import structlog
 
+from src.mcp_servers.cycle_route.geometry import (
+    bearing_deg,
+    coordinates_array,
+    path_length_m,
+    path_lengths_m,
+)
+from src.mcp_servers.cycle_route.spatial_index import GridIndex, polyline_distance_m
+
 logger = structlog.get_logger(__name__)
 
 # UK default speed limits by highway classification (mph)
@@ -162,6 +171,24 @@ def extract_lit(tags: dict[str, str]) -> bool | None:
     return None
 
 
+def sample_route_points(coordinates: list[list[float]]) -> list[list[float]]:
+    """
+    Sample route geometry down to ~50 points for Overpass around filters.
+
+    Args:
+        coordinates: List of [lon, lat] pairs from the route geometry.
+
+    Returns:
+        Every Nth coordinate, always including the last.
+    """
+    # Sample coordinates to avoid huge queries (every 5th point, min 3)
+    step = max(1, len(coordinates) // 50)
+    sampled = coordinates[::step]
+    if coordinates[-1] not in sampled:
+        sampled.append(coordinates[-1])
+    return sampled
+
+
 def build_overpass_query(
     coordinates: list[list[float]],
     buffer_m: int = 20,
@@ -180,15 +207,9 @@ def build_overpass_query(
     Returns:
         Overpass QL query string.
     """
-    # Sample coordinates to avoid huge queries (every 5th point, min 3)
-    step = max(1, len(coordinates) // 50)
-    sampled = coordinates[::step]
-    if coordinates[-1] not in sampled:
-        sampled.append(coordinates[-1])
-
     # Build around statements for sampled points
     around_parts = []
-    for lon, lat in sampled:
+    for lon, lat in sample_route_points(coordinates):
         around_parts.append(f"{lat},{lon}")
 
     coords_str = ",".join(around_parts)
@@ -232,15 +253,7 @@ def _way_length_m(geometry: list[dict]) -> float:
     Returns:
         Total length in metres, or 0 if fewer than 2 nodes.
     """
-    if len(geometry) < 2:
-        return 0.0
-    total = 0.0
-    for i in range(len(geometry) - 1):
-        total += _haversine_distance(
-            geometry[i]["lat"], geometry[i]["lon"],
-            geometry[i + 1]["lat"], geometry[i + 1]["lon"],
-        )
-    return total
+    return path_length_m(coordinates_array(geometry))
 
 
 def parse_overpass_ways(
@@ -251,7 +264,8 @@ def parse_overpass_ways(
     Parse Overpass response into route segments.
 
     Each OSM way becomes a segment. Distance is calculated from the way's
-    actual geometry using haversine sum between consecutive nodes.
+    actual geometry using haversine sum between consecutive nodes, for all
+    ways at once over their coordinate arrays.
 
     Args:
         overpass_response: JSON response from Overpass API.
@@ -267,7 +281,7 @@ def parse_overpass_ways(
     if not ways:
         return []
 
-    segments = []
+    routable = []
     for way in ways:
         tags = way.get("tags", {})
         highway = tags.get("highway", "unknown")
@@ -276,13 +290,15 @@ def parse_overpass_ways(
         if highway in ("proposed", "construction", "abandoned", "razed", "platform"):
             continue
 
-        # Extract geometry: convert Overpass {lat, lon} to GeoJSON [lon, lat]
-        raw_geom = way.get("geometry", [])
-        geom_coords = [[pt["lon"], pt["lat"]] for pt in raw_geom if "lat" in pt and "lon" in pt]
-        segment_geometry = geom_coords if len(geom_coords) >= 2 else None
+        routable.append((way, tags, highway, coordinates_array(way.get("geometry", []))))
 
-        # Calculate distance from actual way geometry
-        way_distance = _way_length_m(raw_geom)
+    # Calculate distances from actual way geometry in one vectorised pass
+    lengths = path_lengths_m([coords for *_, coords in routable])
+
+    segments = []
+    for (way, tags, highway, coords), way_distance in zip(routable, lengths, strict=True):
+        # GeoJSON [lon, lat] order
+        segment_geometry = coords[:, ::-1].tolist() if len(coords) >= 2 else None
 
         segment = RouteSegment(
             way_id=way.get("id", 0),
@@ -291,7 +307,7 @@ def parse_overpass_ways(
             speed_limit=extract_speed_limit(tags),
             surface=extract_surface(tags),
             lit=extract_lit(tags),
-            distance_m=way_distance,
+            distance_m=float(way_distance),
             name=tags.get("name", "Unnamed"),
             geometry=segment_geometry,
         )
@@ -458,6 +474,21 @@ ROAD_HIGHWAY_TYPES = {
     "trunk", "unclassified", "living_street", "service",
 }
 
+# A candidate cycleway must run within this distance of the road (metres)...
+PARALLEL_MAX_DISTANCE_M = 30.0
+
+# ...on a bearing within this many degrees of it
+PARALLEL_MAX_BEARING_DIFF = 30.0
+
+# Grid cell for candidate lookups (degrees); ~55m north-south
+PARALLEL_INDEX_CELL_DEG = 0.0005
+
+# Barriers closer than this are one barrier mapped twice (metres)
+BARRIER_DEDUP_RADIUS_M = 5.0
+
+# Grid cell for barrier deduplication (degrees); ~11m north-south
+BARRIER_DEDUP_CELL_DEG = 0.0001
+
 
 def detect_parallel_provision(
     segments: list[RouteSegment],
@@ -467,8 +498,12 @@ def detect_parallel_provision(
     Scan Overpass data for cycleways parallel to road segments with poor provision.
 
     For each road segment with poor provision, checks if any cycleway/designated-path
-    way in the Overpass data has similar bearing and hasn't already been included as
-    a route segment. If found, upgrades the segment's provision.
+    way in the Overpass data runs within PARALLEL_MAX_DISTANCE_M of the segment's
+    way with a similar bearing and hasn't already been included as a route segment.
+    If found, upgrades the segment's provision.
+
+    Candidate edges are held in a grid index, so each segment only measures
+    distances to the candidates around it.
 
     Args:
         segments: Route segments parsed from Overpass data.
@@ -481,13 +516,17 @@ def detect_parallel_provision(
     # Collect way_ids already in route segments
     segment_way_ids = {seg.way_id for seg in segments}
 
+    # Way geometry by ID, replacing a rescan of the elements per segment
+    ways_by_id: dict[int, dict[str, Any]] = {}
+    for elem in overpass_data.get("elements", []):
+        if elem.get("type") == "way" and "id" in elem:
+            ways_by_id.setdefault(elem["id"], elem)
+
     # Find candidate cycleways from the Overpass data
-    elements = overpass_data.get("elements", [])
     candidates = []
-    for elem in elements:
-        if elem.get("type") != "way":
-            continue
-        if elem.get("id") in segment_way_ids:
+    index = GridIndex(PARALLEL_INDEX_CELL_DEG)
+    for way_id, elem in ways_by_id.items():
+        if way_id in segment_way_ids:
             continue
         tags = elem.get("tags", {})
         highway = tags.get("highway", "")
@@ -500,21 +539,38 @@ def detect_parallel_provision(
             continue
 
         geometry = elem.get("geometry", [])
-        candidate_bearing = calculate_way_bearing(geometry)
-        if candidate_bearing is None:
+        if len(geometry) < 2:
             continue
 
-        provision = classify_provision(tags)
+        position = len(candidates)
         candidates.append({
-            "way_id": elem["id"],
-            "bearing": candidate_bearing,
-            "provision": provision,
+            "way_id": way_id,
+            "provision": classify_provision(tags),
             "geometry": geometry,
         })
+        for a, b in zip(geometry, geometry[1:], strict=False):
+            index.insert(
+                position,
+                min(a["lat"], b["lat"]), min(a["lon"], b["lon"]),
+                max(a["lat"], b["lat"]), max(a["lon"], b["lon"]),
+            )
 
     if not candidates:
         return segments
 
+    # First-to-last node bearings of all candidates in one vectorised pass
+    endpoints = np.array(
+        [
+            (c["geometry"][0]["lat"], c["geometry"][0]["lon"],
+             c["geometry"][-1]["lat"], c["geometry"][-1]["lon"])
+            for c in candidates
+        ],
+        dtype=np.float64,
+    )
+    bearings = bearing_deg(endpoints[:, 0], endpoints[:, 1], endpoints[:, 2], endpoints[:, 3])
+    for cand, bearing in zip(candidates, bearings.tolist(), strict=True):
+        cand["bearing"] = bearing
+
     # For each poor-provision road segment, find matching parallel cycleways
     for seg in segments:
         if seg.provision not in POOR_PROVISIONS:
@@ -522,30 +578,34 @@ def detect_parallel_provision(
         if seg.highway not in ROAD_HIGHWAY_TYPES:
             continue
 
-        # Find this segment's way in the overpass data to get its geometry
-        seg_bearing = None
-        for elem in elements:
-            if elem.get("type") == "way" and elem.get("id") == seg.way_id:
-                geometry = elem.get("geometry", [])
-                seg_bearing = calculate_way_bearing(geometry)
-                break
-
+        seg_geometry = ways_by_id.get(seg.way_id, {}).get("geometry", [])
+        seg_bearing = calculate_way_bearing(seg_geometry)
         if seg_bearing is None:
             continue
 
-        # Find best matching candidate
+        nearby: set[int] = set()
+        for a, b in zip(seg_geometry, seg_geometry[1:], strict=False):
+            nearby |= index.query(
+                min(a["lat"], b["lat"]), min(a["lon"], b["lon"]),
+                max(a["lat"], b["lat"]), max(a["lon"], b["lon"]),
+                pad_m=PARALLEL_MAX_DISTANCE_M,
+            )
+
+        # Find best matching candidate (lowest position wins ties, as in input order)
         best_candidate = None
         best_rank = PROVISION_RANK.get(seg.provision, 0)
 
-        for cand in candidates:
-            diff = bearing_difference(seg_bearing, cand["bearing"])
-            if diff > 30:
-                continue
-
+        for position in sorted(nearby):
+            cand = candidates[position]
             cand_rank = PROVISION_RANK.get(cand["provision"], 0)
-            if cand_rank > best_rank:
-                best_candidate = cand
-                best_rank = cand_rank
+            if cand_rank <= best_rank:
+                continue
+            if bearing_difference(seg_bearing, cand["bearing"]) > PARALLEL_MAX_BEARING_DIFF:
+                continue
+            if polyline_distance_m(seg_geometry, cand["geometry"]) > PARALLEL_MAX_DISTANCE_M:
+                continue
+            best_candidate = cand
+            best_rank = cand_rank
 
         if best_candidate:
             seg.original_provision = seg.provision
@@ -634,6 +694,8 @@ def analyse_transitions(
 
     # 1. Barrier detection (FR-001)
     barriers: list[dict[str, Any]] = []
+    # Kept barriers by grid cell, so deduplication only checks nearby ones
+    barrier_index = GridIndex(BARRIER_DEDUP_CELL_DEG)
     for elem in elements:
         if elem.get("type") != "node":
             continue
@@ -645,12 +707,13 @@ def analyse_transitions(
         lon = elem.get("lon", 0)
 
         # Deduplicate barriers within 5m
-        duplicate = False
-        for existing in barriers:
-            if _haversine_distance(lat, lon, existing["lat"], existing["lon"]) < 5:
-                duplicate = True
-                break
+        duplicate = any(
+            _haversine_distance(lat, lon, barriers[i]["lat"], barriers[i]["lon"])
+            < BARRIER_DEDUP_RADIUS_M
+            for i in barrier_index.query_point(lat, lon, BARRIER_DEDUP_RADIUS_M)
+        )
         if not duplicate:
+            barrier_index.insert_point(len(barriers), lat, lon)
             barriers.append({
                 "type": barrier_type,
                 "node_id": elem.get("id", 0),
@@ -827,6 +890,7 @@ async def query_overpass_resilient(
     query: str,
     *,
     destination: str = "",
+    timeout: float | None = None,
 ) -> dict[str, Any] | None:
     """
     Query Overpass API with retry and fallback.
@@ -834,8 +898,15 @@ async def query_overpass_resilient(
     Retries up to OVERPASS_MAX_RETRIES times on transient errors against the
     primary endpoint, then makes one attempt against the fallback mirror.
 
+    Args:
+        client: HTTP client to send the query with.
+        query: Overpass QL query text.
+        destination: Destination or tile label for logs.
+        timeout: Per-request HTTP timeout in seconds (default: the client's).
+
     Returns parsed JSON response on success, or None if all attempts fail.
     """
+    request_timeout = httpx.USE_CLIENT_DEFAULT if timeout is None else timeout
     endpoints = [
         (OVERPASS_API_URL, 1 + OVERPASS_MAX_RETRIES),
         (OVERPASS_FALLBACK_URL, 1),
@@ -844,7 +915,7 @@ async def query_overpass_resilient(
     for url, max_attempts in endpoints:
         for attempt in range(1, max_attempts + 1):
             try:
-                response = await client.post(url, data={"data": query})
+                response = await client.post(url, data={"data": query}, timeout=request_timeout)
 
                 if response.status_code < 400:
                     return response.json()
@@ -0,0 +1,292 @@
+"""
+Local OSM infrastructure store - an offline alternative to live Overpass queries.
+
+Implements [cycle-route-assessment:FR-002] - Route infrastructure analysis (local backend)
+Implements [cycle-route-assessment:NFR-002] - Graceful failure handling
+
+An Oxfordshire .osm.pbf extract (the one Valhalla builds its tiles from) is
+converted by src.scripts.build_osm_store into a SQLite database holding
+highway ways and barrier/crossing nodes, each with an R-tree index. A route
+query fetches candidates from the R-trees around the sampled route points and
+then applies the same filters as build_overpass_query via OverpassStore, so
+the result has the Overpass JSON shape and parse_overpass_ways and the
+analysers work unchanged.
+"""
+
+import json
+import math
+import sqlite3
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import structlog
+
+from src.mcp_servers.cycle_route.infrastructure import sample_route_points
+from src.mcp_servers.cycle_route.overpass_store import (
+    CROSSING_RADIUS_M,
+    WAY_BUFFER_M,
+    OverpassStore,
+)
+from src.mcp_servers.cycle_route.spatial_index import METRES_PER_DEGREE_LAT
+
+logger = structlog.get_logger(__name__)
+
+SCHEMA_VERSION = 1
+
+# Candidate search radius around each sampled point (largest filter radius)
+SEARCH_RADIUS_M = max(WAY_BUFFER_M, CROSSING_RADIUS_M)
+
+# IDs per SQL IN (...) lookup
+ID_BATCH_SIZE = 500
+
+# Rows per executemany while building
+WRITE_BATCH_SIZE = 10_000
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE ways (
+    id INTEGER PRIMARY KEY,
+    tags TEXT NOT NULL,
+    nodes TEXT NOT NULL,
+    geometry TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE way_index USING rtree(id, min_lat, max_lat, min_lon, max_lon);
+CREATE TABLE nodes (
+    id INTEGER PRIMARY KEY,
+    lat REAL NOT NULL,
+    lon REAL NOT NULL,
+    tags TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE node_index USING rtree(id, min_lat, max_lat, min_lon, max_lon);
+"""
+
+
+class OSMStoreError(Exception):
+    """Raised when the local OSM store is missing or unreadable."""
+
+    pass
+
+
+class OSMStoreWriter:
+    """
+    Writes a local OSM store, replacing the target file only on success.
+
+    Use as a context manager; add_way/add_node buffer rows and flush them in
+    batches.
+    """
+
+    def __init__(self, path: str | Path, source: str = "") -> None:
+        """
+        Args:
+            path: Database file to create (replaced atomically when done).
+            source: Description of the extract, recorded in the meta table.
+        """
+        self.path = Path(path)
+        self.source = source
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._conn: sqlite3.Connection | None = None
+        self._ways: list[tuple] = []
+        self._way_boxes: list[tuple] = []
+        self._nodes: list[tuple] = []
+        self._node_boxes: list[tuple] = []
+        self.way_count = 0
+        self.node_count = 0
+
+    def __enter__(self) -> "OSMStoreWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path.unlink(missing_ok=True)
+        self._conn = sqlite3.connect(self._tmp_path)
+        self._conn.executescript(_SCHEMA)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        assert self._conn is not None
+        if exc_type is not None:
+            self._conn.close()
+            self._tmp_path.unlink(missing_ok=True)
+            return
+        self._flush()
+        self._conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("schema_version", str(SCHEMA_VERSION)),
+                ("source", self.source),
+                ("built_at", datetime.now(UTC).isoformat()),
+                ("way_count", str(self.way_count)),
+                ("node_count", str(self.node_count)),
+            ],
+        )
+        self._conn.commit()
+        self._conn.close()
+        self._tmp_path.replace(self.path)
+
+    def add_way(
+        self,
+        way_id: int,
+        tags: dict[str, str],
+        node_ids: list[int],
+        geometry: list[tuple[float, float]],
+    ) -> None:
+        """
+        Add a highway way.
+
+        Args:
+            way_id: OSM way ID.
+            tags: Way tags.
+            node_ids: Ordered node IDs of the way.
+            geometry: Ordered (lat, lon) node locations.
+        """
+        if not geometry:
+            return
+        lats = [lat for lat, _ in geometry]
+        lons = [lon for _, lon in geometry]
+        self._ways.append((way_id, json.dumps(tags), json.dumps(node_ids), json.dumps(geometry)))
+        self._way_boxes.append((way_id, min(lats), max(lats), min(lons), max(lons)))
+        self.way_count += 1
+        if len(self._ways) >= WRITE_BATCH_SIZE:
+            self._flush()
+
+    def add_node(self, node_id: int, lat: float, lon: float, tags: dict[str, str]) -> None:
+        """Add a barrier or crossing node."""
+        self._nodes.append((node_id, lat, lon, json.dumps(tags)))
+        self._node_boxes.append((node_id, lat, lat, lon, lon))
+        self.node_count += 1
+        if len(self._nodes) >= WRITE_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        assert self._conn is not None
+        self._conn.executemany("INSERT OR REPLACE INTO ways VALUES (?, ?, ?, ?)", self._ways)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO way_index VALUES (?, ?, ?, ?, ?)", self._way_boxes
+        )
+        self._conn.executemany("INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?)", self._nodes)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO node_index VALUES (?, ?, ?, ?, ?)", self._node_boxes
+        )
+        self._ways.clear()
+        self._way_boxes.clear()
+        self._nodes.clear()
+        self._node_boxes.clear()
+
+
+class LocalOSMStore:
+    """Read-only route queries against a local OSM store built by OSMStoreWriter."""
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Args:
+            path: Database file written by OSMStoreWriter.
+
+        Raises:
+            OSMStoreError: If the file is missing or not a compatible store.
+        """
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise OSMStoreError(f"Local OSM store not found: {self.path}")
+        try:
+            self._conn = sqlite3.connect(
+                f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+            )
+            self.meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.DatabaseError as e:
+            raise OSMStoreError(f"Unreadable local OSM store {self.path}: {e}") from e
+        if self.meta.get("schema_version") != str(SCHEMA_VERSION):
+            raise OSMStoreError(
+                f"Unsupported local OSM store schema: {self.meta.get('schema_version')}"
+            )
+        # Queries run in worker threads; one connection serialised by a lock
+        self._lock = threading.Lock()
+        logger.info(
+            "Local OSM store opened",
+            path=str(self.path),
+            source=self.meta.get("source"),
+            ways=self.meta.get("way_count"),
+            nodes=self.meta.get("node_count"),
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _candidate_ids(self, table: str, points: list[tuple[float, float]]) -> set[int]:
+        """IDs in an R-tree (fixed table name) whose boxes come within SEARCH_RADIUS_M of a point."""
+        ids: set[int] = set()
+        for lat, lon in points:
+            dlat = SEARCH_RADIUS_M / METRES_PER_DEGREE_LAT
+            dlon = dlat / max(math.cos(math.radians(lat)), 0.01)
+            rows = self._conn.execute(
+                f"SELECT id FROM {table} "
+                "WHERE max_lat >= ? AND min_lat <= ? AND max_lon >= ? AND min_lon <= ?",
+                (lat - dlat, lat + dlat, lon - dlon, lon + dlon),
+            )
+            ids.update(row[0] for row in rows)
+        return ids
+
+    def _fetch(self, table: str, ids: set[int]) -> list[tuple]:
+        columns = "id, tags, nodes, geometry" if table == "ways" else "id, tags, lat, lon"
+        rows: list[tuple] = []
+        ordered = sorted(ids)
+        for start in range(0, len(ordered), ID_BATCH_SIZE):
+            batch = ordered[start : start + ID_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows.extend(
+                self._conn.execute(
+                    f"SELECT {columns} FROM {table} WHERE id IN ({placeholders}) ORDER BY id",
+                    batch,
+                )
+            )
+        return rows
+
+    def query_route(
+        self,
+        route_coords: list[list[float]],
+        on_route_way_ids: set[int] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Answer the per-route Overpass query from the local store.
+
+        Args:
+            route_coords: Route geometry as [lon, lat] pairs.
+            on_route_way_ids: Way IDs from Valhalla trace_attributes, or None
+                to select barriers by proximity.
+
+        Returns:
+            Overpass-shaped response dict ({"elements": [...]}).
+        """
+        if not route_coords:
+            return {"elements": []}
+        points = [(lat, lon) for lon, lat in sample_route_points(route_coords)]
+
+        with self._lock:
+            way_ids = self._candidate_ids("way_index", points) | set(on_route_way_ids or ())
+            way_rows = self._fetch("ways", way_ids)
+            node_ids = self._candidate_ids("node_index", points)
+            # Barriers on on-route ways may lie between sampled points
+            for way_id, _, nodes, _ in way_rows:
+                if on_route_way_ids and way_id in on_route_way_ids:
+                    node_ids.update(json.loads(nodes))
+            node_rows = self._fetch("nodes", node_ids)
+
+        elements: list[dict[str, Any]] = [
+            {"type": "node", "id": node_id, "lat": lat, "lon": lon, "tags": json.loads(tags)}
+            for node_id, tags, lat, lon in node_rows
+        ]
+        elements.extend(
+            {
+                "type": "way",
+                "id": way_id,
+                "nodes": json.loads(nodes),
+                "tags": json.loads(tags),
+                "geometry": [{"lat": lat, "lon": lon} for lat, lon in json.loads(geometry)],
+            }
+            for way_id, tags, nodes, geometry in way_rows
+        )
+        return OverpassStore([{"elements": elements}]).route_data(route_coords, on_route_way_ids)
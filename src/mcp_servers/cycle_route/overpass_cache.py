@@ -0,0 +1,184 @@
+"""
+Persistent cache of Overpass API responses.
+
+Implements [cycle-route-assessment:FR-002] - Route infrastructure analysis (cached re-use)
+Implements [cycle-route-assessment:NFR-003] - Rate limiting for public services
+
+Resubmissions and reviews of neighbouring sites ask Overpass about the same
+corridors again and again. Responses are cached on disk keyed by the SHA-256
+of the canonical query text (whitespace collapsed), which already encodes the
+sampled corridor points, radii and on-route way IDs.
+
+- Fresh entries (younger than the TTL) are served without a request.
+- Stale entries (within the stale window after the TTL) are served at once
+  while one background request refreshes them (stale-while-revalidate).
+- Older entries are misses. When the cache exceeds its size cap the least
+  recently used entries are evicted.
+
+Entries are stored by DiskJSONCache (gzip files, atomic writes, LRU size cap).
+"""
+
+import asyncio
+import os
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.mcp_servers.cycle_route.disk_cache import DiskJSONCache
+
+logger = structlog.get_logger(__name__)
+
+OverpassFetch = Callable[[], Awaitable[dict[str, Any] | None]]
+
+
+class OverpassCache(DiskJSONCache):
+    """Disk-backed TTL + stale-while-revalidate + size-capped LRU cache."""
+
+    CACHE_FORMAT = "overpass-response"
+    CACHE_FORMAT_VERSION = 1
+
+    DEFAULT_TTL_SECONDS = 7 * 86400.0
+    DEFAULT_STALE_SECONDS = 30 * 86400.0
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        stale_seconds: float = DEFAULT_STALE_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """
+        Initialize the Overpass cache.
+
+        Args:
+            cache_dir: Directory for cache files (created on first write).
+            ttl_seconds: Seconds an entry is served without revalidation.
+            stale_seconds: Further seconds a stale entry is served while it
+                is refreshed in the background.
+            max_bytes: Total size of entries on disk before LRU eviction.
+        """
+        super().__init__(cache_dir, ttl_seconds, stale_seconds, max_bytes)
+        self._revalidating: dict[str, asyncio.Task[None]] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+
+    @classmethod
+    def from_env(cls) -> "OverpassCache | None":
+        """Create a cache from OVERPASS_CACHE_DIR (None when unset) and its sizing variables."""
+        cache_dir = os.getenv("OVERPASS_CACHE_DIR")
+        if not cache_dir:
+            return None
+        return cls(
+            cache_dir,
+            ttl_seconds=float(os.getenv("OVERPASS_CACHE_TTL", str(cls.DEFAULT_TTL_SECONDS))),
+            stale_seconds=float(
+                os.getenv("OVERPASS_CACHE_STALE", str(cls.DEFAULT_STALE_SECONDS))
+            ),
+            max_bytes=int(
+                float(os.getenv("OVERPASS_CACHE_MAX_MB", str(cls.DEFAULT_MAX_BYTES / 2**20)))
+                * 2**20
+            ),
+        )
+
+    @staticmethod
+    def query_hash(query: str) -> str:
+        """SHA-256 of the query with whitespace collapsed."""
+        return DiskJSONCache.key_hash(query)
+
+    async def fetch(self, query: str, fetch: OverpassFetch, label: str = "") -> dict[str, Any] | None:
+        """
+        Get a query's response from the cache, falling back to fetch().
+
+        Args:
+            query: Overpass QL query text.
+            fetch: Coroutine factory making the live request (returns None on failure).
+            label: Destination or tile label for logs.
+
+        Returns:
+            The cached or fetched response, or None if the live request failed.
+        """
+        # The entry's compressed size comes from the LRU index, so a hit is
+        # not re-serialised on the event loop to measure it
+        data, state, saved = await asyncio.to_thread(self.read_with_size, query)
+        if data is not None:
+            self.bytes_saved += saved
+            if state == "fresh":
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                self._revalidate(query, fetch, label)
+            logger.info(
+                "Overpass cache hit",
+                destination=label,
+                state=state,
+                bytes_saved=saved,
+                hit_rate=self._hit_rate(),
+            )
+            return data
+
+        self.misses += 1
+        data = await fetch()
+        stored = data is not None and await self._store(query, data)
+        logger.info(
+            "Overpass cache miss",
+            destination=label,
+            stored=stored,
+            hit_rate=self._hit_rate(),
+        )
+        return data
+
+    async def _store(self, query: str, data: dict[str, Any]) -> bool:
+        """Write a response; a failed write is logged and does not fail the caller."""
+        try:
+            await asyncio.to_thread(self.write, query, data)
+        except OSError as e:
+            logger.warning("Overpass cache write failed", error=str(e))
+            return False
+        return True
+
+    def _revalidate(self, query: str, fetch: OverpassFetch, label: str) -> None:
+        """Refresh a stale entry in the background (once per query at a time)."""
+        key = self.query_hash(query)
+        if key in self._revalidating:
+            return
+
+        async def refresh() -> None:
+            try:
+                data = await fetch()
+                if data is not None and await self._store(query, data):
+                    self.revalidations += 1
+            except Exception as e:
+                logger.warning("Overpass cache revalidation failed", destination=label, error=str(e))
+            finally:
+                self._revalidating.pop(key, None)
+
+        self._revalidating[key] = asyncio.create_task(refresh())
+
+    async def wait_for_revalidations(self) -> None:
+        """Wait for background refreshes in flight (used at shutdown and in tests)."""
+        while self._revalidating:
+            await asyncio.gather(*list(self._revalidating.values()), return_exceptions=True)
+
+    def _hit_rate(self) -> float:
+        served = self.hits + self.stale_hits
+        total = served + self.misses
+        return round(served / total, 3) if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters for this process and the cache's size on disk."""
+        return {
+            **super().stats(),
+            "stale_seconds": self._stale_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "bytes_saved": self.bytes_saved,
+            "hit_rate": self._hit_rate(),
+        }
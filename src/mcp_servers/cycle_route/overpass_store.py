@@ -0,0 +1,425 @@
+"""
+Merged Overpass queries for all routes from one site.
+
+Implements [cycle-route-assessment:FR-002] - Route infrastructure analysis via Overpass
+Implements [cycle-route-assessment:NFR-003] - Rate limiting for public services
+
+Routes from one development site to its destinations overlap heavily near the
+origin, yet each per-route Overpass query fetches that corridor again. For a
+batch assessment the route corridors are instead merged into one query (split
+into a few tiles for very large batches), the responses are loaded once into
+an OverpassStore, and each route's elements are selected from the store with
+the same filters the per-route query applies on the Overpass server:
+
+- ways tagged highway within the buffer of the sampled route line
+- crossing nodes within 20m of the sampled route line
+- barrier nodes on the route's own ways (Valhalla trace_attributes), or
+  within 15m of the sampled route line when no way IDs are known
+
+The merged query uses slightly larger radii than these filters so that
+dropping near-duplicate points between routes never loses an element.
+"""
+
+import math
+import re
+from typing import Any
+
+from src.mcp_servers.cycle_route.infrastructure import sample_route_points
+from src.mcp_servers.cycle_route.spatial_index import (
+    EARTH_RADIUS_M,
+    METRES_PER_DEGREE_LAT,
+    GridIndex,
+    bounding_box,
+)
+
+# Around radii (metres) matching build_overpass_query
+WAY_BUFFER_M = 20
+CROSSING_RADIUS_M = 20
+BARRIER_RADIUS_M = 15
+
+# Same regex the per-route query applies to barrier tags
+BARRIER_TYPES_PATTERN = "cycle_barrier|bollard|gate|stile|lift_gate"
+_BARRIER_RE = re.compile(BARRIER_TYPES_PATTERN)
+
+# Points closer than this (on a lat/lon grid) are merged across routes
+POINT_MERGE_GRID_DEG = 0.00005
+
+# Extra query radius covering the distance from a merged point to its kept twin
+MERGE_PAD_M = 10
+
+# Maximum around points per merged query before splitting into tiles
+MERGED_QUERY_MAX_POINTS = 250
+
+# Overpass server timeout for a merged query (seconds)
+MERGED_QUERY_TIMEOUT = 60
+
+# Client-side HTTP timeout for a merged query: the server timeout plus time
+# to transfer the response (seconds)
+MERGED_QUERY_HTTP_TIMEOUT = MERGED_QUERY_TIMEOUT + 15
+
+# Spatial index cell size (degrees); ~1.1km north-south at UK latitudes
+INDEX_CELL_DEG = 0.01
+
+# Grid cell size (degrees) for a route's own sampled segments; ~220m
+CORRIDOR_CELL_DEG = 0.002
+
+
+def build_merged_overpass_queries(
+    routes: list[tuple[list[list[float]], set[int] | None]],
+    max_points: int = MERGED_QUERY_MAX_POINTS,
+) -> list[str]:
+    """
+    Build Overpass queries covering the corridors of several routes.
+
+    Args:
+        routes: (route coordinates as [lon, lat] pairs, on-route way IDs or
+            None) for every route to cover.
+        max_points: Maximum around points per query; more points are split
+            across several tile queries.
+
+    Returns:
+        Overpass QL query strings (at least one when any route has points).
+    """
+    return [query for query, _ in build_merged_overpass_tiles(routes, max_points)]
+
+
+def build_merged_overpass_tiles(
+    routes: list[tuple[list[list[float]], set[int] | None]],
+    max_points: int = MERGED_QUERY_MAX_POINTS,
+) -> list[tuple[str, set[int]]]:
+    """
+    Build merged Overpass tile queries and the routes each one covers.
+
+    Overpass buffers an around point list as one polyline, so each route
+    keeps its own around statements: one per contiguous run of sampled
+    segments not already queried for an earlier route. Joining points from
+    different routes into one list would also buffer the straight jumps
+    between them.
+
+    A route is covered by every tile holding one of its segments (or the
+    segment it shares with an earlier route), and by the first tile when it
+    has on-route way IDs. If a tile fails, only those routes lack data.
+
+    Args:
+        routes: (route coordinates as [lon, lat] pairs, on-route way IDs or
+            None) for every route to cover.
+        max_points: Maximum around points per query.
+
+    Returns:
+        (Overpass QL query, indexes into routes it covers) per tile.
+    """
+    point_index: dict[tuple[int, int], int] = {}
+    points: list[tuple[float, float]] = []
+    runs: list[list[int]] = []
+    route_segments: list[list[tuple[int, int]]] = []
+    seen: set[tuple[int, int]] = set()
+    for coords, _ in routes:
+        path: list[int] = []
+        for lon, lat in sample_route_points(coords) if coords else ():
+            cell = (round(lat / POINT_MERGE_GRID_DEG), round(lon / POINT_MERGE_GRID_DEG))
+            if cell not in point_index:
+                point_index[cell] = len(points)
+                points.append((lat, lon))
+            if not path or path[-1] != point_index[cell]:
+                path.append(point_index[cell])
+
+        # A lone point is a zero-length segment; shared segments end the run
+        segments = list(zip(path, path[1:], strict=False)) if len(path) > 1 else [(p, p) for p in path]
+        run: list[int] = []
+        for a, b in segments:
+            key = (min(a, b), max(a, b))
+            if key in seen:
+                run = []
+                continue
+            seen.add(key)
+            if not run or run[-1] != a:
+                run = [a]
+                runs.append(run)
+            if b != a:
+                run.append(b)
+        route_segments.append([(min(a, b), max(a, b)) for a, b in segments])
+
+    # Split runs longer than a tile, repeating the point at each cut so the
+    # segment across it stays covered, then pack the pieces into tiles
+    step = max(1, max_points - 1)
+    tile_runs: list[list[list[int]]] = []
+    tile_sizes: list[int] = []
+    segment_tile: dict[tuple[int, int], int] = {}
+    for run in runs:
+        pieces = [run] if len(run) <= max_points else [
+            run[i : i + max_points] for i in range(0, len(run) - 1, step)
+        ]
+        for piece in pieces:
+            if not tile_runs or tile_sizes[-1] + len(piece) > max_points:
+                tile_runs.append([])
+                tile_sizes.append(0)
+            tile_runs[-1].append(piece)
+            tile_sizes[-1] += len(piece)
+            for a, b in zip(piece, piece[1:], strict=False) if len(piece) > 1 else [(piece[0], piece[0])]:
+                segment_tile.setdefault((min(a, b), max(a, b)), len(tile_runs) - 1)
+
+    way_ids = sorted(set().union(*(ids for _, ids in routes if ids)))
+
+    covered_by: list[set[int]] = [set() for _ in tile_runs]
+    for route_index, segments in enumerate(route_segments):
+        for key in segments:
+            covered_by[segment_tile[key]].add(route_index)
+
+    tiles = []
+    for tile_index, pieces in enumerate(tile_runs):
+        covered = covered_by[tile_index]
+        statements = []
+        for piece in pieces:
+            coords_str = ",".join(f"{points[i][0]},{points[i][1]}" for i in piece)
+            statements += [
+                f'  way(around:{WAY_BUFFER_M + MERGE_PAD_M},{coords_str})["highway"];',
+                f'  node(around:{CROSSING_RADIUS_M + MERGE_PAD_M},{coords_str})["crossing"];',
+                f'  node(around:{BARRIER_RADIUS_M + MERGE_PAD_M},{coords_str})'
+                f'["barrier"~"{BARRIER_TYPES_PATTERN}"];',
+            ]
+        header = f"[out:json][timeout:{MERGED_QUERY_TIMEOUT}];"
+        # On-route ways (with their node lists) and barriers go in the first tile only
+        if tile_index == 0 and way_ids:
+            ids_str = ",".join(str(wid) for wid in way_ids)
+            header += f"\nway(id:{ids_str})->.onroute;"
+            statements += [
+                "  .onroute;",
+                f'  node(w.onroute)["barrier"~"{BARRIER_TYPES_PATTERN}"];',
+            ]
+            covered |= {i for i, (_, ids) in enumerate(routes) if ids}
+        tiles.append((f"{header}\n(\n" + "\n".join(statements) + "\n);\nout geom;", covered))
+    return tiles
+
+
+def _cell(lat: float, lon: float) -> tuple[int, int]:
+    return math.floor(lat / INDEX_CELL_DEG), math.floor(lon / INDEX_CELL_DEG)
+
+
+def _segment_distance(
+    a: tuple[float, float],
+    b: tuple[float, float],
+    c: tuple[float, float],
+    d: tuple[float, float],
+) -> float:
+    """Distance between planar segments a-b and c-d (zero when they cross)."""
+
+    def side(p: tuple[float, float], q: tuple[float, float], r: tuple[float, float]) -> float:
+        return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+    d1, d2, d3, d4 = side(c, d, a), side(c, d, b), side(a, b, c), side(a, b, d)
+    if ((d1 > 0) != (d2 > 0)) and ((d3 > 0) != (d4 > 0)) and 0 not in (d1, d2, d3, d4):
+        return 0.0
+    return min(
+        _point_distance(a, c, d),
+        _point_distance(b, c, d),
+        _point_distance(c, a, b),
+        _point_distance(d, a, b),
+    )
+
+
+def _point_distance(
+    p: tuple[float, float], a: tuple[float, float], b: tuple[float, float]
+) -> float:
+    """Distance from planar point p to segment a-b."""
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(
+        0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length_sq)
+    )
+    return math.hypot(p[0] - a[0] - t * dx, p[1] - a[1] - t * dy)
+
+
+class _Corridor:
+    """
+    A route's sampled polyline, the line a per-route around filter buffers.
+
+    Segments are kept in a local projection (metres) and in a fine grid, so
+    each element is only measured against the few segments near it.
+    """
+
+    def __init__(self, points: list[tuple[float, float]]) -> None:
+        """
+        Args:
+            points: Sampled route points as (lat, lon).
+        """
+        ref_lat = points[0][0]
+        self._ky = math.radians(1) * EARTH_RADIUS_M
+        self._kx = self._ky * math.cos(math.radians(ref_lat))
+        projected = [self.project(lat, lon) for lat, lon in points]
+        pairs = list(zip(points, points[1:], strict=False)) or [(points[0], points[0])]
+        self.segments = list(zip(projected, projected[1:], strict=False)) or [(projected[0], projected[0])]
+        self.boxes = [
+            (min(a[0], b[0]), min(a[1], b[1]), max(a[0], b[0]), max(a[1], b[1]))
+            for a, b in pairs
+        ]
+        self._index = GridIndex(CORRIDOR_CELL_DEG)
+        for i, box in enumerate(self.boxes):
+            self._index.insert(i, *box)
+
+    def project(self, lat: float, lon: float) -> tuple[float, float]:
+        return lon * self._kx, lat * self._ky
+
+    def near(self, box: tuple[float, float, float, float], radius_m: float) -> list[int]:
+        """Segments whose grid cells come within radius_m of a lat/lon box."""
+        return sorted(self._index.query(*box, pad_m=radius_m))
+
+    def point_distance(self, lat: float, lon: float, segments: list[int]) -> float:
+        p = self.project(lat, lon)
+        return min(
+            (_point_distance(p, *self.segments[i]) for i in segments), default=math.inf
+        )
+
+    def line_within(
+        self, geometry: list[dict[str, float]], segments: list[int], radius_m: float
+    ) -> bool:
+        """Whether any segment of a way comes within radius_m of the given route segments."""
+        line = [self.project(pt["lat"], pt["lon"]) for pt in geometry]
+        edges = list(zip(line, line[1:], strict=False)) or [(line[0], line[0])]
+        for c, d in edges:
+            for i in segments:
+                a, b = self.segments[i]
+                # Cheap box rejection before the exact distance
+                if (
+                    max(c[0], d[0]) < min(a[0], b[0]) - radius_m
+                    or min(c[0], d[0]) > max(a[0], b[0]) + radius_m
+                    or max(c[1], d[1]) < min(a[1], b[1]) - radius_m
+                    or min(c[1], d[1]) > max(a[1], b[1]) + radius_m
+                ):
+                    continue
+                if _segment_distance(a, b, c, d) <= radius_m:
+                    return True
+        return False
+
+
+class OverpassStore:
+    """
+    Way and node elements from merged Overpass responses, indexed by ID and grid cell.
+
+    Elements keep the order in which Overpass first returned them, so a
+    route's selection looks like the response its own query would produce.
+    """
+
+    def __init__(self, responses: list[dict[str, Any]]) -> None:
+        """
+        Args:
+            responses: Overpass JSON responses (out geom) to load; elements
+                repeated across tiles are stored once.
+        """
+        self._elements: list[dict[str, Any]] = []
+        self._ways: dict[int, int] = {}
+        self._nodes: dict[int, int] = {}
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._boxes: dict[int, tuple[float, float, float, float]] = {}
+
+        for response in responses:
+            for elem in response.get("elements", []):
+                kind = elem.get("type")
+                index = self._ways if kind == "way" else self._nodes if kind == "node" else None
+                if index is None or elem.get("id") in index:
+                    continue
+                position = len(self._elements)
+                self._elements.append(elem)
+                index[elem["id"]] = position
+                self._index_element(elem, position)
+
+    def _index_element(self, elem: dict[str, Any], position: int) -> None:
+        if elem["type"] == "node":
+            if "lat" in elem and "lon" in elem:
+                self._boxes[position] = (elem["lat"], elem["lon"], elem["lat"], elem["lon"])
+                self._cells.setdefault(_cell(elem["lat"], elem["lon"]), []).append(position)
+            return
+        box = bounding_box(pt for pt in elem.get("geometry") or [] if pt and "lat" in pt)
+        if box is None:
+            return
+        self._boxes[position] = box
+        lat_min, lon_min = _cell(box[0], box[1])
+        lat_max, lon_max = _cell(box[2], box[3])
+        for i in range(lat_min, lat_max + 1):
+            for j in range(lon_min, lon_max + 1):
+                self._cells.setdefault((i, j), []).append(position)
+
+    @property
+    def element_count(self) -> int:
+        return len(self._elements)
+
+    def has_ways(self, way_ids: set[int]) -> bool:
+        """Whether every one of the given way IDs is in the store."""
+        return way_ids <= self._ways.keys()
+
+    def _candidates(self, corridor: _Corridor, radius_m: float) -> set[int]:
+        """Positions of elements indexed in cells within radius_m of a route segment."""
+        dlat = radius_m / METRES_PER_DEGREE_LAT
+        found: set[int] = set()
+        for min_lat, min_lon, max_lat, max_lon in corridor.boxes:
+            dlon = dlat / max(math.cos(math.radians(max_lat)), 0.01)
+            lat_min, lon_min = _cell(min_lat - dlat, min_lon - dlon)
+            lat_max, lon_max = _cell(max_lat + dlat, max_lon + dlon)
+            for i in range(lat_min, lat_max + 1):
+                for j in range(lon_min, lon_max + 1):
+                    found.update(self._cells.get((i, j), ()))
+        return found
+
+    def route_data(
+        self,
+        route_coords: list[list[float]],
+        on_route_way_ids: set[int] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Select the elements a per-route Overpass query would return.
+
+        Distances are measured to the sampled route polyline, as Overpass
+        does for an around point list, so ways crossing the route between
+        sampled points are kept.
+
+        Args:
+            route_coords: Route geometry as [lon, lat] pairs.
+            on_route_way_ids: Way IDs from Valhalla trace_attributes, or None
+                to select barriers by proximity.
+
+        Returns:
+            Overpass-shaped response dict ({"elements": [...]}).
+        """
+        if not route_coords:
+            return {"elements": []}
+        corridor = _Corridor([(lat, lon) for lon, lat in sample_route_points(route_coords)])
+        radius = max(WAY_BUFFER_M, CROSSING_RADIUS_M, BARRIER_RADIUS_M)
+
+        on_route_nodes: set[int] = set()
+        for way_id in on_route_way_ids or ():
+            position = self._ways.get(way_id)
+            if position is not None:
+                on_route_nodes.update(self._elements[position].get("nodes", []))
+
+        selected: set[int] = set()
+        for position in self._candidates(corridor, radius):
+            segments = corridor.near(self._boxes[position], radius)
+            if not segments:
+                continue
+            elem = self._elements[position]
+            tags = elem.get("tags", {})
+            if elem["type"] == "way":
+                geometry = [pt for pt in elem.get("geometry") or [] if pt and "lat" in pt]
+                if "highway" in tags and corridor.line_within(geometry, segments, WAY_BUFFER_M):
+                    selected.add(position)
+                continue
+
+            near = corridor.point_distance(elem["lat"], elem["lon"], segments)
+            if "crossing" in tags and near <= CROSSING_RADIUS_M:
+                selected.add(position)
+            elif _BARRIER_RE.search(tags.get("barrier", "")):
+                if on_route_way_ids:
+                    if elem["id"] in on_route_nodes:
+                        selected.add(position)
+                elif near <= BARRIER_RADIUS_M:
+                    selected.add(position)
+
+        # On-route barriers can lie away from the sampled line, outside the grid search
+        if on_route_way_ids:
+            for node_id in on_route_nodes:
+                position = self._nodes.get(node_id)
+                if position is not None and _BARRIER_RE.search(
+                    self._elements[position].get("tags", {}).get("barrier", "")
+                ):
+                    selected.add(position)
+
+        return {"elements": [self._elements[i] for i in sorted(selected)]}
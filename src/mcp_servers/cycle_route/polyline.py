@@ -2,8 +2,65 @@
 
 Decodes Google-format encoded polylines to [lon, lat] coordinate pairs.
 Valhalla uses 6-digit precision (10^6) instead of Google's standard 5-digit (10^5).
+
+Decoding is vectorised: the string's bytes become a NumPy array, the 5-bit
+chunks of each varint are combined with one reduceat, zigzag-decoded to
+signed deltas, and the deltas are summed with cumsum. Routes can also travel
+in encoded form end to end (see expand_route_geometry), with GeoJSON only
+built where it is published.
 """
 
+from typing import Any
+
+import numpy as np
+
+from src.mcp_servers.cycle_route.infrastructure import route_to_geojson
+
+# Precision Valhalla encodes shapes with
+VALHALLA_PRECISION = 6
+
+
+def decode_polyline_array(encoded: str | None, precision: int = 6) -> np.ndarray:
+    """
+    Decode an encoded polyline string to an (n, 2) float64 array of [lon, lat].
+
+    Args:
+        encoded: Encoded polyline string. None or empty returns an empty array.
+        precision: Decimal precision (6 for Valhalla, 5 for Google standard).
+
+    Returns:
+        Array of [lon, lat] rows in GeoJSON coordinate order.
+
+    Raises:
+        ValueError: If the string is truncated or not a polyline.
+    """
+    if not encoded:
+        return np.empty((0, 2), dtype=np.float64)
+
+    chunks = np.frombuffer(encoded.encode("ascii"), dtype=np.uint8).astype(np.int64) - 63
+    if chunks.min() < 0 or chunks.max() > 0x3F:
+        raise ValueError("Invalid character in encoded polyline")
+
+    # A chunk without the continuation bit (0x20) ends a value
+    ends = np.flatnonzero(chunks < 0x20)
+    if len(ends) == 0 or ends[-1] != len(chunks) - 1 or len(ends) % 2:
+        raise ValueError("Truncated encoded polyline")
+    starts = np.concatenate(([0], ends[:-1] + 1))
+
+    # Shift each chunk by 5 bits per position within its value, then combine
+    value_index = np.repeat(np.arange(len(ends)), ends - starts + 1)
+    shifts = 5 * (np.arange(len(chunks)) - starts[value_index])
+    values = np.add.reduceat((chunks & 0x1F) << shifts, starts)
+
+    # Zigzag decoding: odd values are negative
+    deltas = (values >> 1) ^ -(values & 1)
+
+    factor = 10**precision
+    coords = np.empty((len(deltas) // 2, 2), dtype=np.float64)
+    coords[:, 0] = np.cumsum(deltas[1::2]) / factor
+    coords[:, 1] = np.cumsum(deltas[0::2]) / factor
+    return coords
+
 
 def decode_polyline(
     encoded: str | None,
@@ -19,41 +76,65 @@ def decode_polyline(
     Returns:
         List of [lon, lat] pairs in GeoJSON coordinate order.
     """
-    if not encoded:
-        return []
+    return decode_polyline_array(encoded, precision).tolist()
 
-    factor = 10**precision
-    coords: list[list[float]] = []
-    index = 0
-    lat = 0
-    lon = 0
-    length = len(encoded)
-
-    while index < length:
-        # Decode latitude delta
-        shift = 0
-        result = 0
-        while True:
-            byte = ord(encoded[index]) - 63
-            index += 1
-            result |= (byte & 0x1F) << shift
-            shift += 5
-            if byte < 0x20:
-                break
-        lat += ~(result >> 1) if (result & 1) else (result >> 1)
-
-        # Decode longitude delta
-        shift = 0
-        result = 0
-        while True:
-            byte = ord(encoded[index]) - 63
-            index += 1
-            result |= (byte & 0x1F) << shift
-            shift += 5
-            if byte < 0x20:
-                break
-        lon += ~(result >> 1) if (result & 1) else (result >> 1)
-
-        coords.append([lon / factor, lat / factor])
 
-    return coords
+def encode_polyline(coords: list[list[float]] | np.ndarray, precision: int = 6) -> str:
+    """
+    Encode [lon, lat] pairs as a polyline string.
+
+    Args:
+        coords: [lon, lat] pairs in GeoJSON coordinate order.
+        precision: Decimal precision (6 for Valhalla, 5 for Google standard).
+
+    Returns:
+        Encoded polyline string ("" for no coordinates).
+    """
+    points = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return ""
+
+    scaled = np.round(points[:, ::-1] * 10**precision).astype(np.int64)
+    deltas = np.diff(scaled, axis=0, prepend=0).ravel()
+    values = np.where(deltas < 0, ~(deltas << 1), deltas << 1)
+
+    encoded = []
+    for value in values.tolist():
+        while value >= 0x20:
+            encoded.append(chr((0x20 | (value & 0x1F)) + 63))
+            value >>= 5
+        encoded.append(chr(value + 63))
+    return "".join(encoded)
+
+
+def expand_route_geometry(route: dict[str, Any]) -> dict[str, Any]:
+    """
+    Expand a route assessment's encoded polylines into GeoJSON.
+
+    Results requested with geometry_format="polyline" carry route_polyline
+    and shortest_route_polyline instead of route_geojson and
+    shortest_route_geometry. This restores the GeoJSON fields where routes
+    are published. Results already in GeoJSON are returned unchanged.
+
+    Args:
+        route: One assess_cycle_route result.
+
+    Returns:
+        A copy of the result with GeoJSON geometry fields.
+    """
+    if "route_polyline" not in route and "shortest_route_polyline" not in route:
+        return route
+
+    expanded = dict(route)
+    precision = expanded.pop("polyline_precision", VALHALLA_PRECISION)
+    if "route_polyline" in expanded:
+        expanded["route_geojson"] = route_to_geojson(
+            decode_polyline(expanded.pop("route_polyline"), precision),
+            expanded.get("distance_m", 0),
+            expanded.get("duration_minutes", 0) * 60,
+        )
+    if "shortest_route_polyline" in expanded:
+        expanded["shortest_route_geometry"] = decode_polyline(
+            expanded.pop("shortest_route_polyline"), precision
+        )
+    return expanded
@@ -0,0 +1,52 @@
+"""
+Shared rate limiting for external API calls.
+
+Implements [cycle-route-assessment:NFR-003] - Rate limiting for public services
+
+Route assessments for several destinations run concurrently, but the public
+Overpass API must still see a polite request rate. One ExternalRateLimiter is
+shared by every assessment on a server: it bounds how many calls are in flight
+and spaces their start times by a minimum interval.
+"""
+
+import asyncio
+import time
+from types import TracebackType
+
+
+class ExternalRateLimiter:
+    """Async context manager limiting concurrency and start rate of external calls."""
+
+    def __init__(self, max_concurrent: int, min_interval: float) -> None:
+        """
+        Args:
+            max_concurrent: Maximum number of calls in flight at once.
+            min_interval: Minimum seconds between the starts of consecutive calls.
+        """
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> "ExternalRateLimiter":
+        await self._semaphore.acquire()
+        try:
+            # Reserve the next start slot before awaiting so concurrent callers
+            # queue behind each other instead of all waking at once
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._semaphore.release()
@@ -0,0 +1,171 @@
+"""
+Persistent cache of route assessment results.
+
+Implements [cycle-route-assessment:NFR-001] - Complete within 30s for 3 destinations (cached re-use)
+Implements [cycle-route-assessment:NFR-003] - Rate limiting for public services
+
+Destinations are fixed and the sites of one development cluster sit within
+metres of each other, so reviews keep asking for the same routes. A full
+assessment (both Valhalla routes, trace_attributes, infrastructure data,
+scoring and issues) is cached under a key made of:
+
+- the origin snapped to a grid cell of about cell_m metres,
+- the destination ID and snapped destination position,
+- the costing options of both Valhalla requests,
+- the data version: the Valhalla tileset and the OSM data the
+  infrastructure backend reads.
+
+Refreshing Valhalla tiles or the local OSM extract changes the data version,
+so earlier entries are never read again and age out through the TTL and LRU
+size cap. Results are stored with encoded polylines and expanded to GeoJSON
+on the way out when that is what the caller asked for.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.mcp_servers.cycle_route.disk_cache import DiskJSONCache
+from src.mcp_servers.cycle_route.spatial_index import METRES_PER_DEGREE_LAT
+
+logger = structlog.get_logger(__name__)
+
+
+class RouteResultCache(DiskJSONCache):
+    """Disk-backed cache of assess_cycle_route results keyed by snapped endpoints."""
+
+    CACHE_FORMAT = "route-assessment"
+    # 2: results carry shortest_route_score and shortest_route_provision_breakdown
+    CACHE_FORMAT_VERSION = 2
+
+    DEFAULT_TTL_SECONDS = 7 * 86400.0
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    DEFAULT_CELL_M = 25.0
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cell_m: float = DEFAULT_CELL_M,
+    ) -> None:
+        """
+        Initialize the route result cache.
+
+        Args:
+            cache_dir: Directory for cache files (created on first write).
+            ttl_seconds: Seconds a result is served.
+            max_bytes: Total size of entries on disk before LRU eviction.
+            cell_m: Grid cell size in metres that origins and destinations
+                are snapped to.
+        """
+        super().__init__(cache_dir, ttl_seconds, max_bytes=max_bytes)
+        self.cell_m = cell_m
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "RouteResultCache | None":
+        """Create a cache from ROUTE_CACHE_DIR (None when unset) and its sizing variables."""
+        cache_dir = os.getenv("ROUTE_CACHE_DIR")
+        if not cache_dir:
+            return None
+        return cls(
+            cache_dir,
+            ttl_seconds=float(os.getenv("ROUTE_CACHE_TTL", str(cls.DEFAULT_TTL_SECONDS))),
+            max_bytes=int(
+                float(os.getenv("ROUTE_CACHE_MAX_MB", str(cls.DEFAULT_MAX_BYTES / 2**20)))
+                * 2**20
+            ),
+            cell_m=float(os.getenv("ROUTE_CACHE_CELL_M", str(cls.DEFAULT_CELL_M))),
+        )
+
+    def snap(self, lon: float, lat: float) -> tuple[int, int]:
+        """
+        Grid cell (row, column) containing a point.
+
+        Rows are cell_m tall; each row's columns are cell_m wide at the
+        row's centre latitude, so cells stay roughly square.
+        """
+        dlat = self.cell_m / METRES_PER_DEGREE_LAT
+        row = math.floor(lat / dlat)
+        dlon = dlat / max(math.cos(math.radians((row + 0.5) * dlat)), 0.01)
+        return row, math.floor(lon / dlon)
+
+    def route_key(
+        self,
+        origin: tuple[float, float],
+        destination: tuple[float, float],
+        destination_id: str | None,
+        costing_options: Any,
+        data_version: str,
+    ) -> str:
+        """
+        Build the cache key for one route.
+
+        Args:
+            origin: Origin (lon, lat).
+            destination: Destination (lon, lat).
+            destination_id: Caller's destination ID, if any.
+            costing_options: Valhalla costing options the route is planned with.
+            data_version: Version of the routing tiles and OSM data.
+
+        Returns:
+            Key text for read() and write().
+        """
+        costing = hashlib.sha256(
+            json.dumps(costing_options, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+        return json.dumps(
+            {
+                "cell_m": self.cell_m,
+                "origin": self.snap(*origin),
+                "destination": self.snap(*destination),
+                "destination_id": destination_id,
+                "costing": costing,
+                "data_version": data_version,
+            },
+            sort_keys=True,
+        )
+
+    async def get(self, key: str, label: str = "") -> dict[str, Any] | None:
+        """Get a cached result, or None on a miss."""
+        data, state = await asyncio.to_thread(self.read, key)
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        logger.info(
+            "Route cache hit" if data is not None else "Route cache miss",
+            destination=label,
+            state=state,
+            hit_rate=self._hit_rate(),
+        )
+        return data
+
+    async def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store a result; a failed write is logged and does not fail the assessment."""
+        try:
+            await asyncio.to_thread(self.write, key, result)
+        except OSError as e:
+            logger.warning("Route cache write failed", error=str(e))
+
+    def _hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return round(self.hits / total, 3) if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters for this process and the cache's size on disk."""
+        return {
+            **super().stats(),
+            "cell_m": self.cell_m,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self._hit_rate(),
+        }
@@ -16,12 +16,23 @@ Implements test scenarios:
 - [cycle-route-assessment:CycleRouteMCP/TS-03] assess_cycle_route returns full assessment
 - [cycle-route-assessment:CycleRouteMCP/TS-04] assess_cycle_route handles no route
 - [cycle-route-assessment:CycleRouteMCP/TS-05] Large site centroid noted
+- [cycle-route-assessment:CycleRouteMCP/TS-06] assess_cycle_routes_batch assesses
+  destinations concurrently
+- [cycle-route-assessment:CycleRouteMCP/TS-07] assess_cycle_routes_batch shares one
+  merged Overpass query across routes
+- [cycle-route-assessment:CycleRouteMCP/TS-08] screen_destinations shortlists
+  destinations by cycle time from one Valhalla matrix request
 """
 
 import asyncio
+import hashlib
 import json
 import os
-from typing import Any
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import Any, Literal
 
 import httpx
 import structlog
@@ -29,6 +40,7 @@ from mcp.server import Server
 from mcp.types import TextContent, Tool
 from pydantic import BaseModel, Field
 from starlette.applications import Starlette
+from starlette.responses import JSONResponse
 
 from src.mcp_servers.cycle_route.geojson import parse_arcgis_response
 from src.mcp_servers.cycle_route.infrastructure import (
@@ -47,7 +59,20 @@ from src.mcp_servers.cycle_route.issues import (
     generate_s106_suggestions,
     identify_issues,
 )
-from src.mcp_servers.cycle_route.polyline import decode_polyline
+from src.mcp_servers.cycle_route.osm_store import LocalOSMStore
+from src.mcp_servers.cycle_route.overpass_cache import OverpassCache
+from src.mcp_servers.cycle_route.overpass_store import (
+    MERGED_QUERY_HTTP_TIMEOUT,
+    OverpassStore,
+    build_merged_overpass_tiles,
+)
+from src.mcp_servers.cycle_route.polyline import (
+    VALHALLA_PRECISION,
+    decode_polyline,
+    expand_route_geometry,
+)
+from src.mcp_servers.cycle_route.rate_limit import ExternalRateLimiter
+from src.mcp_servers.cycle_route.route_cache import RouteResultCache
 from src.mcp_servers.cycle_route.scoring import score_route
 
 logger = structlog.get_logger(__name__)
@@ -69,6 +94,58 @@ USER_AGENT = "BBUGCycleRouteAssessment/1.0 (cycling-advocacy-tool)"
 # Rate limit delay between external calls (seconds)
 EXTERNAL_API_DELAY = 0.5
 
+# Overpass calls in flight at once across all assessments (public API slots)
+DEFAULT_OVERPASS_MAX_CONCURRENT = 2
+
+# Valhalla requests in flight at once (local routing engine)
+DEFAULT_VALHALLA_MAX_CONCURRENT = 8
+
+# Valhalla request timeout (seconds); trace_attributes on long routes is the slowest call
+VALHALLA_TIMEOUT_SECONDS = 20.0
+
+# Seconds an idle pooled Valhalla connection is kept open for reuse
+VALHALLA_KEEPALIVE_SECONDS = 60.0
+
+# On-route way ID sets from trace_attributes kept per route shape
+WAY_ID_CACHE_SIZE = 1024
+
+# Maximum destinations in one assess_cycle_routes_batch call
+MAX_BATCH_DESTINATIONS = 25
+
+# Maximum destinations in one screen_destinations call (one Valhalla matrix row)
+MAX_SCREEN_DESTINATIONS = 100
+
+# Cycle time beyond which screen_destinations drops a destination (minutes)
+DEFAULT_MAX_CYCLE_MINUTES = 30.0
+
+# Infrastructure data backends: live Overpass API or the local OSM store
+INFRASTRUCTURE_BACKENDS = ("overpass", "local")
+
+# Local OSM store built by src.scripts.build_osm_store
+DEFAULT_OSM_STORE_PATH = "/data/osm/oxfordshire.sqlite"
+
+# Valhalla bicycle costing for the two routes planned to each destination:
+# the shortest, for directness comparison, and the safest, which is assessed
+SHORTEST_COSTING_OPTIONS = {"bicycle": {"shortest": True}}
+SAFEST_COSTING_OPTIONS = {"bicycle": {
+    "use_roads": 0.1,
+    "avoid_bad_surfaces": 0.6,
+    "use_hills": 0.3,
+}}
+
+# Seconds the routing/OSM data version behind route cache keys is reused
+# before Valhalla's /status is asked again
+DATA_VERSION_CHECK_INTERVAL = 300.0
+
+# Route line geometry in results: GeoJSON, or Valhalla's encoded polylines
+GeometryFormat = Literal["geojson", "polyline"]
+
+GEOMETRY_FORMAT_DESCRIPTION = (
+    "Route line geometry: 'geojson' (route_geojson, shortest_route_geometry) or "
+    "'polyline' (route_polyline, shortest_route_polyline as precision-6 encoded "
+    "polylines, several times smaller)"
+)
+
 
 # =============================================================================
 # Tool Input Schemas
@@ -91,6 +168,91 @@ class AssessCycleRouteInput(BaseModel):
         default="Destination",
         description="Human-readable destination name",
     )
+    geometry_format: GeometryFormat = Field(
+        default="geojson",
+        description=GEOMETRY_FORMAT_DESCRIPTION,
+    )
+
+
+class BatchDestination(BaseModel):
+    """A destination in an assess_cycle_routes_batch call."""
+    id: str | None = Field(
+        default=None,
+        description="Caller's destination ID, echoed back as destination_id",
+    )
+    name: str = Field(default="Destination", description="Human-readable destination name")
+    lon: float = Field(description="Destination longitude (WGS84)")
+    lat: float = Field(description="Destination latitude (WGS84)")
+
+
+class AssessCycleRoutesBatchInput(BaseModel):
+    """Input schema for assess_cycle_routes_batch tool."""
+    origin_lon: float = Field(description="Origin longitude (WGS84)")
+    origin_lat: float = Field(description="Origin latitude (WGS84)")
+    destinations: list[BatchDestination] = Field(
+        min_length=1,
+        max_length=MAX_BATCH_DESTINATIONS,
+        description="Destinations to assess from the origin",
+    )
+    merge_overpass: bool = Field(
+        default=True,
+        description=(
+            "Fetch infrastructure for all routes with one merged Overpass query "
+            "instead of one query per route"
+        ),
+    )
+    geometry_format: GeometryFormat = Field(
+        default="geojson",
+        description=GEOMETRY_FORMAT_DESCRIPTION,
+    )
+
+
+class ScreenDestinationsInput(BaseModel):
+    """Input schema for screen_destinations tool."""
+    origin_lon: float = Field(description="Origin longitude (WGS84)")
+    origin_lat: float = Field(description="Origin latitude (WGS84)")
+    destinations: list[BatchDestination] = Field(
+        min_length=1,
+        max_length=MAX_SCREEN_DESTINATIONS,
+        description="Destinations to screen from the origin",
+    )
+    max_cycle_minutes: float = Field(
+        default=DEFAULT_MAX_CYCLE_MINUTES,
+        gt=0,
+        description="Destinations further than this by bicycle are screened out",
+    )
+    max_shortlist: int = Field(
+        default=MAX_BATCH_DESTINATIONS,
+        ge=1,
+        le=MAX_BATCH_DESTINATIONS,
+        description="Shortlist at most this many destinations, nearest first",
+    )
+
+
+@dataclass
+class RoutePlan:
+    """Valhalla routes to one destination, ready for infrastructure analysis."""
+
+    dest_name: str
+    # Safest route: the one assessed (encoded shape and decoded [lon, lat] pairs)
+    shape: str
+    coords: list[list[float]]
+    distance_m: float
+    duration_s: float
+    # Shortest route: distance and geometry for directness comparison, and a
+    # score when the safest route's infrastructure data covers its ways
+    shortest_shape: str
+    shortest_distance_m: float
+    same_route: bool
+    shortest_duration_s: float = 0.0
+    # On-route OSM way IDs from trace_attributes (None if unavailable)
+    way_ids: set[int] | None = None
+    shortest_way_ids: set[int] | None = None
+
+    @property
+    def shortest_coords(self) -> list[list[float]]:
+        """Shortest route [lon, lat] pairs, decoded only when needed."""
+        return decode_polyline(self.shortest_shape)
 
 
 # =============================================================================
@@ -105,10 +267,47 @@ class CycleRouteMCP:
         arcgis_url: str | None = None,
         valhalla_url: str | None = None,
         http_client: httpx.AsyncClient | None = None,
+        overpass_limiter: ExternalRateLimiter | None = None,
+        infrastructure_backend: str | None = None,
+        osm_store: LocalOSMStore | None = None,
+        overpass_cache: OverpassCache | None = None,
+        route_cache: RouteResultCache | None = None,
+        valhalla_client: httpx.AsyncClient | None = None,
     ) -> None:
         self.arcgis_url = arcgis_url or os.getenv("ARCGIS_PLANNING_URL", DEFAULT_ARCGIS_URL)
         self.valhalla_url = valhalla_url or os.getenv("VALHALLA_URL", DEFAULT_VALHALLA_URL)
         self._http = http_client
+        # Valhalla gets its own keep-alive pool unless a client was supplied
+        self._valhalla_http = valhalla_client or http_client
+        self.infrastructure_backend = infrastructure_backend or (
+            "local" if osm_store else os.getenv("INFRASTRUCTURE_BACKEND", "overpass")
+        )
+        if self.infrastructure_backend not in INFRASTRUCTURE_BACKENDS:
+            raise ValueError(
+                f"Unknown infrastructure backend: {self.infrastructure_backend} "
+                f"(expected one of {', '.join(INFRASTRUCTURE_BACKENDS)})"
+            )
+        self.osm_store_path = os.getenv("OSM_STORE_PATH", DEFAULT_OSM_STORE_PATH)
+        self._osm_store = osm_store
+        self._overpass_cache = overpass_cache or OverpassCache.from_env()
+        self._route_cache = route_cache or RouteResultCache.from_env()
+        self._data_version: str | None = None
+        self._data_version_checked_at: float | None = None
+        self._data_version_lock = asyncio.Lock()
+        # Shared by every concurrent assessment so Overpass sees one polite client
+        self._overpass_limiter = overpass_limiter or ExternalRateLimiter(
+            max_concurrent=int(
+                os.getenv("OVERPASS_MAX_CONCURRENT", str(DEFAULT_OVERPASS_MAX_CONCURRENT))
+            ),
+            min_interval=EXTERNAL_API_DELAY,
+        )
+        self.valhalla_max_concurrent = int(
+            os.getenv("VALHALLA_MAX_CONCURRENT", str(DEFAULT_VALHALLA_MAX_CONCURRENT))
+        )
+        self._valhalla_semaphore = asyncio.Semaphore(self.valhalla_max_concurrent)
+        # Route shape hash -> on-route way IDs, least recently used first
+        self._way_id_cache: OrderedDict[str, set[int]] = OrderedDict()
+        self._way_id_requests: dict[str, asyncio.Task[set[int] | None]] = {}
         self.server = Server("cycle-route-mcp")
         self._setup_handlers()
 
@@ -121,6 +320,43 @@ class CycleRouteMCP:
             )
         return self._http
 
+    @property
+    def valhalla_http(self) -> httpx.AsyncClient:
+        """
+        Get the client for Valhalla requests.
+
+        A keep-alive pool sized to VALHALLA_MAX_CONCURRENT, so the route,
+        trace_attributes and matrix requests of concurrent assessments reuse
+        warm connections instead of sharing the pool of external API calls.
+        """
+        if self._valhalla_http is None:
+            self._valhalla_http = httpx.AsyncClient(
+                timeout=VALHALLA_TIMEOUT_SECONDS,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=self.valhalla_max_concurrent,
+                    max_keepalive_connections=self.valhalla_max_concurrent,
+                    keepalive_expiry=VALHALLA_KEEPALIVE_SECONDS,
+                ),
+            )
+        return self._valhalla_http
+
+    @property
+    def overpass_cache(self) -> OverpassCache | None:
+        """Get the Overpass response cache (None when disabled)."""
+        return self._overpass_cache
+
+    @property
+    def route_cache(self) -> RouteResultCache | None:
+        """Get the route assessment result cache (None when disabled)."""
+        return self._route_cache
+
+    @property
+    def osm_store(self) -> LocalOSMStore:
+        if self._osm_store is None:
+            self._osm_store = LocalOSMStore(self.osm_store_path)
+        return self._osm_store
+
     def _setup_handlers(self) -> None:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
@@ -145,6 +381,27 @@ class CycleRouteMCP:
                     ),
                     inputSchema=AssessCycleRouteInput.model_json_schema(),
                 ),
+                Tool(
+                    name="assess_cycle_routes_batch",
+                    description=(
+                        "Assess cycling routes from one origin to several destinations "
+                        "concurrently. Each destination gets the same result as "
+                        "assess_cycle_route, returned in input order with its "
+                        "destination_id."
+                    ),
+                    inputSchema=AssessCycleRoutesBatchInput.model_json_schema(),
+                ),
+                Tool(
+                    name="screen_destinations",
+                    description=(
+                        "Pre-screen destinations before route assessment with one "
+                        "Valhalla matrix request from the origin. Returns each "
+                        "destination's cycle time and distance, nearest first, and "
+                        "shortlists those within max_cycle_minutes for "
+                        "assess_cycle_routes_batch."
+                    ),
+                    inputSchema=ScreenDestinationsInput.model_json_schema(),
+                ),
             ]
 
         @self.server.call_tool()
@@ -154,6 +411,10 @@ class CycleRouteMCP:
                     result = await self._get_site_boundary(arguments)
                 elif name == "assess_cycle_route":
                     result = await self._assess_cycle_route(arguments)
+                elif name == "assess_cycle_routes_batch":
+                    result = await self._assess_cycle_routes_batch(arguments)
+                elif name == "screen_destinations":
+                    result = await self._screen_destinations(arguments)
                 else:
                     result = {
                         "status": "error",
@@ -213,29 +474,125 @@ class CycleRouteMCP:
         }
 
     async def _assess_single_route(
+        self,
+        plan: RoutePlan,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """
+        Assess a planned route: fetch its infrastructure, parse segments,
+        run parallel detection, score, and identify issues.
+
+        Returns:
+            Tuple of (safest route assessment or None if no infrastructure
+            data, shortest route summary or None; see _assess_shortest_route).
+        """
+        overpass_data = await self._fetch_infrastructure(plan.coords, plan.way_ids, plan.dest_name)
+
+        assessment = self._analyse_route(
+            plan.coords, plan.distance_m, plan.duration_s,
+            plan.dest_name, overpass_data, shortest_distance_m=plan.shortest_distance_m,
+        )
+        shortest = None
+        if overpass_data is not None and not plan.same_route and plan.shortest_way_ids:
+            shortest = self._assess_shortest_route(plan, OverpassStore([overpass_data]))
+        return assessment, shortest
+
+    def _assess_shortest_route(
+        self,
+        plan: RoutePlan,
+        store: OverpassStore | None,
+    ) -> dict[str, Any] | None:
+        """
+        Score the shortest route from infrastructure already fetched.
+
+        Only the safest route's infrastructure is queried. When every way the
+        shortest route follows is already in the store (the routes share a
+        corridor, or a merged batch fetched it for another route), the
+        shortest route is analysed from the store without another query.
+
+        Returns:
+            Dict with the shortest route's "score" and "provision_breakdown",
+            or None if the routes coincide or the store does not cover it.
+        """
+        if (
+            store is None
+            or plan.same_route
+            or not plan.shortest_way_ids
+            or not store.has_ways(plan.shortest_way_ids)
+        ):
+            return None
+        coords = plan.shortest_coords
+        assessment = self._analyse_route(
+            coords, plan.shortest_distance_m, plan.shortest_duration_s, plan.dest_name,
+            store.route_data(coords, plan.shortest_way_ids),
+            shortest_distance_m=plan.shortest_distance_m,
+        )
+        if assessment is None:
+            return None
+        return {
+            "score": assessment["score"],
+            "provision_breakdown": assessment["provision_breakdown"],
+        }
+
+    async def _fetch_infrastructure(
+        self,
+        route_coords: list[list[float]],
+        on_route_way_ids: set[int] | None,
+        dest_name: str,
+    ) -> dict[str, Any] | None:
+        """
+        Fetch Overpass-shaped infrastructure data for one route.
+
+        Uses the local OSM store when the infrastructure backend is "local"
+        (no external calls, so no rate limiting), otherwise the Overpass API.
+        """
+        if self.infrastructure_backend == "local":
+            return await asyncio.to_thread(
+                self.osm_store.query_route, route_coords, on_route_way_ids
+            )
+        overpass_query = build_overpass_query(route_coords, on_route_way_ids=on_route_way_ids)
+        return await self._query_overpass(overpass_query, dest_name)
+
+    async def _query_overpass(
+        self,
+        query: str,
+        label: str,
+        timeout: float | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Answer one Overpass query from the response cache, or send it
+        through the shared rate limiter.
+
+        Args:
+            query: Overpass QL query text.
+            label: Destination or tile label for logs.
+            timeout: HTTP timeout for the live request (default: the client's).
+        """
+
+        async def live() -> dict[str, Any] | None:
+            async with self._overpass_limiter:
+                return await query_overpass_resilient(
+                    self.http, query, destination=label, timeout=timeout
+                )
+
+        if self._overpass_cache is None:
+            return await live()
+        return await self._overpass_cache.fetch(query, live, label)
+
+    def _analyse_route(
         self,
         route_coords: list[list[float]],
         cycling_distance_m: float,
         cycling_duration_s: float,
         dest_name: str,
+        overpass_data: dict[str, Any] | None,
         shortest_distance_m: float | None = None,
     ) -> dict[str, Any] | None:
         """
-        Assess a single route: query Overpass, parse segments,
-        run parallel detection, score, and identify issues.
+        Parse segments from Overpass data for one route, run parallel
+        detection and transition analysis, score, and identify issues.
 
         Returns route assessment dict or None if no infrastructure data.
         """
-        # Identify on-route way IDs for barrier filtering
-        on_route_way_ids = await self._request_trace_attributes(route_coords, dest_name)
-
-        # Rate limit before Overpass call
-        await asyncio.sleep(EXTERNAL_API_DELAY)
-
-        overpass_query = build_overpass_query(route_coords, on_route_way_ids=on_route_way_ids)
-        overpass_data = await query_overpass_resilient(
-            self.http, overpass_query, destination=dest_name,
-        )
         if overpass_data is None:
             return None
 
@@ -307,10 +664,11 @@ class CycleRouteMCP:
             body["costing_options"] = costing_options
 
         try:
-            response = await self.http.post(
-                f"{self.valhalla_url}/route",
-                json=body,
-            )
+            async with self._valhalla_semaphore:
+                response = await self.valhalla_http.post(
+                    f"{self.valhalla_url}/route",
+                    json=body,
+                )
             if response.status_code != 200:
                 return None
             data = response.json()
@@ -320,22 +678,112 @@ class CycleRouteMCP:
         except Exception:
             return None
 
+    async def _request_valhalla_matrix(
+        self,
+        origin_lon: float,
+        origin_lat: float,
+        targets: list[tuple[float, float]],
+    ) -> list[dict[str, Any] | None] | None:
+        """
+        Request bicycle times and distances from one origin to many targets.
+
+        Uses Valhalla's sources_to_targets with the safest-route costing, so
+        times match the route that gets assessed.
+
+        Args:
+            origin_lon: Origin longitude.
+            origin_lat: Origin latitude.
+            targets: (lon, lat) per target.
+
+        Returns:
+            One matrix cell ({"time": s, "distance": km, ...}) or None per
+            target in input order, or None if the request failed.
+        """
+        body = {
+            "sources": [{"lon": origin_lon, "lat": origin_lat}],
+            "targets": [{"lon": lon, "lat": lat} for lon, lat in targets],
+            "costing": "bicycle",
+            "costing_options": SAFEST_COSTING_OPTIONS,
+            "units": "kilometers",
+        }
+        try:
+            async with self._valhalla_semaphore:
+                response = await self.valhalla_http.post(
+                    f"{self.valhalla_url}/sources_to_targets",
+                    json=body,
+                )
+            if response.status_code != 200:
+                logger.warning(
+                    "Valhalla matrix request failed",
+                    status_code=response.status_code,
+                    targets=len(targets),
+                )
+                return None
+            rows = response.json().get("sources_to_targets") or []
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Valhalla matrix request failed", error=str(e), targets=len(targets))
+            return None
+
+        if not rows or not isinstance(rows[0], list):
+            logger.warning("Valhalla matrix response has no rows", targets=len(targets))
+            return None
+        cells = {cell.get("to_index", i): cell for i, cell in enumerate(rows[0])}
+        return [cells.get(i) for i in range(len(targets))]
+
+    async def _get_way_ids(self, shape: str, dest_name: str = "") -> set[int] | None:
+        """
+        Get on-route OSM way IDs for an encoded route shape.
+
+        Results are cached per shape hash, and concurrent lookups of one shape
+        (shortest and safest routes that coincide, destinations reached by the
+        same route) share a single trace_attributes request. Failures are not
+        cached.
+
+        Returns:
+            Set of way IDs (shared; do not modify), or None on failure.
+        """
+        key = hashlib.sha256(shape.encode("ascii")).hexdigest()
+        cached = self._way_id_cache.get(key)
+        if cached is not None:
+            self._way_id_cache.move_to_end(key)
+            return cached
+
+        task = self._way_id_requests.get(key)
+        if task is None:
+            task = asyncio.create_task(self._request_trace_attributes(shape, dest_name))
+            self._way_id_requests[key] = task
+        try:
+            way_ids = await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._way_id_requests.pop(key, None)
+
+        if way_ids is not None:
+            self._way_id_cache[key] = way_ids
+            while len(self._way_id_cache) > WAY_ID_CACHE_SIZE:
+                self._way_id_cache.popitem(last=False)
+        return way_ids
+
     async def _request_trace_attributes(
         self,
-        route_coords: list[list[float]],
+        route: list[list[float]] | str,
         dest_name: str = "",
     ) -> set[int] | None:
         """Request on-route OSM way IDs via Valhalla trace_attributes.
 
-        Posts the route shape to Valhalla's /trace_attributes endpoint with
+        Posts the route to Valhalla's /trace_attributes endpoint with
         edge_walk matching to identify exact OSM way IDs the route follows.
+        A Valhalla encoded polyline (precision 6) is posted as is, several
+        times smaller than the equivalent list of points.
+
+        Args:
+            route: Route as [lon, lat] pairs or a Valhalla encoded polyline.
+            dest_name: Destination name for logs.
 
         Returns a set of non-zero way IDs, or None on any failure.
         """
         try:
-            shape = [{"lat": coord[1], "lon": coord[0]} for coord in route_coords]
-            body = {
-                "shape": shape,
+            body: dict[str, Any] = {
                 "costing": "bicycle",
                 "shape_match": "edge_walk",
                 "filters": {
@@ -343,11 +791,15 @@ class CycleRouteMCP:
                     "action": "include",
                 },
             }
-            response = await self.http.post(
-                f"{self.valhalla_url}/trace_attributes",
-                json=body,
-                timeout=10.0,
-            )
+            if isinstance(route, str):
+                body["encoded_polyline"] = route
+            else:
+                body["shape"] = [{"lat": coord[1], "lon": coord[0]} for coord in route]
+            async with self._valhalla_semaphore:
+                response = await self.valhalla_http.post(
+                    f"{self.valhalla_url}/trace_attributes",
+                    json=body,
+                )
             if response.status_code != 200:
                 logger.warning(
                     "trace_attributes request failed",
@@ -379,12 +831,445 @@ class CycleRouteMCP:
 
     async def _assess_cycle_route(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """Assess cycling route between two points with dual Valhalla routing."""
-        origin_lon = arguments["origin_lon"]
-        origin_lat = arguments["origin_lat"]
-        dest_lon = arguments["destination_lon"]
-        dest_lat = arguments["destination_lat"]
-        dest_name = arguments.get("destination_name", "Destination")
+        return await self._assess_destination(
+            arguments["origin_lon"],
+            arguments["origin_lat"],
+            arguments["destination_lon"],
+            arguments["destination_lat"],
+            arguments.get("destination_name", "Destination"),
+            geometry_format=arguments.get("geometry_format", "geojson"),
+        )
+
+    async def _assess_cycle_routes_batch(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """
+        Assess routes from one origin to several destinations concurrently.
+
+        Valhalla requests for all destinations run together against the local
+        routing engine; only Overpass calls are throttled, by the shared limiter.
+        With merge_overpass (the default) all route corridors are fetched with
+        one merged Overpass query and each route's elements are selected from
+        the shared result. A failure for one destination becomes an error
+        entry in its slot and does not affect the others.
+
+        Returns:
+            Dict with per-destination results in input order under "routes",
+            each carrying the caller's destination_id.
+        """
+        params = AssessCycleRoutesBatchInput(**arguments)
 
+        logger.info(
+            "Assessing cycle routes batch",
+            destinations=len(params.destinations),
+            origin=f"{params.origin_lat:.4f},{params.origin_lon:.4f}",
+            merge_overpass=params.merge_overpass,
+            backend=self.infrastructure_backend,
+        )
+
+        # Merging only saves external calls; local store queries are per route
+        if params.merge_overpass and self.infrastructure_backend == "overpass":
+            routes = await self._assess_batch_merged(params)
+        else:
+            routes = await asyncio.gather(*(
+                self._batch_step(dest.name, self._assess_destination(
+                    params.origin_lon, params.origin_lat, dest.lon, dest.lat, dest.name,
+                    geometry_format=params.geometry_format,
+                    dest_id=dest.id,
+                ))
+                for dest in params.destinations
+            ))
+
+        for dest, result in zip(params.destinations, routes, strict=True):
+            result.setdefault("destination", dest.name)
+            result["destination_id"] = dest.id
+        assessed = sum(1 for r in routes if r["status"] == "success")
+
+        logger.info(
+            "Cycle routes batch assessed",
+            assessed=assessed,
+            failed=len(routes) - assessed,
+        )
+
+        return {
+            "status": "success",
+            "routes": list(routes),
+            "assessed": assessed,
+            "failed": len(routes) - assessed,
+        }
+
+    async def _screen_destinations(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """
+        Shortlist destinations by cycle time before detailed assessment.
+
+        One Valhalla matrix request gives the cycle time and distance to every
+        destination. Destinations are ranked nearest first; those with no route
+        or beyond max_cycle_minutes are screened out, as are any past the first
+        max_shortlist within the limit.
+
+        Returns:
+            Dict with every destination under "destinations" (nearest first,
+            unreachable last), each with its input index, matrix result,
+            "shortlisted" flag and "screen_reason" (None when shortlisted);
+            or a matrix_unavailable error.
+        """
+        params = ScreenDestinationsInput(**arguments)
+
+        cells = await self._request_valhalla_matrix(
+            params.origin_lon,
+            params.origin_lat,
+            [(dest.lon, dest.lat) for dest in params.destinations],
+        )
+        if cells is None:
+            return {
+                "status": "error",
+                "error_type": "matrix_unavailable",
+                "message": "Valhalla matrix request failed; destinations were not screened",
+            }
+
+        entries = []
+        for index, (dest, cell) in enumerate(zip(params.destinations, cells, strict=True)):
+            time_s = cell.get("time") if cell else None
+            distance_km = cell.get("distance") if cell else None
+            entries.append({
+                "index": index,
+                "destination_id": dest.id,
+                "destination": dest.name,
+                "reachable": time_s is not None,
+                "cycle_minutes": round(time_s / 60, 1) if time_s is not None else None,
+                "distance_m": round(distance_km * 1000) if distance_km is not None else None,
+            })
+
+        # Nearest first, unreachable last
+        entries.sort(key=lambda e: (not e["reachable"], e["cycle_minutes"] or 0.0, e["index"]))
+        shortlisted = 0
+        for entry in entries:
+            if not entry["reachable"]:
+                reason = "unreachable"
+            elif entry["cycle_minutes"] > params.max_cycle_minutes:
+                reason = "too_far"
+            elif shortlisted >= params.max_shortlist:
+                reason = "beyond_shortlist"
+            else:
+                reason = None
+                shortlisted += 1
+            entry["shortlisted"] = reason is None
+            entry["screen_reason"] = reason
+
+        logger.info(
+            "Destinations screened",
+            origin=f"{params.origin_lat:.4f},{params.origin_lon:.4f}",
+            destinations=len(entries),
+            shortlisted=shortlisted,
+            max_cycle_minutes=params.max_cycle_minutes,
+        )
+
+        return {
+            "status": "success",
+            "max_cycle_minutes": params.max_cycle_minutes,
+            "destinations": entries,
+            "shortlisted": shortlisted,
+            "screened_out": len(entries) - shortlisted,
+        }
+
+    async def _batch_step(self, dest_name: str, step: Awaitable[Any]) -> Any:
+        """Await one destination's step, turning an exception into its error entry."""
+        try:
+            return await step
+        except Exception as e:
+            logger.exception("Batch route assessment failed", destination=dest_name)
+            return {
+                "status": "error",
+                "error_type": "internal_error",
+                "message": str(e),
+            }
+
+    async def _assess_batch_merged(
+        self,
+        params: AssessCycleRoutesBatchInput,
+    ) -> list[dict[str, Any]]:
+        """
+        Assess a batch with one merged Overpass fetch for all planned routes.
+
+        Destinations answered by the route cache are not planned or fetched.
+        """
+        destinations = params.destinations
+        cache_keys = await asyncio.gather(*(
+            self._route_cache_key(params.origin_lon, params.origin_lat, dest.lon, dest.lat, dest.id)
+            for dest in destinations
+        ))
+        results: list[dict[str, Any] | None] = list(await asyncio.gather(*(
+            self._cached_route(key, dest.name, params.geometry_format)
+            for dest, key in zip(destinations, cache_keys, strict=True)
+        )))
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        planned = await asyncio.gather(*(
+            self._batch_step(destinations[i].name, self._plan_route(
+                params.origin_lon, params.origin_lat,
+                destinations[i].lon, destinations[i].lat, destinations[i].name,
+            ))
+            for i in misses
+        ))
+        plans = [(i, p) for i, p in zip(misses, planned, strict=True) if isinstance(p, RoutePlan)]
+
+        store, uncovered = await self._fetch_merged_overpass(
+            [(plan.coords, plan.way_ids) for _, plan in plans]
+        )
+
+        async def finish(plan: RoutePlan, cache_key: str | None, merged: bool) -> dict[str, Any]:
+            if not merged:
+                # A tile this route needed failed: fetch its corridor on its own
+                assessment, shortest = await self._assess_single_route(plan)
+                return await self._finish_and_cache(
+                    plan, assessment, params.geometry_format, cache_key, shortest=shortest
+                )
+            # Selection and scoring are CPU-bound; keep them off the event loop
+            assessment, shortest = await asyncio.to_thread(self._analyse_from_store, plan, store)
+            return await self._finish_and_cache(
+                plan, assessment, params.geometry_format, cache_key, shortest=shortest
+            )
+
+        for i, result in zip(misses, planned, strict=True):
+            results[i] = result
+        finished = await asyncio.gather(*(
+            self._batch_step(
+                plan.dest_name, finish(plan, cache_keys[i], merged=n not in uncovered)
+            )
+            for n, (i, plan) in enumerate(plans)
+        ))
+        for (i, _), result in zip(plans, finished, strict=True):
+            results[i] = result
+        return [result for result in results if result is not None]
+
+    def _analyse_from_store(
+        self,
+        plan: RoutePlan,
+        store: OverpassStore | None,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """
+        Analyse a planned route and its shortest alternative from merged data.
+
+        Returns:
+            Tuple of (assessment, shortest route score or None), as from
+            _assess_single_route.
+        """
+        overpass_data = store.route_data(plan.coords, plan.way_ids) if store else None
+        assessment = self._analyse_route(
+            plan.coords, plan.distance_m, plan.duration_s, plan.dest_name,
+            overpass_data, shortest_distance_m=plan.shortest_distance_m,
+        )
+        shortest = self._assess_shortest_route(plan, store) if assessment else None
+        return assessment, shortest
+
+    async def _fetch_merged_overpass(
+        self,
+        routes: list[tuple[list[list[float]], set[int] | None]],
+    ) -> tuple[OverpassStore | None, set[int]]:
+        """
+        Fetch Overpass data for several routes with merged tile queries.
+
+        Returns:
+            Tuple of (OverpassStore over the tile responses that succeeded, or
+            None if there is nothing to query or every tile failed; indexes
+            into routes covered by a failed tile, which callers fetch per route).
+        """
+        tiles = build_merged_overpass_tiles(routes)
+        if not tiles:
+            return None, set()
+
+        responses = await asyncio.gather(*(
+            self._query_overpass(
+                query, f"merged tile {i + 1}/{len(tiles)}", timeout=MERGED_QUERY_HTTP_TIMEOUT
+            )
+            for i, (query, _) in enumerate(tiles)
+        ), return_exceptions=True)
+
+        uncovered: set[int] = set()
+        loaded = []
+        for (_, covered), response in zip(tiles, responses, strict=True):
+            if isinstance(response, dict):
+                loaded.append(response)
+            else:
+                uncovered |= covered
+        if uncovered:
+            logger.warning(
+                "Merged Overpass tiles failed, fetching their routes individually",
+                routes=len(routes),
+                tiles=len(tiles),
+                failed_tiles=len(tiles) - len(loaded),
+                fallback_routes=len(uncovered),
+            )
+        if not loaded:
+            return None, uncovered
+
+        store = OverpassStore(loaded)
+        logger.info(
+            "Merged Overpass data loaded",
+            routes=len(routes),
+            tiles=len(tiles),
+            elements=store.element_count,
+        )
+        return store, uncovered
+
+    async def _assess_destination(
+        self,
+        origin_lon: float,
+        origin_lat: float,
+        dest_lon: float,
+        dest_lat: float,
+        dest_name: str,
+        geometry_format: GeometryFormat = "geojson",
+        dest_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Assess the cycling route to one destination with its own Overpass query."""
+        cache_key = await self._route_cache_key(origin_lon, origin_lat, dest_lon, dest_lat, dest_id)
+        cached = await self._cached_route(cache_key, dest_name, geometry_format)
+        if cached is not None:
+            return cached
+
+        plan = await self._plan_route(origin_lon, origin_lat, dest_lon, dest_lat, dest_name)
+        if not isinstance(plan, RoutePlan):
+            return plan
+
+        # Fetch infrastructure for the safest route only; the shortest route
+        # is scored from the same data when it covers the shortest route's ways
+        assessment, shortest = await self._assess_single_route(plan)
+        return await self._finish_and_cache(
+            plan, assessment, geometry_format, cache_key, shortest=shortest
+        )
+
+    async def _route_cache_key(
+        self,
+        origin_lon: float,
+        origin_lat: float,
+        dest_lon: float,
+        dest_lat: float,
+        dest_id: str | None,
+    ) -> str | None:
+        """
+        Build the route cache key for one destination.
+
+        Returns:
+            The key, or None when the cache is disabled or the data version is
+            unknown (results then bypass the cache rather than risk serving
+            routes from other tiles).
+        """
+        if self._route_cache is None:
+            return None
+        data_version = await self._get_data_version()
+        if data_version is None:
+            return None
+        return self._route_cache.route_key(
+            (origin_lon, origin_lat),
+            (dest_lon, dest_lat),
+            dest_id,
+            [SHORTEST_COSTING_OPTIONS, SAFEST_COSTING_OPTIONS],
+            data_version,
+        )
+
+    async def _cached_route(
+        self,
+        cache_key: str | None,
+        dest_name: str,
+        geometry_format: GeometryFormat,
+    ) -> dict[str, Any] | None:
+        """Get a cached assessment in the requested geometry format, or None."""
+        if cache_key is None or self._route_cache is None:
+            return None
+        result = await self._route_cache.get(cache_key, dest_name)
+        if result is None:
+            return None
+        # The entry may have been stored under another name for the destination
+        result["destination"] = dest_name
+        return expand_route_geometry(result) if geometry_format == "geojson" else result
+
+    async def _finish_and_cache(
+        self,
+        plan: RoutePlan,
+        assessment: dict[str, Any] | None,
+        geometry_format: GeometryFormat,
+        cache_key: str | None,
+        shortest: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the tool result and store it in the route cache.
+
+        Only routes with infrastructure data are cached, so a transient
+        Overpass failure is retried by the next review. Entries hold encoded
+        polylines whatever format was requested.
+        """
+        if cache_key is None or assessment is None or self._route_cache is None:
+            return self._finish_assessment(plan, assessment, geometry_format, shortest)
+        result = self._finish_assessment(plan, assessment, "polyline", shortest)
+        await self._route_cache.put(cache_key, result)
+        return expand_route_geometry(result) if geometry_format == "geojson" else result
+
+    async def _get_data_version(self) -> str | None:
+        """
+        Get the version of the data behind route assessments.
+
+        Combines Valhalla's tileset_last_modified with the local OSM store's
+        build time (or "overpass" for live Overpass data, which the cache TTL
+        bounds instead). Rechecked every DATA_VERSION_CHECK_INTERVAL seconds,
+        so refreshed tiles or a rebuilt extract invalidate cached routes.
+
+        Returns:
+            Version string, or None if Valhalla's status is unavailable.
+        """
+        async with self._data_version_lock:
+            now = time.monotonic()
+            if (
+                self._data_version_checked_at is not None
+                and now - self._data_version_checked_at < DATA_VERSION_CHECK_INTERVAL
+            ):
+                return self._data_version
+
+            tileset = await self._request_valhalla_tileset_version()
+            if tileset is None:
+                version = None
+            elif self.infrastructure_backend == "local":
+                meta = await asyncio.to_thread(lambda: self.osm_store.meta)
+                version = f"tiles:{tileset}|osm:{meta.get('source', '')}@{meta.get('built_at', '')}"
+            else:
+                version = f"tiles:{tileset}|osm:overpass"
+
+            if version != self._data_version:
+                logger.info("Route data version", data_version=version)
+            self._data_version = version
+            self._data_version_checked_at = now
+            return version
+
+    async def _request_valhalla_tileset_version(self) -> str | None:
+        """Get tileset_last_modified from Valhalla's /status endpoint, or None."""
+        try:
+            response = await self.valhalla_http.get(f"{self.valhalla_url}/status")
+            response.raise_for_status()
+            tileset = response.json().get("tileset_last_modified")
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Valhalla status unavailable, bypassing route cache", error=str(e))
+            return None
+        if tileset is None:
+            logger.warning("Valhalla status has no tileset_last_modified, bypassing route cache")
+            return None
+        return str(tileset)
+
+    async def _plan_route(
+        self,
+        origin_lon: float,
+        origin_lat: float,
+        dest_lon: float,
+        dest_lat: float,
+        dest_name: str,
+    ) -> RoutePlan | dict[str, Any]:
+        """
+        Request shortest and safest bicycle routes from Valhalla, with their way IDs.
+
+        Each route request is followed straight away by trace_attributes for
+        its shape, and the two chains run concurrently, so a destination costs
+        about one route plus one trace_attributes round trip.
+
+        Returns:
+            RoutePlan, or a no_route error dict if neither route was found.
+        """
         logger.info(
             "Assessing cycle route",
             destination=dest_name,
@@ -393,22 +1278,23 @@ class CycleRouteMCP:
         )
 
         # Step 1: Request two bicycle routes from Valhalla (no driving route)
-        shortest_data = await self._request_valhalla_route(
-            origin_lon, origin_lat, dest_lon, dest_lat,
-            costing="bicycle",
-            costing_options={"bicycle": {"shortest": True}},
-        )
-
-        await asyncio.sleep(EXTERNAL_API_DELAY)
+        # and the on-route way IDs of each. Valhalla is our own instance, so
+        # everything runs at once without a delay.
+        async def route_with_way_ids(
+            costing_options: dict[str, Any],
+        ) -> tuple[dict[str, Any] | None, set[int] | None]:
+            data = await self._request_valhalla_route(
+                origin_lon, origin_lat, dest_lon, dest_lat,
+                costing="bicycle",
+                costing_options=costing_options,
+            )
+            if data is None:
+                return None, None
+            return data, await self._get_way_ids(data["trip"]["legs"][0]["shape"], dest_name)
 
-        safest_data = await self._request_valhalla_route(
-            origin_lon, origin_lat, dest_lon, dest_lat,
-            costing="bicycle",
-            costing_options={"bicycle": {
-                "use_roads": 0.1,
-                "avoid_bad_surfaces": 0.6,
-                "use_hills": 0.3,
-            }},
+        (shortest_data, shortest_way_ids), (safest_data, safest_way_ids) = await asyncio.gather(
+            route_with_way_ids(SHORTEST_COSTING_OPTIONS),
+            route_with_way_ids(SAFEST_COSTING_OPTIONS),
         )
 
         # Fallback logic: if one bicycle route fails, use the other for both
@@ -420,21 +1306,20 @@ class CycleRouteMCP:
             }
 
         if shortest_data is None:
-            shortest_data = safest_data
+            shortest_data, shortest_way_ids = safest_data, safest_way_ids
         elif safest_data is None:
-            safest_data = shortest_data
+            safest_data, safest_way_ids = shortest_data, shortest_way_ids
 
         # Step 2: Decode routes
-        def _extract_route(data: dict[str, Any]) -> tuple[list[list[float]], float, float]:
-            leg = data["trip"]["legs"][0]
-            coords = decode_polyline(leg["shape"])
+        def _extract_route(data: dict[str, Any]) -> tuple[str, float, float]:
+            shape = data["trip"]["legs"][0]["shape"]
             summary = data["trip"]["summary"]
             distance_m = summary["length"] * 1000  # km → m
             duration_s = summary["time"]
-            return coords, distance_m, duration_s
+            return shape, distance_m, duration_s
 
-        shortest_coords, shortest_dist, shortest_dur = _extract_route(shortest_data)
-        safest_coords, safest_dist, safest_dur = _extract_route(safest_data)
+        shortest_shape, shortest_dist, shortest_dur = _extract_route(shortest_data)
+        safest_shape, safest_dist, safest_dur = _extract_route(safest_data)
 
         # Determine if same route (distance difference < 1%)
         same_route = (
@@ -442,13 +1327,36 @@ class CycleRouteMCP:
             or abs(shortest_dist - safest_dist) / max(shortest_dist, 1) < 0.01
         )
 
-        # Step 3: Assess ONLY the safest route via Overpass + scoring
-        # Shortest route provides distance only for directness comparison
-        assessment = await self._assess_single_route(
-            safest_coords, safest_dist, safest_dur,
-            dest_name, shortest_distance_m=shortest_dist,
+        return RoutePlan(
+            dest_name=dest_name,
+            shape=safest_shape,
+            coords=decode_polyline(safest_shape),
+            distance_m=safest_dist,
+            duration_s=safest_dur,
+            shortest_shape=shortest_shape,
+            shortest_distance_m=shortest_dist,
+            same_route=same_route,
+            shortest_duration_s=shortest_dur,
+            way_ids=safest_way_ids,
+            shortest_way_ids=shortest_way_ids,
         )
 
+    def _finish_assessment(
+        self,
+        plan: RoutePlan,
+        assessment: dict[str, Any] | None,
+        geometry_format: GeometryFormat = "geojson",
+        shortest: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the tool result for a planned route and its assessment (None if no data).
+
+        With geometry_format "polyline" the route lines stay as Valhalla's
+        encoded shapes; polyline.expand_route_geometry restores the GeoJSON
+        fields where results are published. A shortest route summary from
+        _assess_shortest_route adds shortest_route_score and
+        shortest_route_provision_breakdown.
+        """
         # Build fallback stub for routes with no infrastructure data
         def _empty_assessment(coords: list, dist: float, dur: float) -> dict[str, Any]:
             return {
@@ -466,24 +1374,44 @@ class CycleRouteMCP:
             }
 
         if assessment is None:
-            assessment = _empty_assessment(safest_coords, safest_dist, safest_dur)
+            assessment = _empty_assessment(plan.coords, plan.distance_m, plan.duration_s)
 
         logger.info(
             "Route assessed",
-            destination=dest_name,
+            destination=plan.dest_name,
             distance=assessment["distance_m"],
             score=assessment["score"]["score"],
-            shortest_distance=round(shortest_dist),
-            same_route=same_route,
+            shortest_distance=round(plan.shortest_distance_m),
+            same_route=plan.same_route,
         )
 
+        if geometry_format == "polyline":
+            # Swap route_geojson for the encoded shape, keeping the field order
+            assessment = {
+                ("route_polyline" if key == "route_geojson" else key): value
+                for key, value in assessment.items()
+            }
+            assessment["route_polyline"] = plan.shape
+            assessment["polyline_precision"] = VALHALLA_PRECISION
+            shortest_geometry = {"shortest_route_polyline": plan.shortest_shape}
+        else:
+            shortest_geometry = {"shortest_route_geometry": plan.shortest_coords}
+
         return {
             "status": "success",
-            "destination": dest_name,
+            "destination": plan.dest_name,
             **assessment,
-            "shortest_route_distance_m": round(shortest_dist),
-            "shortest_route_geometry": shortest_coords,
-            "same_route": same_route,
+            "shortest_route_distance_m": round(plan.shortest_distance_m),
+            **shortest_geometry,
+            **(
+                {
+                    "shortest_route_score": shortest["score"],
+                    "shortest_route_provision_breakdown": shortest["provision_breakdown"],
+                }
+                if shortest
+                else {}
+            ),
+            "same_route": plan.same_route,
         }
 
 
@@ -492,7 +1420,22 @@ def create_app() -> Starlette:
     from src.mcp_servers.shared.transport import create_mcp_app
 
     mcp_server = CycleRouteMCP()
-    return create_mcp_app(mcp_server.server)
+
+    async def handle_health(request):  # noqa: ARG001
+        overpass_cache = mcp_server.overpass_cache
+        route_cache = mcp_server.route_cache
+        return JSONResponse(
+            {
+                "status": "ok",
+                "infrastructure_backend": mcp_server.infrastructure_backend,
+                "overpass_cache": (
+                    await asyncio.to_thread(overpass_cache.stats) if overpass_cache else None
+                ),
+                "route_cache": await asyncio.to_thread(route_cache.stats) if route_cache else None,
+            }
+        )
+
+    return create_mcp_app(mcp_server.server, health_handler=handle_health)
 
 
 async def main() -> None:
@@ -0,0 +1,130 @@
+"""
+Grid spatial index and distance helpers for route geometry.
+
+Implements [cycle-route-assessment:FR-002] - Route infrastructure analysis (spatial lookups)
+
+Dense urban corridors return thousands of ways and nodes from Overpass.
+Comparing every element with every other is quadratic, so proximity lookups
+go through a uniform lat/lon grid instead: items are registered in the cells
+their bounding box covers, and a query only inspects items in the cells
+around the search box. Distances use a local equirectangular projection,
+which is accurate to well under a metre at corridor scale.
+"""
+
+import math
+from collections.abc import Iterable
+
+EARTH_RADIUS_M = 6_371_000.0
+
+METRES_PER_DEGREE_LAT = 111_320.0
+
+
+def distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Equirectangular distance in metres (accurate at corridor scale)."""
+    x = math.radians(lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = math.radians(lat2 - lat1)
+    return EARTH_RADIUS_M * math.hypot(x, y)
+
+
+def point_segment_distance_m(
+    lat: float, lon: float, a: dict[str, float], b: dict[str, float]
+) -> float:
+    """Distance in metres from a point to the segment a-b (local projection)."""
+    cos_lat = math.cos(math.radians(lat))
+    ax = math.radians(a["lon"] - lon) * cos_lat
+    ay = math.radians(a["lat"] - lat)
+    bx = math.radians(b["lon"] - lon) * cos_lat
+    by = math.radians(b["lat"] - lat)
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+    return EARTH_RADIUS_M * math.hypot(ax + t * dx, ay + t * dy)
+
+
+def polyline_distance_m(line_a: list[dict[str, float]], line_b: list[dict[str, float]]) -> float:
+    """
+    Closest approach in metres between two polylines of {lat, lon} points.
+
+    Measured from every vertex of each line to the segments of the other, so
+    lines that cross without a vertex nearby are not reported as touching;
+    callers use this for side-by-side ways, where that case does not arise.
+    """
+    best = math.inf
+    for points, line in ((line_a, line_b), (line_b, line_a)):
+        edges = list(zip(line, line[1:] or line, strict=False))
+        for pt in points:
+            for a, b in edges:
+                best = min(best, point_segment_distance_m(pt["lat"], pt["lon"], a, b))
+    return best
+
+
+def bounding_box(points: Iterable[dict[str, float]]) -> tuple[float, float, float, float] | None:
+    """(min_lat, min_lon, max_lat, max_lon) of {lat, lon} points, or None if empty."""
+    lats: list[float] = []
+    lons: list[float] = []
+    for pt in points:
+        lats.append(pt["lat"])
+        lons.append(pt["lon"])
+    if not lats:
+        return None
+    return min(lats), min(lons), max(lats), max(lons)
+
+
+class GridIndex:
+    """Uniform lat/lon grid mapping cells to the integer IDs of items overlapping them."""
+
+    def __init__(self, cell_deg: float) -> None:
+        """
+        Args:
+            cell_deg: Cell size in degrees; pick it near the typical search
+                radius so queries touch few cells and few items per cell.
+        """
+        self.cell_deg = cell_deg
+        self._cells: dict[tuple[int, int], list[int]] = {}
+
+    def _cell_range(
+        self, min_lat: float, min_lon: float, max_lat: float, max_lon: float
+    ) -> tuple[range, range]:
+        rows = range(math.floor(min_lat / self.cell_deg), math.floor(max_lat / self.cell_deg) + 1)
+        cols = range(math.floor(min_lon / self.cell_deg), math.floor(max_lon / self.cell_deg) + 1)
+        return rows, cols
+
+    def insert(
+        self, item: int, min_lat: float, min_lon: float, max_lat: float, max_lon: float
+    ) -> None:
+        """Register an item in every cell its bounding box covers."""
+        rows, cols = self._cell_range(min_lat, min_lon, max_lat, max_lon)
+        for row in rows:
+            for col in cols:
+                self._cells.setdefault((row, col), []).append(item)
+
+    def insert_point(self, item: int, lat: float, lon: float) -> None:
+        """Register a point item."""
+        self.insert(item, lat, lon, lat, lon)
+
+    def query(
+        self,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+        pad_m: float = 0.0,
+    ) -> set[int]:
+        """
+        Items whose cells overlap a bounding box grown by pad_m metres.
+
+        The result is a superset of the items within pad_m of the box;
+        callers apply the exact distance test.
+        """
+        dlat = pad_m / METRES_PER_DEGREE_LAT
+        dlon = dlat / max(math.cos(math.radians((min_lat + max_lat) / 2)), 0.01)
+        rows, cols = self._cell_range(min_lat - dlat, min_lon - dlon, max_lat + dlat, max_lon + dlon)
+        found: set[int] = set()
+        for row in rows:
+            for col in cols:
+                found.update(self._cells.get((row, col), ()))
+        return found
+
+    def query_point(self, lat: float, lon: float, radius_m: float) -> set[int]:
+        """Items whose cells come within radius_m of a point."""
+        return self.query(lat, lon, lat, lon, pad_m=radius_m)
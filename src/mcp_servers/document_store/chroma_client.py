@@ -7,7 +7,6 @@ Implements [document-processing:NFR-004] - Storage efficiency
 Implements [document-processing:NFR-005] - Search latency <500ms
 """
 
-import hashlib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -16,6 +15,8 @@ import chromadb
 import structlog
 from chromadb.config import Settings
 
+from src.shared.hashing import sha256_file
+
 logger = structlog.get_logger(__name__)
 
 
@@ -75,6 +76,9 @@ class ChromaClient:
     COLLECTION_NAME = "application_docs"
     DOCUMENT_REGISTRY_COLLECTION = "document_registry"
 
+    # Chunks fetched per round trip when patching metadata in place
+    METADATA_UPDATE_BATCH_SIZE = 500
+
     def __init__(
         self,
         persist_directory: str | Path | None = None,
@@ -152,6 +156,20 @@ class ChromaClient:
         hash_short = file_hash[:6] if len(file_hash) >= 6 else file_hash
         return f"{safe_ref}_{hash_short}_{page_number:03d}_{chunk_index:03d}"
 
+    @staticmethod
+    def generate_content_chunk_id(
+        file_hash: str,
+        page_number: int,
+        chunk_index: int,
+    ) -> str:
+        """
+        Generate a content-addressed chunk ID shared by every application.
+
+        Format: sha256_{file_hash_16}_{page}_{chunk_idx}
+        Example: sha256_a1b2c3d4e5f60718_014_042
+        """
+        return f"sha256_{file_hash[:16]}_{page_number:03d}_{chunk_index:03d}"
+
     @staticmethod
     def generate_document_id(application_ref: str, file_hash: str) -> str:
         """Generate a document ID from application ref and file hash."""
@@ -162,11 +180,7 @@ class ChromaClient:
     @staticmethod
     def compute_file_hash(file_path: str | Path) -> str:
         """Compute SHA256 hash of a file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        return sha256_file(file_path)
 
     def upsert_chunk(self, chunk: ChunkRecord) -> None:
         """
@@ -210,6 +224,33 @@ class ChromaClient:
 
         logger.debug("Chunks upserted", count=len(chunks))
 
+    def update_chunk_metadata(self, chunk_ids: list[str], updates: dict[str, Any]) -> None:
+        """
+        Merge metadata fields into existing chunks.
+
+        Used by streaming ingestion to set fields such as total_chunks that are
+        only known once every chunk has been stored.
+
+        Args:
+            chunk_ids: IDs of the chunks to update.
+            updates: Metadata fields to set on every chunk.
+        """
+        if not chunk_ids:
+            return
+
+        collection = self._get_collection()
+
+        for start in range(0, len(chunk_ids), self.METADATA_UPDATE_BATCH_SIZE):
+            batch_ids = chunk_ids[start : start + self.METADATA_UPDATE_BATCH_SIZE]
+            results = collection.get(ids=batch_ids, include=["metadatas"])
+            metadatas = results.get("metadatas") or []
+            collection.update(
+                ids=results["ids"],
+                metadatas=[{**(meta or {}), **updates} for meta in metadatas],
+            )
+
+        logger.debug("Chunk metadata updated", count=len(chunk_ids), fields=list(updates))
+
     def search(
         self,
         query_embedding: list[float],
@@ -223,6 +264,11 @@ class ChromaClient:
         Implements [document-processing:ChromaClient/TS-03] - Semantic search
         Implements [document-processing:ChromaClient/TS-04] - Search with filter
 
+        Content-addressed chunks carry no application fields, so filters are
+        resolved through the document registry to the file hashes referenced
+        by matching documents. Chunks stored per application (before content
+        sharing) are still matched on their own metadata.
+
         Args:
             query_embedding: The query embedding vector.
             n_results: Maximum number of results to return.
@@ -248,6 +294,13 @@ class ChromaClient:
         elif len(where_conditions) > 1:
             where = {"$and": where_conditions}
 
+        references: list[DocumentRecord] | None = None
+        if where is not None:
+            references = self._find_references(application_ref, document_types)
+            hashes = sorted({r.file_hash for r in references if r.file_hash})
+            if hashes:
+                where = {"$or": [where, {"file_hash": {"$in": hashes}}]}
+
         try:
             results = collection.query(
                 query_embeddings=[query_embedding],
@@ -278,10 +331,11 @@ class ChromaClient:
                         chunk_id=chunk_id,
                         text=documents[i] if i < len(documents) else "",
                         relevance_score=relevance_score,
-                        metadata=metadatas[i] if i < len(metadatas) else {},
+                        metadata=dict(metadatas[i]) if i < len(metadatas) and metadatas[i] else {},
                     )
                 )
 
+        self._attach_references([r.metadata for r in search_results], references)
         return search_results
 
     def get_document_chunks(self, document_id: str) -> list[ChunkRecord]:
@@ -298,11 +352,17 @@ class ChromaClient:
         """
         collection = self._get_collection()
 
+        # Registered documents may point at shared content-addressed chunks
+        record = self.get_document_record(document_id)
+        where: dict[str, Any] = {"document_id": document_id}
+        if record is not None and record.file_hash:
+            where = {"$or": [where, {"file_hash": record.file_hash}]}
+
         # Query chunks that start with the document ID
         # ChromaDB doesn't support prefix matching, so we filter by metadata
         try:
             results = collection.get(
-                where={"document_id": document_id},
+                where=where,
                 include=["documents", "metadatas", "embeddings"],
             )
         except Exception:
@@ -334,10 +394,13 @@ class ChromaClient:
                         chunk_id=chunk_id,
                         text=documents_list[i] if i < len(documents_list) else "",
                         embedding=embedding,
-                        metadata=metadatas_list[i] if i < len(metadatas_list) else {},
+                        metadata=dict(metadatas_list[i]) if i < len(metadatas_list) and metadatas_list[i] else {},
                     )
                 )
 
+        if record is not None:
+            self._attach_references([c.metadata for c in chunks], [record])
+
         # Sort by chunk index
         chunks.sort(key=lambda c: c.metadata.get("chunk_index", 0))
         return chunks
@@ -348,6 +411,9 @@ class ChromaClient:
 
         Implements [document-processing:ChromaClient/TS-06]
 
+        Removes the document's registry entry. Shared content-addressed chunks
+        are only deleted once no other document references the same file.
+
         Args:
             document_id: The document ID.
 
@@ -355,6 +421,7 @@ class ChromaClient:
             Number of chunks deleted.
         """
         collection = self._get_collection()
+        record = self.get_document_record(document_id)
 
         # Get chunks to delete
         try:
@@ -362,13 +429,14 @@ class ChromaClient:
                 where={"document_id": document_id},
             )
         except Exception:
-            return 0
+            results = {"ids": []}
 
-        if not results["ids"]:
-            return 0
+        chunk_ids = list(results["ids"] or [])
+        if chunk_ids:
+            collection.delete(ids=chunk_ids)
 
-        chunk_ids = results["ids"]
-        collection.delete(ids=chunk_ids)
+        if record is None and not chunk_ids:
+            return 0
 
         # Also remove from registry
         try:
@@ -377,9 +445,92 @@ class ChromaClient:
         except Exception:
             pass
 
-        logger.info("Document deleted", document_id=document_id, chunks_deleted=len(chunk_ids))
+        deleted = len(chunk_ids)
+        if record is not None and record.file_hash:
+            deleted += self.delete_unreferenced_content(record.file_hash)
+
+        logger.info("Document deleted", document_id=document_id, chunks_deleted=deleted)
+        return deleted
+
+    def delete_unreferenced_content(self, file_hash: str) -> int:
+        """
+        Delete the shared chunks for a file hash if no document references it.
+
+        Also used to discard partially stored content after a failed ingest.
+
+        Args:
+            file_hash: SHA256 hash of the file.
+
+        Returns:
+            Number of chunks deleted (0 while references remain).
+        """
+        if self.list_documents_by_hash(file_hash):
+            return 0
+
+        collection = self._get_collection()
+        try:
+            results = collection.get(where={"file_hash": file_hash})
+        except Exception:
+            return 0
+
+        chunk_ids = results["ids"] or []
+        if chunk_ids:
+            collection.delete(ids=chunk_ids)
+            logger.info(
+                "Unreferenced content deleted",
+                file_hash=file_hash[:16],
+                chunks_deleted=len(chunk_ids),
+            )
         return len(chunk_ids)
 
+    def _find_references(
+        self,
+        application_ref: str | None,
+        document_types: list[str] | None,
+    ) -> list[DocumentRecord]:
+        """Find registered documents matching search filters."""
+        conditions: list[dict[str, Any]] = []
+        if application_ref:
+            conditions.append({"application_ref": application_ref})
+        if document_types:
+            conditions.append({"document_type": {"$in": document_types}})
+
+        where = conditions[0] if len(conditions) == 1 else {"$and": conditions}
+        return self._query_registry(where)
+
+    def _attach_references(
+        self,
+        metadatas: list[dict[str, Any]],
+        references: list[DocumentRecord] | None,
+    ) -> None:
+        """
+        Fill application-specific fields into content-addressed chunk metadata.
+
+        Each shared chunk is attributed to a referencing document, preferring
+        the given references (e.g. those matching the search filters).
+        """
+        shared = [m for m in metadatas if "file_hash" in m and "application_ref" not in m]
+        if not shared:
+            return
+
+        by_hash: dict[str, DocumentRecord] = {}
+        for record in references or []:
+            by_hash.setdefault(record.file_hash, record)
+
+        missing = sorted({m["file_hash"] for m in shared} - by_hash.keys())
+        if missing:
+            for record in self._query_registry({"file_hash": {"$in": missing}}):
+                by_hash.setdefault(record.file_hash, record)
+
+        for meta in shared:
+            record = by_hash.get(meta["file_hash"])
+            if record is None:
+                continue
+            meta["application_ref"] = record.application_ref
+            meta["document_id"] = record.document_id
+            meta["document_type"] = record.document_type
+            meta["source_file"] = Path(record.file_path).name
+
     def register_document(self, record: DocumentRecord) -> None:
         """
         Register a document in the document registry.
@@ -428,18 +579,7 @@ class ChromaClient:
         if not results["ids"] or not results["metadatas"]:
             return None
 
-        meta = results["metadatas"][0]
-        return DocumentRecord(
-            document_id=document_id,
-            file_path=meta.get("file_path", ""),
-            file_hash=meta.get("file_hash", ""),
-            application_ref=meta.get("application_ref", ""),
-            document_type=meta.get("document_type", ""),
-            chunk_count=meta.get("chunk_count", 0),
-            ingested_at=meta.get("ingested_at", ""),
-            extraction_method=meta.get("extraction_method", "text_layer"),
-            contains_drawings=meta.get("contains_drawings", False),
-        )
+        return self._record_from_metadata(document_id, results["metadatas"][0])
 
     def is_document_ingested(self, file_hash: str, application_ref: str) -> bool:
         """
@@ -456,6 +596,34 @@ class ChromaClient:
         record = self.get_document_record(document_id)
         return record is not None and record.file_hash == file_hash
 
+    def find_content_record(self, file_hash: str) -> DocumentRecord | None:
+        """
+        Find any registered document with this content, from any application.
+
+        A registry entry is only written once every chunk has been stored, so
+        a match means the content-addressed chunks are complete and reusable.
+
+        Args:
+            file_hash: SHA256 hash of the file.
+
+        Returns:
+            A document record referencing the content, or None.
+        """
+        records = self.list_documents_by_hash(file_hash)
+        return records[0] if records else None
+
+    def list_documents_by_hash(self, file_hash: str) -> list[DocumentRecord]:
+        """
+        List all documents, across applications, that reference a file hash.
+
+        Args:
+            file_hash: SHA256 hash of the file.
+
+        Returns:
+            List of document records.
+        """
+        return self._query_registry({"file_hash": file_hash})
+
     def list_documents_by_application(self, application_ref: str) -> list[DocumentRecord]:
         """
         List all documents for an application.
@@ -466,11 +634,15 @@ class ChromaClient:
         Returns:
             List of document records.
         """
+        return self._query_registry({"application_ref": application_ref})
+
+    def _query_registry(self, where: dict[str, Any]) -> list[DocumentRecord]:
+        """Fetch document records matching a registry where clause."""
         registry = self._get_registry_collection()
 
         try:
             results = registry.get(
-                where={"application_ref": application_ref},
+                where=where,
                 include=["metadatas"],
             )
         except Exception:
@@ -480,22 +652,25 @@ class ChromaClient:
         if results["ids"]:
             for i, doc_id in enumerate(results["ids"]):
                 meta = results["metadatas"][i] if results["metadatas"] else {}
-                records.append(
-                    DocumentRecord(
-                        document_id=doc_id,
-                        file_path=meta.get("file_path", ""),
-                        file_hash=meta.get("file_hash", ""),
-                        application_ref=meta.get("application_ref", ""),
-                        document_type=meta.get("document_type", ""),
-                        chunk_count=meta.get("chunk_count", 0),
-                        ingested_at=meta.get("ingested_at", ""),
-                        extraction_method=meta.get("extraction_method", "text_layer"),
-                        contains_drawings=meta.get("contains_drawings", False),
-                    )
-                )
+                records.append(self._record_from_metadata(doc_id, meta))
 
         return records
 
+    @staticmethod
+    def _record_from_metadata(document_id: str, meta: dict[str, Any]) -> DocumentRecord:
+        """Build a DocumentRecord from registry metadata."""
+        return DocumentRecord(
+            document_id=document_id,
+            file_path=meta.get("file_path", ""),
+            file_hash=meta.get("file_hash", ""),
+            application_ref=meta.get("application_ref", ""),
+            document_type=meta.get("document_type", ""),
+            chunk_count=meta.get("chunk_count", 0),
+            ingested_at=meta.get("ingested_at", ""),
+            extraction_method=meta.get("extraction_method", "text_layer"),
+            contains_drawings=meta.get("contains_drawings", False),
+        )
+
     def get_collection_stats(self) -> dict[str, Any]:
         """Get statistics about the collection."""
         collection = self._get_collection()
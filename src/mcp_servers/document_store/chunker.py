@@ -4,6 +4,8 @@ Text chunking for document processing.
 Implements [document-processing:FR-003] - Chunk text with configurable size and overlap
 """
 
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -47,6 +49,10 @@ class TextChunker:
     DEFAULT_CHUNK_OVERLAP = 50  # tokens
     CHARS_PER_TOKEN = 4  # Rough approximation
 
+    # Streaming mode buffers roughly this many chunks of text before splitting,
+    # so memory is bounded by the window (or one page) rather than the document
+    STREAM_WINDOW_CHUNKS = 16
+
     def __init__(
         self,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
@@ -203,6 +209,123 @@ class TextChunker:
 
         return result
 
+    def iter_chunk_pages(
+        self,
+        pages: Iterable[tuple[int, str]],
+    ) -> Iterator[TextChunk]:
+        """
+        Chunk a stream of pages, yielding chunks as soon as they are final.
+
+        Behaves like chunk_pages() but only buffers a sliding window of text.
+        Whenever the buffer exceeds the window, every chunk except the last is
+        emitted and the buffer restarts at the last chunk, which may still grow
+        with text from the following page.
+
+        Args:
+            pages: Iterable of (page_number, text) tuples, e.g. a generator.
+
+        Yields:
+            TextChunk objects with page context and document-wide chunk_index.
+        """
+        window = self.chunk_size * self.CHARS_PER_TOKEN * self.STREAM_WINDOW_CHUNKS
+
+        buffer = ""
+        # (start offset in buffer, page number), sorted by offset
+        spans: list[tuple[int, int]] = []
+        next_index = 0
+        total_pages = 0
+
+        for page_num, page_text in pages:
+            total_pages += 1
+            if not page_text.strip():
+                continue
+
+            # The separator is attributed to the following page, as in chunk_pages()
+            spans.append((len(buffer), page_num))
+            if buffer:
+                buffer += "\n\n"
+            buffer += page_text
+
+            if len(buffer) >= window:
+                chunks, carry_from = self._split_buffer(buffer, spans, next_index, final=False)
+                yield from chunks
+                next_index += len(chunks)
+                buffer, spans = self._trim_buffer(buffer, spans, carry_from)
+
+        if buffer.strip():
+            chunks, _ = self._split_buffer(buffer, spans, next_index, final=True)
+            yield from chunks
+            next_index += len(chunks)
+
+        logger.debug(
+            "Pages chunked (streaming)",
+            total_pages=total_pages,
+            output_chunks=next_index,
+        )
+
+    def _split_buffer(
+        self,
+        buffer: str,
+        spans: list[tuple[int, int]],
+        start_index: int,
+        *,
+        final: bool,
+    ) -> tuple[list[TextChunk], int]:
+        """
+        Split the streaming buffer into chunks.
+
+        Returns the chunks to emit and the buffer offset the next window should
+        start from. Unless final, the last chunk is held back because it may be
+        cut short by the end of the buffer.
+        """
+        pieces = self._splitter.split_text(buffer)
+        span_starts = [start for start, _ in spans]
+
+        located: list[tuple[str, int]] = []
+        current_pos = 0
+        for piece in pieces:
+            piece_start = buffer.find(piece, current_pos)
+            if piece_start == -1:
+                piece_start = current_pos
+            located.append((piece, piece_start))
+            current_pos = max(current_pos, piece_start + 1)
+
+        carry_from = len(buffer)
+        if not final and len(located) > 1:
+            carry_from = located[-1][1]
+            located = located[:-1]
+
+        result: list[TextChunk] = []
+        for offset, (piece, piece_start) in enumerate(located):
+            piece_end = min(piece_start + len(piece), len(buffer))
+            first = max(bisect_right(span_starts, piece_start) - 1, 0)
+            last = max(bisect_right(span_starts, piece_end - 1) - 1, first)
+            page_numbers = sorted({page for _, page in spans[first : last + 1]})
+            result.append(
+                TextChunk(
+                    text=piece,
+                    chunk_index=start_index + offset,
+                    char_count=len(piece),
+                    word_count=len(piece.split()),
+                    page_numbers=page_numbers,
+                )
+            )
+
+        return result, carry_from
+
+    @staticmethod
+    def _trim_buffer(
+        buffer: str,
+        spans: list[tuple[int, int]],
+        carry_from: int,
+    ) -> tuple[str, list[tuple[int, int]]]:
+        """Drop emitted text from the buffer and rebase page spans onto the remainder."""
+        remaining = buffer[carry_from:]
+        starts = [start for start, _ in spans]
+        first = max(bisect_right(starts, carry_from) - 1, 0)
+        rebased = [(max(start - carry_from, 0), page) for start, page in spans[first:]]
+        return remaining, rebased
+
     def estimate_tokens(self, text: str) -> int:
         """
         Estimate the number of tokens in a text.
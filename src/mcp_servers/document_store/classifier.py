@@ -5,6 +5,7 @@ Implements [document-processing:FR-010] - Classify documents based on filename a
 """
 
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import StrEnum
 
@@ -164,6 +165,31 @@ CONTENT_PATTERNS: list[tuple[list[str], str, int]] = [
 ]
 
 
+def _trie_alternation(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation of literal words factored as a prefix trie.
+
+    Shared prefixes are matched once, so the regex engine tests each text
+    position against a handful of branches rather than every keyword.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word ending here may also continue into a longer word; prefer the longer
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
 class DocumentClassifier:
     """
     Classifies planning application documents by type.
@@ -174,8 +200,39 @@ class DocumentClassifier:
     1. First attempts filename pattern matching (high confidence)
     2. Falls back to content keyword analysis (medium confidence)
     3. Returns 'other' if no match found (low confidence)
+
+    Both stages use a single combined regex compiled from FILENAME_PATTERNS
+    and CONTENT_PATTERNS, so each text is scanned once for all document types.
     """
 
+    # Content beyond this many characters is not scanned; the opening pages
+    # of a document are what identify its type
+    CONTENT_SAMPLE_CHARS = 50_000
+
+    def __init__(self) -> None:
+        """Compile the combined filename and content matchers."""
+        # Each filename pattern becomes a named lookahead branch. At any
+        # position the first (highest-priority) matching pattern is reported,
+        # so the minimum index over all positions is the first pattern in
+        # FILENAME_PATTERNS that matches anywhere.
+        self._filename_regex = re.compile(
+            "(?=" + "|".join(
+                f"(?P<p{i}>{pattern.pattern})" for i, (pattern, _) in enumerate(FILENAME_PATTERNS)
+            ) + ")",
+            re.IGNORECASE,
+        )
+
+        # Content keywords are matched as overlapping lookaheads over a trie
+        # alternation; the longest keyword at each position is reported, and
+        # shorter keywords that are its prefixes are credited with it.
+        keywords = {kw.lower() for kws, _, _ in CONTENT_PATTERNS for kw in kws}
+        self._content_regex = re.compile(f"(?=({_trie_alternation(keywords)}))")
+        self._keyword_prefixes = {
+            kw: frozenset(other for other in keywords if kw.startswith(other))
+            for kw in keywords
+        }
+        self._keyword_count = len(keywords)
+
     def classify(
         self,
         filename: str,
@@ -226,14 +283,22 @@ class DocumentClassifier:
 
     def _classify_by_filename(self, filename: str) -> ClassificationResult:
         """Classify based on filename patterns."""
-        for pattern, doc_type in FILENAME_PATTERNS:
-            if pattern.search(filename):
-                return ClassificationResult(
-                    document_type=doc_type,
-                    confidence="high",
-                    method="filename",
-                    matched_pattern=pattern.pattern,
-                )
+        best: int | None = None
+        for match in self._filename_regex.finditer(filename):
+            index = int(match.lastgroup[1:])  # type: ignore[index]
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+
+        if best is not None:
+            pattern, doc_type = FILENAME_PATTERNS[best]
+            return ClassificationResult(
+                document_type=doc_type,
+                confidence="high",
+                method="filename",
+                matched_pattern=pattern.pattern,
+            )
 
         return ClassificationResult(
             document_type=DocumentType.OTHER,
@@ -242,14 +307,20 @@ class DocumentClassifier:
         )
 
     def _classify_by_content(self, content: str) -> ClassificationResult:
-        """Classify based on content keyword analysis."""
-        content_lower = content.lower()
+        """Classify based on keyword analysis of a bounded content prefix."""
+        sample = content[: self.CONTENT_SAMPLE_CHARS].lower()
+
+        found: set[str] = set()
+        for match in self._content_regex.finditer(sample):
+            found.update(self._keyword_prefixes[match.group(1)])
+            if len(found) == self._keyword_count:
+                break
 
         best_match: tuple[str, int] | None = None
         best_score = 0
 
         for keywords, doc_type, min_matches in CONTENT_PATTERNS:
-            matches = sum(1 for kw in keywords if kw.lower() in content_lower)
+            matches = sum(1 for kw in keywords if kw.lower() in found)
             if matches >= min_matches and matches > best_score:
                 best_match = (doc_type, matches)
                 best_score = matches
@@ -5,6 +5,7 @@ Implements [document-processing:FR-004] - Generate embeddings with all-MiniLM-L6
 Implements [document-processing:NFR-003] - Embedding consistency
 """
 
+import threading
 from typing import Protocol
 
 import numpy as np
@@ -55,22 +56,25 @@ class EmbeddingService:
         """
         self._model: EmbeddingModel | None = model
         self._model_loaded = model is not None
+        self._load_lock = threading.Lock()
 
     def _load_model(self) -> EmbeddingModel:
-        """Lazy load the embedding model."""
+        """Lazy load the embedding model (once, even when first used from several threads)."""
         if self._model is None:
-            try:
-                from sentence_transformers import SentenceTransformer
-
-                logger.info("Loading embedding model", model=self.MODEL_NAME)
-                self._model = SentenceTransformer(self.MODEL_NAME)
-                self._model_loaded = True
-                logger.info("Embedding model loaded successfully")
-            except ImportError:
-                raise RuntimeError(
-                    "sentence-transformers not installed. "
-                    "Install with: pip install sentence-transformers"
-                )
+            with self._load_lock:
+                if self._model is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+
+                        logger.info("Loading embedding model", model=self.MODEL_NAME)
+                        self._model = SentenceTransformer(self.MODEL_NAME)
+                        self._model_loaded = True
+                        logger.info("Embedding model loaded successfully")
+                    except ImportError:
+                        raise RuntimeError(
+                            "sentence-transformers not installed. "
+                            "Install with: pip install sentence-transformers"
+                        )
         return self._model
 
     def embed(self, text: str) -> list[float]:
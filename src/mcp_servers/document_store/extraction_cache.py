@@ -0,0 +1,209 @@
+"""
+Persistent cache of PDF extraction results.
+
+Implements [document-processing:FR-001] - PDF text extraction (cached re-use)
+
+Re-chunking, re-embedding, reindexing and retries all need the page texts of
+a PDF that has already been through PyMuPDF/OCR. Results are cached on disk
+keyed by the file's SHA-256 and an extraction fingerprint (processor version
+and the settings that change its output), so they are never re-extracted.
+
+File format: a gzip-compressed stream of JSON lines. The first line is a
+header; every following line is a row group of up to ROW_GROUP_SIZE pages
+stored column-wise ({"page_number": [...], "text": [...], ...}). Row groups
+are written and read one at a time, so neither side holds a whole document.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.mcp_servers.document_store.processor import PageExtraction
+from src.shared.hashing import sha256_file
+
+logger = structlog.get_logger(__name__)
+
+CACHE_FORMAT = "page-extraction"
+CACHE_FORMAT_VERSION = 1
+
+# Column order for row groups; must match PageExtraction fields
+_COLUMNS = (
+    "page_number",
+    "text",
+    "extraction_method",
+    "char_count",
+    "word_count",
+    "contains_drawings",
+    "ocr_confidence",
+    "image_ratio",
+)
+
+
+class ExtractionCache:
+    """
+    Disk-backed cache of per-page extraction results.
+
+    Entries live at {cache_dir}/{sha[:2]}/{sha}.{fingerprint}.jsonl.gz and are
+    written to a temporary file then atomically renamed, so a partially
+    written entry is never served.
+    """
+
+    ROW_GROUP_SIZE = 64
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """
+        Initialize the extraction cache.
+
+        Args:
+            cache_dir: Directory for cache files (created on first write).
+        """
+        self._cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ExtractionCache | None":
+        """Create a cache from EXTRACTION_CACHE_DIR, or None when unset."""
+        cache_dir = os.getenv("EXTRACTION_CACHE_DIR")
+        if not cache_dir:
+            return None
+        return cls(cache_dir)
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the cache directory."""
+        return self._cache_dir
+
+    @staticmethod
+    def hash_file(file_path: str | Path) -> str:
+        """Compute the SHA256 cache key of a file."""
+        return sha256_file(file_path)
+
+    def _entry_path(self, file_hash: str, fingerprint: str) -> Path:
+        return self._cache_dir / file_hash[:2] / f"{file_hash}.{fingerprint}.jsonl.gz"
+
+    def contains(self, file_hash: str, fingerprint: str) -> bool:
+        """Check whether a complete entry exists."""
+        return self._entry_path(file_hash, fingerprint).exists()
+
+    def iter_pages(self, file_hash: str, fingerprint: str) -> Iterator[PageExtraction] | None:
+        """
+        Get cached pages for a file.
+
+        Args:
+            file_hash: SHA256 hash of the source file.
+            fingerprint: Extraction fingerprint from DocumentProcessor.
+
+        Returns:
+            An iterator over cached pages, or None on a miss or unreadable entry.
+        """
+        path = self._entry_path(file_hash, fingerprint)
+        if not path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as stream:
+                header = json.loads(stream.readline())
+        except (OSError, ValueError) as e:
+            logger.warning("Unreadable extraction cache entry", path=str(path), error=str(e))
+            self.misses += 1
+            return None
+
+        if header.get("format") != CACHE_FORMAT or header.get("version") != CACHE_FORMAT_VERSION:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.info("Extraction cache hit", file_hash=file_hash[:16], fingerprint=fingerprint)
+        return self._read_row_groups(path)
+
+    @staticmethod
+    def _read_row_groups(path: Path) -> Iterator[PageExtraction]:
+        with gzip.open(path, "rt", encoding="utf-8") as stream:
+            stream.readline()  # header, checked by iter_pages
+            for line in stream:
+                group = json.loads(line)
+                for row in zip(*(group[c] for c in _COLUMNS), strict=True):
+                    yield PageExtraction(**dict(zip(_COLUMNS, row, strict=True)))
+
+    def write_through(
+        self,
+        file_hash: str,
+        fingerprint: str,
+        pages: Iterable[PageExtraction],
+    ) -> Iterator[PageExtraction]:
+        """
+        Pass pages through while writing them to the cache.
+
+        The entry is committed only if the iterator is fully consumed; if the
+        consumer stops early or extraction fails, the temporary file is removed.
+
+        Args:
+            file_hash: SHA256 hash of the source file.
+            fingerprint: Extraction fingerprint from DocumentProcessor.
+            pages: Freshly extracted pages, in page order.
+
+        Yields:
+            The same pages, unchanged.
+        """
+        path = self._entry_path(file_hash, fingerprint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+
+        header = {
+            "format": CACHE_FORMAT,
+            "version": CACHE_FORMAT_VERSION,
+            "file_hash": file_hash,
+            "fingerprint": fingerprint,
+        }
+
+        committed = False
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as stream:
+                stream.write(json.dumps(header, separators=(",", ":")) + "\n")
+                group: list[PageExtraction] = []
+                total_pages = 0
+                for page in pages:
+                    group.append(page)
+                    total_pages += 1
+                    if len(group) >= self.ROW_GROUP_SIZE:
+                        self._write_row_group(stream, group)
+                        group = []
+                    yield page
+                if group:
+                    self._write_row_group(stream, group)
+
+            os.replace(tmp_path, path)
+            committed = True
+            logger.info(
+                "Extraction cached",
+                file_hash=file_hash[:16],
+                fingerprint=fingerprint,
+                pages=total_pages,
+            )
+        finally:
+            if not committed:
+                tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _write_row_group(stream: Any, group: list[PageExtraction]) -> None:
+        columns = {c: [getattr(p, c) for p in group] for c in _COLUMNS}
+        stream.write(json.dumps(columns, separators=(",", ":")) + "\n")
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
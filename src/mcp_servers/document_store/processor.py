@@ -6,6 +6,7 @@ Implements [document-processing:FR-002] - OCR via Tesseract for scanned document
 Implements [document-processing:FR-012] - Detection of image-heavy pages
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -31,6 +32,8 @@ except ImportError:
 if TYPE_CHECKING:
     from PIL import Image as PILImage
 
+    from src.mcp_servers.document_store.extraction_cache import ExtractionCache
+
 logger = structlog.get_logger(__name__)
 
 
@@ -121,7 +124,15 @@ class DocumentProcessor:
         re.IGNORECASE,
     )
 
-    def __init__(self, enable_ocr: bool = True) -> None:
+    # Bump when a change to extraction logic alters page output, so cached
+    # extractions from older versions are no longer served
+    EXTRACTION_VERSION = 1
+
+    def __init__(
+        self,
+        enable_ocr: bool = True,
+        extraction_cache: "ExtractionCache | None" = None,
+    ) -> None:
         """
         Initialize the document processor.
 
@@ -129,8 +140,11 @@ class DocumentProcessor:
 
         Args:
             enable_ocr: Whether to enable OCR fallback for scanned documents.
+            extraction_cache: Optional cache of PDF extraction results, used
+                when callers supply the file's hash.
         """
         self.enable_ocr = enable_ocr
+        self.extraction_cache = extraction_cache
         self._ocr_available: bool | None = None
         # Implements [document-type-detection:NFR-002] - Override threshold from env
         threshold_str = os.getenv("IMAGE_RATIO_THRESHOLD")
@@ -239,7 +253,19 @@ class DocumentProcessor:
 
         return self._ocr_available
 
-    def extract_text(self, file_path: str | Path) -> DocumentExtraction:
+    def extraction_fingerprint(self, path: Path) -> str:
+        """
+        Identify the settings that determine extraction output for a file.
+
+        Cached extractions are keyed by file hash plus this fingerprint, so a
+        processor upgrade or a change in OCR/threshold settings misses the cache.
+        """
+        ocr = self.enable_ocr and not self._is_rendering(path) and self._check_ocr_available()
+        return f"v{self.EXTRACTION_VERSION}-ocr{int(ocr)}-img{self.IMAGE_HEAVY_THRESHOLD:g}"
+
+    def extract_text(
+        self, file_path: str | Path, file_hash: str | None = None
+    ) -> DocumentExtraction:
         """
         Extract text from a document.
 
@@ -247,6 +273,7 @@ class DocumentProcessor:
 
         Args:
             file_path: Path to the document file.
+            file_hash: SHA256 of the file, if already known (extraction cache key).
 
         Returns:
             DocumentExtraction with extracted text and metadata.
@@ -271,15 +298,81 @@ class DocumentProcessor:
         logger.info("Starting text extraction", file_path=str(path), extension=extension)
 
         if extension == ".pdf":
-            return self._extract_from_pdf(path)
+            return self._extract_from_pdf(path, file_hash)
         else:
             return self._extract_from_image(path)
 
-    def _extract_from_pdf(self, path: Path) -> DocumentExtraction:
+    def iter_pages(
+        self, file_path: str | Path, file_hash: str | None = None
+    ) -> Iterator[PageExtraction]:
         """
-        Extract text from a PDF file.
+        Extract a document page by page.
 
-        Implements [document-processing:DocumentProcessor/TS-01] - Text layer extraction
+        Implements [document-processing:FR-001] - PDF text extraction (streaming)
+
+        Yields one PageExtraction at a time so callers can chunk and embed
+        incrementally without holding every page of a large document in memory.
+        Image files yield a single OCR page.
+
+        Args:
+            file_path: Path to the document file.
+            file_hash: SHA256 of the file, if already known (extraction cache key).
+
+        Yields:
+            PageExtraction for each page, in page order.
+
+        Raises:
+            ExtractionError: If the file cannot be processed.
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file type is not supported.
+        """
+        path = Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        extension = path.suffix.lower()
+        if extension not in self.SUPPORTED_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported file type: {extension}. "
+                f"Supported types: {', '.join(self.SUPPORTED_EXTENSIONS)}"
+            )
+
+        if extension == ".pdf":
+            yield from self._iter_pdf_pages_cached(path, file_hash)
+        else:
+            yield from self._extract_from_image(path).pages
+
+    def _iter_pdf_pages_cached(
+        self, path: Path, file_hash: str | None
+    ) -> Iterator[PageExtraction]:
+        """
+        Yield PDF pages from the extraction cache, extracting on a miss.
+
+        A miss writes pages through to the cache as they are extracted; the
+        entry is only committed once every page has been consumed. The file is
+        hashed here only if the caller has not already done so.
+        """
+        if self.extraction_cache is None:
+            return self._iter_pdf_pages(path)
+
+        if file_hash is None:
+            file_hash = self.extraction_cache.hash_file(path)
+
+        fingerprint = self.extraction_fingerprint(path)
+        cached = self.extraction_cache.iter_pages(file_hash, fingerprint)
+        if cached is not None:
+            return cached
+        return self.extraction_cache.write_through(
+            file_hash, fingerprint, self._iter_pdf_pages(path)
+        )
+
+    def _iter_pdf_pages(self, path: Path) -> Iterator[PageExtraction]:
+        """
+        Yield text extractions for each page of a PDF.
+
+        The document handle is held open only while the generator is consumed
+        and is always closed, including when the consumer stops early.
         """
         # Skip OCR for architectural renderings (perspectives, bird's eye views, etc.)
         # These are 3D renders that produce no useful text via OCR.
@@ -292,38 +385,42 @@ class DocumentProcessor:
         except Exception as e:
             raise ExtractionError(f"Failed to open PDF: {e}") from e
 
+        try:
+            for page_num in range(len(doc)):
+                try:
+                    page_extraction = self._extract_page(
+                        doc[page_num], page_num + 1, skip_ocr=skip_ocr
+                    )
+                except Exception as e:
+                    raise ExtractionError(f"Error extracting page {page_num + 1}: {e}") from e
+                yield page_extraction
+        finally:
+            doc.close()
+
+    def _extract_from_pdf(self, path: Path, file_hash: str | None = None) -> DocumentExtraction:
+        """
+        Extract text from a PDF file.
+
+        Implements [document-processing:DocumentProcessor/TS-01] - Text layer extraction
+        """
         pages: list[PageExtraction] = []
         total_chars = 0
         total_words = 0
         has_drawings = False
         methods_used: set[str] = set()
 
-        try:
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_extraction = self._extract_page(page, page_num + 1, skip_ocr=skip_ocr)
-                pages.append(page_extraction)
-
-                total_chars += page_extraction.char_count
-                total_words += page_extraction.word_count
-                methods_used.add(page_extraction.extraction_method)
+        for page_extraction in self._iter_pdf_pages_cached(path, file_hash):
+            pages.append(page_extraction)
 
-                if page_extraction.contains_drawings:
-                    has_drawings = True
+            total_chars += page_extraction.char_count
+            total_words += page_extraction.word_count
+            methods_used.add(page_extraction.extraction_method)
 
-        except Exception as e:
-            doc.close()
-            raise ExtractionError(f"Error extracting page {page_num + 1}: {e}") from e
-        finally:
-            doc.close()
+            if page_extraction.contains_drawings:
+                has_drawings = True
 
         # Determine overall extraction method
-        if len(methods_used) == 1:
-            overall_method = methods_used.pop()
-        elif methods_used:
-            overall_method = "mixed"
-        else:
-            overall_method = "text_layer"
+        overall_method = self.combine_extraction_methods(methods_used)
 
         logger.info(
             "PDF extraction complete",
@@ -344,6 +441,20 @@ class DocumentProcessor:
             total_word_count=total_words,
         )
 
+    @staticmethod
+    def combine_extraction_methods(methods_used: set[str]) -> str:
+        """
+        Reduce per-page extraction methods to a document-level method.
+
+        Returns the single method when all pages agree, "mixed" when they
+        differ, and "text_layer" when no pages were extracted.
+        """
+        if len(methods_used) == 1:
+            return next(iter(methods_used))
+        if methods_used:
+            return "mixed"
+        return "text_layer"
+
     def _extract_page(self, page: fitz.Page, page_number: int, *, skip_ocr: bool = False) -> PageExtraction:
         """
         Extract text from a single PDF page.
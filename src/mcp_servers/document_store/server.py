@@ -10,6 +10,8 @@ Implements [document-processing:FR-009] - list_ingested_documents tool
 import asyncio
 import json
 import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -24,17 +26,63 @@ from src.mcp_servers.document_store.chroma_client import (
     ChunkRecord,
     DocumentRecord,
 )
-from src.mcp_servers.document_store.chunker import TextChunker
+from src.mcp_servers.document_store.chunker import TextChunk, TextChunker
 from src.mcp_servers.document_store.classifier import DocumentClassifier
 from src.mcp_servers.document_store.embeddings import EmbeddingService
+from src.mcp_servers.document_store.extraction_cache import ExtractionCache
 from src.mcp_servers.document_store.processor import (
     DocumentProcessor,
     ExtractionError,
+    PageExtraction,
 )
 
 logger = structlog.get_logger(__name__)
 
 
+@dataclass
+class _IngestStats:
+    """
+    Running totals for a streamed ingestion.
+
+    Keeps a bounded "[Page N]" sample of the text for content classification
+    in place of DocumentExtraction.full_text.
+    """
+
+    sample_limit: int
+    page_count: int = 0
+    total_chars: int = 0
+    total_words: int = 0
+    contains_drawings: bool = False
+    methods_used: set[str] = field(default_factory=set)
+    _sample_parts: list[str] = field(default_factory=list)
+    _sample_chars: int = 0
+
+    def add_page(self, page: PageExtraction) -> None:
+        """Fold one extracted page into the totals and the classification sample."""
+        self.page_count += 1
+        self.total_chars += page.char_count
+        self.total_words += page.word_count
+        self.methods_used.add(page.extraction_method)
+        if page.contains_drawings:
+            self.contains_drawings = True
+
+        if not self.sample_full and page.text.strip():
+            part = f"[Page {page.page_number}]\n{page.text}"
+            part = part[: self.sample_limit - self._sample_chars]
+            self._sample_parts.append(part)
+            self._sample_chars += len(part)
+
+    @property
+    def sample_full(self) -> bool:
+        """Whether the classification sample has reached its size limit."""
+        return self._sample_chars >= self.sample_limit
+
+    @property
+    def sample_text(self) -> str:
+        """The bounded text sample, formatted like DocumentExtraction.full_text."""
+        return "\n\n".join(self._sample_parts)
+
+
 # Tool input schemas
 class IngestDocumentInput(BaseModel):
     """Input schema for ingest_document tool."""
@@ -44,6 +92,11 @@ class IngestDocumentInput(BaseModel):
     document_type: str | None = Field(
         default=None, description="Document type (e.g., 'transport_assessment'). Auto-classified if not provided."
     )
+    file_hash: str | None = Field(
+        default=None,
+        pattern=r"^[0-9a-f]{64}$",
+        description="SHA256 hex digest of the file, if already known (skips rehashing)",
+    )
 
 
 class SearchInput(BaseModel):
@@ -78,6 +131,12 @@ class DocumentStoreMCP:
     Implements [document-processing:DocumentStoreMCP/TS-12] - Server initialization
     """
 
+    # Chunks embedded and upserted per round trip during streaming ingestion
+    INGEST_BATCH_SIZE = 64
+
+    # Characters of leading text kept for content-based classification
+    CLASSIFICATION_SAMPLE_CHARS = 50_000
+
     def __init__(
         self,
         chroma_persist_dir: str | Path | None = None,
@@ -114,8 +173,15 @@ class DocumentStoreMCP:
     def _get_processor(self) -> DocumentProcessor:
         """Get or create DocumentProcessor."""
         if self._processor is None:
-            self._processor = DocumentProcessor(enable_ocr=self._enable_ocr)
-            logger.info("DocumentProcessor initialized", ocr_enabled=self._enable_ocr)
+            cache = ExtractionCache.from_env()
+            self._processor = DocumentProcessor(
+                enable_ocr=self._enable_ocr, extraction_cache=cache
+            )
+            logger.info(
+                "DocumentProcessor initialized",
+                ocr_enabled=self._enable_ocr,
+                extraction_cache=str(cache.cache_dir) if cache else None,
+            )
         return self._processor
 
     def _get_chunker(self) -> TextChunker:
@@ -218,9 +284,10 @@ class DocumentStoreMCP:
                 "message": f"Unsupported file type: {file_path.suffix}",
             }
 
-        # Compute file hash for idempotency
+        # Compute file hash for idempotency, unless the caller hashed the
+        # file at download time and passed it through
         chroma = self._get_chroma_client()
-        file_hash = ChromaClient.compute_file_hash(file_path)
+        file_hash = input.file_hash or ChromaClient.compute_file_hash(file_path)
 
         # Check if already ingested
         if chroma.is_document_ingested(file_hash, input.application_ref):
@@ -235,6 +302,14 @@ class DocumentStoreMCP:
                 "message": "Document has already been ingested with the same content",
             }
 
+        document_id = ChromaClient.generate_document_id(input.application_ref, file_hash)
+
+        # Identical content ingested for another application: link to its
+        # content-addressed chunks instead of re-extracting and re-embedding
+        existing = chroma.find_content_record(file_hash)
+        if existing is not None:
+            return self._link_existing_content(input, file_path, document_id, existing)
+
         # Implements [document-type-detection:FR-001] - Classify before extraction
         # Implements [document-type-detection:FR-002] - Skip ingestion for image-based docs
         processor = self._get_processor()
@@ -254,32 +329,52 @@ class DocumentStoreMCP:
                 "total_pages": classification.page_count,
             }
 
-        # Extract text
+        # Stream pages -> chunks -> embed+upsert batches so memory stays flat
+        # regardless of document size. Only a bounded text sample is retained
+        # for content-based classification.
+        stats = _IngestStats(sample_limit=self.CLASSIFICATION_SAMPLE_CHARS)
+
+        def page_stream() -> Iterator[tuple[int, str]]:
+            for page in processor.iter_pages(file_path, file_hash=file_hash):
+                stats.add_page(page)
+                yield page.page_number, page.text
+
+        pending: list[TextChunk] = []
+        chunk_ids: list[str] = []
+
         try:
-            extraction = processor.extract_text(file_path)
+            for chunk in self._get_chunker().iter_chunk_pages(page_stream()):
+                pending.append(chunk)
+                if len(pending) >= self.INGEST_BATCH_SIZE:
+                    chunk_ids.extend(self._store_chunk_batch(pending, file_hash, file_path.name))
+                    pending = []
+
+            # Skip if no text extracted
+            if stats.total_chars == 0:
+                logger.warning("No text extracted", file_path=str(file_path))
+                return {
+                    "status": "error",
+                    "error_type": "no_content",
+                    "message": "No text could be extracted from the document",
+                }
+
+            if pending:
+                chunk_ids.extend(self._store_chunk_batch(pending, file_hash, file_path.name))
+
         except ExtractionError as e:
             logger.error("Extraction failed", file_path=str(file_path), error=str(e))
+            chroma.delete_unreferenced_content(file_hash)
             return {
                 "status": "error",
                 "error_type": "extraction_failed",
                 "message": str(e),
             }
+        except Exception:
+            # Don't leave partially stored content behind
+            chroma.delete_unreferenced_content(file_hash)
+            raise
 
-        # Skip if no text extracted
-        if extraction.total_char_count == 0:
-            logger.warning("No text extracted", file_path=str(file_path))
-            return {
-                "status": "error",
-                "error_type": "no_content",
-                "message": "No text could be extracted from the document",
-            }
-
-        # Chunk text
-        chunker = self._get_chunker()
-        pages = [(p.page_number, p.text) for p in extraction.pages]
-        chunks = chunker.chunk_pages(pages)
-
-        if not chunks:
+        if not chunk_ids:
             logger.warning("No chunks produced", file_path=str(file_path))
             return {
                 "status": "error",
@@ -287,101 +382,158 @@ class DocumentStoreMCP:
                 "message": "Document produced no valid text chunks",
             }
 
-        # Generate embeddings
-        embedding_service = self._get_embedding_service()
-        texts = [c.text for c in chunks]
-        embeddings = embedding_service.embed_batch(texts)
+        # Document-level fields are only known once the stream is exhausted
+        extraction_method = DocumentProcessor.combine_extraction_methods(stats.methods_used)
+        chroma.update_chunk_metadata(
+            chunk_ids,
+            {"total_chunks": len(chunk_ids), "extraction_method": extraction_method},
+        )
 
-        # Generate document ID
-        document_id = ChromaClient.generate_document_id(input.application_ref, file_hash)
+        document_type = input.document_type or self._classify_document(
+            file_path, stats.sample_text
+        )
 
-        # Classify document type if not provided
-        if input.document_type:
-            document_type = input.document_type
-            classification_method = "provided"
-        else:
-            classifier = self._get_classifier()
-            # Use full text for content-based classification
-            full_text = extraction.full_text
-            classification = classifier.classify(file_path.name, content=full_text)
-            document_type = classification.document_type
-            classification_method = classification.method
-            logger.info(
-                "Document auto-classified",
-                filename=file_path.name,
-                document_type=document_type,
-                confidence=classification.confidence,
-                method=classification_method,
-            )
+        # Register document
+        import datetime
 
-        # Create chunk records
-        chunk_records = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=True)):
-            chunk_id = ChromaClient.generate_chunk_id(
-                application_ref=input.application_ref,
+        chroma.register_document(
+            DocumentRecord(
+                document_id=document_id,
+                file_path=str(file_path),
                 file_hash=file_hash,
-                page_number=chunk.page_numbers[0] if chunk.page_numbers else 0,
-                chunk_index=i,
-            )
-            # ChromaDB metadata must be str, int, float, bool, or None (no lists)
-            page_numbers_str = ",".join(str(p) for p in chunk.page_numbers) if chunk.page_numbers else ""
-            chunk_records.append(
-                ChunkRecord(
-                    chunk_id=chunk_id,
-                    text=chunk.text,
-                    embedding=embedding,
-                    metadata={
-                        "application_ref": input.application_ref,
-                        "document_id": document_id,
-                        "source_file": file_path.name,
-                        "document_type": document_type,
-                        "page_numbers": page_numbers_str,
-                        "chunk_index": i,
-                        "total_chunks": len(chunks),
-                        "extraction_method": extraction.extraction_method,
-                        "char_count": chunk.char_count,
-                        "word_count": chunk.word_count,
-                    },
-                )
+                application_ref=input.application_ref,
+                document_type=document_type,
+                chunk_count=len(chunk_ids),
+                ingested_at=datetime.datetime.now(datetime.UTC).isoformat(),
+                extraction_method=extraction_method,
+                contains_drawings=stats.contains_drawings,
             )
+        )
 
-        # Store chunks
-        chroma.upsert_chunks(chunk_records)
+        logger.info(
+            "Document ingested",
+            document_id=document_id,
+            chunks=len(chunk_ids),
+            pages=stats.page_count,
+            extraction_method=extraction_method,
+        )
 
-        # Register document
+        return {
+            "status": "success",
+            "document_id": document_id,
+            "chunks_created": len(chunk_ids),
+            "extraction_method": extraction_method,
+            "contains_drawings": stats.contains_drawings,
+            "total_chars": stats.total_chars,
+            "total_words": stats.total_words,
+        }
+
+    def _classify_document(self, file_path: Path, sample_text: str) -> str:
+        """Auto-classify a document from its filename and a bounded content sample."""
+        classification = self._get_classifier().classify(file_path.name, content=sample_text)
+        logger.info(
+            "Document auto-classified",
+            filename=file_path.name,
+            document_type=classification.document_type,
+            confidence=classification.confidence,
+            method=classification.method,
+        )
+        return classification.document_type
+
+    def _link_existing_content(
+        self,
+        input: IngestDocumentInput,
+        file_path: Path,
+        document_id: str,
+        existing: DocumentRecord,
+    ) -> dict[str, Any]:
+        """
+        Register a document that reuses chunks already stored for its content.
+
+        The new registry entry is the per-application reference; extraction,
+        chunks and embeddings are shared with the existing document.
+        """
         import datetime
 
-        chroma.register_document(
+        document_type = input.document_type or existing.document_type
+        self._get_chroma_client().register_document(
             DocumentRecord(
                 document_id=document_id,
                 file_path=str(file_path),
-                file_hash=file_hash,
+                file_hash=existing.file_hash,
                 application_ref=input.application_ref,
                 document_type=document_type,
-                chunk_count=len(chunk_records),
+                chunk_count=existing.chunk_count,
                 ingested_at=datetime.datetime.now(datetime.UTC).isoformat(),
-                extraction_method=extraction.extraction_method,
-                contains_drawings=extraction.contains_drawings,
+                extraction_method=existing.extraction_method,
+                contains_drawings=existing.contains_drawings,
             )
         )
 
         logger.info(
-            "Document ingested",
+            "Document linked to existing content",
             document_id=document_id,
-            chunks=len(chunk_records),
-            extraction_method=extraction.extraction_method,
+            linked_from=existing.document_id,
+            chunks=existing.chunk_count,
         )
 
         return {
             "status": "success",
             "document_id": document_id,
-            "chunks_created": len(chunk_records),
-            "extraction_method": extraction.extraction_method,
-            "contains_drawings": extraction.contains_drawings,
-            "total_chars": extraction.total_char_count,
-            "total_words": extraction.total_word_count,
+            "chunks_created": 0,
+            "chunks_linked": existing.chunk_count,
+            "deduplicated_from": existing.document_id,
+            "extraction_method": existing.extraction_method,
+            "contains_drawings": existing.contains_drawings,
         }
 
+    def _store_chunk_batch(
+        self,
+        chunks: list[TextChunk],
+        file_hash: str,
+        source_file: str,
+    ) -> list[str]:
+        """
+        Embed and upsert one batch of content-addressed chunks.
+
+        Chunks are keyed by file hash only and carry no application fields, so
+        they can be shared by every document with the same content. total_chunks
+        and extraction_method are patched in once ingestion has finished, since
+        neither is known while pages are still streaming.
+
+        Returns:
+            The IDs of the stored chunks.
+        """
+        embeddings = self._get_embedding_service().embed_batch([c.text for c in chunks])
+
+        chunk_records = []
+        for chunk, embedding in zip(chunks, embeddings, strict=True):
+            chunk_id = ChromaClient.generate_content_chunk_id(
+                file_hash=file_hash,
+                page_number=chunk.page_numbers[0] if chunk.page_numbers else 0,
+                chunk_index=chunk.chunk_index,
+            )
+            # ChromaDB metadata must be str, int, float, bool, or None (no lists)
+            page_numbers_str = ",".join(str(p) for p in chunk.page_numbers) if chunk.page_numbers else ""
+            chunk_records.append(
+                ChunkRecord(
+                    chunk_id=chunk_id,
+                    text=chunk.text,
+                    embedding=embedding,
+                    metadata={
+                        "file_hash": file_hash,
+                        "source_file": source_file,
+                        "page_numbers": page_numbers_str,
+                        "chunk_index": chunk.chunk_index,
+                        "char_count": chunk.char_count,
+                        "word_count": chunk.word_count,
+                    },
+                )
+            )
+
+        self._get_chroma_client().upsert_chunks(chunk_records)
+        return [r.chunk_id for r in chunk_records]
+
     async def _search_documents(self, input: SearchInput) -> dict[str, Any]:
         """
         Search documents using semantic search.
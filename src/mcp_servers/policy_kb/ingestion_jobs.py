@@ -0,0 +1,102 @@
+"""
+Background ingestion jobs for the Policy KB MCP server.
+
+Implements [policy-knowledge-base:PolicyKBMCP/TS-10] - Ingest policy revision (non-blocking)
+
+ingest_policy_revision returns a job handle straight away. Extraction,
+chunking, embedding and ChromaDB writes run in an executor, so searches
+served by the same event loop are not stalled by an admin ingest or reindex.
+Jobs are kept in process so get_ingestion_status can report on them.
+"""
+
+import asyncio
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+# Finished jobs kept for status queries; running jobs are never dropped
+MAX_FINISHED_JOBS = 100
+
+
+@dataclass
+class IngestionJob:
+    """An ingest or reindex of one policy revision."""
+
+    job_id: str
+    source: str
+    revision_id: str
+    reindex: bool
+    status: str = "queued"  # "queued", "running", "complete", "failed"
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    finished_at: datetime | None = None
+    result: dict[str, Any] | None = None
+    task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has completed or failed."""
+        return self.status in ("complete", "failed")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise for tool responses."""
+        return {
+            "job_id": self.job_id,
+            "source": self.source,
+            "revision_id": self.revision_id,
+            "reindex": self.reindex,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "result": self.result,
+        }
+
+
+class IngestionJobs:
+    """In-process table of ingestion jobs."""
+
+    def __init__(self, max_finished: int = MAX_FINISHED_JOBS) -> None:
+        """
+        Initialize the job table.
+
+        Args:
+            max_finished: Finished jobs to keep before dropping the oldest.
+        """
+        self._max_finished = max_finished
+        self._jobs: OrderedDict[str, IngestionJob] = OrderedDict()
+
+    def create(self, source: str, revision_id: str, reindex: bool) -> IngestionJob:
+        """Register a new queued job."""
+        job = IngestionJob(
+            job_id=f"ingest_{uuid.uuid4().hex[:12]}",
+            source=source,
+            revision_id=revision_id,
+            reindex=reindex,
+        )
+        self._jobs[job.job_id] = job
+        self._prune()
+        return job
+
+    def get(self, job_id: str) -> IngestionJob | None:
+        """Get a job by ID."""
+        return self._jobs.get(job_id)
+
+    def active_for(self, source: str, revision_id: str) -> IngestionJob | None:
+        """Get the unfinished job for a revision, if any."""
+        for job in self._jobs.values():
+            if job.source == source and job.revision_id == revision_id and not job.finished:
+                return job
+        return None
+
+    def finish(self, job: IngestionJob, status: str, result: dict[str, Any]) -> None:
+        """Record a job's outcome."""
+        job.status = status
+        job.result = result
+        job.finished_at = datetime.now(UTC)
+        self._prune()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self._max_finished)]:
+            del self._jobs[job_id]
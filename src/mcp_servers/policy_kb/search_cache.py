@@ -0,0 +1,117 @@
+"""
+In-process cache of policy search results.
+
+Implements [policy-knowledge-base:FR-005] - search_policy (cached re-use)
+
+Reviews ask search_policy near-identical questions, and the agent's fallback
+queries are identical across reviews. Results are cached keyed by the
+normalised query, the filters and the corpus generation, so any ingest or
+removal makes earlier entries unreachable without an explicit flush.
+Entries also expire after a TTL, and the least recently used entry is
+evicted when the cache is full.
+"""
+
+import copy
+import os
+import time
+from collections import OrderedDict
+from typing import Any
+
+SearchCacheKey = tuple[Any, ...]
+
+
+class SearchResultCache:
+    """LRU + TTL cache of search_policy responses."""
+
+    DEFAULT_MAX_ENTRIES = 512
+    DEFAULT_TTL_SECONDS = 3600.0
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the search result cache.
+
+        Args:
+            max_entries: Maximum number of cached responses.
+            ttl_seconds: Seconds before an entry expires.
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[SearchCacheKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> "SearchResultCache":
+        """Create a cache sized by POLICY_SEARCH_CACHE_SIZE and POLICY_SEARCH_CACHE_TTL."""
+        return cls(
+            max_entries=int(os.getenv("POLICY_SEARCH_CACHE_SIZE", str(cls.DEFAULT_MAX_ENTRIES))),
+            ttl_seconds=float(os.getenv("POLICY_SEARCH_CACHE_TTL", str(cls.DEFAULT_TTL_SECONDS))),
+        )
+
+    @staticmethod
+    def make_key(
+        query: str,
+        sources: list[str] | None,
+        effective_date: str | None,
+        n_results: int,
+        generation: tuple[int, ...],
+    ) -> SearchCacheKey:
+        """
+        Build a cache key.
+
+        Queries are compared case-insensitively with whitespace collapsed, and
+        source filters regardless of order or duplicates.
+        """
+        normalised_query = " ".join(query.casefold().split())
+        normalised_sources = tuple(sorted(set(sources))) if sources else None
+        return (normalised_query, normalised_sources, effective_date, n_results, generation)
+
+    def get(self, key: SearchCacheKey) -> dict[str, Any] | None:
+        """
+        Get a cached response.
+
+        Returns:
+            A copy of the cached response, or None on a miss or expired entry.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: SearchCacheKey, response: dict[str, Any]) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, copy.deepcopy(response))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters for this process."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
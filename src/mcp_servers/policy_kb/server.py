@@ -26,22 +26,31 @@ Implements:
 import asyncio
 import json
 import os
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from mcp.server import Server
 from mcp.types import TextContent, Tool
 from pydantic import BaseModel, Field
 from starlette.applications import Starlette
+from starlette.responses import JSONResponse
 
+from src.api.schemas.policy import PolicyRevisionRecord
 from src.mcp_servers.document_store.chunker import TextChunker
 from src.mcp_servers.document_store.embeddings import EmbeddingService
+from src.mcp_servers.document_store.extraction_cache import ExtractionCache
 from src.mcp_servers.document_store.processor import DocumentProcessor
-from src.shared.policy_chroma_client import PolicyChromaClient
+from src.mcp_servers.policy_kb.ingestion_jobs import IngestionJob, IngestionJobs
+from src.mcp_servers.policy_kb.search_cache import SearchResultCache
+from src.shared.policy_chroma_client import PolicyChromaClient, PolicyChunkRecord
 from src.shared.policy_registry import PolicyRegistry
 
+if TYPE_CHECKING:
+    from src.worker.policy_jobs import PreparedRevision
+
 logger = structlog.get_logger(__name__)
 
 
@@ -81,7 +90,16 @@ class IngestPolicyRevisionInput(BaseModel):
     source: str = Field(description="Policy source slug")
     revision_id: str = Field(description="Revision ID")
     file_path: str = Field(description="Path to PDF file")
-    reindex: bool = Field(default=False, description="If True, delete existing chunks first")
+    reindex: bool = Field(
+        default=False,
+        description="If True, replace existing chunks, re-embedding only changed text",
+    )
+
+
+class GetIngestionStatusInput(BaseModel):
+    """Input schema for get_ingestion_status tool."""
+
+    job_id: str = Field(description="Job ID returned by ingest_policy_revision")
 
 
 class RemovePolicyRevisionInput(BaseModel):
@@ -105,6 +123,9 @@ class PolicyKBMCP:
         embedder: EmbeddingService | None = None,
         processor: DocumentProcessor | None = None,
         chunker: TextChunker | None = None,
+        search_cache: SearchResultCache | None = None,
+        use_current_view: bool | None = None,
+        ingest_executor: Executor | None = None,
     ) -> None:
         """
         Initialize the Policy KB MCP server.
@@ -115,12 +136,31 @@ class PolicyKBMCP:
             embedder: EmbeddingService for generating embeddings.
             processor: DocumentProcessor for PDF extraction.
             chunker: TextChunker for chunking text.
+            search_cache: Cache for search_policy results (defaults to one
+                configured from the environment).
+            use_current_view: Serve present-day searches from the
+                current-in-force collection (defaults to POLICY_CURRENT_VIEW,
+                enabled unless set to "false").
+            ingest_executor: Executor for blocking ingestion work (defaults
+                to a single thread, so ingests run one at a time).
         """
         self._registry = registry
         self._chroma_client = chroma_client
         self._embedder = embedder
         self._processor = processor
         self._chunker = chunker
+        self._search_cache = search_cache or SearchResultCache.from_env()
+        # Corpus changes made by this process; covers running without a registry
+        self._corpus_changes = 0
+        if use_current_view is None:
+            use_current_view = os.getenv("POLICY_CURRENT_VIEW", "true").lower() != "false"
+        self._use_current_view = use_current_view
+        # (as_of, registry generation) of the current view last confirmed fresh
+        self._current_view_key: tuple[date, int] | None = None
+        self._ingest_executor = ingest_executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="policy-ingest"
+        )
+        self._ingestion_jobs = IngestionJobs()
 
         # MCP server
         self._server = Server("policy-kb-mcp")
@@ -144,7 +184,9 @@ class PolicyKBMCP:
     def _get_processor(self) -> DocumentProcessor:
         """Get or create DocumentProcessor."""
         if self._processor is None:
-            self._processor = DocumentProcessor(enable_ocr=True)
+            self._processor = DocumentProcessor(
+                enable_ocr=True, extraction_cache=ExtractionCache.from_env()
+            )
             logger.info("DocumentProcessor initialized")
         return self._processor
 
@@ -155,6 +197,84 @@ class PolicyKBMCP:
             logger.info("TextChunker initialized")
         return self._chunker
 
+    @property
+    def search_cache(self) -> SearchResultCache:
+        """Get the search result cache."""
+        return self._search_cache
+
+    async def _corpus_generation(self) -> tuple[int, ...] | None:
+        """
+        Get the corpus generation used in search cache keys.
+
+        Combines the registry generation, which changes whenever any process
+        ingests, reindexes or removes a revision, with this process's own
+        change counter.
+
+        Returns:
+            Generation tuple, or None if the registry cannot be read (the
+            cache is then bypassed).
+        """
+        if self._registry is None:
+            return (self._corpus_changes,)
+        try:
+            return (await self._registry.get_generation(), self._corpus_changes)
+        except Exception as e:
+            logger.warning("Corpus generation unavailable, bypassing search cache", error=str(e))
+            return None
+
+    async def _current_view_ready(
+        self, effective_date: date, generation: tuple[int, ...] | None
+    ) -> bool:
+        """
+        Check whether a search can be served from the current-in-force collection.
+
+        Only present-day searches qualify. If the collection's membership was
+        computed for another day or an older registry generation, it is
+        refreshed from the registry first.
+
+        Args:
+            effective_date: The search's effective date.
+            generation: Corpus generation from _corpus_generation().
+
+        Returns:
+            True if the current view is fresh for effective_date.
+        """
+        today = date.today()
+        if (
+            not self._use_current_view
+            or self._registry is None
+            or generation is None
+            or effective_date != today
+        ):
+            return False
+
+        key = (today, generation[0])
+        if self._current_view_key == key:
+            return True
+
+        chroma = self._get_chroma_client()
+        try:
+            view = chroma.get_current_view()
+            if view is None or (view.as_of, view.generation) != key:
+                in_force = await self._registry.get_all_effective_for_date(today)
+                chroma.refresh_current_view(
+                    {(source, rev.revision_id) for source, rev in in_force.items() if rev},
+                    as_of=today,
+                    generation=generation[0],
+                )
+        except Exception as e:
+            logger.warning("Current policy view unavailable, using filtered search", error=str(e))
+            return False
+
+        self._current_view_key = key
+        return True
+
+    async def _record_corpus_change(self, source: str, revision_id: str) -> None:
+        """Invalidate cached search results after chunks are added or removed."""
+        self._corpus_changes += 1
+        if self._registry is not None:
+            await self._registry.notify_change(source, revision_id)
+
     def _setup_handlers(self) -> None:
         """Set up MCP server handlers."""
 
@@ -184,9 +304,14 @@ class PolicyKBMCP:
                 ),
                 Tool(
                     name="ingest_policy_revision",
-                    description="Ingest a policy revision PDF into the vector store.",
+                    description="Start ingesting a policy revision PDF into the vector store. Returns a job handle immediately.",
                     inputSchema=IngestPolicyRevisionInput.model_json_schema(),
                 ),
+                Tool(
+                    name="get_ingestion_status",
+                    description="Get the status and result of a policy ingestion job.",
+                    inputSchema=GetIngestionStatusInput.model_json_schema(),
+                ),
                 Tool(
                     name="remove_policy_revision",
                     description="Remove all chunks for a policy revision from the vector store.",
@@ -208,6 +333,8 @@ class PolicyKBMCP:
                     result = await self._list_policy_revisions(ListPolicyRevisionsInput(**arguments))
                 elif name == "ingest_policy_revision":
                     result = await self._ingest_policy_revision(IngestPolicyRevisionInput(**arguments))
+                elif name == "get_ingestion_status":
+                    result = await self._get_ingestion_status(GetIngestionStatusInput(**arguments))
                 elif name == "remove_policy_revision":
                     result = await self._remove_policy_revision(RemovePolicyRevisionInput(**arguments))
                 else:
@@ -224,6 +351,7 @@ class PolicyKBMCP:
         Search policy documents with optional temporal filtering.
 
         Implements [policy-knowledge-base:PolicyKBMCP/TS-01] - Search without date filter
+            (an undated search is answered as of today)
         Implements [policy-knowledge-base:PolicyKBMCP/TS-02] - Search with effective date
         Implements [policy-knowledge-base:PolicyKBMCP/TS-03] - Search filtered by sources
         Implements [policy-knowledge-base:PolicyKBMCP/TS-04] - Date before any revision
@@ -240,29 +368,56 @@ class PolicyKBMCP:
                     "error_type": "invalid_date",
                     "message": f"Invalid date format: {input.effective_date}. Use YYYY-MM-DD.",
                 }
+        # Undated searches are present-day on every path, including the
+        # filtered fallback when the current view is off or unavailable
+        search_date = effective_date or date.today()
+
+        generation = await self._corpus_generation()
+        cache_key = SearchResultCache.make_key(
+            input.query,
+            input.sources,
+            search_date.isoformat(),
+            input.n_results,
+            generation or (),
+        )
+        if generation is not None:
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                cached["query"] = input.query
+                logger.info(
+                    "Policy search cache hit",
+                    query=input.query[:50],
+                    results_count=cached["results_count"],
+                )
+                return cached
 
-        # Generate query embedding
+        # Generate query embedding off the event loop (model inference, and
+        # the model load on first use)
         embedder = self._get_embedder()
-        query_embedding = embedder.embed(input.query)
+        query_embedding = await asyncio.to_thread(embedder.embed, input.query)
 
-        # Search ChromaDB
+        # Search ChromaDB: present-day queries hit the small current-in-force
+        # collection, historical ones the temporally filtered full collection
+        use_current_view = await self._current_view_ready(search_date, generation)
         chroma = self._get_chroma_client()
         results = chroma.search(
             query_embedding=query_embedding,
             n_results=input.n_results,
-            effective_date=effective_date,
+            effective_date=search_date,
             sources=input.sources,
+            use_current_view=use_current_view,
         )
 
         logger.info(
             "Policy search completed",
             query=input.query[:50],
             results_count=len(results),
-            effective_date=str(effective_date) if effective_date else None,
+            effective_date=str(search_date),
             sources=input.sources,
+            current_view=use_current_view,
         )
 
-        return {
+        response = {
             "status": "success",
             "query": input.query,
             "effective_date": input.effective_date,
@@ -281,6 +436,9 @@ class PolicyKBMCP:
                 for r in results
             ],
         }
+        if generation is not None:
+            self._search_cache.put(cache_key, response)
+        return response
 
     async def _get_policy_section(self, input: GetPolicySectionInput) -> dict[str, Any]:
         """
@@ -292,24 +450,31 @@ class PolicyKBMCP:
         """
         chroma = self._get_chroma_client()
 
-        # Query for section by metadata filter
-        # We search for chunks where section_ref matches
-        # Use a dummy embedding and filter by metadata
-        embedder = self._get_embedder()
-        query_embedding = embedder.embed(input.section_ref)
+        # Default to the revision currently in force
+        revision_id = input.revision_id
+        if revision_id is None and self._registry is not None:
+            current = await self._registry.get_current_revision(input.source)
+            revision_id = current.revision_id if current is not None else None
+
+        # Exact lookup through the section index written at ingest time
+        chunk_ids: list[str] | None = None
+        if revision_id is not None and self._registry is not None:
+            chunk_ids = await self._registry.get_section_chunk_ids(
+                input.source, revision_id, input.section_ref
+            )
 
-        results = chroma.search(
-            query_embedding=query_embedding,
-            n_results=20,  # Get more results to find exact match
-            sources=[input.source],
-            revision_id=input.revision_id,
-        )
+        matching_chunks = chroma.get_chunks_by_ids(chunk_ids) if chunk_ids else []
 
-        # Filter to exact section_ref matches
-        matching_chunks = [
-            r for r in results
-            if r.section_ref == input.section_ref
-        ]
+        if chunk_ids is None or (chunk_ids and not matching_chunks):
+            # Revision ingested without an index (or index out of date):
+            # exact metadata match instead
+            matching_chunks = chroma.get_section_chunks(
+                input.source, input.section_ref, revision_id
+            )
+            if revision_id is None and matching_chunks:
+                # Sorted by effective_from, so the last chunk is from the newest revision
+                latest = matching_chunks[-1].revision_id
+                matching_chunks = [c for c in matching_chunks if c.revision_id == latest]
 
         if not matching_chunks:
             logger.warning(
@@ -414,9 +579,13 @@ class PolicyKBMCP:
 
     async def _ingest_policy_revision(self, input: IngestPolicyRevisionInput) -> dict[str, Any]:
         """
-        Ingest a policy revision PDF.
+        Start ingesting a policy revision PDF in the background.
 
         Implements [policy-knowledge-base:PolicyKBMCP/TS-10] - Ingest policy revision
+
+        Validates the request and returns a job handle straight away; use
+        get_ingestion_status to follow the job. A second request for a
+        revision that is already being ingested returns the existing job.
         """
         file_path = Path(input.file_path)
 
@@ -443,99 +612,171 @@ class PolicyKBMCP:
                 "message": f"Revision not found: {input.source}/{input.revision_id}",
             }
 
-        chroma = self._get_chroma_client()
-
-        # If reindex, clear existing chunks first
-        if input.reindex:
-            deleted_count = chroma.delete_revision_chunks(input.source, input.revision_id)
-            logger.info(
-                "Cleared existing chunks for reindex",
-                source=input.source,
-                revision_id=input.revision_id,
-                deleted_count=deleted_count,
-            )
-
-        # Extract text from PDF
-        processor = self._get_processor()
-        extraction = processor.extract_text(str(file_path))
-
-        # Chunk the text
-        chunker = self._get_chunker()
-        pages_with_text = [
-            (page.page_number, page.text)
-            for page in extraction.pages
-            if page.text.strip()
-        ]
-        chunks = chunker.chunk_pages(pages_with_text)
-
-        if not chunks:
-            return {
-                "status": "error",
-                "error_type": "no_content",
-                "message": "No text could be extracted from PDF",
-            }
-
-        # Generate embeddings
-        embedder = self._get_embedder()
-        texts = [c.text for c in chunks]
-        embeddings = embedder.embed_batch(texts)
+        job = self._ingestion_jobs.active_for(input.source, input.revision_id)
+        if job is None:
+            job = self._ingestion_jobs.create(input.source, input.revision_id, input.reindex)
+            job.task = asyncio.create_task(self._run_ingestion(job, input, revision))
 
-        # Prepare temporal metadata
-        effective_from_int = PolicyChromaClient.format_date_for_metadata(revision.effective_from)
-        effective_to_int = PolicyChromaClient.format_date_for_metadata(revision.effective_to)
+        logger.info(
+            "Policy revision ingestion accepted",
+            job_id=job.job_id,
+            source=input.source,
+            revision_id=input.revision_id,
+            reindex=input.reindex,
+        )
+        return {"status": "accepted", "job_id": job.job_id, "job": job.to_dict()}
 
-        # Create chunk records
-        from src.shared.policy_chroma_client import PolicyChunkRecord
+    async def _run_ingestion(
+        self,
+        job: IngestionJob,
+        input: IngestPolicyRevisionInput,
+        revision: PolicyRevisionRecord,
+    ) -> None:
+        """Run an ingestion job; blocking work goes to the ingest executor."""
         from src.worker.policy_jobs import PolicyIngestionService
 
-        chunk_records = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=True)):
-            section_ref = PolicyIngestionService._extract_section_ref(chunk.text)
-
-            chunk_id = PolicyChromaClient.generate_chunk_id(
-                source=input.source,
-                revision_id=input.revision_id,
-                section_ref=section_ref,
-                chunk_index=i,
+        job.status = "running"
+        # Initialise lazily created components on the event loop thread, so the
+        # executor and concurrent searches never construct them twice
+        chroma = self._get_chroma_client()
+        chroma.get_collection_stats()
+        self._get_embedder()
+        self._get_processor()
+        self._get_chunker()
+        loop = asyncio.get_running_loop()
+        try:
+            chunk_records, prepared = await loop.run_in_executor(
+                self._ingest_executor, self._ingest_blocking, input, revision
             )
 
-            chunk_records.append(
-                PolicyChunkRecord(
-                    chunk_id=chunk_id,
-                    text=chunk.text,
-                    embedding=embedding,
-                    metadata={
-                        "source": input.source,
-                        "source_title": revision.source,
-                        "revision_id": input.revision_id,
-                        "version_label": revision.version_label,
-                        "effective_from": effective_from_int,
-                        "effective_to": effective_to_int,
-                        "section_ref": section_ref,
-                        "page_number": chunk.page_numbers[0] if chunk.page_numbers else 0,
-                        "chunk_index": i,
+            if not chunk_records:
+                if input.reindex:
+                    await self._record_corpus_change(input.source, input.revision_id)
+                self._ingestion_jobs.finish(
+                    job,
+                    "failed",
+                    {
+                        "status": "error",
+                        "error_type": "no_content",
+                        "message": "No text could be extracted from PDF",
                     },
                 )
-            )
+                return
 
-        # Store chunks
-        chroma.upsert_chunks(chunk_records)
+            await self._registry.set_section_index(
+                input.source,
+                input.revision_id,
+                PolicyIngestionService.build_section_index(chunk_records),
+            )
+            await self._record_corpus_change(input.source, input.revision_id)
+        except Exception as e:
+            logger.exception(
+                "Policy revision ingestion failed",
+                job_id=job.job_id,
+                source=input.source,
+                revision_id=input.revision_id,
+            )
+            self._ingestion_jobs.finish(
+                job,
+                "failed",
+                {"status": "error", "error_type": "ingestion_failed", "message": str(e)},
+            )
+            return
 
         logger.info(
             "Policy revision ingested",
+            job_id=job.job_id,
             source=input.source,
             revision_id=input.revision_id,
             chunks_created=len(chunk_records),
         )
+        self._ingestion_jobs.finish(
+            job,
+            "complete",
+            {
+                "status": "success",
+                "source": input.source,
+                "revision_id": input.revision_id,
+                "chunks_created": len(chunk_records),
+                "chunks_embedded": prepared.embedded_count,
+                "page_count": prepared.page_count,
+                "extraction_method": prepared.extraction_method,
+            },
+        )
 
-        return {
-            "status": "success",
-            "source": input.source,
-            "revision_id": input.revision_id,
-            "chunks_created": len(chunk_records),
-            "page_count": extraction.total_pages,
-            "extraction_method": extraction.extraction_method,
-        }
+    def _ingest_blocking(
+        self, input: IngestPolicyRevisionInput, revision: PolicyRevisionRecord
+    ) -> tuple[list[PolicyChunkRecord], "PreparedRevision"]:
+        """
+        Extract, chunk, embed and store a revision (runs in the ingest executor).
+
+        Returns:
+            The stored chunk records (empty if no text was extracted) and the
+            prepared revision.
+        """
+        from src.worker.policy_jobs import PolicyIngestionService, prepare_revision_file
+
+        chroma = self._get_chroma_client()
+
+        # If reindex, reuse embeddings of chunks whose text is unchanged
+        known_embeddings = (
+            chroma.get_revision_embeddings(input.source, input.revision_id)
+            if input.reindex
+            else None
+        )
+
+        # Extract, chunk and embed new text
+        prepared = prepare_revision_file(
+            Path(input.file_path),
+            self._get_processor(),
+            self._get_chunker(),
+            self._get_embedder(),
+            known_embeddings,
+        )
+
+        if not prepared.chunks:
+            if input.reindex:
+                chroma.delete_revision_chunks(input.source, input.revision_id)
+            return [], prepared
+
+        chunk_records = PolicyIngestionService.build_chunk_records(
+            input.source, input.revision_id, revision, prepared.chunks, prepared.embeddings
+        )
+
+        # Store chunks (in place on reindex)
+        if input.reindex:
+            chroma.sync_revision_chunks(input.source, input.revision_id, chunk_records)
+        else:
+            chroma.upsert_chunks(chunk_records)
+        return chunk_records, prepared
+
+    async def wait_for_ingestion(self, job_id: str) -> dict[str, Any] | None:
+        """
+        Wait for an ingestion job to finish.
+
+        Args:
+            job_id: Job ID returned by ingest_policy_revision.
+
+        Returns:
+            The finished job, or None if the job is unknown.
+        """
+        job = self._ingestion_jobs.get(job_id)
+        if job is None:
+            return None
+        if job.task is not None:
+            await asyncio.shield(job.task)
+        return job.to_dict()
+
+    async def _get_ingestion_status(self, input: GetIngestionStatusInput) -> dict[str, Any]:
+        """Report the state of an ingestion job."""
+        job = self._ingestion_jobs.get(input.job_id)
+        if job is None:
+            return {
+                "status": "error",
+                "error_type": "job_not_found",
+                "message": f"Ingestion job not found: {input.job_id}",
+            }
+        return {"status": "success", "job": job.to_dict()}
 
     async def _remove_policy_revision(self, input: RemovePolicyRevisionInput) -> dict[str, Any]:
         """
@@ -546,6 +787,9 @@ class PolicyKBMCP:
         chroma = self._get_chroma_client()
 
         chunks_removed = chroma.delete_revision_chunks(input.source, input.revision_id)
+        if self._registry is not None:
+            await self._registry.set_section_index(input.source, input.revision_id, {})
+        await self._record_corpus_change(input.source, input.revision_id)
 
         logger.info(
             "Policy revision removed",
@@ -598,7 +842,12 @@ def create_app(
         chroma_client=chroma_client,
     )
 
-    return create_mcp_app(mcp_server.server)
+    async def handle_health(request):  # noqa: ARG001
+        return JSONResponse(
+            {"status": "ok", "search_cache": mcp_server.search_cache.stats()}
+        )
+
+    return create_mcp_app(mcp_server.server, health_handler=handle_health)
 
 
 async def main() -> None:
@@ -0,0 +1,100 @@
+"""
+Build the local OSM infrastructure store from an .osm.pbf extract.
+
+Implements [cycle-route-assessment:FR-002] - Route infrastructure analysis (local backend)
+
+Reads the extract with pyosmium (optional dependency: pip install
+".[osm]") and writes highway ways plus barrier and crossing nodes into the
+SQLite/R-tree store read by LocalOSMStore. Use the same extract Valhalla
+builds its tiles from so routes and infrastructure agree.
+
+Usage:
+    python -m src.scripts.build_osm_store oxfordshire-latest.osm.pbf /data/osm/oxfordshire.sqlite
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from src.mcp_servers.cycle_route.osm_store import OSMStoreWriter
+
+logger = structlog.get_logger(__name__)
+
+
+def build_osm_store(pbf_path: str | Path, store_path: str | Path) -> tuple[int, int]:
+    """
+    Convert an .osm.pbf extract into a local OSM store.
+
+    Args:
+        pbf_path: OSM extract to read.
+        store_path: Store file to write (replaced when complete).
+
+    Returns:
+        Tuple of (ways written, nodes written).
+
+    Raises:
+        RuntimeError: If pyosmium is not installed.
+    """
+    try:
+        import osmium
+    except ImportError:
+        raise RuntimeError(
+            "pyosmium not installed. Install with: pip install '.[osm]'"
+        )
+
+    class _Handler(osmium.SimpleHandler):
+        def __init__(self, writer: OSMStoreWriter) -> None:
+            super().__init__()
+            self.writer = writer
+
+        def node(self, n: Any) -> None:
+            tags = {t.k: t.v for t in n.tags}
+            if ("barrier" in tags or "crossing" in tags) and n.location.valid():
+                self.writer.add_node(n.id, n.location.lat, n.location.lon, tags)
+
+        def way(self, w: Any) -> None:
+            tags = {t.k: t.v for t in w.tags}
+            if "highway" not in tags:
+                return
+            self.writer.add_way(
+                w.id,
+                tags,
+                [nd.ref for nd in w.nodes],
+                [(nd.lat, nd.lon) for nd in w.nodes if nd.location.valid()],
+            )
+
+    with OSMStoreWriter(store_path, source=Path(pbf_path).name) as writer:
+        # locations=True resolves way node coordinates during the single pass
+        _Handler(writer).apply_file(str(pbf_path), locations=True)
+    return writer.way_count, writer.node_count
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Build the local OSM store from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("pbf", help="Input .osm.pbf extract")
+    parser.add_argument("store", help="Output store file")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        ways, nodes = build_osm_store(args.pbf, args.store)
+    except RuntimeError as e:
+        logger.error("OSM store build failed", error=str(e))
+        sys.exit(1)
+
+    logger.info(
+        "OSM store built",
+        store=args.store,
+        ways=ways,
+        nodes=nodes,
+        duration_seconds=round(time.perf_counter() - started, 1),
+    )
+
+
+if __name__ == "__main__":
+    main()
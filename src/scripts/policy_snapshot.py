@@ -0,0 +1,358 @@
+"""
+Policy corpus snapshots - export and import the knowledge base without re-ingesting.
+
+Implements [policy-knowledge-base:FR-013] - Seed policies (from a snapshot)
+Implements [policy-knowledge-base:FR-014] - Redis as source of truth
+
+Rebuilding a policy-kb node with seed_policies re-extracts and re-embeds every
+PDF. A snapshot instead carries the registry, chunk texts, chunk metadata and
+float32 embeddings in one zip file:
+
+- manifest.json: format version, counts, embedding dimension and the SHA256
+  of every other member
+- registry.jsonl: one line per policy with its revisions and section indexes
+- chunks.jsonl: chunk ID, text and metadata, one line per chunk
+- embeddings.npy: float32 matrix, row i belonging to line i of chunks.jsonl
+
+Import verifies every checksum before writing anything, then bulk-loads
+ChromaDB and replaces each snapshot policy in the registry.
+
+Usage:
+    python -m src.scripts.policy_snapshot export /data/policy/corpus.zip
+    python -m src.scripts.policy_snapshot import /data/policy/corpus.zip
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import structlog
+
+from src.api.schemas.policy import PolicyDocumentRecord, PolicyRevisionRecord
+from src.shared.policy_chroma_client import PolicyChromaClient, PolicyChunkRecord
+from src.shared.policy_registry import PolicyRegistry
+
+logger = structlog.get_logger(__name__)
+
+SNAPSHOT_FORMAT = "policy-kb-snapshot"
+SNAPSHOT_VERSION = 1
+
+MANIFEST_MEMBER = "manifest.json"
+REGISTRY_MEMBER = "registry.jsonl"
+CHUNKS_MEMBER = "chunks.jsonl"
+EMBEDDINGS_MEMBER = "embeddings.npy"
+DATA_MEMBERS = (REGISTRY_MEMBER, CHUNKS_MEMBER, EMBEDDINGS_MEMBER)
+
+# Chunk IDs listed in an export error before the rest are summarised
+MAX_REPORTED_CHUNKS = 10
+
+# Chunks per ChromaDB upsert during import (below ChromaDB's max batch size)
+IMPORT_BATCH_SIZE = 1000
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot is malformed or fails verification."""
+
+    pass
+
+
+@dataclass
+class SnapshotResult:
+    """Summary of an export or import."""
+
+    path: str
+    policy_count: int
+    revision_count: int
+    chunk_count: int
+    embedding_dim: int
+    duration_seconds: float
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _jsonl(rows: list[dict]) -> bytes:
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode("utf-8")
+
+
+async def export_snapshot(
+    registry: PolicyRegistry,
+    chroma: PolicyChromaClient,
+    path: str | Path,
+) -> SnapshotResult:
+    """
+    Write the whole policy corpus to a snapshot file.
+
+    Args:
+        registry: PolicyRegistry to read policies, revisions and section indexes from.
+        chroma: PolicyChromaClient to read chunks and embeddings from.
+        path: Snapshot file to write (replaced if it exists).
+
+    Returns:
+        SnapshotResult with counts.
+
+    Raises:
+        SnapshotError: If any chunk has no stored embedding (nothing is written).
+    """
+    started = time.perf_counter()
+    path = Path(path)
+
+    _, policies = await registry.get_all_policies_with_revisions()
+    keys = [(policy.source, rev.revision_id) for policy, revisions in policies for rev in revisions]
+    section_indexes = dict(zip(keys, await registry.get_section_indexes(keys), strict=True))
+
+    registry_rows = []
+    chunk_rows = []
+    vectors: list[list[float]] = []
+    missing: list[str] = []
+    for policy, revisions in policies:
+        registry_rows.append(
+            {
+                "policy": policy.model_dump(mode="json"),
+                "revisions": [rev.model_dump(mode="json") for rev in revisions],
+                "sections": {
+                    rev.revision_id: section_indexes[(policy.source, rev.revision_id)]
+                    for rev in revisions
+                },
+            }
+        )
+        for rev in revisions:
+            for chunk in chroma.get_revision_chunks(policy.source, rev.revision_id):
+                if not chunk.embedding:
+                    missing.append(chunk.chunk_id)
+                chunk_rows.append(
+                    {"id": chunk.chunk_id, "text": chunk.text, "metadata": chunk.metadata}
+                )
+                vectors.append(chunk.embedding)
+
+    if missing:
+        listed = ", ".join(missing[:MAX_REPORTED_CHUNKS])
+        more = len(missing) - MAX_REPORTED_CHUNKS
+        raise SnapshotError(
+            f"{len(missing)} chunk(s) have no embedding; reindex their revisions "
+            f"before exporting: {listed}" + (f" and {more} more" if more > 0 else "")
+        )
+    if len({len(vector) for vector in vectors}) > 1:
+        raise SnapshotError("Chunks have embeddings of different dimensions")
+
+    embeddings = np.asarray(vectors, dtype=np.float32)
+    if embeddings.ndim != 2:
+        embeddings = embeddings.reshape(len(vectors), 0)
+    npy = io.BytesIO()
+    np.save(npy, embeddings, allow_pickle=False)
+
+    members = {
+        REGISTRY_MEMBER: _jsonl(registry_rows),
+        CHUNKS_MEMBER: _jsonl(chunk_rows),
+        EMBEDDINGS_MEMBER: npy.getvalue(),
+    }
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "policy_count": len(registry_rows),
+        "revision_count": len(keys),
+        "chunk_count": len(chunk_rows),
+        "embedding_dim": int(embeddings.shape[1]),
+        "checksums": {name: _sha256(data) for name, data in members.items()},
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with zipfile.ZipFile(tmp_path, "w") as zf:
+        zf.writestr(MANIFEST_MEMBER, json.dumps(manifest, indent=2), zipfile.ZIP_DEFLATED)
+        zf.writestr(REGISTRY_MEMBER, members[REGISTRY_MEMBER], zipfile.ZIP_DEFLATED)
+        zf.writestr(CHUNKS_MEMBER, members[CHUNKS_MEMBER], zipfile.ZIP_DEFLATED)
+        # float32 noise barely deflates; store it to keep export and import fast
+        zf.writestr(EMBEDDINGS_MEMBER, members[EMBEDDINGS_MEMBER], zipfile.ZIP_STORED)
+    tmp_path.replace(path)
+
+    result = SnapshotResult(
+        path=str(path),
+        policy_count=manifest["policy_count"],
+        revision_count=manifest["revision_count"],
+        chunk_count=manifest["chunk_count"],
+        embedding_dim=manifest["embedding_dim"],
+        duration_seconds=time.perf_counter() - started,
+    )
+    logger.info(
+        "Policy snapshot exported",
+        path=result.path,
+        policies=result.policy_count,
+        revisions=result.revision_count,
+        chunks=result.chunk_count,
+        embedding_dim=result.embedding_dim,
+        size_bytes=path.stat().st_size,
+        duration_seconds=round(result.duration_seconds, 2),
+    )
+    return result
+
+
+def read_snapshot(
+    path: str | Path,
+) -> tuple[dict, list[dict], list[dict], np.ndarray]:
+    """
+    Read and verify a snapshot file.
+
+    Args:
+        path: Snapshot file.
+
+    Returns:
+        Tuple of (manifest, registry rows, chunk rows, float32 embeddings).
+
+    Raises:
+        SnapshotError: If the file is not a snapshot, has an unsupported
+            version, lacks a required member, or any checksum or count does
+            not match the manifest.
+    """
+    try:
+        with zipfile.ZipFile(path) as zf:
+            manifest = json.loads(zf.read(MANIFEST_MEMBER))
+            if manifest.get("format") != SNAPSHOT_FORMAT:
+                raise SnapshotError(f"{path} is not a policy snapshot")
+            if manifest.get("version") != SNAPSHOT_VERSION:
+                raise SnapshotError(f"Unsupported snapshot version: {manifest.get('version')}")
+            absent = [name for name in DATA_MEMBERS if name not in manifest["checksums"]]
+            if absent:
+                raise SnapshotError(
+                    f"Snapshot {path} manifest has no checksum for {', '.join(absent)}"
+                )
+            members = {name: zf.read(name) for name in manifest["checksums"]}
+    except (zipfile.BadZipFile, KeyError, json.JSONDecodeError) as e:
+        raise SnapshotError(f"Malformed snapshot {path}: {e}") from e
+
+    for name, expected in manifest["checksums"].items():
+        if _sha256(members[name]) != expected:
+            raise SnapshotError(f"Checksum mismatch for {name} in {path}")
+
+    registry_rows = [json.loads(line) for line in members[REGISTRY_MEMBER].splitlines()]
+    chunk_rows = [json.loads(line) for line in members[CHUNKS_MEMBER].splitlines()]
+    embeddings = np.load(io.BytesIO(members[EMBEDDINGS_MEMBER]), allow_pickle=False)
+
+    if (
+        len(registry_rows) != manifest["policy_count"]
+        or len(chunk_rows) != manifest["chunk_count"]
+        or embeddings.shape != (manifest["chunk_count"], manifest["embedding_dim"])
+    ):
+        raise SnapshotError(f"Snapshot {path} contents do not match its manifest")
+
+    return manifest, registry_rows, chunk_rows, embeddings
+
+
+async def import_snapshot(
+    registry: PolicyRegistry,
+    chroma: PolicyChromaClient,
+    path: str | Path,
+) -> SnapshotResult:
+    """
+    Load a snapshot into ChromaDB and the registry.
+
+    Every policy in the snapshot replaces the policy with the same source,
+    including all of its revisions and chunks. Policies not in the snapshot
+    are left alone. Chunks are written before registry records, so no
+    revision is visible as active without its chunks.
+
+    Args:
+        registry: PolicyRegistry to restore policies into.
+        chroma: PolicyChromaClient to load chunks into.
+        path: Snapshot file written by export_snapshot().
+
+    Returns:
+        SnapshotResult with counts.
+
+    Raises:
+        SnapshotError: If the snapshot fails verification (nothing is written).
+    """
+    started = time.perf_counter()
+    manifest, registry_rows, chunk_rows, embeddings = read_snapshot(path)
+
+    # Drop chunks of the revisions being replaced, including ones the snapshot lacks
+    sources = [row["policy"]["source"] for row in registry_rows]
+    for source, revision_id in await registry.list_revision_keys(sources):
+        chroma.delete_revision_chunks(source, revision_id)
+
+    for start in range(0, len(chunk_rows), IMPORT_BATCH_SIZE):
+        batch = chunk_rows[start : start + IMPORT_BATCH_SIZE]
+        vectors = embeddings[start : start + IMPORT_BATCH_SIZE].tolist()
+        chroma.upsert_chunks(
+            [
+                PolicyChunkRecord(
+                    chunk_id=row["id"],
+                    text=row["text"],
+                    embedding=vector,
+                    metadata=row["metadata"],
+                )
+                for row, vector in zip(batch, vectors, strict=True)
+            ]
+        )
+
+    for row in registry_rows:
+        await registry.restore_policy(
+            PolicyDocumentRecord.model_validate(row["policy"]),
+            [PolicyRevisionRecord.model_validate(rev) for rev in row["revisions"]],
+            row["sections"],
+        )
+
+    result = SnapshotResult(
+        path=str(path),
+        policy_count=manifest["policy_count"],
+        revision_count=manifest["revision_count"],
+        chunk_count=manifest["chunk_count"],
+        embedding_dim=manifest["embedding_dim"],
+        duration_seconds=time.perf_counter() - started,
+    )
+    logger.info(
+        "Policy snapshot imported",
+        path=result.path,
+        policies=result.policy_count,
+        revisions=result.revision_count,
+        chunks=result.chunk_count,
+        embedding_dim=result.embedding_dim,
+        duration_seconds=round(result.duration_seconds, 2),
+    )
+    return result
+
+
+async def main(argv: list[str] | None = None) -> None:
+    """Export or import a policy snapshot from the command line."""
+    import redis.asyncio as aioredis
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("path", help="Snapshot file")
+    args = parser.parse_args(argv)
+
+    # Configuration from environment
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    chroma_dir = os.getenv("CHROMA_PERSIST_DIR", "/data/chroma")
+
+    redis_client = aioredis.from_url(redis_url, decode_responses=True)
+    registry = PolicyRegistry(redis_client)
+    chroma_client = PolicyChromaClient(persist_directory=chroma_dir)
+
+    # export_snapshot and import_snapshot log their own summary
+    try:
+        if args.command == "export":
+            await export_snapshot(registry, chroma_client, args.path)
+        else:
+            await import_snapshot(registry, chroma_client, args.path)
+    except SnapshotError as e:
+        logger.error("Policy snapshot failed", error=str(e))
+        sys.exit(1)
+    finally:
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
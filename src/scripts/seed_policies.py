@@ -9,20 +9,35 @@ Implements:
 - [policy-knowledge-base:PolicySeeder/TS-03] Seed files present
 - [policy-knowledge-base:PolicySeeder/TS-04] Correct effective dates
 - [policy-knowledge-base:PolicySeeder/TS-05] Missing seed file
+
+Set SEED_WORKERS > 1 to extract and embed seed PDFs in a process pool.
+Interrupted runs resume: revisions not yet ACTIVE are re-ingested.
 """
 
 import asyncio
 import json
+import multiprocessing
 import os
-from dataclasses import dataclass, field
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import date
 from pathlib import Path
 
 import structlog
 
-from src.api.schemas.policy import PolicyCategory
+from src.api.schemas.policy import PolicyCategory, RevisionStatus
 from src.shared.policy_registry import PolicyRegistry
-from src.worker.policy_jobs import PolicyIngestionService
+from src.worker.policy_jobs import (
+    IngestionProgress,
+    IngestionResult,
+    PolicyIngestionService,
+    PrepareComponents,
+    default_prepare_components,
+    init_prepare_worker,
+    prepare_policy_revision,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -43,7 +58,36 @@ class SeedResult:
     revisions_skipped: int = 0
     files_processed: int = 0
     files_missing: int = 0
+    revisions_resumed: int = 0
     errors: list[str] = field(default_factory=list)
+    timings: list["SeedTiming"] = field(default_factory=list)
+
+    def log_timings(self) -> None:
+        """Log the wall-clock time spent on each seed file."""
+        for t in self.timings:
+            logger.info(
+                "Seed file timing",
+                file=t.file,
+                source=t.source,
+                revision_id=t.revision_id,
+                pages=t.page_count,
+                chunks=t.chunk_count,
+                duration_seconds=round(t.seconds, 2),
+                status=t.status,
+            )
+
+
+@dataclass
+class SeedTiming:
+    """Wall-clock time spent ingesting one seed file."""
+
+    source: str
+    revision_id: str
+    file: str
+    page_count: int
+    chunk_count: int
+    seconds: float
+    status: str  # "ok", "failed", "error"
 
 
 @dataclass
@@ -67,6 +111,21 @@ class RevisionConfig:
     file: str
 
 
+@dataclass
+class _PendingIngestion:
+    """A revision record whose PDF still needs ingesting."""
+
+    source: str
+    revision_id: str
+    file: str
+    file_path: Path
+    reindex: bool = False
+
+
+# Revisions in these states were interrupted or failed and are re-ingested
+_RESUMABLE_STATUSES = (RevisionStatus.PROCESSING, RevisionStatus.FAILED)
+
+
 class PolicySeeder:
     """
     Seeds initial policy documents at first deployment.
@@ -80,6 +139,8 @@ class PolicySeeder:
         ingestion_service: PolicyIngestionService,
         config_path: Path | str,
         seed_dir: Path | str,
+        workers: int = 1,
+        component_factory: Callable[[], PrepareComponents] = default_prepare_components,
     ) -> None:
         """
         Initialize the PolicySeeder.
@@ -89,11 +150,16 @@ class PolicySeeder:
             ingestion_service: Service for ingesting PDFs.
             config_path: Path to seed configuration JSON file.
             seed_dir: Directory containing seed PDF files.
+            workers: Extraction/embedding processes (1 ingests in-process).
+            component_factory: Picklable callable building each worker's
+                processor, chunker and embedder.
         """
         self._registry = registry
         self._ingestion_service = ingestion_service
         self._config_path = Path(config_path)
         self._seed_dir = Path(seed_dir)
+        self._workers = workers
+        self._component_factory = component_factory
 
     def _load_config(self) -> list[PolicyConfig]:
         """
@@ -147,6 +213,11 @@ class PolicySeeder:
         Implements [policy-knowledge-base:PolicySeeder/TS-01] - First run seeds all policies
         Implements [policy-knowledge-base:PolicySeeder/TS-02] - Idempotent re-run
 
+        Policies and revision records are created first, in config order, so
+        auto-supersession has settled before any chunks are written. The PDFs
+        are then ingested: one at a time, or with workers > 1 extracted and
+        embedded in a process pool while results are stored in config order.
+
         Returns:
             SeedResult with counts and any errors.
         """
@@ -156,13 +227,21 @@ class PolicySeeder:
             "Starting policy seeding",
             config_path=str(self._config_path),
             seed_dir=str(self._seed_dir),
+            workers=self._workers,
         )
 
         # Load configuration
         policies = self._load_config()
 
+        pending: list[_PendingIngestion] = []
         for policy_config in policies:
-            await self._seed_policy(policy_config, result)
+            pending.extend(await self._seed_policy(policy_config, result))
+
+        if self._workers > 1 and len(pending) > 1:
+            await self._ingest_parallel(pending, result)
+        else:
+            for item in pending:
+                await self._ingest_sequential(item, result)
 
         logger.info(
             "Policy seeding complete",
@@ -170,6 +249,7 @@ class PolicySeeder:
             policies_skipped=result.policies_skipped,
             revisions_created=result.revisions_created,
             revisions_skipped=result.revisions_skipped,
+            revisions_resumed=result.revisions_resumed,
             files_processed=result.files_processed,
             files_missing=result.files_missing,
             errors=len(result.errors),
@@ -177,11 +257,16 @@ class PolicySeeder:
 
         return result
 
-    async def _seed_policy(self, config: PolicyConfig, result: SeedResult) -> None:
+    async def _seed_policy(
+        self, config: PolicyConfig, result: SeedResult
+    ) -> list["_PendingIngestion"]:
         """
-        Seed a single policy and its revisions.
+        Seed a single policy and its revision records.
 
         Implements [policy-knowledge-base:PolicySeeder/TS-02] - Idempotent re-run
+
+        Returns:
+            Revisions whose PDFs still need ingesting.
         """
         # Check if policy already exists
         existing = await self._registry.get_policy(config.source)
@@ -208,35 +293,45 @@ class PolicySeeder:
             result.policies_created += 1
 
         # Seed each revision
+        pending = []
         for revision_config in config.revisions:
-            await self._seed_revision(config.source, revision_config, result)
+            item = await self._seed_revision(config.source, revision_config, result)
+            if item is not None:
+                pending.append(item)
+        return pending
 
     async def _seed_revision(
         self,
         source: str,
         config: RevisionConfig,
         result: SeedResult,
-    ) -> None:
+    ) -> "_PendingIngestion | None":
         """
-        Seed a single revision.
+        Seed a single revision record.
 
         Implements [policy-knowledge-base:PolicySeeder/TS-03] - Seed files present
         Implements [policy-knowledge-base:PolicySeeder/TS-04] - Correct effective dates
         Implements [policy-knowledge-base:PolicySeeder/TS-05] - Missing seed file
+
+        The revision status is the checkpoint: a revision left PROCESSING or
+        FAILED by an interrupted run is re-ingested rather than skipped.
+
+        Returns:
+            The revision to ingest, or None if it is done or its file is missing.
         """
         revision_id = self._generate_revision_id(source, config.effective_from)
 
         # Check if revision already exists
         existing = await self._registry.get_revision(source, revision_id)
 
-        if existing:
+        if existing and existing.status not in _RESUMABLE_STATUSES:
             logger.info(
                 "Revision already exists, skipping",
                 source=source,
                 revision_id=revision_id,
             )
             result.revisions_skipped += 1
-            return
+            return None
 
         # Check if file exists
         file_path = self._seed_dir / config.file
@@ -250,7 +345,17 @@ class PolicySeeder:
             )
             result.files_missing += 1
             result.errors.append(error_msg)
-            return
+            return None
+
+        if existing:
+            logger.info(
+                "Resuming incomplete revision",
+                source=source,
+                revision_id=revision_id,
+                status=str(existing.status),
+            )
+            result.revisions_resumed += 1
+            return _PendingIngestion(source, revision_id, config.file, file_path, reindex=True)
 
         # Create the revision record
         await self._registry.create_revision(
@@ -269,41 +374,145 @@ class PolicySeeder:
             effective_from=str(config.effective_from),
         )
         result.revisions_created += 1
+        return _PendingIngestion(source, revision_id, config.file, file_path)
 
-        # Ingest the PDF
+    async def _ingest_sequential(self, item: "_PendingIngestion", result: SeedResult) -> None:
+        """Extract, embed and store one revision in this process."""
+        started = time.perf_counter()
         try:
             ingestion_result = await self._ingestion_service.ingest_revision(
-                source=source,
-                revision_id=revision_id,
-                file_path=file_path,
+                source=item.source,
+                revision_id=item.revision_id,
+                file_path=item.file_path,
+                reindex=item.reindex,
             )
+        except Exception as e:
+            self._record_exception(item, e, time.perf_counter() - started, result)
+            return
+        self._record_ingestion(item, ingestion_result, time.perf_counter() - started, result)
 
-            if ingestion_result.success:
-                logger.info(
-                    "Revision ingested",
-                    source=source,
-                    revision_id=revision_id,
-                    chunks=ingestion_result.chunk_count,
-                )
-                result.files_processed += 1
-            else:
-                error_msg = f"Ingestion failed for {config.file}: {ingestion_result.error}"
-                logger.error(
-                    error_msg,
-                    source=source,
-                    revision_id=revision_id,
-                )
-                result.errors.append(error_msg)
+    async def _ingest_parallel(
+        self, pending: list["_PendingIngestion"], result: SeedResult
+    ) -> None:
+        """
+        Extract and embed revisions in a process pool, storing them in order.
 
-        except Exception as e:
-            error_msg = f"Ingestion error for {config.file}: {e}"
-            logger.exception(
+        Every file is submitted up front; results are awaited and written to
+        ChromaDB and the registry in config order, so a revision is only
+        marked ACTIVE once its chunks are stored.
+        """
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=min(self._workers, len(pending)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_prepare_worker,
+            initargs=(self._component_factory,),
+        ) as pool:
+            started = time.perf_counter()
+            futures = [
+                loop.run_in_executor(pool, prepare_policy_revision, str(item.file_path))
+                for item in pending
+            ]
+            for item, future in zip(pending, futures, strict=True):
+                try:
+                    prepared = await future
+                except Exception as e:
+                    await self._registry.update_revision(
+                        source=item.source,
+                        revision_id=item.revision_id,
+                        status=RevisionStatus.FAILED,
+                        error=f"Ingestion failed: {e}",
+                    )
+                    await self._registry.publish_ingestion_progress(
+                        item.source,
+                        item.revision_id,
+                        asdict(
+                            IngestionProgress(
+                                phase="failed",
+                                percent_complete=100,
+                                error=f"Ingestion failed: {e}",
+                            )
+                        ),
+                    )
+                    self._record_exception(item, e, time.perf_counter() - started, result)
+                    continue
+
+                store_started = time.perf_counter()
+                try:
+                    ingestion_result = await self._ingestion_service.store_prepared(
+                        source=item.source,
+                        revision_id=item.revision_id,
+                        prepared=prepared,
+                        reindex=item.reindex,
+                    )
+                except Exception as e:
+                    self._record_exception(item, e, prepared.prepare_seconds, result)
+                    continue
+                seconds = prepared.prepare_seconds + time.perf_counter() - store_started
+                self._record_ingestion(item, ingestion_result, seconds, result)
+
+    def _record_ingestion(
+        self,
+        item: "_PendingIngestion",
+        ingestion_result: IngestionResult,
+        seconds: float,
+        result: SeedResult,
+    ) -> None:
+        """Count an ingestion outcome and add its timing row."""
+        if ingestion_result.success:
+            logger.info(
+                "Revision ingested",
+                source=item.source,
+                revision_id=item.revision_id,
+                chunks=ingestion_result.chunk_count,
+                seconds=round(seconds, 2),
+            )
+            result.files_processed += 1
+        else:
+            error_msg = f"Ingestion failed for {item.file}: {ingestion_result.error}"
+            logger.error(
                 error_msg,
-                source=source,
-                revision_id=revision_id,
+                source=item.source,
+                revision_id=item.revision_id,
             )
             result.errors.append(error_msg)
 
+        result.timings.append(SeedTiming(
+            source=item.source,
+            revision_id=item.revision_id,
+            file=item.file,
+            page_count=ingestion_result.page_count,
+            chunk_count=ingestion_result.chunk_count,
+            seconds=seconds,
+            status="ok" if ingestion_result.success else "failed",
+        ))
+
+    def _record_exception(
+        self,
+        item: "_PendingIngestion",
+        error: Exception,
+        seconds: float,
+        result: SeedResult,
+    ) -> None:
+        """Count an ingestion exception and add its timing row."""
+        error_msg = f"Ingestion error for {item.file}: {error}"
+        logger.error(
+            error_msg,
+            source=item.source,
+            revision_id=item.revision_id,
+            exc_info=error,
+        )
+        result.errors.append(error_msg)
+        result.timings.append(SeedTiming(
+            source=item.source,
+            revision_id=item.revision_id,
+            file=item.file,
+            page_count=0,
+            chunk_count=0,
+            seconds=seconds,
+            status="error",
+        ))
+
 
 async def main() -> None:
     """Run the policy seeder from command line."""
@@ -316,6 +525,7 @@ async def main() -> None:
     chroma_dir = os.getenv("CHROMA_PERSIST_DIR", "/data/chroma")
     config_path = os.getenv("SEED_CONFIG_PATH", "/data/policy/seed_config.json")
     seed_dir = os.getenv("SEED_DIR", "/data/policy/seed")
+    workers = int(os.getenv("SEED_WORKERS", "1"))
 
     logger.info(
         "Policy Seeder starting",
@@ -323,6 +533,7 @@ async def main() -> None:
         chroma_dir=chroma_dir,
         config_path=config_path,
         seed_dir=seed_dir,
+        workers=workers,
     )
 
     # Create dependencies
@@ -340,11 +551,14 @@ async def main() -> None:
         ingestion_service=ingestion_service,
         config_path=config_path,
         seed_dir=seed_dir,
+        workers=workers,
     )
 
     try:
         result = await seeder.seed()
 
+        result.log_timings()
+
         if result.errors:
             logger.warning(
                 "Seeding completed with errors",
@@ -4,14 +4,28 @@ Effective date resolution for policy revisions.
 Implements [policy-knowledge-base:FR-005] - Automatic selection based on date
 Implements [policy-knowledge-base:FR-009] - Get effective snapshot for date
 Implements [policy-knowledge-base:NFR-002] - 100% correct revision selection
+
+Revisions change rarely, so the resolver keeps an in-memory interval index of
+every revision per source and answers point-in-time queries with a bisect. The
+index is tagged with the registry generation counter and dropped whenever the
+registry announces a change, either in-process or on INVALIDATION_CHANNEL.
 """
 
-from dataclasses import dataclass
+import asyncio
+import contextlib
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import date
 
 import structlog
 
-from src.api.schemas.policy import PolicyCategory, PolicyRevisionSummary
+from src.api.schemas.policy import (
+    PolicyCategory,
+    PolicyDocumentRecord,
+    PolicyRevisionRecord,
+    PolicyRevisionSummary,
+)
 from src.shared.policy_registry import PolicyRegistry
 
 logger = structlog.get_logger(__name__)
@@ -39,6 +53,35 @@ class EffectiveSnapshotResult:
     policies_in_gap: list[str]  # Sources where date falls in a gap between revisions
 
 
+@dataclass
+class _PolicyTimeline:
+    """All revisions of one policy, ordered by effective_from."""
+
+    policy: PolicyDocumentRecord
+    revisions: list[PolicyRevisionRecord]
+    starts: list[date] = field(init=False)
+    by_id: dict[str, PolicyRevisionRecord] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.starts = [rev.effective_from for rev in self.revisions]
+        self.by_id = {rev.revision_id: rev for rev in self.revisions}
+
+    def effective_on(self, effective_date: date) -> PolicyRevisionRecord | None:
+        """Find the revision in force on a date."""
+        # Revisions starting on or before the date, newest first
+        end = bisect_right(self.starts, effective_date)
+        candidates = self.revisions[:end][::-1]
+        return PolicyRegistry._select_effective_revision(candidates, effective_date)
+
+
+@dataclass
+class _RevisionIndex:
+    """Snapshot of the registry at one generation."""
+
+    generation: int
+    timelines: dict[str, _PolicyTimeline]  # Ordered by source slug
+
+
 class EffectiveDateResolver:
     """
     Temporal query logic for determining which revision was in force on a given date.
@@ -46,6 +89,11 @@ class EffectiveDateResolver:
     Used by PolicyKBMCP for temporal search filtering and PolicyRouter for
     effective snapshot endpoints.
 
+    Queries are served from an in-memory index that is rebuilt when the
+    registry generation changes. Without a pub/sub subscription every query
+    checks the generation (one GET); with one, the check is skipped for up to
+    REVALIDATE_SECONDS after the last check as a guard against lost messages.
+
     Implements:
     - [policy-knowledge-base:EffectiveDateResolver/TS-01] Single revision, date in range
     - [policy-knowledge-base:EffectiveDateResolver/TS-02] Multiple revisions, middle date
@@ -57,14 +105,119 @@ class EffectiveDateResolver:
     - [policy-knowledge-base:EffectiveDateResolver/TS-08] Policy with no revision for date
     """
 
-    def __init__(self, registry: PolicyRegistry) -> None:
+    REVALIDATE_SECONDS = 30.0
+    RECONNECT_MAX_SECONDS = 30.0
+
+    def __init__(self, registry: PolicyRegistry, subscribe: bool = False) -> None:
         """
         Initialize EffectiveDateResolver.
 
         Args:
             registry: PolicyRegistry instance for accessing policy data.
+            subscribe: Listen on the registry's invalidation channel. The
+                listener task starts on the first query, inside the running loop.
         """
         self._registry = registry
+        self._subscribe = subscribe
+        self._index: _RevisionIndex | None = None
+        self._validated_at: float | None = None
+        self._invalidations = 0
+        self._lock = asyncio.Lock()
+        self._subscribed = False
+        self._listener: asyncio.Task[None] | None = None
+        self.rebuilds = 0
+
+        registry.add_change_listener(self.invalidate)
+
+    # =========================================================================
+    # Index Management
+    # =========================================================================
+
+    def invalidate(self) -> None:
+        """Drop the index so the next query rebuilds it."""
+        self._index = None
+        self._validated_at = None
+        self._invalidations += 1
+
+    async def _get_index(self) -> _RevisionIndex:
+        """Get the current index, rebuilding it if the registry has changed."""
+        if self._subscribe and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+        index = self._index
+        if (
+            index is not None
+            and self._subscribed
+            and self._validated_at is not None
+            and time.monotonic() - self._validated_at < self.REVALIDATE_SECONDS
+        ):
+            return index
+
+        async with self._lock:
+            invalidations = self._invalidations
+            generation = await self._registry.get_generation()
+            index = self._index
+            if index is None or index.generation != generation:
+                index = await self._build_index()
+                self._index = index
+            # A change announced mid-build must not be masked by this check
+            if invalidations == self._invalidations:
+                self._validated_at = time.monotonic()
+            return index
+
+    async def _build_index(self) -> _RevisionIndex:
+        """Load every policy and revision from the registry."""
+        generation, policies = await self._registry.get_all_policies_with_revisions()
+        timelines = {
+            policy.source: _PolicyTimeline(policy=policy, revisions=revisions)
+            for policy, revisions in policies
+        }
+        self.rebuilds += 1
+        logger.info(
+            "Effective date index built",
+            generation=generation,
+            policies=len(timelines),
+            revisions=sum(len(t.revisions) for t in timelines.values()),
+        )
+        return _RevisionIndex(generation=generation, timelines=timelines)
+
+    async def _listen(self) -> None:
+        """Invalidate the index on every change announced by any process."""
+        backoff = 1.0
+        while True:
+            try:
+                pubsub = await self._registry.subscribe_to_changes()
+                try:
+                    self._subscribed = True
+                    # Changes may have been missed while disconnected
+                    self._validated_at = None
+                    backoff = 1.0
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.invalidate()
+                finally:
+                    self._subscribed = False
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Policy invalidation subscription lost", error=str(e), retry_in=backoff
+                )
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.RECONNECT_MAX_SECONDS)
+
+    async def close(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
 
     async def resolve_for_policy(
         self, source: str, effective_date: date
@@ -85,11 +238,16 @@ class EffectiveDateResolver:
         Returns:
             EffectivePolicyResult with the effective revision, or None if policy not found.
         """
-        policy = await self._registry.get_policy(source)
-        if policy is None:
+        index = await self._get_index()
+        timeline = index.timelines.get(source)
+        if timeline is None:
             return None
+        return self._resolve(timeline, effective_date)
 
-        revision = await self._registry.get_effective_revision_for_date(source, effective_date)
+    def _resolve(self, timeline: _PolicyTimeline, effective_date: date) -> EffectivePolicyResult:
+        """Resolve one policy's timeline for a date."""
+        policy = timeline.policy
+        revision = timeline.effective_on(effective_date)
 
         if revision is not None:
             return EffectivePolicyResult(
@@ -99,35 +257,27 @@ class EffectiveDateResolver:
                 effective_revision=self._registry._revision_to_summary(revision),
             )
 
-        # Determine why no revision was found
-        reason = await self._determine_no_revision_reason(source, effective_date)
-
         return EffectivePolicyResult(
             source=policy.source,
             title=policy.title,
             category=policy.category,
             effective_revision=None,
-            reason=reason,
+            reason=self._determine_no_revision_reason(timeline, effective_date),
         )
 
-    async def _determine_no_revision_reason(
-        self, source: str, effective_date: date
-    ) -> str:
+    @staticmethod
+    def _determine_no_revision_reason(timeline: _PolicyTimeline, effective_date: date) -> str:
         """
         Determine why no revision was found for the given date.
 
         Returns:
             Reason string: "date_before_first_revision", "date_in_gap", or "no_revisions"
         """
-        revisions = await self._registry.list_revisions(source)
-
-        if not revisions:
+        if not timeline.revisions:
             return "no_revisions"
 
         # Check if date is before the first revision
-        # Revisions are sorted by effective_from DESC, so last one is earliest
-        earliest_revision = revisions[-1]
-        if effective_date < earliest_revision.effective_from:
+        if effective_date < timeline.starts[0]:
             return "date_before_first_revision"
 
         # If we get here and no revision was found, it must be a gap
@@ -146,18 +296,15 @@ class EffectiveDateResolver:
         Returns:
             EffectiveSnapshotResult with effective revisions for each policy.
         """
-        policies = await self._registry.list_policies()
+        index = await self._get_index()
 
         results: list[EffectivePolicyResult] = []
         policies_with_revision: list[str] = []
         policies_not_yet_effective: list[str] = []
         policies_in_gap: list[str] = []
 
-        for policy_summary in policies:
-            result = await self.resolve_for_policy(policy_summary.source, effective_date)
-            if result is None:
-                continue
-
+        for timeline in index.timelines.values():
+            result = self._resolve(timeline, effective_date)
             results.append(result)
 
             if result.effective_revision is not None:
@@ -191,25 +338,17 @@ class EffectiveDateResolver:
         Returns:
             Dict mapping source slug to revision_id (or None if no revision effective).
         """
-        result: dict[str, str | None] = {}
-
+        index = await self._get_index()
         if sources is None:
-            # Resolve all policies
-            snapshot = await self.resolve_snapshot(effective_date)
-            for policy_result in snapshot.policies:
-                if policy_result.effective_revision is not None:
-                    result[policy_result.source] = policy_result.effective_revision.revision_id
-                else:
-                    result[policy_result.source] = None
-        else:
-            # Resolve only specified sources
-            for source in sources:
-                policy_result = await self.resolve_for_policy(source, effective_date)
-                if policy_result is not None:
-                    if policy_result.effective_revision is not None:
-                        result[source] = policy_result.effective_revision.revision_id
-                    else:
-                        result[source] = None
+            sources = list(index.timelines)
+
+        result: dict[str, str | None] = {}
+        for source in sources:
+            timeline = index.timelines.get(source)
+            if timeline is None:
+                continue
+            revision = timeline.effective_on(effective_date)
+            result[source] = revision.revision_id if revision is not None else None
 
         return result
 
@@ -230,7 +369,9 @@ class EffectiveDateResolver:
         Returns:
             True if the revision was in force on that date, False otherwise.
         """
-        revision = await self._registry.get_revision(source, revision_id)
+        index = await self._get_index()
+        timeline = index.timelines.get(source)
+        revision = timeline.by_id.get(revision_id) if timeline is not None else None
         if revision is None:
             return False
 
@@ -0,0 +1,51 @@
+"""
+File content hashing shared by the scraper, document store and orchestrator.
+
+Documents are hashed once, while they stream to disk after download, and the
+digest is passed along with the file. These helpers cover the places where a
+file on disk still has to be hashed.
+"""
+
+import hashlib
+from pathlib import Path
+
+# Read size for hashing files from disk. Large reads keep the per-call
+# overhead negligible next to SHA-256 itself.
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def sha256_file(file_path: str | Path) -> str:
+    """
+    Compute the SHA256 hex digest of a file.
+
+    Reads into a single reusable 1 MB buffer, so no per-chunk bytes objects
+    are allocated.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Lowercase hex digest.
+    """
+    sha256 = hashlib.sha256()
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            sha256.update(view[:n])
+    return sha256.hexdigest()
+
+
+def sha256_text(text: str) -> str:
+    """
+    Compute the SHA256 hex digest of a string's UTF-8 encoding.
+
+    Used to match re-chunked policy text against stored chunks.
+
+    Args:
+        text: Text to hash.
+
+    Returns:
+        Lowercase hex digest.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,195 @@
+"""
+Policy ingestion progress for status reads and the Server-Sent Events stream.
+
+Implements [policy-knowledge-base:FR-003] - Async processing with progress reporting
+Implements [policy-knowledge-base:PolicyIngestionJob/TS-05] - Progress updates
+
+The worker publishes progress through PolicyRegistry (PROGRESS_CHANNEL plus a
+per-revision snapshot). One stream subscribes once and forwards the updates
+for every revision it covers, so admins watching a seed or reindex run do not
+have to poll each revision's status endpoint.
+"""
+
+import json
+import weakref
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import structlog
+
+from src.api.schemas.policy import PolicyRevisionRecord, RevisionStatus
+from src.shared.policy_registry import FINISHED_PHASES, PolicyRegistry
+
+logger = structlog.get_logger(__name__)
+
+# Seconds without an update before a keep-alive comment is sent
+HEARTBEAT_SECONDS = 15.0
+
+# Each stream holds a Redis pub/sub connection from the API's shared pool
+MAX_PROGRESS_STREAMS = 4
+
+
+def pending_progress() -> dict[str, Any]:
+    """Progress for a revision queued for ingestion but not yet started."""
+    return {"phase": "pending", "percent_complete": 0, "chunks_processed": 0}
+
+
+def revision_progress(
+    revision: PolicyRevisionRecord, snapshot: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """
+    Combine a revision's status with its latest published progress.
+
+    A finished snapshot on a revision that is processing again belongs to an
+    earlier run and is ignored.
+
+    Args:
+        revision: Revision record from the registry.
+        snapshot: Latest progress message for the revision, if any.
+
+    Returns:
+        Progress dict, or None when there is nothing to report.
+    """
+    progress = (
+        {k: v for k, v in snapshot.items() if k not in ("source", "revision_id")}
+        if snapshot
+        else None
+    )
+    phase = progress.get("phase") if progress else None
+
+    if revision.status == RevisionStatus.PROCESSING:
+        if progress and phase not in FINISHED_PHASES:
+            return progress
+        return pending_progress()
+    if revision.status == RevisionStatus.ACTIVE:
+        if progress and phase == "complete":
+            return progress
+        return {
+            "phase": "complete",
+            "percent_complete": 100,
+            "chunks_processed": revision.chunk_count or 0,
+        }
+    if revision.status == RevisionStatus.FAILED and progress and phase == "failed":
+        return progress
+    return None
+
+
+def format_event(event: str, data: dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class ProgressStreamLimiter:
+    """Counts open progress streams against MAX_PROGRESS_STREAMS."""
+
+    def __init__(self, max_streams: int = MAX_PROGRESS_STREAMS) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            max_streams: Streams allowed open at once.
+        """
+        self._max_streams = max_streams
+        self._open = 0
+
+    def try_acquire(self) -> bool:
+        """Reserve a stream slot, returning False if all are in use."""
+        if self._open >= self._max_streams:
+            return False
+        self._open += 1
+        return True
+
+    @property
+    def open_streams(self) -> int:
+        """Get the number of slots in use."""
+        return self._open
+
+    def release(self) -> None:
+        """Free a stream slot."""
+        self._open = max(0, self._open - 1)
+
+    def hold(self, owner: object) -> Callable[[], Any]:
+        """
+        Tie an acquired slot to the object that streams with it.
+
+        A response may be dropped before its body is ever iterated (the
+        client disconnects first), so a release in the event generator's
+        finally is not enough. The slot is freed by the first call of the
+        returned callable, or when owner is garbage collected, whichever
+        comes first.
+
+        Args:
+            owner: Object whose lifetime bounds the slot (the response).
+
+        Returns:
+            Callable that frees the slot; later calls do nothing.
+        """
+        return weakref.finalize(owner, self.release)
+
+
+stream_limiter = ProgressStreamLimiter()
+
+
+async def stream_ingestion_progress(
+    registry: PolicyRegistry,
+    keys: list[tuple[str, str]],
+    heartbeat_seconds: float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    Stream ingestion progress for several revisions as Server-Sent Events.
+
+    Events:
+        snapshot: Current status and progress of each revision, sent first.
+        progress: A progress message published by the worker.
+        done: Every covered revision has finished; the stream then ends.
+
+    Revisions that are not processing finish immediately. Unknown revisions
+    get a snapshot with status null. A comment line is sent after
+    heartbeat_seconds without updates so proxies keep the connection open.
+
+    Args:
+        registry: PolicyRegistry to read statuses and subscribe through.
+        keys: (source, revision_id) pairs to cover.
+        heartbeat_seconds: Idle time before a keep-alive comment.
+
+    Yields:
+        Encoded Server-Sent Event strings.
+    """
+    # Subscribe before reading statuses so no update falls in between
+    pubsub = await registry.subscribe_to_ingestion_progress()
+    try:
+        statuses = await registry.get_ingestion_statuses(keys)
+        pending: set[tuple[str, str]] = set()
+        for (source, revision_id), (revision, snapshot) in zip(keys, statuses, strict=True):
+            yield format_event(
+                "snapshot",
+                {
+                    "source": source,
+                    "revision_id": revision_id,
+                    "status": revision.status.value if revision else None,
+                    "progress": revision_progress(revision, snapshot) if revision else None,
+                },
+            )
+            if revision is not None and revision.status == RevisionStatus.PROCESSING:
+                pending.add((source, revision_id))
+
+        while pending:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=heartbeat_seconds
+            )
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+
+            data = json.loads(message["data"])
+            key = (data.get("source"), data.get("revision_id"))
+            if key not in pending:
+                continue
+            yield format_event("progress", data)
+            if data.get("phase") in FINISHED_PHASES:
+                pending.discard(key)
+
+        yield format_event("done", {"revisions": len(keys)})
+    finally:
+        await pubsub.aclose()
+        logger.debug("Ingestion progress stream closed", revisions=len(keys))
@@ -9,8 +9,14 @@ Implements:
 - [policy-knowledge-base:ChromaDBSchema/TS-01] Temporal filter returns correct revision
 - [policy-knowledge-base:ChromaDBSchema/TS-02] Source filter works
 - [policy-knowledge-base:ChromaDBSchema/TS-03] Empty effective_to means current
+
+Besides policy_docs, an optional policy_docs_current collection materialises
+the revisions in force on one date (normally today), as decided by the
+registry. Present-day searches query that small collection without temporal
+where clauses. Historical searches use the filtered path on policy_docs.
 """
 
+import json
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
@@ -19,6 +25,9 @@ from typing import Any
 import chromadb
 import structlog
 from chromadb.config import Settings
+from chromadb.errors import NotFoundError
+
+from src.shared.hashing import sha256_text
 
 logger = structlog.get_logger(__name__)
 
@@ -50,6 +59,24 @@ class PolicySearchResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class RevisionSyncResult:
+    """Outcome of replacing a revision's chunks in place."""
+
+    upserted: int
+    unchanged: int
+    deleted: int
+
+
+@dataclass(frozen=True)
+class CurrentView:
+    """Membership of the current-in-force collection."""
+
+    as_of: date
+    generation: int  # Registry generation the membership was computed at
+    members: frozenset[tuple[str, str]]  # (source, revision_id)
+
+
 class PolicyChromaClient:
     """
     Client for ChromaDB operations on the policy_docs collection.
@@ -64,6 +91,7 @@ class PolicyChromaClient:
     """
 
     COLLECTION_NAME = "policy_docs"
+    CURRENT_COLLECTION_NAME = "policy_docs_current"
 
     def __init__(
         self,
@@ -80,6 +108,7 @@ class PolicyChromaClient:
         self._persist_directory = Path(persist_directory) if persist_directory else None
         self._client = client
         self._collection: chromadb.Collection | None = None
+        self._current_collection: chromadb.Collection | None = None
 
     def _get_client(self) -> chromadb.ClientAPI:
         """Get or create the ChromaDB client."""
@@ -112,6 +141,118 @@ class PolicyChromaClient:
             logger.debug("Collection initialized", name=self.COLLECTION_NAME)
         return self._collection
 
+    def _get_current_collection(self, create: bool = False) -> chromadb.Collection | None:
+        """
+        Get the current-in-force collection.
+
+        Args:
+            create: Create it if missing (otherwise return None when missing).
+        """
+        client = self._get_client()
+        if create:
+            self._current_collection = client.get_or_create_collection(
+                name=self.CURRENT_COLLECTION_NAME,
+                metadata={"description": "Chunks of policy revisions currently in force"},
+            )
+            return self._current_collection
+        try:
+            # Re-read so membership written by other processes is seen
+            self._current_collection = client.get_collection(self.CURRENT_COLLECTION_NAME)
+        except NotFoundError:
+            return None
+        return self._current_collection
+
+    def get_current_view(self) -> CurrentView | None:
+        """
+        Get the membership of the current-in-force collection.
+
+        Returns:
+            CurrentView, or None if the collection has never been refreshed.
+        """
+        collection = self._get_current_collection()
+        metadata = collection.metadata if collection is not None else None
+        if not metadata or "as_of" not in metadata:
+            return None
+        return CurrentView(
+            as_of=self.parse_date_from_metadata(metadata["as_of"]) or date.max,
+            generation=int(metadata["generation"]),
+            members=frozenset(tuple(m) for m in json.loads(metadata["members"])),
+        )
+
+    def refresh_current_view(
+        self,
+        members: set[tuple[str, str]],
+        as_of: date,
+        generation: int,
+    ) -> CurrentView:
+        """
+        Make the current-in-force collection hold exactly the given revisions.
+
+        Revisions that joined are copied from policy_docs with their stored
+        embeddings; revisions that left are deleted. Unchanged members are
+        not touched.
+
+        Args:
+            members: (source, revision_id) of every revision in force on as_of.
+            as_of: Date the membership was computed for.
+            generation: Registry generation the membership was computed at.
+
+        Returns:
+            The new CurrentView.
+        """
+        previous = self.get_current_view()
+        old_members = previous.members if previous is not None else frozenset()
+        collection = self._get_current_collection(create=True)
+        assert collection is not None
+
+        added = set(members) - old_members
+        removed = old_members - set(members)
+        for source, revision_id in removed:
+            self._delete_where(collection, source, revision_id)
+        for source, revision_id in added:
+            self._upsert_into(collection, self.get_revision_chunks(source, revision_id))
+
+        view = CurrentView(as_of=as_of, generation=generation, members=frozenset(members))
+        collection.modify(
+            metadata={
+                "description": "Chunks of policy revisions currently in force",
+                "as_of": self.format_date_for_metadata(as_of),
+                "generation": generation,
+                "members": json.dumps(sorted(view.members)),
+            }
+        )
+        logger.info(
+            "Current policy view refreshed",
+            as_of=as_of.isoformat(),
+            generation=generation,
+            members=len(view.members),
+            added=len(added),
+            removed=len(removed),
+        )
+        return view
+
+    def _mirrored_members(self) -> tuple[chromadb.Collection, frozenset[tuple[str, str]]] | None:
+        """Get the current collection and its members, if it is in use."""
+        view = self.get_current_view()
+        if view is None or self._current_collection is None:
+            return None
+        return self._current_collection, view.members
+
+    @staticmethod
+    def _upsert_into(collection: chromadb.Collection, chunks: list[PolicyChunkRecord]) -> None:
+        if not chunks:
+            return
+        collection.upsert(
+            ids=[c.chunk_id for c in chunks],
+            embeddings=[c.embedding for c in chunks],
+            documents=[c.text for c in chunks],
+            metadatas=[c.metadata for c in chunks],
+        )
+
+    @staticmethod
+    def _delete_where(collection: chromadb.Collection, source: str, revision_id: str) -> None:
+        collection.delete(where={"$and": [{"source": source}, {"revision_id": revision_id}]})
+
     @staticmethod
     def generate_chunk_id(
         source: str,
@@ -162,14 +303,7 @@ class PolicyChromaClient:
         Args:
             chunk: The chunk to store.
         """
-        collection = self._get_collection()
-
-        collection.upsert(
-            ids=[chunk.chunk_id],
-            embeddings=[chunk.embedding],
-            documents=[chunk.text],
-            metadatas=[chunk.metadata],
-        )
+        self.upsert_chunks([chunk])
 
         logger.debug("Policy chunk upserted", chunk_id=chunk.chunk_id)
 
@@ -186,14 +320,20 @@ class PolicyChromaClient:
         if not chunks:
             return 0
 
-        collection = self._get_collection()
-
-        collection.upsert(
-            ids=[c.chunk_id for c in chunks],
-            embeddings=[c.embedding for c in chunks],
-            documents=[c.text for c in chunks],
-            metadatas=[c.metadata for c in chunks],
-        )
+        self._upsert_into(self._get_collection(), chunks)
+
+        # Keep revisions in the current-in-force collection in step
+        mirrored = self._mirrored_members()
+        if mirrored is not None:
+            current, members = mirrored
+            self._upsert_into(
+                current,
+                [
+                    c
+                    for c in chunks
+                    if (c.metadata.get("source"), c.metadata.get("revision_id")) in members
+                ],
+            )
 
         logger.debug("Policy chunks upserted", count=len(chunks))
         return len(chunks)
@@ -205,6 +345,7 @@ class PolicyChromaClient:
         effective_date: date | None = None,
         sources: list[str] | None = None,
         revision_id: str | None = None,
+        use_current_view: bool = False,
     ) -> list[PolicySearchResult]:
         """
         Search policy documents with optional temporal and source filtering.
@@ -219,17 +360,24 @@ class PolicyChromaClient:
             effective_date: Optional date for temporal filtering.
             sources: Optional list of source slugs to filter.
             revision_id: Optional specific revision ID to search.
+            use_current_view: Search the current-in-force collection instead.
+                The caller must have checked that its view is up to date for
+                effective_date (see refresh_current_view); no temporal filter
+                is applied because membership already encodes it.
 
         Returns:
             List of search results ordered by relevance.
         """
-        collection = self._get_collection()
+        collection = self._get_current_collection() if use_current_view else None
+        if collection is None:
+            collection = self._get_collection()
+            use_current_view = False
 
         # Build where clause for filters
         where_conditions: list[dict[str, Any]] = []
 
         # Temporal filtering
-        if effective_date is not None:
+        if effective_date is not None and not use_current_view:
             date_int = self.format_date_for_metadata(effective_date)
             # effective_from <= effective_date
             where_conditions.append({"effective_from": {"$lte": date_int}})
@@ -277,30 +425,115 @@ class PolicyChromaClient:
                 distance = distances[i] if i < len(distances) else 0
                 relevance_score = max(0, 1 - (distance / 2))
 
-                meta = metadatas[i] if i < len(metadatas) else {}
-
-                # Parse dates from integer format
-                effective_from_int = meta.get("effective_from", 0)
-                effective_to_int = meta.get("effective_to", 99991231)
-
                 search_results.append(
-                    PolicySearchResult(
-                        chunk_id=chunk_id,
-                        text=documents[i] if i < len(documents) else "",
-                        relevance_score=relevance_score,
-                        source=meta.get("source", ""),
-                        revision_id=meta.get("revision_id", ""),
-                        version_label=meta.get("version_label", ""),
-                        effective_from=self.parse_date_from_metadata(effective_from_int),
-                        effective_to=self.parse_date_from_metadata(effective_to_int),
-                        section_ref=meta.get("section_ref", ""),
-                        page_number=meta.get("page_number", 0),
-                        metadata=meta,
+                    self._to_search_result(
+                        chunk_id,
+                        documents[i] if i < len(documents) else "",
+                        metadatas[i] if i < len(metadatas) else {},
+                        relevance_score,
                     )
                 )
 
         return search_results
 
+    def _to_search_result(
+        self, chunk_id: str, text: str, meta: dict[str, Any], relevance_score: float
+    ) -> PolicySearchResult:
+        """Build a PolicySearchResult from stored chunk metadata."""
+        # Parse dates from integer format
+        effective_from_int = meta.get("effective_from", 0)
+        effective_to_int = meta.get("effective_to", 99991231)
+
+        return PolicySearchResult(
+            chunk_id=chunk_id,
+            text=text,
+            relevance_score=relevance_score,
+            source=meta.get("source", ""),
+            revision_id=meta.get("revision_id", ""),
+            version_label=meta.get("version_label", ""),
+            effective_from=self.parse_date_from_metadata(effective_from_int),
+            effective_to=self.parse_date_from_metadata(effective_to_int),
+            section_ref=meta.get("section_ref", ""),
+            page_number=meta.get("page_number", 0),
+            metadata=meta,
+        )
+
+    def get_chunks_by_ids(self, chunk_ids: list[str]) -> list[PolicySearchResult]:
+        """
+        Get chunks by ID with an exact lookup (no vector search).
+
+        Args:
+            chunk_ids: Chunk IDs, in the order they should be returned.
+
+        Returns:
+            Chunks found, in the order of chunk_ids, with relevance_score 1.0.
+            IDs that no longer exist are skipped.
+        """
+        if not chunk_ids:
+            return []
+
+        collection = self._get_collection()
+        try:
+            results = collection.get(ids=chunk_ids, include=["documents", "metadatas"])
+        except Exception as e:
+            logger.error("Policy chunk lookup failed", error=str(e))
+            return []
+
+        found = {
+            chunk_id: self._to_search_result(chunk_id, text or "", meta or {}, 1.0)
+            for chunk_id, text, meta in zip(
+                results["ids"], results["documents"] or [], results["metadatas"] or [],
+                strict=True,
+            )
+        }
+        return [found[chunk_id] for chunk_id in chunk_ids if chunk_id in found]
+
+    def get_section_chunks(
+        self, source: str, section_ref: str, revision_id: str | None = None
+    ) -> list[PolicySearchResult]:
+        """
+        Get every chunk of a section by exact metadata match.
+
+        Used for revisions ingested before the section index existed.
+
+        Args:
+            source: Policy source slug.
+            section_ref: Exact section reference.
+            revision_id: Optional revision ID; all revisions when None.
+
+        Returns:
+            Matching chunks ordered by revision effective_from then chunk index.
+        """
+        collection = self._get_collection()
+
+        where_conditions: list[dict[str, Any]] = [
+            {"source": source},
+            {"section_ref": section_ref},
+        ]
+        if revision_id:
+            where_conditions.append({"revision_id": revision_id})
+
+        try:
+            results = collection.get(
+                where={"$and": where_conditions},
+                include=["documents", "metadatas"],
+            )
+        except Exception as e:
+            logger.error("Policy section lookup failed", source=source, error=str(e))
+            return []
+
+        chunks = [
+            self._to_search_result(chunk_id, text or "", meta or {}, 1.0)
+            for chunk_id, text, meta in zip(
+                results["ids"], results["documents"] or [], results["metadatas"] or [],
+                strict=True,
+            )
+        ]
+        chunks.sort(
+            key=lambda c: (c.metadata.get("effective_from", 0), c.metadata.get("chunk_index", 0))
+        )
+        return chunks
+
     def delete_revision_chunks(self, source: str, revision_id: str) -> int:
         """
         Delete all chunks for a specific revision.
@@ -345,6 +578,9 @@ class PolicyChromaClient:
 
         chunk_ids = results["ids"]
         collection.delete(ids=chunk_ids)
+        mirrored = self._mirrored_members()
+        if mirrored is not None and (source, revision_id) in mirrored[1]:
+            mirrored[0].delete(ids=chunk_ids)
 
         logger.info(
             "Revision chunks deleted",
@@ -354,6 +590,94 @@ class PolicyChromaClient:
         )
         return len(chunk_ids)
 
+    def sync_revision_chunks(
+        self, source: str, revision_id: str, chunks: list[PolicyChunkRecord]
+    ) -> RevisionSyncResult:
+        """
+        Replace a revision's chunks with a new set, touching only differences.
+
+        Implements [policy-knowledge-base:NFR-004] - Atomic deletion
+
+        New and changed chunks are upserted first and orphaned chunks are
+        deleted afterwards. Readers therefore always see a complete revision:
+        the old set, or the new set plus orphans that are about to go. They
+        never see an empty revision.
+
+        Args:
+            source: Policy source slug.
+            revision_id: Revision ID.
+            chunks: The revision's complete new chunk set.
+
+        Returns:
+            RevisionSyncResult with upserted, unchanged and deleted counts.
+
+        Raises:
+            Exception: If the revision's existing chunks cannot be read;
+                nothing is written in that case.
+        """
+        collection = self._get_collection()
+
+        # A failed read propagates: syncing against an empty set would leave
+        # the old chunks in place as orphans while reporting success
+        results = collection.get(
+            where={"$and": [{"source": source}, {"revision_id": revision_id}]},
+            include=["documents", "metadatas"],
+        )
+        existing: dict[str, tuple[str, dict[str, Any]]] = {
+            chunk_id: (text or "", dict(meta or {}))
+            for chunk_id, text, meta in zip(
+                results["ids"],
+                results["documents"] or [],
+                results["metadatas"] or [],
+                strict=True,
+            )
+        }
+
+        changed = [
+            c for c in chunks if existing.get(c.chunk_id) != (c.text, c.metadata)
+        ]
+        new_ids = {c.chunk_id for c in chunks}
+        orphan_ids = [chunk_id for chunk_id in existing if chunk_id not in new_ids]
+
+        self.upsert_chunks(changed)
+        if orphan_ids:
+            collection.delete(ids=orphan_ids)
+            mirrored = self._mirrored_members()
+            if mirrored is not None and (source, revision_id) in mirrored[1]:
+                mirrored[0].delete(ids=orphan_ids)
+
+        result = RevisionSyncResult(
+            upserted=len(changed),
+            unchanged=len(chunks) - len(changed),
+            deleted=len(orphan_ids),
+        )
+        logger.info(
+            "Revision chunks synced",
+            source=source,
+            revision_id=revision_id,
+            upserted=result.upserted,
+            unchanged=result.unchanged,
+            deleted=result.deleted,
+        )
+        return result
+
+    def get_revision_embeddings(self, source: str, revision_id: str) -> dict[str, list[float]]:
+        """
+        Get a revision's stored embeddings keyed by chunk text hash.
+
+        Args:
+            source: Policy source slug.
+            revision_id: Revision ID.
+
+        Returns:
+            Dict of SHA256 text hash to embedding.
+        """
+        return {
+            chunk.metadata.get("text_hash") or sha256_text(chunk.text): chunk.embedding
+            for chunk in self.get_revision_chunks(source, revision_id)
+            if chunk.embedding
+        }
+
     def get_revision_chunks(self, source: str, revision_id: str) -> list[PolicyChunkRecord]:
         """
         Get all chunks for a specific revision.
@@ -9,10 +9,14 @@ Implements [policy-knowledge-base:FR-010] - Update revision metadata
 Implements [policy-knowledge-base:FR-014] - Redis as source of truth
 """
 
-from datetime import date, datetime, timedelta
+import json
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
 
 import redis.asyncio as redis
 import structlog
+from redis.asyncio.client import PubSub
 
 from src.api.schemas.policy import (
     PolicyCategory,
@@ -26,6 +30,19 @@ from src.api.schemas.policy import (
 
 logger = structlog.get_logger(__name__)
 
+# Pub/sub channel announcing policy and revision changes. Every process that
+# caches registry data (API, policy-kb, worker) subscribes to the same channel.
+INVALIDATION_CHANNEL = "policies:invalidate"
+
+# Pub/sub channel carrying ingestion progress for every revision being
+# ingested. The latest message per revision is also kept as a snapshot so
+# status reads and new subscribers do not have to wait for the next update.
+PROGRESS_CHANNEL = "policies:ingest_progress"
+PROGRESS_TTL_SECONDS = 24 * 60 * 60
+
+# Ingestion phases after which no further progress is published
+FINISHED_PHASES = frozenset({"complete", "failed"})
+
 
 class PolicyRegistryError(Exception):
     """Base exception for policy registry errors."""
@@ -97,6 +114,8 @@ class PolicyRegistry:
     - policy_revision:{source}:{revision_id} - Hash for revision metadata
     - policy_revisions:{source} - Sorted Set for revision IDs sorted by effective_from
     - policies_all - Set of all source slugs
+    - policies_generation - Counter incremented on every policy/revision change
+    - policy_sections:{source}:{revision_id} - Hash of section_ref to JSON chunk ID list
 
     Implements:
     - [policy-knowledge-base:PolicyRegistry/TS-01] Create policy document
@@ -119,6 +138,7 @@ class PolicyRegistry:
             redis_client: Async Redis client instance.
         """
         self._client = redis_client
+        self._change_listeners: list[Callable[[], None]] = []
 
     # =========================================================================
     # Key Generation
@@ -136,10 +156,81 @@ class PolicyRegistry:
         """Get Redis key for a policy's revisions sorted set."""
         return f"policy_revisions:{source}"
 
+    def _sections_key(self, source: str, revision_id: str) -> str:
+        """Get Redis key for a revision's section index."""
+        return f"policy_sections:{source}:{revision_id}"
+
+    def _progress_key(self, source: str, revision_id: str) -> str:
+        """Get Redis key for a revision's latest ingestion progress."""
+        return f"policy_ingest_progress:{source}:{revision_id}"
+
     def _policies_all_key(self) -> str:
         """Get Redis key for the set of all policy source slugs."""
         return "policies_all"
 
+    def _generation_key(self) -> str:
+        """Get Redis key for the registry generation counter."""
+        return "policies_generation"
+
+    # =========================================================================
+    # Change Notification
+    # =========================================================================
+
+    def add_change_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback run in-process after every registry write.
+
+        Other processes learn about the same writes from INVALIDATION_CHANNEL;
+        the in-process callback keeps this process's own reads consistent
+        without waiting for the pub/sub round trip.
+
+        Args:
+            callback: Function called with no arguments.
+        """
+        self._change_listeners.append(callback)
+
+    async def get_generation(self) -> int:
+        """
+        Get the registry generation counter.
+
+        Returns:
+            Number of changes recorded so far (0 for a fresh registry).
+        """
+        value = await self._client.get(self._generation_key())
+        return int(value) if value else 0
+
+    async def subscribe_to_changes(self) -> PubSub:
+        """
+        Open a pub/sub connection subscribed to INVALIDATION_CHANNEL.
+
+        Returns:
+            Subscribed PubSub; the caller closes it with aclose().
+        """
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(INVALIDATION_CHANNEL)
+        return pubsub
+
+    async def notify_change(self, source: str, revision_id: str | None = None) -> None:
+        """
+        Bump the generation counter and announce a change to all processes.
+
+        Called by every registry write. Also used for changes made outside
+        the registry that affect what readers see, such as policy chunks
+        being added to or removed from the vector store.
+
+        Args:
+            source: Policy source slug that changed.
+            revision_id: Revision ID that changed, if any.
+        """
+        message = json.dumps({"source": source, "revision_id": revision_id})
+        async with self._client.pipeline() as pipe:
+            await pipe.incr(self._generation_key())
+            await pipe.publish(INVALIDATION_CHANNEL, message)
+            await pipe.execute()
+
+        for callback in self._change_listeners:
+            callback()
+
     # =========================================================================
     # Serialization Helpers
     # =========================================================================
@@ -264,6 +355,7 @@ class PolicyRegistry:
             # Add to policies_all set
             await pipe.sadd(self._policies_all_key(), source)
             await pipe.execute()
+        await self.notify_change(source)
 
         logger.info(
             "Policy created",
@@ -337,6 +429,7 @@ class PolicyRegistry:
         await self._client.hset(
             self._policy_key(source), mapping=self._serialize_policy(record)
         )
+        await self.notify_change(source)
 
         logger.debug("Policy updated", source=source)
         return record
@@ -393,33 +486,139 @@ class PolicyRegistry:
         if not sources:
             return []
 
-        summaries = []
-        for source in sorted(sources):
-            if source_filter and source != source_filter:
-                continue
-
-            policy = await self.get_policy(source)
-            if policy is None:
-                continue
-
-            if category and policy.category != category:
-                continue
+        sources = sorted(s for s in sources if not source_filter or s == source_filter)
+        policies = [
+            (policy, revision_ids)
+            for policy, revision_ids in await self._get_policies_with_revision_ids(sources)
+            if not category or policy.category == category
+        ]
 
-            current_revision = await self.get_current_revision(source)
-            revision_count = await self._client.zcard(self._revisions_set_key(source))
+        # One more round trip for the revisions of the matching policies
+        revisions = await self._get_revisions_bulk(
+            [(policy.source, rev_id) for policy, revision_ids in policies for rev_id in revision_ids]
+        )
 
+        today = date.today()
+        summaries = []
+        offset = 0
+        for policy, revision_ids in policies:
+            policy_revisions = revisions[offset : offset + len(revision_ids)]
+            offset += len(revision_ids)
             summaries.append(
                 PolicyDocumentSummary(
                     source=policy.source,
                     title=policy.title,
                     category=policy.category,
-                    current_revision=current_revision,
-                    revision_count=revision_count,
+                    current_revision=self._select_current_revision(policy_revisions, today),
+                    revision_count=len(revision_ids),
                 )
             )
 
         return summaries
 
+    async def get_all_policies_with_revisions(
+        self,
+    ) -> tuple[int, list[tuple[PolicyDocumentRecord, list[PolicyRevisionRecord]]]]:
+        """
+        Load every policy with all of its revisions.
+
+        Used to build in-process indexes. The generation is read before the
+        data, so a write racing with the load leaves the caller holding an
+        older generation and the next generation check reloads.
+
+        Returns:
+            Tuple of (generation, [(policy, revisions ordered by effective_from)])
+            with policies ordered by source slug.
+        """
+        async with self._client.pipeline() as pipe:
+            await pipe.get(self._generation_key())
+            await pipe.smembers(self._policies_all_key())
+            generation, sources = await pipe.execute()
+
+        policies = await self._get_policies_with_revision_ids(sorted(sources))
+        revisions = await self._get_revisions_bulk(
+            [(policy.source, rev_id) for policy, revision_ids in policies for rev_id in revision_ids]
+        )
+
+        result: list[tuple[PolicyDocumentRecord, list[PolicyRevisionRecord]]] = []
+        offset = 0
+        for policy, revision_ids in policies:
+            policy_revisions = revisions[offset : offset + len(revision_ids)]
+            offset += len(revision_ids)
+            result.append((policy, [rev for rev in policy_revisions if rev]))
+
+        return int(generation) if generation else 0, result
+
+    async def _get_policies_with_revision_ids(
+        self, sources: list[str]
+    ) -> list[tuple[PolicyDocumentRecord, list[str]]]:
+        """Get policy records and revision IDs (by effective_from) in one pipelined round trip."""
+        if not sources:
+            return []
+
+        async with self._client.pipeline() as pipe:
+            for source in sources:
+                await pipe.hgetall(self._policy_key(source))
+                await pipe.zrange(self._revisions_set_key(source), 0, -1)
+            replies = await pipe.execute()
+
+        policies: list[tuple[PolicyDocumentRecord, list[str]]] = []
+        for index in range(0, len(replies), 2):
+            policy_data, revision_ids = replies[index], replies[index + 1]
+            if policy_data:
+                policies.append((self._deserialize_policy(policy_data), revision_ids))
+        return policies
+
+    async def restore_policy(
+        self,
+        policy: PolicyDocumentRecord,
+        revisions: list[PolicyRevisionRecord],
+        sections: dict[str, dict[str, list[str]]],
+    ) -> None:
+        """
+        Replace a policy, its revisions and section indexes with stored records.
+
+        Used to load a corpus snapshot. Records are written as given, with no
+        overlap checks or auto-supersession, in a single MULTI/EXEC so readers
+        see either the old policy or the restored one.
+
+        Args:
+            policy: Policy record.
+            revisions: All revisions of the policy.
+            sections: Section index per revision ID.
+        """
+        source = policy.source
+        existing = await self._client.zrange(self._revisions_set_key(source), 0, -1)
+
+        async with self._client.pipeline() as pipe:
+            for revision_id in existing:
+                await pipe.delete(self._revision_key(source, revision_id))
+                await pipe.delete(self._sections_key(source, revision_id))
+                await pipe.delete(self._progress_key(source, revision_id))
+            await pipe.delete(self._revisions_set_key(source))
+            await pipe.delete(self._policy_key(source))
+            await pipe.hset(self._policy_key(source), mapping=self._serialize_policy(policy))
+            await pipe.sadd(self._policies_all_key(), source)
+            for record in revisions:
+                await pipe.hset(
+                    self._revision_key(source, record.revision_id),
+                    mapping=self._serialize_revision(record),
+                )
+                score = (record.effective_from - date(1970, 1, 1)).days
+                await pipe.zadd(self._revisions_set_key(source), {record.revision_id: score})
+                if sections.get(record.revision_id):
+                    await pipe.hset(
+                        self._sections_key(source, record.revision_id),
+                        mapping={
+                            ref: json.dumps(ids)
+                            for ref, ids in sections[record.revision_id].items()
+                        },
+                    )
+            await pipe.execute()
+        await self.notify_change(source)
+
+        logger.info("Policy restored", source=source, revisions=len(revisions))
+
     async def delete_policy(self, source: str) -> bool:
         """
         Delete a policy and all its revisions.
@@ -442,11 +641,13 @@ class PolicyRegistry:
             # Delete all revision hashes
             for rev_id in revision_ids:
                 await pipe.delete(self._revision_key(source, rev_id))
+                await pipe.delete(self._sections_key(source, rev_id))
             # Delete revisions sorted set
             await pipe.delete(self._revisions_set_key(source))
             # Remove from policies_all
             await pipe.srem(self._policies_all_key(), source)
             await pipe.execute()
+        await self.notify_change(source)
 
         logger.info("Policy deleted", source=source, revisions_deleted=len(revision_ids))
         return True
@@ -524,6 +725,7 @@ class PolicyRegistry:
             # Add to revisions sorted set
             await pipe.zadd(self._revisions_set_key(source), {revision_id: score})
             await pipe.execute()
+        await self.notify_change(source, revision_id)
 
         logger.info(
             "Revision created",
@@ -616,12 +818,30 @@ class PolicyRegistry:
     async def _get_all_revisions(self, source: str) -> list[PolicyRevisionRecord]:
         """Get all revisions for a policy."""
         revision_ids = await self._client.zrange(self._revisions_set_key(source), 0, -1)
-        revisions = []
-        for rev_id in revision_ids:
-            rev = await self.get_revision(source, rev_id)
-            if rev:
-                revisions.append(rev)
-        return revisions
+        revisions = await self._get_revisions_bulk([(source, rev_id) for rev_id in revision_ids])
+        return [rev for rev in revisions if rev]
+
+    async def _get_revisions_bulk(
+        self, keys: list[tuple[str, str]]
+    ) -> list[PolicyRevisionRecord | None]:
+        """
+        Get many revisions in a single pipelined round trip.
+
+        Args:
+            keys: (source, revision_id) pairs.
+
+        Returns:
+            Revision records in the same order as keys (None where missing).
+        """
+        if not keys:
+            return []
+
+        async with self._client.pipeline() as pipe:
+            for source, revision_id in keys:
+                await pipe.hgetall(self._revision_key(source, revision_id))
+            replies = await pipe.execute()
+
+        return [self._deserialize_revision(data) if data else None for data in replies]
 
     async def get_revision(self, source: str, revision_id: str) -> PolicyRevisionRecord | None:
         """
@@ -653,14 +873,9 @@ class PolicyRegistry:
         """
         # Get revision IDs in reverse order (newest first)
         revision_ids = await self._client.zrevrange(self._revisions_set_key(source), 0, -1)
+        revisions = await self._get_revisions_bulk([(source, rev_id) for rev_id in revision_ids])
 
-        summaries = []
-        for rev_id in revision_ids:
-            rev = await self.get_revision(source, rev_id)
-            if rev:
-                summaries.append(self._revision_to_summary(rev))
-
-        return summaries
+        return [self._revision_to_summary(rev) for rev in revisions if rev]
 
     async def get_current_revision(self, source: str) -> PolicyRevisionSummary | None:
         """
@@ -672,12 +887,16 @@ class PolicyRegistry:
         Returns:
             Current revision summary if one exists, None otherwise.
         """
-        today = date.today()
         revisions = await self._get_all_revisions(source)
+        return self._select_current_revision(revisions, date.today())
 
+    def _select_current_revision(
+        self, revisions: list[PolicyRevisionRecord | None], today: date
+    ) -> PolicyRevisionSummary | None:
+        """Pick the active revision in force today from revisions ordered by effective_from."""
         for rev in revisions:
-            # Skip non-active revisions
-            if rev.status != RevisionStatus.ACTIVE:
+            # Skip missing and non-active revisions
+            if rev is None or rev.status != RevisionStatus.ACTIVE:
                 continue
 
             # Check if revision is currently in force
@@ -752,6 +971,7 @@ class PolicyRegistry:
         if effective_from is not None:
             score = (effective_from - date(1970, 1, 1)).days
             await self._client.zadd(self._revisions_set_key(source), {revision_id: score})
+        await self.notify_change(source, revision_id)
 
         logger.debug("Revision updated", source=source, revision_id=revision_id)
         return revision
@@ -784,11 +1004,14 @@ class PolicyRegistry:
                 raise CannotDeleteSoleRevisionError(source, revision_id)
 
         async with self._client.pipeline() as pipe:
-            # Delete revision hash
+            # Delete revision hash and section index
             await pipe.delete(self._revision_key(source, revision_id))
+            await pipe.delete(self._sections_key(source, revision_id))
+            await pipe.delete(self._progress_key(source, revision_id))
             # Remove from sorted set
             await pipe.zrem(self._revisions_set_key(source), revision_id)
             await pipe.execute()
+        await self.notify_change(source, revision_id)
 
         logger.info("Revision deleted", source=source, revision_id=revision_id)
         return True
@@ -798,6 +1021,197 @@ class PolicyRegistry:
         revisions = await self._get_all_revisions(source)
         return sum(1 for rev in revisions if rev.status == RevisionStatus.ACTIVE)
 
+    # =========================================================================
+    # Ingestion Progress
+    # =========================================================================
+
+    async def publish_ingestion_progress(
+        self, source: str, revision_id: str, progress: dict[str, Any]
+    ) -> None:
+        """
+        Record a revision's ingestion progress and announce it on PROGRESS_CHANNEL.
+
+        Progress is not a registry write: the generation counter is untouched.
+
+        Args:
+            source: Policy source slug.
+            revision_id: Revision ID.
+            progress: Progress fields (phase, percent_complete, counters, error).
+        """
+        message = json.dumps(
+            {
+                "source": source,
+                "revision_id": revision_id,
+                **progress,
+                "updated_at": datetime.now(UTC).isoformat(),
+            }
+        )
+        async with self._client.pipeline() as pipe:
+            await pipe.set(
+                self._progress_key(source, revision_id), message, ex=PROGRESS_TTL_SECONDS
+            )
+            await pipe.publish(PROGRESS_CHANNEL, message)
+            await pipe.execute()
+
+    async def get_ingestion_progress(
+        self, source: str, revision_id: str
+    ) -> dict[str, Any] | None:
+        """
+        Get the latest ingestion progress published for a revision.
+
+        Args:
+            source: Policy source slug.
+            revision_id: Revision ID.
+
+        Returns:
+            Progress message, or None if none was published recently.
+        """
+        data = await self._client.get(self._progress_key(source, revision_id))
+        return json.loads(data) if data else None
+
+    async def get_ingestion_statuses(
+        self, keys: list[tuple[str, str]]
+    ) -> list[tuple[PolicyRevisionRecord | None, dict[str, Any] | None]]:
+        """
+        Get many revisions and their latest progress in one pipelined round trip.
+
+        Args:
+            keys: (source, revision_id) pairs.
+
+        Returns:
+            (revision, progress) pairs in the same order as keys.
+        """
+        if not keys:
+            return []
+
+        async with self._client.pipeline() as pipe:
+            for source, revision_id in keys:
+                await pipe.hgetall(self._revision_key(source, revision_id))
+                await pipe.get(self._progress_key(source, revision_id))
+            replies = await pipe.execute()
+
+        return [
+            (
+                self._deserialize_revision(data) if data else None,
+                json.loads(progress) if progress else None,
+            )
+            for data, progress in zip(replies[::2], replies[1::2], strict=True)
+        ]
+
+    async def list_revision_keys(self, sources: list[str]) -> list[tuple[str, str]]:
+        """
+        List the (source, revision_id) pairs of several policies in one round trip.
+
+        Args:
+            sources: Policy source slugs.
+
+        Returns:
+            Pairs ordered by source as given, then by effective_from.
+        """
+        if not sources:
+            return []
+
+        async with self._client.pipeline() as pipe:
+            for source in sources:
+                await pipe.zrange(self._revisions_set_key(source), 0, -1)
+            replies = await pipe.execute()
+
+        return [
+            (source, revision_id)
+            for source, revision_ids in zip(sources, replies, strict=True)
+            for revision_id in revision_ids
+        ]
+
+    async def subscribe_to_ingestion_progress(self) -> PubSub:
+        """
+        Open a pub/sub connection subscribed to PROGRESS_CHANNEL.
+
+        Returns:
+            Subscribed PubSub; the caller closes it with aclose().
+        """
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(PROGRESS_CHANNEL)
+        return pubsub
+
+    # =========================================================================
+    # Section Index
+    # =========================================================================
+
+    async def set_section_index(
+        self, source: str, revision_id: str, sections: dict[str, list[str]]
+    ) -> None:
+        """
+        Replace the section index of a revision.
+
+        Args:
+            source: Policy source slug.
+            revision_id: Revision ID.
+            sections: Section reference to chunk IDs in chunk order.
+        """
+        key = self._sections_key(source, revision_id)
+        async with self._client.pipeline() as pipe:
+            await pipe.delete(key)
+            if sections:
+                await pipe.hset(
+                    key,
+                    mapping={ref: json.dumps(ids) for ref, ids in sections.items()},
+                )
+            await pipe.execute()
+
+        logger.debug(
+            "Section index stored",
+            source=source,
+            revision_id=revision_id,
+            sections=len(sections),
+        )
+
+    async def get_section_indexes(
+        self, keys: list[tuple[str, str]]
+    ) -> list[dict[str, list[str]]]:
+        """
+        Get the full section indexes of many revisions in one round trip.
+
+        Args:
+            keys: (source, revision_id) pairs.
+
+        Returns:
+            Section reference to chunk IDs, per key (empty where none).
+        """
+        if not keys:
+            return []
+
+        async with self._client.pipeline() as pipe:
+            for source, revision_id in keys:
+                await pipe.hgetall(self._sections_key(source, revision_id))
+            replies = await pipe.execute()
+
+        return [{ref: json.loads(ids) for ref, ids in data.items()} for data in replies]
+
+    async def get_section_chunk_ids(
+        self, source: str, revision_id: str, section_ref: str
+    ) -> list[str] | None:
+        """
+        Get the chunk IDs of a section from the revision's section index.
+
+        Args:
+            source: Policy source slug.
+            revision_id: Revision ID.
+            section_ref: Exact section reference.
+
+        Returns:
+            Chunk IDs in chunk order, an empty list if the revision is indexed
+            but has no such section, or None if the revision has no index.
+        """
+        key = self._sections_key(source, revision_id)
+        async with self._client.pipeline() as pipe:
+            await pipe.hget(key, section_ref)
+            await pipe.exists(key)
+            chunk_ids, indexed = await pipe.execute()
+
+        if chunk_ids is not None:
+            return json.loads(chunk_ids)
+        return [] if indexed else None
+
     # =========================================================================
     # Effective Date Resolution
     # =========================================================================
@@ -833,8 +1247,15 @@ class PolicyRegistry:
             "-inf",
         )
 
-        for rev_id in revision_ids:
-            rev = await self.get_revision(source, rev_id)
+        revisions = await self._get_revisions_bulk([(source, rev_id) for rev_id in revision_ids])
+        return self._select_effective_revision(revisions, effective_date)
+
+    @staticmethod
+    def _select_effective_revision(
+        revisions: list[PolicyRevisionRecord | None], effective_date: date
+    ) -> PolicyRevisionRecord | None:
+        """Pick the revision in force on a date from candidates ordered newest first."""
+        for rev in revisions:
             if rev is None:
                 continue
 
@@ -854,17 +1275,39 @@ class PolicyRegistry:
         """
         Get effective revision for each policy on a given date.
 
+        Uses three round trips regardless of the number of policies: the
+        source set, one pipeline of candidate revision IDs per source, and
+        one pipeline of the candidate revision hashes.
+
         Args:
             effective_date: The date to check.
 
         Returns:
             Dict mapping source slug to effective revision (or None if none effective).
         """
-        sources = await self._client.smembers(self._policies_all_key())
-        result: dict[str, PolicyRevisionRecord | None] = {}
+        sources = list(await self._client.smembers(self._policies_all_key()))
+        if not sources:
+            return {}
+
+        max_score = (effective_date - date(1970, 1, 1)).days
+        async with self._client.pipeline() as pipe:
+            for source in sources:
+                await pipe.zrevrangebyscore(self._revisions_set_key(source), max_score, "-inf")
+            candidate_ids = await pipe.execute()
+
+        revisions = await self._get_revisions_bulk(
+            [
+                (source, rev_id)
+                for source, revision_ids in zip(sources, candidate_ids, strict=True)
+                for rev_id in revision_ids
+            ]
+        )
 
-        for source in sources:
-            rev = await self.get_effective_revision_for_date(source, effective_date)
-            result[source] = rev
+        result: dict[str, PolicyRevisionRecord | None] = {}
+        offset = 0
+        for source, revision_ids in zip(sources, candidate_ids, strict=True):
+            candidates = revisions[offset : offset + len(revision_ids)]
+            offset += len(revision_ids)
+            result[source] = self._select_effective_revision(candidates, effective_date)
 
         return result
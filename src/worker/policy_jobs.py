@@ -14,23 +14,32 @@ Implements:
 - [policy-knowledge-base:PolicyIngestionJob/TS-05] Progress updates
 """
 
+import asyncio
 import os
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import structlog
 
-from src.api.schemas.policy import RevisionStatus
-from src.mcp_servers.document_store.chunker import TextChunker
+from src.api.schemas.policy import PolicyRevisionRecord, RevisionStatus
+from src.mcp_servers.document_store.chunker import TextChunk, TextChunker
 from src.mcp_servers.document_store.embeddings import EmbeddingService
+from src.mcp_servers.document_store.extraction_cache import ExtractionCache
 from src.mcp_servers.document_store.processor import DocumentProcessor, ExtractionError
+from src.shared.hashing import sha256_text
 from src.shared.policy_chroma_client import PolicyChromaClient, PolicyChunkRecord
 from src.shared.policy_registry import PolicyRegistry
 
 logger = structlog.get_logger(__name__)
 
+# Chunks per embedding / ChromaDB write between progress updates
+EMBED_PROGRESS_BATCH = 64
+STORE_PROGRESS_BATCH = 256
+
 
 @dataclass
 class IngestionProgress:
@@ -45,6 +54,16 @@ class IngestionProgress:
     error: str | None = None
 
 
+ProgressCallback = Callable[[IngestionProgress], None]
+
+
+def _percent(start: int, end: int, done: int, total: int) -> int:
+    """Map done/total onto the percent band [start, end] of a phase."""
+    if total <= 0:
+        return end
+    return start + (end - start) * done // total
+
+
 @dataclass
 class IngestionResult:
     """Result of policy ingestion job."""
@@ -57,6 +76,179 @@ class IngestionResult:
     extraction_method: str
     error: str | None = None
     duration_seconds: float = 0.0
+    chunks_embedded: int = 0
+
+
+@dataclass
+class PreparedRevision:
+    """Chunks and embeddings for a policy PDF, ready to be stored."""
+
+    chunks: list[TextChunk]
+    embeddings: list[list[float]]
+    page_count: int
+    extraction_method: str
+    prepare_seconds: float = 0.0
+    embedded_count: int = 0
+
+
+def prepare_revision_file(
+    file_path: str | Path,
+    processor: DocumentProcessor,
+    chunker: TextChunker,
+    embedder: EmbeddingService,
+    known_embeddings: Mapping[str, list[float]] | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> PreparedRevision:
+    """
+    Extract, chunk and embed a policy PDF.
+
+    Implements [policy-knowledge-base:PolicyIngestionJob/TS-05] - Progress updates
+
+    This is the CPU-bound part of ingestion. It has no Redis or ChromaDB
+    dependency, so it can run in a worker process or thread; progress is
+    reported through on_progress for the caller to publish.
+
+    Args:
+        file_path: Path to PDF file.
+        processor: DocumentProcessor for extraction.
+        chunker: TextChunker for chunking.
+        embedder: EmbeddingService for embeddings.
+        known_embeddings: Embeddings already stored for this revision, keyed
+            by text hash; chunks whose text is unchanged reuse them.
+        on_progress: Called after extraction and after each embedding batch.
+
+    Returns:
+        PreparedRevision (with no chunks if no text could be extracted).
+
+    Raises:
+        ExtractionError: If the PDF cannot be read.
+    """
+    started = time.perf_counter()
+
+    def report(progress: IngestionProgress) -> None:
+        if on_progress is not None:
+            on_progress(progress)
+
+    # Phase 1: Extract text from PDF
+    logger.info("Extracting text from PDF", phase="extracting")
+    extraction = processor.extract_text(str(file_path))
+
+    page_count = extraction.total_pages
+    logger.info(
+        "Text extraction complete",
+        pages=page_count,
+        method=extraction.extraction_method,
+        char_count=extraction.total_char_count,
+    )
+    report(
+        IngestionProgress(
+            phase="chunking",
+            percent_complete=40,
+            pages_processed=page_count,
+            total_pages=page_count,
+        )
+    )
+
+    # Phase 2: Chunk the text
+    logger.info("Chunking text", phase="chunking")
+    pages_with_text = [
+        (page.page_number, page.text)
+        for page in extraction.pages
+        if page.text.strip()
+    ]
+    chunks = chunker.chunk_pages(pages_with_text)
+
+    logger.info("Chunking complete", chunk_count=len(chunks))
+
+    # Phase 3: Generate embeddings for chunks whose text is new
+    known = known_embeddings or {}
+    hashes = [sha256_text(c.text) for c in chunks]
+    missing = list(dict.fromkeys(h for h in hashes if h not in known))
+    computed: dict[str, list[float]] = {}
+
+    def report_embedded() -> None:
+        # Chunks whose embedding is ready, reused or computed
+        done = sum(1 for h in hashes if h in known or h in computed)
+        report(
+            IngestionProgress(
+                phase="embedding",
+                percent_complete=_percent(50, 90, done, len(chunks)),
+                pages_processed=page_count,
+                total_pages=page_count,
+                chunks_processed=done,
+                total_chunks=len(chunks),
+            )
+        )
+
+    report_embedded()
+    if missing:
+        texts_by_hash = dict(zip(hashes, (c.text for c in chunks), strict=True))
+        logger.info(
+            "Generating embeddings",
+            phase="embedding",
+            chunk_count=len(chunks),
+            to_embed=len(missing),
+        )
+        for i in range(0, len(missing), EMBED_PROGRESS_BATCH):
+            batch = missing[i : i + EMBED_PROGRESS_BATCH]
+            vectors = embedder.embed_batch([texts_by_hash[h] for h in batch])
+            computed.update(zip(batch, vectors, strict=True))
+            report_embedded()
+        logger.info("Embeddings generated")
+
+    return PreparedRevision(
+        chunks=chunks,
+        embeddings=[computed[h] if h in computed else known[h] for h in hashes],
+        page_count=page_count,
+        extraction_method=extraction.extraction_method,
+        prepare_seconds=time.perf_counter() - started,
+        embedded_count=len(missing),
+    )
+
+
+PrepareComponents = tuple[DocumentProcessor, TextChunker, EmbeddingService]
+
+# Per-process components for prepare_policy_revision(), set by init_prepare_worker()
+_worker_components: PrepareComponents | None = None
+
+
+def default_prepare_components() -> PrepareComponents:
+    """Build the extraction/chunking/embedding components used for ingestion."""
+    return (
+        DocumentProcessor(enable_ocr=True, extraction_cache=ExtractionCache.from_env()),
+        TextChunker(),
+        EmbeddingService(),
+    )
+
+
+def init_prepare_worker(
+    factory: Callable[[], PrepareComponents] = default_prepare_components,
+) -> None:
+    """
+    Process pool initializer: build this worker's components once.
+
+    Args:
+        factory: Picklable (module-level) callable returning the components.
+    """
+    global _worker_components
+    _worker_components = factory()
+
+
+def prepare_policy_revision(file_path: str) -> PreparedRevision:
+    """
+    Process pool entry point wrapping prepare_revision_file().
+
+    Args:
+        file_path: Path to PDF file.
+
+    Returns:
+        PreparedRevision for the file.
+    """
+    if _worker_components is None:
+        init_prepare_worker()
+    assert _worker_components is not None
+    processor, chunker, embedder = _worker_components
+    return prepare_revision_file(file_path, processor, chunker, embedder)
 
 
 class PolicyIngestionService:
@@ -87,7 +279,9 @@ class PolicyIngestionService:
         """
         self._registry = registry
         self._chroma = chroma_client
-        self._processor = processor or DocumentProcessor(enable_ocr=True)
+        self._processor = processor or DocumentProcessor(
+            enable_ocr=True, extraction_cache=ExtractionCache.from_env()
+        )
         self._chunker = chunker or TextChunker()
         self._embedder = embedder or EmbeddingService()
 
@@ -110,7 +304,9 @@ class PolicyIngestionService:
             source: Policy source slug.
             revision_id: Revision ID.
             file_path: Path to PDF file.
-            reindex: If True, delete existing chunks first.
+            reindex: If True, replace the existing chunks incrementally: only
+                chunks whose text changed are re-embedded, and orphans are
+                deleted after the new chunks are written.
 
         Returns:
             IngestionResult with success status and details.
@@ -132,168 +328,286 @@ class PolicyIngestionService:
             if revision is None:
                 raise ValueError(f"Revision not found: {source}/{revision_id}")
 
-            # If reindex, clear existing chunks first
-            if reindex:
-                deleted_count = self._chroma.delete_revision_chunks(source, revision_id)
-                logger.info(
-                    "Cleared existing chunks for reindex",
-                    source=source,
-                    revision_id=revision_id,
-                    deleted_count=deleted_count,
-                )
-
-            # Phase 1: Extract text from PDF
-            logger.info("Extracting text from PDF", phase="extracting")
-            extraction = self._processor.extract_text(str(file_path))
+            # If reindex, reuse embeddings of chunks whose text is unchanged
+            known_embeddings = (
+                self._chroma.get_revision_embeddings(source, revision_id) if reindex else None
+            )
 
-            page_count = extraction.total_pages
-            logger.info(
-                "Text extraction complete",
-                pages=page_count,
-                method=extraction.extraction_method,
-                char_count=extraction.total_char_count,
+            await self._publish_progress(
+                source, revision_id, IngestionProgress(phase="extracting", percent_complete=0)
+            )
+            prepared = await self._prepare_with_progress(
+                source, revision_id, file_path, known_embeddings
+            )
+            return await self._store(
+                source, revision_id, revision, prepared, start_time, reindex=reindex
             )
 
-            # Phase 2: Chunk the text
-            logger.info("Chunking text", phase="chunking")
-            pages_with_text = [
-                (page.page_number, page.text)
-                for page in extraction.pages
-                if page.text.strip()
-            ]
-            chunks = self._chunker.chunk_pages(pages_with_text)
-
-            logger.info("Chunking complete", chunk_count=len(chunks))
-
-            if not chunks:
-                # No text extracted - mark as failed
-                await self._update_revision_failed(
-                    source, revision_id, "No text could be extracted from PDF"
-                )
-                return IngestionResult(
-                    success=False,
-                    source=source,
-                    revision_id=revision_id,
-                    chunk_count=0,
-                    page_count=page_count,
-                    extraction_method=extraction.extraction_method,
-                    error="No text could be extracted from PDF",
-                    duration_seconds=(datetime.now(UTC) - start_time).total_seconds(),
-                )
+        except Exception as e:
+            return await self._fail(source, revision_id, e, start_time)
+
+    def prepare(
+        self,
+        file_path: str | Path,
+        known_embeddings: Mapping[str, list[float]] | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> "PreparedRevision":
+        """
+        Extract, chunk and embed a policy PDF without touching any store.
 
-            # Phase 3: Generate embeddings
-            logger.info("Generating embeddings", phase="embedding", chunk_count=len(chunks))
-            texts = [c.text for c in chunks]
-            embeddings = self._embedder.embed_batch(texts)
+        Args:
+            file_path: Path to PDF file.
+            known_embeddings: Stored embeddings keyed by text hash to reuse.
+            on_progress: Optional progress callback (see prepare_revision_file).
 
-            logger.info("Embeddings generated")
+        Returns:
+            PreparedRevision ready for store_prepared().
+        """
+        return prepare_revision_file(
+            file_path,
+            self._processor,
+            self._chunker,
+            self._embedder,
+            known_embeddings,
+            on_progress=on_progress,
+        )
 
-            # Phase 4: Store chunks in ChromaDB
-            logger.info("Storing chunks", phase="storing", chunk_count=len(chunks))
+    async def _prepare_with_progress(
+        self,
+        source: str,
+        revision_id: str,
+        file_path: Path,
+        known_embeddings: Mapping[str, list[float]] | None,
+    ) -> "PreparedRevision":
+        """
+        Run prepare() in a thread, publishing its progress from the event loop.
 
-            # Prepare temporal metadata
-            effective_from_int = PolicyChromaClient.format_date_for_metadata(revision.effective_from)
-            effective_to_int = PolicyChromaClient.format_date_for_metadata(revision.effective_to)
+        Updates are queued in the order they are reported, so subscribers
+        never see a later phase before an earlier one.
+        """
+        loop = asyncio.get_running_loop()
+        updates: asyncio.Queue[IngestionProgress | None] = asyncio.Queue()
 
-            chunk_records = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=True)):
-                # Determine section reference from chunk
-                section_ref = self._extract_section_ref(chunk.text)
+        def on_progress(progress: IngestionProgress) -> None:
+            loop.call_soon_threadsafe(updates.put_nowait, progress)
 
-                chunk_id = PolicyChromaClient.generate_chunk_id(
-                    source=source,
-                    revision_id=revision_id,
-                    section_ref=section_ref,
-                    chunk_index=i,
-                )
+        async def forward() -> None:
+            while (progress := await updates.get()) is not None:
+                await self._publish_progress(source, revision_id, progress)
 
-                chunk_records.append(
-                    PolicyChunkRecord(
-                        chunk_id=chunk_id,
-                        text=chunk.text,
-                        embedding=embedding,
-                        metadata={
-                            "source": source,
-                            "source_title": revision.source,  # Will be policy title
-                            "revision_id": revision_id,
-                            "version_label": revision.version_label,
-                            "effective_from": effective_from_int,
-                            "effective_to": effective_to_int,
-                            "section_ref": section_ref,
-                            "page_number": chunk.page_numbers[0] if chunk.page_numbers else 0,
-                            "chunk_index": i,
-                        },
-                    )
-                )
+        forwarder = asyncio.create_task(forward())
+        try:
+            return await asyncio.to_thread(
+                self.prepare, file_path, known_embeddings, on_progress
+            )
+        finally:
+            updates.put_nowait(None)
+            await forwarder
 
-            self._chroma.upsert_chunks(chunk_records)
+    async def _publish_progress(
+        self, source: str, revision_id: str, progress: IngestionProgress
+    ) -> None:
+        """
+        Publish progress through the registry.
 
-            logger.info("Chunks stored", count=len(chunk_records))
+        Implements [policy-knowledge-base:PolicyIngestionJob/TS-05] - Progress updates
 
-            # Update revision status to active
-            await self._registry.update_revision(
-                source=source,
-                revision_id=revision_id,
-                status=RevisionStatus.ACTIVE,
-                chunk_count=len(chunk_records),
-                ingested_at=datetime.now(UTC),
+        Progress is advisory: a failure to publish never fails the ingestion.
+        """
+        try:
+            await self._registry.publish_ingestion_progress(
+                source, revision_id, asdict(progress)
             )
-
-            duration = (datetime.now(UTC) - start_time).total_seconds()
-            logger.info(
-                "Policy ingestion complete",
+        except Exception as e:
+            logger.warning(
+                "Failed to publish ingestion progress",
                 source=source,
                 revision_id=revision_id,
-                chunk_count=len(chunk_records),
-                page_count=page_count,
-                duration_seconds=duration,
+                phase=progress.phase,
+                error=str(e),
             )
 
-            return IngestionResult(
-                success=True,
-                source=source,
-                revision_id=revision_id,
-                chunk_count=len(chunk_records),
-                page_count=page_count,
-                extraction_method=extraction.extraction_method,
-                duration_seconds=duration,
+    async def store_prepared(
+        self,
+        source: str,
+        revision_id: str,
+        prepared: "PreparedRevision",
+        reindex: bool = False,
+    ) -> IngestionResult:
+        """
+        Store a revision prepared elsewhere (e.g. in a worker process).
+
+        Args:
+            source: Policy source slug.
+            revision_id: Revision ID.
+            prepared: Output of prepare() / prepare_revision_file().
+            reindex: If True, replace the existing chunks incrementally.
+
+        Returns:
+            IngestionResult with success status and details.
+        """
+        start_time = datetime.now(UTC)
+        try:
+            revision = await self._registry.get_revision(source, revision_id)
+            if revision is None:
+                raise ValueError(f"Revision not found: {source}/{revision_id}")
+
+            return await self._store(
+                source, revision_id, revision, prepared, start_time, reindex=reindex
             )
 
-        except ExtractionError as e:
-            error_msg = f"PDF extraction failed: {e}"
-            logger.error("Ingestion failed", source=source, revision_id=revision_id, error=error_msg)
-            await self._update_revision_failed(source, revision_id, error_msg)
+        except Exception as e:
+            return await self._fail(source, revision_id, e, start_time)
+
+    async def _store(
+        self,
+        source: str,
+        revision_id: str,
+        revision: PolicyRevisionRecord,
+        prepared: "PreparedRevision",
+        start_time: datetime,
+        reindex: bool = False,
+    ) -> IngestionResult:
+        """Write prepared chunks to ChromaDB and mark the revision active."""
+        chunks = prepared.chunks
+        page_count = prepared.page_count
+
+        if not chunks:
+            if reindex:
+                self._chroma.delete_revision_chunks(source, revision_id)
+            # No text extracted - mark as failed
+            await self._update_revision_failed(
+                source, revision_id, "No text could be extracted from PDF"
+            )
+            await self._publish_progress(
+                source,
+                revision_id,
+                IngestionProgress(
+                    phase="failed",
+                    percent_complete=100,
+                    pages_processed=page_count,
+                    total_pages=page_count,
+                    error="No text could be extracted from PDF",
+                ),
+            )
             return IngestionResult(
                 success=False,
                 source=source,
                 revision_id=revision_id,
                 chunk_count=0,
-                page_count=0,
-                extraction_method="failed",
-                error=error_msg,
+                page_count=page_count,
+                extraction_method=prepared.extraction_method,
+                error="No text could be extracted from PDF",
                 duration_seconds=(datetime.now(UTC) - start_time).total_seconds(),
             )
 
-        except Exception as e:
-            error_msg = f"Ingestion failed: {e}"
+        # Phase 4: Store chunks in ChromaDB
+        logger.info("Storing chunks", phase="storing", chunk_count=len(chunks))
+
+        chunk_records = self.build_chunk_records(
+            source, revision_id, revision, chunks, prepared.embeddings
+        )
+
+        def stored(count: int) -> IngestionProgress:
+            return IngestionProgress(
+                phase="storing",
+                percent_complete=_percent(90, 99, count, len(chunk_records)),
+                pages_processed=page_count,
+                total_pages=page_count,
+                chunks_processed=count,
+                total_chunks=len(chunk_records),
+            )
+
+        await self._publish_progress(source, revision_id, stored(0))
+        if reindex:
+            # Orphans are deleted after all upserts, so sync in one pass
+            self._chroma.sync_revision_chunks(source, revision_id, chunk_records)
+        else:
+            for i in range(0, len(chunk_records), STORE_PROGRESS_BATCH):
+                batch = chunk_records[i : i + STORE_PROGRESS_BATCH]
+                self._chroma.upsert_chunks(batch)
+                if i + len(batch) < len(chunk_records):
+                    await self._publish_progress(source, revision_id, stored(i + len(batch)))
+        await self._registry.set_section_index(
+            source, revision_id, self.build_section_index(chunk_records)
+        )
+
+        logger.info("Chunks stored", count=len(chunk_records))
+
+        # Update revision status to active
+        await self._registry.update_revision(
+            source=source,
+            revision_id=revision_id,
+            status=RevisionStatus.ACTIVE,
+            chunk_count=len(chunk_records),
+            ingested_at=datetime.now(UTC),
+        )
+        await self._publish_progress(
+            source,
+            revision_id,
+            IngestionProgress(
+                phase="complete",
+                percent_complete=100,
+                pages_processed=page_count,
+                total_pages=page_count,
+                chunks_processed=len(chunk_records),
+                total_chunks=len(chunk_records),
+            ),
+        )
+
+        duration = (datetime.now(UTC) - start_time).total_seconds()
+        logger.info(
+            "Policy ingestion complete",
+            source=source,
+            revision_id=revision_id,
+            chunk_count=len(chunk_records),
+            page_count=page_count,
+            duration_seconds=duration,
+        )
+
+        return IngestionResult(
+            success=True,
+            source=source,
+            revision_id=revision_id,
+            chunk_count=len(chunk_records),
+            page_count=page_count,
+            extraction_method=prepared.extraction_method,
+            duration_seconds=duration,
+            chunks_embedded=prepared.embedded_count,
+        )
+
+    async def _fail(
+        self, source: str, revision_id: str, error: Exception, start_time: datetime
+    ) -> IngestionResult:
+        """Mark a revision failed and build the failure result."""
+        if isinstance(error, ExtractionError):
+            error_msg = f"PDF extraction failed: {error}"
+            logger.error("Ingestion failed", source=source, revision_id=revision_id, error=error_msg)
+        else:
+            error_msg = f"Ingestion failed: {error}"
             logger.error(
                 "Ingestion failed",
                 source=source,
                 revision_id=revision_id,
-                error=str(e),
-                exc_info=True,
-            )
-            await self._update_revision_failed(source, revision_id, error_msg)
-            return IngestionResult(
-                success=False,
-                source=source,
-                revision_id=revision_id,
-                chunk_count=0,
-                page_count=0,
-                extraction_method="failed",
-                error=error_msg,
-                duration_seconds=(datetime.now(UTC) - start_time).total_seconds(),
+                error=str(error),
+                exc_info=error,
             )
+        await self._update_revision_failed(source, revision_id, error_msg)
+        await self._publish_progress(
+            source,
+            revision_id,
+            IngestionProgress(phase="failed", percent_complete=100, error=error_msg),
+        )
+        return IngestionResult(
+            success=False,
+            source=source,
+            revision_id=revision_id,
+            chunk_count=0,
+            page_count=0,
+            extraction_method="failed",
+            error=error_msg,
+            duration_seconds=(datetime.now(UTC) - start_time).total_seconds(),
+        )
 
     async def _update_revision_failed(
         self, source: str, revision_id: str, error: str
@@ -314,6 +628,80 @@ class PolicyIngestionService:
                 error=str(e),
             )
 
+    @classmethod
+    def build_chunk_records(
+        cls,
+        source: str,
+        revision_id: str,
+        revision: PolicyRevisionRecord,
+        chunks: list[TextChunk],
+        embeddings: list[list[float]],
+    ) -> list[PolicyChunkRecord]:
+        """
+        Build ChromaDB records with temporal metadata for a revision's chunks.
+
+        Implements [policy-knowledge-base:PolicyIngestionJob/TS-03] - Chunks have temporal metadata
+
+        Args:
+            source: Policy source slug.
+            revision_id: Revision ID.
+            revision: Revision record supplying version and effective dates.
+            chunks: Text chunks in document order.
+            embeddings: One embedding per chunk.
+
+        Returns:
+            Chunk records with deterministic IDs and a text_hash for reindex.
+        """
+        effective_from_int = PolicyChromaClient.format_date_for_metadata(revision.effective_from)
+        effective_to_int = PolicyChromaClient.format_date_for_metadata(revision.effective_to)
+
+        chunk_records = []
+        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=True)):
+            # Determine section reference from chunk
+            section_ref = cls._extract_section_ref(chunk.text)
+
+            chunk_id = PolicyChromaClient.generate_chunk_id(
+                source=source,
+                revision_id=revision_id,
+                section_ref=section_ref,
+                chunk_index=i,
+            )
+
+            chunk_records.append(
+                PolicyChunkRecord(
+                    chunk_id=chunk_id,
+                    text=chunk.text,
+                    embedding=embedding,
+                    metadata={
+                        "source": source,
+                        "source_title": revision.source,  # Will be policy title
+                        "revision_id": revision_id,
+                        "version_label": revision.version_label,
+                        "effective_from": effective_from_int,
+                        "effective_to": effective_to_int,
+                        "section_ref": section_ref,
+                        "page_number": chunk.page_numbers[0] if chunk.page_numbers else 0,
+                        "chunk_index": i,
+                        "text_hash": sha256_text(chunk.text),
+                    },
+                )
+            )
+        return chunk_records
+
+    @staticmethod
+    def build_section_index(chunk_records: list[PolicyChunkRecord]) -> dict[str, list[str]]:
+        """
+        Map each section reference to its chunk IDs, in chunk order.
+
+        Chunks without a section reference are not indexed.
+        """
+        sections: dict[str, list[str]] = {}
+        for record in chunk_records:
+            section_ref = record.metadata.get("section_ref")
+            if section_ref:
+                sections.setdefault(section_ref, []).append(record.chunk_id)
+        return sections
+
     @staticmethod
     def _extract_section_ref(text: str) -> str:
         """
@@ -401,4 +789,5 @@ async def ingest_policy_revision(
         "extraction_method": result.extraction_method,
         "error": result.error,
         "duration_seconds": result.duration_seconds,
+        "chunks_embedded": result.chunks_embedded,
     }
@@ -17,6 +17,7 @@ import redis.asyncio as redis
 import structlog
 
 from src.agent.orchestrator import AgentOrchestrator, ReviewResult
+from src.mcp_servers.cycle_route.polyline import expand_route_geometry
 from src.shared.models import ReviewStatus
 from src.shared.redis_client import RedisClient
 from src.shared.storage import StorageBackend, create_storage_backend
@@ -233,12 +234,11 @@ def _upload_review_output(
                 storage.upload(md_path, key)
                 urls["review_md"] = storage.public_url(key)
 
-            # Routes JSON
+            # Routes JSON (encoded route polylines expanded to GeoJSON here)
             key = f"{prefix}/{result.review_id}_routes.json"
             routes_path = Path(tmpdir) / f"{result.review_id}_routes.json"
-            routes_path.write_text(
-                json.dumps(route_assessments or [], indent=2, default=str)
-            )
+            routes = [expand_route_geometry(route) for route in route_assessments or []]
+            routes_path.write_text(json.dumps(routes, indent=2, default=str))
             storage.upload(routes_path, key)
             urls["routes_json"] = storage.public_url(key)
 
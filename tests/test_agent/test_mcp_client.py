@@ -33,6 +33,7 @@ ALL_TOOL_NAMES = [
     "list_policy_documents",
     "list_policy_revisions",
     "ingest_policy_revision",
+    "get_ingestion_status",
     "remove_policy_revision",
 ]
 
@@ -2739,6 +2739,51 @@ class TestS3StorageIngestionPhase:
 
         await orchestrator.close()
 
+    @pytest.mark.asyncio
+    async def test_ingest_passes_download_hash(
+        self,
+        mock_mcp_client,
+        mock_redis,
+        sample_ingest_response,
+    ):
+        """
+        Given: A file hash was recorded at download time for one document
+        When: Ingestion runs
+        Then: ingest_document receives that hash; other documents omit it
+        """
+        mock_mcp_client.call_tool.side_effect = [
+            sample_ingest_response,
+            sample_ingest_response,
+        ]
+
+        orchestrator = AgentOrchestrator(
+            review_id="rev_test_hash",
+            application_ref="25/01178/REM",
+            mcp_client=mock_mcp_client,
+            redis_client=mock_redis,
+            storage_backend=_make_local_backend_mock(),
+        )
+        await orchestrator.initialize()
+
+        orchestrator._ingestion_result = DocumentIngestionResult(
+            documents_fetched=2,
+            document_paths=[
+                "/data/raw/25_01178_REM/001_Transport Assessment.pdf",
+                "/data/raw/25_01178_REM/002_Site Plan.pdf",
+            ],
+            file_hashes={"/data/raw/25_01178_REM/001_Transport Assessment.pdf": "cd" * 32},
+        )
+
+        await orchestrator._phase_ingest_documents()
+
+        arguments = {
+            c[0][1]["file_path"]: c[0][1] for c in mock_mcp_client.call_tool.call_args_list
+        }
+        assert arguments["/data/raw/25_01178_REM/001_Transport Assessment.pdf"]["file_hash"] == "cd" * 32
+        assert "file_hash" not in arguments["/data/raw/25_01178_REM/002_Site Plan.pdf"]
+
+        await orchestrator.close()
+
 
 class TestTwoPhaseReviewGeneration:
     """
@@ -3913,6 +3958,60 @@ class TestManifestPersistence:
         backend.upload.assert_not_called()
         await orchestrator.close()
 
+    @pytest.mark.asyncio
+    async def test_manifest_uses_download_hash(
+        self,
+        mock_mcp_client,
+        mock_redis,
+        sample_application_response,
+    ):
+        """
+        Given: download_document returns the file's SHA256
+        When: Download phase finishes
+        Then: The manifest records that hash without re-reading the file
+        """
+        backend = _make_s3_backend_mock()
+        captured_manifests: list[dict] = []
+
+        def capture_upload(local_path, key):
+            if "manifest.json" in key:
+                captured_manifests.append(json.loads(local_path.read_text()))
+
+        backend.upload.side_effect = capture_upload
+
+        digest = "ab" * 32
+        mock_mcp_client.call_tool.side_effect = [
+            sample_application_response,
+            {
+                "status": "success",
+                "file_path": "/data/raw/25_01178_REM/001_Transport Assessment.pdf",
+                "file_size": 100,
+                "file_hash": digest,
+            },
+        ]
+
+        orchestrator = AgentOrchestrator(
+            review_id="rev_manifest_hash",
+            application_ref="25/01178/REM",
+            mcp_client=mock_mcp_client,
+            redis_client=mock_redis,
+            storage_backend=backend,
+        )
+        await orchestrator.initialize()
+
+        await orchestrator._phase_fetch_metadata()
+        orchestrator._selected_documents = [S3_SELECTED_DOCUMENTS[0]]
+        with patch("src.agent.orchestrator.sha256_file") as mock_hash:
+            await orchestrator._phase_download_documents()
+
+        mock_hash.assert_not_called()
+        assert captured_manifests[0]["documents"][0]["file_hash"] == f"sha256:{digest}"
+        assert orchestrator._ingestion_result.file_hashes == {
+            "/data/raw/25_01178_REM/001_Transport Assessment.pdf": digest,
+        }
+
+        await orchestrator.close()
+
 
 class TestDocumentReuse:
     """Tests for document reuse from S3 when manifest exists."""
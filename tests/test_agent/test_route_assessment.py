@@ -20,7 +20,12 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.agent.mcp_client import TOOL_ROUTING, MCPClientManager, MCPServerType, MCPToolError
-from src.agent.orchestrator import AgentOrchestrator, OrchestratorError, ReviewPhase
+from src.agent.orchestrator import (
+    ROUTE_BATCH_MAX_DESTINATIONS,
+    AgentOrchestrator,
+    OrchestratorError,
+    ReviewPhase,
+)
 from src.agent.progress import PHASE_NUMBER_MAP, PHASE_WEIGHTS
 
 # =============================================================================
@@ -68,6 +73,14 @@ class TestToolRouting:
         """assess_cycle_route routes to CYCLE_ROUTE."""
         assert TOOL_ROUTING["assess_cycle_route"] == MCPServerType.CYCLE_ROUTE
 
+    def test_assess_cycle_routes_batch_routed(self):
+        """assess_cycle_routes_batch routes to CYCLE_ROUTE."""
+        assert TOOL_ROUTING["assess_cycle_routes_batch"] == MCPServerType.CYCLE_ROUTE
+
+    def test_screen_destinations_routed(self):
+        """screen_destinations routes to CYCLE_ROUTE."""
+        assert TOOL_ROUTING["screen_destinations"] == MCPServerType.CYCLE_ROUTE
+
     def test_cycle_route_server_config(self):
         """MCPClientManager has cycle-route server config."""
         mgr = MCPClientManager(
@@ -80,6 +93,8 @@ class TestToolRouting:
         assert config.base_url == "http://fake:3004"
         assert "get_site_boundary" in config.tools
         assert "assess_cycle_route" in config.tools
+        assert "assess_cycle_routes_batch" in config.tools
+        assert "screen_destinations" in config.tools
 
 
 # =============================================================================
@@ -168,6 +183,49 @@ def _make_route_result(destination="Bicester North", same_route=True,
     return result
 
 
+def _make_batch_result(*routes, destination_ids=None):
+    """Wrap per-destination results in an assess_cycle_routes_batch response."""
+    ids = destination_ids or [f"dest_{i + 1:03d}" for i in range(len(routes))]
+    batch = [{**route, "destination_id": dest_id} for route, dest_id in zip(routes, ids, strict=True)]
+    assessed = sum(1 for r in batch if r["status"] == "success")
+    return {
+        "status": "success",
+        "routes": batch,
+        "assessed": assessed,
+        "failed": len(batch) - assessed,
+    }
+
+
+def _make_screen_result(*entries, max_cycle_minutes=30.0):
+    """
+    Create a screen_destinations response.
+
+    Each entry is (index, destination_id, name, cycle_minutes, screen_reason);
+    cycle_minutes None means unreachable.
+    """
+    destinations = [
+        {
+            "index": index,
+            "destination_id": dest_id,
+            "destination": name,
+            "reachable": minutes is not None,
+            "cycle_minutes": minutes,
+            "distance_m": round(minutes * 250) if minutes is not None else None,
+            "shortlisted": reason is None,
+            "screen_reason": reason,
+        }
+        for index, dest_id, name, minutes, reason in entries
+    ]
+    shortlisted = sum(1 for d in destinations if d["shortlisted"])
+    return {
+        "status": "success",
+        "max_cycle_minutes": max_cycle_minutes,
+        "destinations": destinations,
+        "shortlisted": shortlisted,
+        "screened_out": len(destinations) - shortlisted,
+    }
+
+
 def _make_dual_route_result(destination="Bicester North"):
     """Create a mock flat result where shortest != safest."""
     return _make_route_result(
@@ -283,10 +341,12 @@ class TestPhaseAssessRoutes:
         boundary_result = _make_boundary_result()
         route_result = _make_route_result("Bicester North")
 
-        # call_tool dispatches: first call is get_site_boundary, rest are assess_cycle_route
+        # call_tool dispatches: get_site_boundary, screen_destinations, then one
+        # assess_cycle_routes_batch
         mcp_client.call_tool = AsyncMock(side_effect=[
             boundary_result,
-            route_result,
+            _make_screen_result((0, "dest_001", "Bicester North", 6.5, None)),
+            _make_batch_result(route_result),
         ])
 
         mock_redis = AsyncMock()
@@ -329,8 +389,11 @@ class TestPhaseAssessRoutes:
 
         mcp_client.call_tool = AsyncMock(side_effect=[
             boundary_result,
-            success_result,
-            error_result,
+            _make_screen_result(
+                (0, "dest_001", "Bicester North", 6.5, None),
+                (1, "dest_002", "Faraway", 25.0, None),
+            ),
+            _make_batch_result(success_result, {**error_result, "destination": "Faraway"}),
         ])
 
         mock_redis = AsyncMock()
@@ -370,7 +433,8 @@ class TestPhaseAssessRoutes:
 
         mcp_client.call_tool = AsyncMock(side_effect=[
             boundary_result,
-            route_result,
+            _make_screen_result((0, "dest_001", "Bicester North", 6.5, None)),
+            _make_batch_result(route_result),
         ])
 
         mock_redis = AsyncMock()
@@ -402,7 +466,246 @@ class TestPhaseAssessRoutes:
 
         # Only dest_001 assessed, not dest_002
         assert len(orch._route_assessments) == 1
-        assert mcp_client.call_tool.call_count == 2  # boundary + 1 route
+        assert mcp_client.call_tool.call_count == 3  # boundary + screen + 1 batch
+        screen_args = mcp_client.call_tool.call_args_list[1].args
+        assert screen_args[0] == "screen_destinations"
+        assert [d["id"] for d in screen_args[1]["destinations"]] == ["dest_001"]
+        batch_args = mcp_client.call_tool.call_args_list[2].args
+        assert batch_args[0] == "assess_cycle_routes_batch"
+        assert [d["id"] for d in batch_args[1]["destinations"]] == ["dest_001"]
+        assert batch_args[1]["geometry_format"] == "polyline"
+
+    @pytest.mark.anyio
+    async def test_batch_tool_error_is_not_fatal(self):
+        """A failed batch call leaves no assessments but does not raise."""
+        mcp_client = _make_mock_mcp_client(connected=True)
+        mcp_client.call_tool = AsyncMock(side_effect=[
+            _make_boundary_result(),
+            _make_screen_result((0, "dest_001", "Bicester North", 6.5, None)),
+            MCPToolError("assess_cycle_routes_batch", "Timed out"),
+        ])
+
+        mock_redis = AsyncMock()
+        mock_redis.exists = AsyncMock(return_value=True)
+        mock_redis.hgetall = AsyncMock(return_value={
+            "dest_001": json.dumps({
+                "id": "dest_001", "name": "Bicester North",
+                "lat": 51.9054, "lon": -1.1512, "category": "rail",
+            }),
+        })
+
+        orch = AgentOrchestrator(
+            review_id="rev_test",
+            application_ref="21/03267/OUT",
+            mcp_client=mcp_client,
+            redis_client=mock_redis,
+        )
+        orch._initialized = True
+
+        await orch._phase_assess_routes()
+
+        assert orch._route_assessments == []
+
+    @pytest.mark.anyio
+    async def test_long_destination_list_split_into_batches(self):
+        """More destinations than one batch call accepts are assessed in consecutive batches."""
+        names = [
+            (f"dest_{i + 1:03d}", f"Destination {i + 1}")
+            for i in range(ROUTE_BATCH_MAX_DESTINATIONS + 1)
+        ]
+        mcp_client = _make_mock_mcp_client(connected=True)
+        mcp_client.call_tool = AsyncMock(side_effect=[
+            _make_boundary_result(),
+            _make_screen_result(*(
+                (i, dest_id, name, 5.0 + i / 10, None) for i, (dest_id, name) in enumerate(names)
+            )),
+            _make_batch_result(
+                *(_make_route_result(name) for _, name in names[:ROUTE_BATCH_MAX_DESTINATIONS]),
+                destination_ids=[dest_id for dest_id, _ in names[:ROUTE_BATCH_MAX_DESTINATIONS]],
+            ),
+            _make_batch_result(
+                _make_route_result(names[-1][1]), destination_ids=[names[-1][0]]
+            ),
+        ])
+
+        orch = AgentOrchestrator(
+            review_id="rev_test",
+            application_ref="21/03267/OUT",
+            mcp_client=mcp_client,
+            redis_client=_make_destinations_redis(*names),
+        )
+        orch._initialized = True
+
+        await orch._phase_assess_routes()
+
+        batch_calls = mcp_client.call_tool.call_args_list[2:]
+        assert [len(call.args[1]["destinations"]) for call in batch_calls] == [
+            ROUTE_BATCH_MAX_DESTINATIONS, 1,
+        ]
+        assert batch_calls[1].args[1]["destinations"][0]["id"] == names[-1][0]
+        assert len(orch._route_assessments) == ROUTE_BATCH_MAX_DESTINATIONS + 1
+
+
+def _make_destinations_redis(*destinations):
+    """Create a mock Redis holding destination records (id, name)."""
+    mock_redis = AsyncMock()
+    mock_redis.exists = AsyncMock(return_value=True)
+    mock_redis.hgetall = AsyncMock(return_value={
+        dest_id: json.dumps({
+            "id": dest_id, "name": name, "lat": 51.9 + i / 100, "lon": -1.15, "category": "rail",
+        })
+        for i, (dest_id, name) in enumerate(destinations)
+    })
+    return mock_redis
+
+
+class TestDestinationPrescreen:
+    """Destinations beyond cycling range are screened out before the batch assessment."""
+
+    @pytest.mark.anyio
+    async def test_only_shortlisted_destinations_assessed_nearest_first(self):
+        mcp_client = _make_mock_mcp_client(connected=True)
+        mcp_client.call_tool = AsyncMock(side_effect=[
+            _make_boundary_result(),
+            _make_screen_result(
+                (1, "dest_002", "Bicester Village", 7.0, None),
+                (0, "dest_001", "Bicester North", 12.0, None),
+                (2, "dest_003", "Oxford", 75.0, "too_far"),
+            ),
+            _make_batch_result(
+                _make_route_result("Bicester Village"),
+                _make_route_result("Bicester North"),
+                destination_ids=["dest_002", "dest_001"],
+            ),
+        ])
+        redis = _make_destinations_redis(
+            ("dest_001", "Bicester North"),
+            ("dest_002", "Bicester Village"),
+            ("dest_003", "Oxford"),
+        )
+
+        orch = AgentOrchestrator(
+            review_id="rev_test",
+            application_ref="21/03267/OUT",
+            mcp_client=mcp_client,
+            redis_client=redis,
+        )
+        orch._initialized = True
+
+        await orch._phase_assess_routes()
+
+        screen_args = mcp_client.call_tool.call_args_list[1].args
+        assert screen_args[0] == "screen_destinations"
+        assert len(screen_args[1]["destinations"]) == 3
+        batch_args = mcp_client.call_tool.call_args_list[2].args
+        assert [d["id"] for d in batch_args[1]["destinations"]] == ["dest_002", "dest_001"]
+        assert len(orch._route_assessments) == 2
+        assert orch._route_prescreen["screened_out"] == 1
+
+    @pytest.mark.anyio
+    async def test_all_screened_out_skips_batch(self):
+        mcp_client = _make_mock_mcp_client(connected=True)
+        mcp_client.call_tool = AsyncMock(side_effect=[
+            _make_boundary_result(),
+            _make_screen_result((0, "dest_001", "Oxford", None, "unreachable")),
+        ])
+        redis = _make_destinations_redis(("dest_001", "Oxford"))
+
+        orch = AgentOrchestrator(
+            review_id="rev_test",
+            application_ref="21/03267/OUT",
+            mcp_client=mcp_client,
+            redis_client=redis,
+        )
+        orch._initialized = True
+
+        await orch._phase_assess_routes()
+
+        assert mcp_client.call_tool.call_count == 2
+        assert orch._route_assessments == []
+        assert "Oxford: no route -- not assessed (no cycle route found)" in (
+            orch._build_evidence_context()[5]
+        )
+
+    @pytest.mark.anyio
+    async def test_screen_failure_assesses_all_destinations(self):
+        mcp_client = _make_mock_mcp_client(connected=True)
+        mcp_client.call_tool = AsyncMock(side_effect=[
+            _make_boundary_result(),
+            {"status": "error", "error_type": "matrix_unavailable", "message": "Valhalla down"},
+            _make_batch_result(_make_route_result("Bicester North"), _make_route_result("Oxford")),
+        ])
+        redis = _make_destinations_redis(("dest_001", "Bicester North"), ("dest_002", "Oxford"))
+
+        orch = AgentOrchestrator(
+            review_id="rev_test",
+            application_ref="21/03267/OUT",
+            mcp_client=mcp_client,
+            redis_client=redis,
+        )
+        orch._initialized = True
+
+        await orch._phase_assess_routes()
+
+        batch_args = mcp_client.call_tool.call_args_list[2].args
+        assert len(batch_args[1]["destinations"]) == 2
+        assert orch._route_prescreen is None
+        assert len(orch._route_assessments) == 2
+
+    @pytest.mark.anyio
+    async def test_screen_failure_with_many_destinations_assessed_in_batches(self):
+        """A matrix outage makes the assessment slower, not a failed oversized batch."""
+        names = [(f"dest_{i + 1:03d}", f"Destination {i + 1}") for i in range(30)]
+        mcp_client = _make_mock_mcp_client(connected=True)
+        mcp_client.call_tool = AsyncMock(side_effect=[
+            _make_boundary_result(),
+            MCPToolError("screen_destinations", "Valhalla down"),
+            _make_batch_result(
+                *(_make_route_result(name) for _, name in names[:ROUTE_BATCH_MAX_DESTINATIONS]),
+                destination_ids=[dest_id for dest_id, _ in names[:ROUTE_BATCH_MAX_DESTINATIONS]],
+            ),
+            _make_batch_result(
+                *(_make_route_result(name) for _, name in names[ROUTE_BATCH_MAX_DESTINATIONS:]),
+                destination_ids=[dest_id for dest_id, _ in names[ROUTE_BATCH_MAX_DESTINATIONS:]],
+            ),
+        ])
+
+        orch = AgentOrchestrator(
+            review_id="rev_test",
+            application_ref="21/03267/OUT",
+            mcp_client=mcp_client,
+            redis_client=_make_destinations_redis(*names),
+        )
+        orch._initialized = True
+
+        await orch._phase_assess_routes()
+
+        batch_calls = mcp_client.call_tool.call_args_list[2:]
+        assert [len(call.args[1]["destinations"]) for call in batch_calls] == [
+            ROUTE_BATCH_MAX_DESTINATIONS, 30 - ROUTE_BATCH_MAX_DESTINATIONS,
+        ]
+        assert orch._route_prescreen is None
+        assert len(orch._route_assessments) == 30
+
+    def test_prescreen_in_evidence(self):
+        orch = AgentOrchestrator(
+            review_id="rev_test",
+            application_ref="21/03267/OUT",
+        )
+        orch._route_assessments = [_make_route_result("Bicester North")]
+        orch._route_prescreen = _make_screen_result(
+            (0, "dest_001", "Bicester North", 6.5, None),
+            (1, "dest_002", "Oxford", 75.0, "too_far"),
+        )
+
+        route_evidence = orch._build_evidence_context()[5]
+        summary = orch._build_route_evidence_summary()
+
+        for text in (route_evidence, summary):
+            assert "### Destination pre-screen" in text
+            assert "over 30 minutes are not assessed" in text
+            assert "- Bicester North: 6.5 min, 1625m -- shortlisted for assessment" in text
+            assert "- Oxford: 75.0 min, 18750m -- not assessed (beyond cycling range)" in text
 
 
 # =============================================================================
@@ -455,6 +758,26 @@ class TestBuildEvidenceContext:
         assert "2200m" in route_text  # shortest distance noted
         assert "2800m" in route_text  # safest distance in detail
         assert "72/100" in route_text  # safest route score
+        assert "2200m (not assessed)" in route_text
+
+    def test_scored_shortest_route_in_evidence(self):
+        """Shortest route scored from shared infrastructure data shows its score."""
+        orch = AgentOrchestrator(
+            review_id="rev_test",
+            application_ref="21/03267/OUT",
+        )
+        route = _make_dual_route_result("Bicester North")
+        route["shortest_route_score"] = {"score": 41, "rating": "red"}
+        orch._route_assessments = [route]
+
+        route_text = orch._build_evidence_context()[5]
+
+        assert "**Shortest route:** 2200m, LTN 1/20 score: 41/100 (red)" in route_text
+        assert orch._shortest_route_summary(route) == {
+            "distance_m": 2200,
+            "ltn_score": 41,
+            "rating": "red",
+        }
 
     def test_parallel_detection_noted_in_evidence(self):
         """Parallel detection upgrades are noted in evidence text."""
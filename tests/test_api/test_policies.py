@@ -4,6 +4,7 @@ Tests for policies API endpoints.
 Implements test scenarios from [policy-knowledge-base:PolicyRouter/TS-01] through [TS-11]
 """
 
+import gc
 from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock
 
@@ -12,6 +13,7 @@ from fastapi.testclient import TestClient
 
 from src.api.dependencies import get_arq_pool, get_effective_date_resolver, get_policy_registry
 from src.api.main import app
+from src.api.routes.policies import stream_revision_progress
 from src.api.schemas import PolicyCategory
 from src.api.schemas.policy import (
     PolicyDocumentRecord,
@@ -19,6 +21,7 @@ from src.api.schemas.policy import (
     RevisionStatus,
 )
 from src.shared.effective_date_resolver import EffectivePolicyResult, EffectiveSnapshotResult
+from src.shared.ingestion_progress import stream_limiter
 from src.shared.policy_registry import (
     CannotDeleteSoleRevisionError,
     PolicyAlreadyExistsError,
@@ -48,6 +51,7 @@ def mock_registry():
     mock.list_revisions = AsyncMock(return_value=[])
     mock.update_revision = AsyncMock()
     mock.delete_revision = AsyncMock()
+    mock.get_ingestion_progress = AsyncMock(return_value=None)
     return mock
 
 
@@ -1065,6 +1069,146 @@ class TestRevisionStatus:
         assert data["progress"]["chunks_processed"] == 150
 
 
+class TestIngestionProgressEndpoints:
+    """Tests for the bulk status endpoint and the progress stream."""
+
+    @staticmethod
+    def revision(revision_id, status, chunk_count=None):
+        from src.api.schemas.policy import PolicyRevisionRecord
+
+        return PolicyRevisionRecord(
+            revision_id=revision_id,
+            source="NPPF",
+            version_label=revision_id,
+            effective_from=date(2024, 12, 12),
+            status=status,
+            chunk_count=chunk_count,
+            created_at=datetime.now(UTC),
+        )
+
+    def test_status_uses_published_progress(self, client, mock_registry):
+        """The single-revision status reports the worker's latest progress."""
+        mock_registry.get_revision = AsyncMock(
+            return_value=self.revision("rev_2024", RevisionStatus.PROCESSING)
+        )
+        mock_registry.get_ingestion_progress = AsyncMock(
+            return_value={
+                "source": "NPPF",
+                "revision_id": "rev_2024",
+                "phase": "embedding",
+                "percent_complete": 70,
+                "chunks_processed": 64,
+                "total_chunks": 128,
+            }
+        )
+        app.dependency_overrides[get_policy_registry] = lambda: mock_registry
+
+        response = client.get("/api/v1/policies/NPPF/revisions/rev_2024/status")
+
+        app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.json()["progress"]["chunks_processed"] == 64
+
+    def test_bulk_status(self, client, mock_registry):
+        """
+        Given: A revision key and a source with two revisions
+        When: GET /policies/ingestion/status
+        Then: Returns every revision's status from one registry read, with unknown keys listed
+        """
+        mock_registry.list_revision_keys = AsyncMock(
+            return_value=[("NPPF", "rev_2023"), ("NPPF", "rev_2024")]
+        )
+        mock_registry.get_ingestion_statuses = AsyncMock(
+            return_value=[
+                (None, None),
+                (
+                    self.revision("rev_2024", RevisionStatus.PROCESSING),
+                    {"phase": "storing", "percent_complete": 95},
+                ),
+                (self.revision("rev_2023", RevisionStatus.ACTIVE, chunk_count=40), None),
+            ]
+        )
+        app.dependency_overrides[get_policy_registry] = lambda: mock_registry
+
+        response = client.get(
+            "/api/v1/policies/ingestion/status",
+            params={"revision": ["LTN_1_20:rev_gone", "NPPF:rev_2024"], "source": "NPPF"},
+        )
+
+        app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        mock_registry.get_ingestion_statuses.assert_awaited_once_with(
+            [("LTN_1_20", "rev_gone"), ("NPPF", "rev_2024"), ("NPPF", "rev_2023")]
+        )
+        data = response.json()
+        assert data["not_found"] == ["LTN_1_20:rev_gone"]
+        assert [(r["revision_id"], r["progress"]["phase"]) for r in data["revisions"]] == [
+            ("rev_2024", "storing"),
+            ("rev_2023", "complete"),
+        ]
+
+    def test_bulk_status_rejects_bad_selection(self, client, mock_registry):
+        """Malformed keys and empty selections return 422."""
+        mock_registry.list_revision_keys = AsyncMock(return_value=[])
+        app.dependency_overrides[get_policy_registry] = lambda: mock_registry
+
+        malformed = client.get("/api/v1/policies/ingestion/status?revision=NPPF")
+        empty = client.get("/api/v1/policies/ingestion/status?source=NPPF")
+
+        app.dependency_overrides.clear()
+
+        assert malformed.status_code == 422
+        assert malformed.json()["error"]["code"] == "invalid_revision_key"
+        assert empty.status_code == 422
+        assert empty.json()["error"]["code"] == "no_revisions_requested"
+
+    def test_stream(self, client, mock_registry):
+        """
+        Given: A revision that has already finished
+        When: GET /policies/ingestion/stream
+        Then: Returns an event stream with its snapshot and a done event
+        """
+        pubsub = AsyncMock()
+        mock_registry.list_revision_keys = AsyncMock(return_value=[])
+        mock_registry.subscribe_to_ingestion_progress = AsyncMock(return_value=pubsub)
+        mock_registry.get_ingestion_statuses = AsyncMock(
+            return_value=[(self.revision("rev_2023", RevisionStatus.ACTIVE, chunk_count=40), None)]
+        )
+        app.dependency_overrides[get_policy_registry] = lambda: mock_registry
+
+        response = client.get("/api/v1/policies/ingestion/stream?revision=NPPF:rev_2023")
+
+        app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [line for line in response.text.splitlines() if line.startswith("event:")]
+        assert events == ["event: snapshot", "event: done"]
+        pubsub.aclose.assert_awaited_once()
+        assert stream_limiter.open_streams == 0
+
+    @pytest.mark.anyio
+    async def test_unsent_stream_releases_slot(self, mock_registry):
+        """
+        Given: A progress stream response that is never sent (client gone first)
+        When: The response is discarded unstarted
+        Then: Its stream slot is released
+        """
+        mock_registry.list_revision_keys = AsyncMock(return_value=[])
+
+        response = await stream_revision_progress(
+            registry=mock_registry, revision=["NPPF:rev_2023"], source=[]
+        )
+        assert stream_limiter.open_streams == 1
+
+        del response
+        gc.collect()
+
+        assert stream_limiter.open_streams == 0
+
+
 class TestReindexRevision:
     """
     Tests for POST /api/v1/policies/{source}/revisions/{revision_id}/reindex endpoint.
@@ -9,6 +9,7 @@ Implements:
 - [foundation-api:CherwellScraperMCP/TS-05] Download all documents
 """
 
+import hashlib
 import tempfile
 from pathlib import Path
 
@@ -229,6 +230,7 @@ class TestDownloadDocument:
             assert result["status"] == "success"
             assert "file_path" in result
             assert result["file_size"] == len(pdf_content)
+            assert result["file_hash"] == hashlib.sha256(pdf_content).hexdigest()
 
             # Verify file was created
             output_path = Path(result["file_path"])
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.mcp_servers.cherwell_scraper.models import DocumentInfo
+from src.mcp_servers.cherwell_scraper.models import DocumentInfo, DownloadedFile
 from src.mcp_servers.cherwell_scraper.server import (
     CherwellScraperMCP,
     DownloadAllDocumentsInput,
@@ -77,7 +77,9 @@ class TestCherwellScraperMCPFiltering:
         """Mock Cherwell client."""
         mock_client = AsyncMock()
         mock_client.get_documents_page.return_value = "<html>mock</html>"
-        mock_client.download_document.return_value = 1024  # 1KB per doc
+        mock_client.download_document.return_value = DownloadedFile(
+            size_bytes=1024, sha256="0" * 64
+        )  # 1KB per doc
         mock_client.base_url = "https://test.portal.example.com"
         return mock_client
 
@@ -387,7 +389,7 @@ class TestDownloadAllDocumentsTogglePassthrough:
         """Mock Cherwell client."""
         mock_client = AsyncMock()
         mock_client.get_documents_page.return_value = "<html>mock</html>"
-        mock_client.download_document.return_value = 1024
+        mock_client.download_document.return_value = DownloadedFile(size_bytes=1024, sha256="0" * 64)
         mock_client.base_url = "https://test.portal.example.com"
         return mock_client
 
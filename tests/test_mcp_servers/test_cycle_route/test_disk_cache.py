@@ -0,0 +1,43 @@
+"""
+Tests for the shared disk-backed JSON cache.
+
+Verifies [cycle-route-assessment:NFR-003] - Rate limiting for public services (cached re-use)
+"""
+
+from src.mcp_servers.cycle_route.disk_cache import DiskJSONCache
+
+
+class OtherFormatCache(DiskJSONCache):
+    CACHE_FORMAT = "other"
+
+
+class TestDiskJSONCache:
+    def test_round_trip(self, tmp_path):
+        cache = DiskJSONCache(tmp_path, ttl_seconds=60)
+        cache.write("key", {"a": [1, 2]})
+
+        assert cache.read("key") == ({"a": [1, 2]}, "fresh")
+
+    def test_read_with_size(self, tmp_path):
+        """The entry's compressed size is reported from the index; misses report 0."""
+        cache = DiskJSONCache(tmp_path, ttl_seconds=60)
+        cache.write("key", {"a": [1, 2]})
+        entry_size = next(tmp_path.glob("*/*.json.gz")).stat().st_size
+
+        assert cache.read_with_size("key") == ({"a": [1, 2]}, "fresh", entry_size)
+        assert cache.read_with_size("other") == (None, "miss", 0)
+
+    def test_other_format_is_miss(self, tmp_path):
+        """Caches sharing a directory never read each other's entries."""
+        DiskJSONCache(tmp_path, ttl_seconds=60).write("key", {"a": 1})
+
+        assert OtherFormatCache(tmp_path, ttl_seconds=60).read("key") == (None, "miss")
+
+    def test_clear(self, tmp_path):
+        cache = DiskJSONCache(tmp_path, ttl_seconds=60)
+        cache.write("one", 1)
+        cache.write("two", 2)
+
+        assert cache.clear() == 2
+        assert cache.read("one") == (None, "miss")
+        assert cache.stats()["entries"] == 0
@@ -0,0 +1,98 @@
+"""
+Tests for the array-backed geometry kernels.
+
+Verifies [cycle-route-assessment:FR-002] - Route infrastructure analysis (way geometry)
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.mcp_servers.cycle_route.geometry import (
+    bearing_deg,
+    coordinates_array,
+    haversine_m,
+    path_length_m,
+    path_lengths_m,
+)
+from src.mcp_servers.cycle_route.infrastructure import (
+    _haversine_distance,
+    calculate_way_bearing,
+)
+
+
+def _geometry(*points: tuple[float, float]) -> list[dict]:
+    return [{"lat": lat, "lon": lon} for lat, lon in points]
+
+
+class TestCoordinatesArray:
+    def test_contiguous_lat_lon_float64(self):
+        coords = coordinates_array(_geometry((51.9, -1.15), (51.91, -1.14)))
+
+        assert coords.dtype == np.float64
+        assert coords.flags["C_CONTIGUOUS"]
+        assert coords.tolist() == [[51.9, -1.15], [51.91, -1.14]]
+
+    def test_unresolved_points_dropped(self):
+        geometry = [{"lat": 51.9, "lon": -1.15}, None, {}, {"lat": 51.91, "lon": -1.14}]
+
+        assert coordinates_array(geometry).shape == (2, 2)
+        assert coordinates_array([]).shape == (0, 2)
+
+
+class TestKernels:
+    def test_haversine_matches_scalar(self):
+        lat1 = np.array([51.9, 51.8, 0.0])
+        lon1 = np.array([-1.15, -1.2, 0.0])
+        lat2 = np.array([51.91, 51.85, 1.0])
+        lon2 = np.array([-1.14, -1.1, 1.0])
+
+        result = haversine_m(lat1, lon1, lat2, lon2)
+
+        for i in range(3):
+            assert result[i] == pytest.approx(
+                _haversine_distance(lat1[i], lon1[i], lat2[i], lon2[i]), rel=1e-12
+            )
+
+    def test_bearing_matches_scalar(self):
+        for lat2, lon2 in [(51.91, -1.15), (51.9, -1.14), (51.89, -1.16), (51.9, -1.16)]:
+            expected = calculate_way_bearing(_geometry((51.9, -1.15), (lat2, lon2)))
+            assert float(bearing_deg(51.9, -1.15, lat2, lon2)) == pytest.approx(expected)
+
+    def test_path_length(self):
+        coords = coordinates_array(_geometry((51.9, -1.15), (51.901, -1.15), (51.902, -1.15)))
+
+        assert path_length_m(coords) == pytest.approx(222.4, abs=0.5)
+        assert path_length_m(coords[:1]) == 0.0
+
+
+class TestPathLengths:
+    def test_matches_per_path_lengths(self):
+        paths = [
+            coordinates_array(_geometry((51.9, -1.15), (51.901, -1.149), (51.902, -1.15))),
+            coordinates_array(_geometry((51.95, -1.2))),
+            coordinates_array([]),
+            coordinates_array(_geometry((51.8, -1.1), (51.8, -1.09))),
+        ]
+
+        lengths = path_lengths_m(paths)
+
+        assert lengths.shape == (4,)
+        assert lengths[1] == lengths[2] == 0.0
+        for path, length in zip(paths, lengths, strict=True):
+            assert length == pytest.approx(path_length_m(path), abs=1e-6)
+
+    def test_no_length_between_paths(self):
+        """The gap from one path's end to the next path's start is not counted."""
+        a = coordinates_array(_geometry((51.9, -1.15), (51.901, -1.15)))
+        b = coordinates_array(_geometry((52.9, -1.15), (52.901, -1.15)))
+
+        lengths = path_lengths_m([a, b])
+
+        assert lengths.sum() == pytest.approx(2 * 111.2, abs=0.5)
+
+    def test_empty_inputs(self):
+        assert path_lengths_m([]).shape == (0,)
+        assert path_lengths_m([coordinates_array([])]).tolist() == [0.0]
+        assert math.isclose(path_lengths_m([coordinates_array(_geometry((51.9, -1.1)))])[0], 0)
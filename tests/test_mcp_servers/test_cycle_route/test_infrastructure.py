@@ -911,6 +911,35 @@ class TestDetectParallelProvision:
         assert result[0].original_provision is None
 
 
+    def test_distant_parallel_cycleway_not_used(self):
+        """A cycleway on the same bearing but streets away does not upgrade."""
+        road = _make_road_way(100, 51.90, -1.16, 51.90, -1.14)
+        # ~110m north of the road
+        cycleway = _make_cycleway_way(200, 51.901, -1.16, 51.901, -1.14)
+
+        segments = [
+            RouteSegment(100, "none", "secondary", 30, "asphalt", True, 500, "Test Road"),
+        ]
+        overpass = _make_overpass_data([road, cycleway])
+
+        result = detect_parallel_provision(segments, overpass)
+        assert result[0].provision == "none"
+        assert result[0].original_provision is None
+
+    def test_nearby_cycleway_beyond_segment_end_not_used(self):
+        """A parallel cycleway continuing past the road's end only counts if it is near."""
+        road = _make_road_way(100, 51.90, -1.16, 51.90, -1.15)
+        cycleway = _make_cycleway_way(200, 51.9001, -1.14, 51.9001, -1.13)
+
+        segments = [
+            RouteSegment(100, "none", "secondary", 30, "asphalt", True, 500, "Test Road"),
+        ]
+        overpass = _make_overpass_data([road, cycleway])
+
+        result = detect_parallel_provision(segments, overpass)
+        assert result[0].provision == "none"
+
+
 # =============================================================================
 # analyse_transitions
 # =============================================================================
@@ -970,6 +999,19 @@ class TestAnalyseTransitions:
         result = analyse_transitions(segments, {"elements": elements})
         assert len(result["barriers"]) == 1
 
+    def test_distinct_barriers_in_neighbouring_cells_kept(self):
+        """Barriers just over 5m apart are both kept, duplicates across cell edges are not."""
+        elements = [
+            _make_barrier_node(1001, 51.899999, -1.15, "bollard"),
+            _make_barrier_node(1002, 51.900001, -1.15, "bollard"),
+            _make_barrier_node(1003, 51.900060, -1.15, "bollard"),
+        ]
+        segments = [
+            RouteSegment(100, "segregated", "cycleway", 0, "asphalt", True, 500, "Route"),
+        ]
+        result = analyse_transitions(segments, {"elements": elements})
+        assert [b["node_id"] for b in result["barriers"]] == [1001, 1003]
+
     def test_non_priority_crossing_detected(self):
         """[TS-21] Non-priority crossing at off-road to road transition."""
         segments = [
@@ -0,0 +1,93 @@
+"""
+Tests for the local OSM infrastructure store.
+
+Verifies [cycle-route-assessment:FR-002] - Route infrastructure analysis (local backend)
+"""
+
+import pytest
+
+from src.mcp_servers.cycle_route.osm_store import LocalOSMStore, OSMStoreError, OSMStoreWriter
+from src.mcp_servers.cycle_route.overpass_store import OverpassStore
+
+ROUTE = [[-1.1534, 51.8997], [-1.1510, 51.9010], [-1.1480, 51.9025]]
+
+WAYS = [
+    (100, {"highway": "cycleway", "surface": "asphalt"}, [1, 2], [(51.8997, -1.1534), (51.9010, -1.1510)]),
+    (101, {"highway": "secondary", "maxspeed": "30 mph"}, [2, 3], [(51.9010, -1.1510), (51.9025, -1.1480)]),
+    (102, {"highway": "residential"}, [8, 9], [(51.95, -1.10), (51.96, -1.09)]),
+]
+NODES = [
+    (1, 51.89972, -1.15338, {"barrier": "bollard"}),
+    (20, 51.9011, -1.1511, {"crossing": "uncontrolled"}),
+    (30, 51.90252, -1.14802, {"barrier": "gate"}),
+    (40, 51.96, -1.09, {"barrier": "stile"}),
+]
+
+
+def _elements() -> list[dict]:
+    """The store contents as Overpass out geom elements."""
+    return [
+        {"type": "node", "id": node_id, "lat": lat, "lon": lon, "tags": tags}
+        for node_id, lat, lon, tags in NODES
+    ] + [
+        {
+            "type": "way",
+            "id": way_id,
+            "nodes": node_ids,
+            "tags": tags,
+            "geometry": [{"lat": lat, "lon": lon} for lat, lon in geometry],
+        }
+        for way_id, tags, node_ids, geometry in WAYS
+    ]
+
+
+@pytest.fixture
+def store(tmp_path) -> LocalOSMStore:
+    path = tmp_path / "osm.sqlite"
+    with OSMStoreWriter(path, source="test.osm.pbf") as writer:
+        for way in WAYS:
+            writer.add_way(*way)
+        for node in NODES:
+            writer.add_node(*node)
+    store = LocalOSMStore(path)
+    yield store
+    store.close()
+
+
+class TestLocalOSMStore:
+    def test_meta(self, store):
+        assert store.meta["source"] == "test.osm.pbf"
+        assert store.meta["way_count"] == "3"
+
+    @pytest.mark.parametrize("on_route_way_ids", [None, {100}])
+    def test_matches_overpass_filters(self, store, on_route_way_ids):
+        """Route queries return what the Overpass query filters would select."""
+        expected = OverpassStore([{"elements": _elements()}]).route_data(ROUTE, on_route_way_ids)
+
+        result = store.query_route(ROUTE, on_route_way_ids)
+
+        assert result == expected
+        ids = {e["id"] for e in result["elements"]}
+        assert {100, 101, 20} <= ids
+        assert 102 not in ids
+
+    def test_on_route_barriers_only(self, store):
+        """With way IDs only barriers on those ways are returned."""
+        ids = {e["id"] for e in store.query_route(ROUTE, {100})["elements"]}
+
+        assert 1 in ids
+        assert 30 not in ids
+
+    def test_missing_store(self, tmp_path):
+        with pytest.raises(OSMStoreError, match="not found"):
+            LocalOSMStore(tmp_path / "missing.sqlite")
+
+    def test_failed_build_leaves_no_store(self, tmp_path):
+        path = tmp_path / "osm.sqlite"
+
+        with pytest.raises(ValueError), OSMStoreWriter(path) as writer:
+            writer.add_way(*WAYS[0])
+            raise ValueError("corrupt extract")
+
+        assert not path.exists()
+        assert not path.with_name("osm.sqlite.tmp").exists()
@@ -0,0 +1,191 @@
+"""
+Tests for the persistent Overpass response cache.
+
+Verifies [cycle-route-assessment:FR-002] - Route infrastructure analysis (cached re-use)
+Verifies [cycle-route-assessment:NFR-003] - Rate limiting for public services
+"""
+
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from src.mcp_servers.cycle_route.overpass_cache import OverpassCache
+
+QUERY = '[out:json][timeout:25];\n(\n  way(around:20,51.8997,-1.1534)["highway"];\n);\nout geom;'
+RESPONSE = {"elements": [{"type": "way", "id": 100, "tags": {"highway": "cycleway"}}]}
+
+
+def _fetcher(response: dict | None, calls: list[str]):
+    async def fetch() -> dict | None:
+        calls.append("fetch")
+        return response
+
+    return fetch
+
+
+def _age_entry(cache: OverpassCache, query: str, seconds: float) -> None:
+    """Rewrite an entry's fetched_at as if it were fetched `seconds` ago."""
+    path = cache.cache_dir / cache.query_hash(query)[:2] / f"{cache.query_hash(query)}.json.gz"
+    with gzip.open(path, "rt", encoding="utf-8") as stream:
+        entry = json.load(stream)
+    entry["fetched_at"] = time.time() - seconds
+    with gzip.open(path, "wt", encoding="utf-8") as stream:
+        json.dump(entry, stream)
+
+
+class TestOverpassCacheReadWrite:
+    """Tests for keys, freshness and on-disk entries."""
+
+    def test_key_ignores_whitespace(self, tmp_path):
+        cache = OverpassCache(tmp_path)
+        cache.write(QUERY, RESPONSE)
+
+        data, state = cache.read("  " + QUERY.replace("\n", "  \n "))
+
+        assert (data, state) == (RESPONSE, "fresh")
+
+    def test_states_by_age(self, tmp_path):
+        cache = OverpassCache(tmp_path, ttl_seconds=100, stale_seconds=100)
+        cache.write(QUERY, RESPONSE)
+
+        _age_entry(cache, QUERY, 150)
+        assert cache.read(QUERY)[1] == "stale"
+
+        _age_entry(cache, QUERY, 250)
+        assert cache.read(QUERY) == (None, "miss")
+        # Expired entries are removed
+        assert cache.stats()["entries"] == 0
+
+    def test_corrupt_entry_is_miss(self, tmp_path):
+        cache = OverpassCache(tmp_path)
+        cache.write(QUERY, RESPONSE)
+        path = next(tmp_path.glob("*/*.json.gz"))
+        path.write_bytes(b"not gzip")
+
+        assert cache.read(QUERY) == (None, "miss")
+        assert not path.exists()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Writes over the size cap evict the least recently used entries."""
+        probe = OverpassCache(tmp_path / "probe")
+        probe.write(QUERY, RESPONSE)
+        entry_size = next((tmp_path / "probe").glob("*/*.json.gz")).stat().st_size
+
+        cache = OverpassCache(tmp_path / "cache", max_bytes=entry_size * 2 + entry_size // 2)
+        queries = [QUERY.replace("51.8997", f"51.{9000 + i}") for i in range(3)]
+        cache.write(queries[0], RESPONSE)
+        cache.write(queries[1], RESPONSE)
+        # Touch the first entry so the second becomes least recently used
+        time.sleep(0.01)
+        cache.read(queries[0])
+        time.sleep(0.01)
+        cache.write(queries[2], RESPONSE)
+
+        assert cache.read(queries[1]) == (None, "miss")
+        assert cache.read(queries[0])[1] == "fresh"
+        assert cache.read(queries[2])[1] == "fresh"
+        assert cache.stats()["evictions"] == 1
+
+    def test_index_rebuilt_from_disk(self, tmp_path):
+        """A new process sees entries written by an earlier one."""
+        OverpassCache(tmp_path).write(QUERY, RESPONSE)
+
+        stats = OverpassCache(tmp_path).stats()
+
+        assert stats["entries"] == 1
+        assert stats["size_bytes"] > 0
+
+
+class TestOverpassCacheFetch:
+    """Tests for fetch() with stale-while-revalidate."""
+
+    @pytest.mark.anyio
+    async def test_miss_then_fresh_hit(self, tmp_path):
+        cache = OverpassCache(tmp_path)
+        calls: list[str] = []
+
+        first = await cache.fetch(QUERY, _fetcher(RESPONSE, calls), "Bicester North")
+        second = await cache.fetch(QUERY, _fetcher(RESPONSE, calls), "Bicester North")
+
+        assert first == second == RESPONSE
+        assert calls == ["fetch"]
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+        assert stats["bytes_saved"] == stats["size_bytes"] > 0
+
+    @pytest.mark.anyio
+    async def test_failed_fetch_not_cached(self, tmp_path):
+        cache = OverpassCache(tmp_path)
+        calls: list[str] = []
+
+        assert await cache.fetch(QUERY, _fetcher(None, calls)) is None
+        assert await cache.fetch(QUERY, _fetcher(None, calls)) is None
+
+        assert calls == ["fetch", "fetch"]
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.anyio
+    async def test_failed_write_returns_response(self, tmp_path):
+        """A full or read-only cache volume does not fail the fetch."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        cache = OverpassCache(blocker)
+        calls: list[str] = []
+
+        assert await cache.fetch(QUERY, _fetcher(RESPONSE, calls)) == RESPONSE
+        assert calls == ["fetch"]
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.anyio
+    async def test_stale_served_and_revalidated(self, tmp_path):
+        """A stale entry is returned at once and refreshed in the background."""
+        cache = OverpassCache(tmp_path, ttl_seconds=100, stale_seconds=1000)
+        cache.write(QUERY, RESPONSE)
+        _age_entry(cache, QUERY, 500)
+        refreshed = {"elements": []}
+        calls: list[str] = []
+
+        result = await cache.fetch(QUERY, _fetcher(refreshed, calls))
+        assert result == RESPONSE
+
+        await cache.wait_for_revalidations()
+        assert calls == ["fetch"]
+        assert cache.read(QUERY) == (refreshed, "fresh")
+        assert (cache.stats()["stale_hits"], cache.stats()["revalidations"]) == (1, 1)
+
+    @pytest.mark.anyio
+    async def test_revalidation_failure_keeps_stale_entry(self, tmp_path):
+        cache = OverpassCache(tmp_path, ttl_seconds=100, stale_seconds=1000)
+        cache.write(QUERY, RESPONSE)
+        _age_entry(cache, QUERY, 500)
+
+        async def failing() -> dict:
+            raise RuntimeError("Overpass down")
+
+        assert await cache.fetch(QUERY, failing) == RESPONSE
+        await cache.wait_for_revalidations()
+
+        assert cache.read(QUERY) == (RESPONSE, "stale")
+
+
+class TestOverpassCacheFromEnv:
+    def test_disabled_without_dir(self, monkeypatch):
+        monkeypatch.delenv("OVERPASS_CACHE_DIR", raising=False)
+
+        assert OverpassCache.from_env() is None
+
+    def test_settings_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("OVERPASS_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("OVERPASS_CACHE_TTL", "3600")
+        monkeypatch.setenv("OVERPASS_CACHE_STALE", "7200")
+        monkeypatch.setenv("OVERPASS_CACHE_MAX_MB", "16")
+
+        stats = OverpassCache.from_env().stats()
+
+        assert (stats["ttl_seconds"], stats["stale_seconds"]) == (3600.0, 7200.0)
+        assert stats["max_bytes"] == 16 * 2**20
+        assert os.fspath(OverpassCache.from_env().cache_dir) == str(tmp_path)
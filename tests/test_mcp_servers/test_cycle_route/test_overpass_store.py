@@ -0,0 +1,256 @@
+"""
+Tests for merged Overpass queries and the shared element store.
+
+Verifies [cycle-route-assessment:FR-002] - Route infrastructure analysis via Overpass
+"""
+
+import math
+import re
+
+import pytest
+
+from src.mcp_servers.cycle_route.infrastructure import build_overpass_query
+from src.mcp_servers.cycle_route.overpass_store import (
+    OverpassStore,
+    build_merged_overpass_queries,
+    build_merged_overpass_tiles,
+)
+from src.mcp_servers.cycle_route.spatial_index import distance_m, point_segment_distance_m
+
+ROUTE_A = [[-1.1534, 51.8997], [-1.1510, 51.9010], [-1.1480, 51.9025]]
+ROUTE_B = [[-1.1534, 51.8997], [-1.1510, 51.9010], [-1.1560, 51.9040]]
+
+
+def _way(way_id: int, points: list[tuple[float, float]], nodes=None, **tags) -> dict:
+    return {
+        "type": "way",
+        "id": way_id,
+        "nodes": nodes or [],
+        "tags": {"highway": "residential", **tags},
+        "geometry": [{"lat": lat, "lon": lon} for lon, lat in points],
+    }
+
+
+def _node(node_id: int, lon: float, lat: float, **tags) -> dict:
+    return {"type": "node", "id": node_id, "lat": lat, "lon": lon, "tags": tags}
+
+
+AROUND_RE = re.compile(r"(way|node)\(around:(\d+),([-\d.,]+)\)\[([^\]]+)\];")
+
+
+def _tags_match(tag_filter: str, tags: dict) -> bool:
+    if "~" in tag_filter:
+        key, pattern = (part.strip('"') for part in tag_filter.split("~"))
+        return re.search(pattern, tags.get(key, "")) is not None
+    return tag_filter.strip('"') in tags
+
+
+def _distance_to_line(elem: dict, line: list[dict]) -> float:
+    """Closest approach of an element to an around polyline, ways densified to ~1m."""
+    points = [elem]
+    if elem["type"] == "way":
+        geometry = elem["geometry"]
+        points = []
+        for a, b in zip(geometry, geometry[1:], strict=False):
+            steps = max(1, math.ceil(distance_m(a["lat"], a["lon"], b["lat"], b["lon"])))
+            points += [
+                {"lat": a["lat"] + (b["lat"] - a["lat"]) * k / steps,
+                 "lon": a["lon"] + (b["lon"] - a["lon"]) * k / steps}
+                for k in range(steps + 1)
+            ]
+    edges = list(zip(line, line[1:], strict=False)) or [(line[0], line[0])]
+    return min(
+        point_segment_distance_m(pt["lat"], pt["lon"], a, b) for pt in points for a, b in edges
+    )
+
+
+def _run_overpass(query: str, payload: list[dict]) -> dict:
+    """Answer a query from a fixed payload, buffering each around list as a polyline."""
+    found = set()
+    for kind, radius, coords, tag_filter in AROUND_RE.findall(query):
+        values = [float(v) for v in coords.split(",")]
+        line = [{"lat": lat, "lon": lon} for lat, lon in zip(values[::2], values[1::2], strict=True)]
+        found |= {
+            e["id"] for e in payload
+            if e["type"] == kind
+            and _tags_match(tag_filter, e["tags"])
+            and _distance_to_line(e, line) <= int(radius)
+        }
+    onroute = re.search(r"way\(id:([\d,]+)\)->\.onroute;", query)
+    if onroute:
+        ways = [e for e in payload if e["type"] == "way" and str(e["id"]) in onroute.group(1).split(",")]
+        found |= {e["id"] for e in ways}
+        tag_filter = re.search(r"node\(w\.onroute\)\[([^\]]+)\];", query).group(1)
+        found |= {
+            e["id"] for e in payload
+            if e["type"] == "node"
+            and any(e["id"] in w["nodes"] for w in ways)
+            and _tags_match(tag_filter, e["tags"])
+        }
+    return {"elements": [e for e in payload if e["id"] in found]}
+
+
+class TestBuildMergedOverpassQueries:
+    def test_shared_points_queried_once(self):
+        """Points common to several routes appear once in the merged query."""
+        queries = build_merged_overpass_queries([(ROUTE_A, None), (ROUTE_B, None)])
+
+        assert len(queries) == 1
+        assert queries[0].count("51.8997,-1.1534") == 3  # ways, crossings, barriers
+        assert "-1.156" in queries[0]
+
+    def test_on_route_ways_in_first_tile(self):
+        """Union of on-route way IDs is fetched once, with their barrier nodes."""
+        queries = build_merged_overpass_queries(
+            [(ROUTE_A, {101, 100}), (ROUTE_B, {102})], max_points=2
+        )
+
+        assert len(queries) == 3
+        assert "way(id:100,101,102)->.onroute;" in queries[0]
+        assert "node(w.onroute)" in queries[0]
+        assert all(".onroute" not in query for query in queries[1:])
+
+    def test_one_around_line_per_route_run(self):
+        """Each route keeps its own around list; the shared segment is queried once."""
+        query = build_merged_overpass_queries([(ROUTE_A, None), (ROUTE_B, None)])[0]
+
+        lines = re.findall(r"way\(around:\d+,([-\d.,]+)\)", query)
+        assert lines == [
+            "51.8997,-1.1534,51.901,-1.151,51.9025,-1.148",
+            "51.901,-1.151,51.904,-1.156",
+        ]
+
+    def test_long_runs_split_with_overlap(self):
+        """A run cut across tiles repeats the cut point, so no segment is lost."""
+        route = [[-1.15 + i * 0.001, 51.9] for i in range(7)]
+        tiles = build_merged_overpass_tiles([(route, None)], max_points=3)
+
+        lines = [re.findall(r"way\(around:\d+,([-\d.,]+)\)", query)[0] for query, _ in tiles]
+        assert [line.split(",")[-1] for line in lines[:-1]] == [
+            line.split(",")[1] for line in lines[1:]
+        ]
+        assert all(covered == {0} for _, covered in tiles)
+
+    def test_no_routes(self):
+        assert build_merged_overpass_queries([]) == []
+
+    def test_tiles_record_covered_routes(self):
+        """A tile covers the routes with points in it, including merged shared points."""
+        tiles = build_merged_overpass_tiles([(ROUTE_A, None), (ROUTE_B, None)], max_points=3)
+
+        assert [covered for _, covered in tiles] == [{0, 1}, {1}]
+        assert [query for query, _ in tiles] == build_merged_overpass_queries(
+            [(ROUTE_A, None), (ROUTE_B, None)], max_points=3
+        )
+
+    def test_first_tile_covers_routes_with_way_ids(self):
+        tiles = build_merged_overpass_tiles([(ROUTE_B, None), (ROUTE_A, {100})], max_points=3)
+
+        assert tiles[0][1] == {0, 1}
+
+
+class TestOverpassStore:
+    def _store(self) -> OverpassStore:
+        near_a = _way(1, [(-1.1534, 51.8997), (-1.1510, 51.9010)], nodes=[10, 11])
+        far = _way(2, [(-1.10, 51.95), (-1.09, 51.96)])
+        near_b_only = _way(3, [(-1.1510, 51.9010), (-1.1560, 51.9040)])
+        crossing = _node(20, -1.1510, 51.9011, crossing="marked")
+        barrier_on_way = _node(10, -1.15335, 51.89975, barrier="bollard")
+        barrier_nearby = _node(30, -1.14801, 51.90251, barrier="kissing_gate")
+        return OverpassStore([
+            {"elements": [near_a, far, crossing]},
+            {"elements": [near_a, near_b_only, barrier_on_way, barrier_nearby]},
+        ])
+
+    def test_elements_deduplicated_across_tiles(self):
+        assert self._store().element_count == 6
+
+    def test_has_ways(self):
+        store = self._store()
+
+        assert store.has_ways({1, 3})
+        assert not store.has_ways({1, 99})
+
+    def test_route_selection_by_proximity(self):
+        """A route gets nearby highway ways and crossings, not other routes' ways."""
+        data = self._store().route_data(ROUTE_A)
+        ids = [e["id"] for e in data["elements"]]
+
+        assert 1 in ids
+        assert 20 in ids
+        assert 2 not in ids
+        # Proximity barriers when no way IDs are known
+        assert 10 in ids
+        assert 30 in ids
+
+    def test_barriers_from_on_route_ways(self):
+        """With way IDs, only barrier nodes on those ways are selected."""
+        data = self._store().route_data(ROUTE_A, on_route_way_ids={1})
+        ids = [e["id"] for e in data["elements"]]
+
+        assert 10 in ids
+        assert 30 not in ids
+
+    def test_store_order_preserved(self):
+        """Selected elements keep their response order."""
+        data = self._store().route_data(ROUTE_B)
+        ids = [e["id"] for e in data["elements"]]
+
+        assert ids == sorted(ids, key=[1, 2, 20, 3, 10, 30].index)
+        assert 3 in ids
+
+
+class TestMergedMatchesPerRoute:
+    """
+    Selecting from merged tiles gives each route what its own query returns.
+
+    Overpass buffers an around point list as one polyline, so the payload
+    includes a way crossing a route between sampled points and a way on the
+    straight line between the two routes' ends.
+    """
+
+    ROUTE_EAST = [[-1.1534, 51.8997], [-1.1514, 51.8997], [-1.1494, 51.8997], [-1.1474, 51.8997]]
+    ROUTE_NORTH = [[-1.1534, 51.8997], [-1.1514, 51.8997], [-1.1514, 51.9017], [-1.1514, 51.9037]]
+
+    PAYLOAD = [
+        _way(1, [(-1.1534, 51.8997), (-1.1474, 51.8997)], nodes=[10, 11]),
+        # Crosses the east route midway between sampled points, vertices ~80m away
+        _way(2, [(-1.1504, 51.8990), (-1.1504, 51.9004)]),
+        # Beside the north route's second leg
+        _way(3, [(-1.15125, 51.9020), (-1.15125, 51.9030)]),
+        # On the jump from the east route's end to the north route's first new point
+        _way(4, [(-1.1495, 51.9006), (-1.1493, 51.9008)]),
+        {**_way(5, [(-1.1484, 51.8998), (-1.1483, 51.8999)]), "tags": {"building": "yes"}},
+        _node(10, -1.1480, 51.8997, barrier="bollard"),
+        _node(11, -1.1474, 51.8997),
+        _node(20, -1.1484, 51.89975, crossing="marked"),
+        _node(21, -1.15135, 51.9027, barrier="gate"),
+        _node(22, -1.1494, 51.9007, crossing="zebra"),
+    ]
+
+    @pytest.mark.parametrize("max_points", [250, 3])
+    def test_route_data_matches_per_route_queries(self, max_points):
+        routes = [(self.ROUTE_EAST, {1}), (self.ROUTE_NORTH, None)]
+        tiles = build_merged_overpass_tiles(routes, max_points=max_points)
+        store = OverpassStore([_run_overpass(query, self.PAYLOAD) for query, _ in tiles])
+
+        for coords, way_ids in routes:
+            merged = {e["id"] for e in store.route_data(coords, way_ids)["elements"]}
+            separate = _run_overpass(
+                build_overpass_query(coords, on_route_way_ids=way_ids), self.PAYLOAD
+            )
+            assert merged == {e["id"] for e in separate["elements"]}
+
+        east = {e["id"] for e in store.route_data(self.ROUTE_EAST, {1})["elements"]}
+        assert east == {1, 2, 10, 20}
+
+    def test_merged_query_skips_gap_between_routes(self):
+        """Elements on the straight line between two routes are not fetched."""
+        query = build_merged_overpass_queries(
+            [(self.ROUTE_EAST, None), (self.ROUTE_NORTH, None)]
+        )[0]
+        ids = {e["id"] for e in _run_overpass(query, self.PAYLOAD)["elements"]}
+
+        assert 4 not in ids
+        assert 22 not in ids
+        assert {1, 2, 3, 20, 21} <= ids
@@ -0,0 +1,236 @@
+"""
+Performance tests for infrastructure analysis on dense corridors.
+
+Verifies [cycle-route-assessment:FR-002] - Route infrastructure analysis (spatial lookups)
+Verifies [cycle-route-assessment:NFR-001] - Complete within 30s for 3 destinations
+
+Synthetic Overpass payloads model a dense urban grid: thousands of short
+roads, each with a cycleway either alongside it or a block away, and
+barriers mapped more than once. Parallel detection and barrier
+deduplication must stay near-linear in the payload size, and way lengths
+from the vectorised kernels must match the scalar haversine sum.
+"""
+
+import random
+import time
+
+import pytest
+
+from src.mcp_servers.cycle_route.geometry import coordinates_array, path_lengths_m
+from src.mcp_servers.cycle_route.infrastructure import (
+    PARALLEL_MAX_BEARING_DIFF,
+    PARALLEL_MAX_DISTANCE_M,
+    PROVISION_RANK,
+    RouteSegment,
+    _haversine_distance,
+    analyse_transitions,
+    bearing_difference,
+    calculate_way_bearing,
+    detect_parallel_provision,
+    parse_overpass_ways,
+)
+from src.mcp_servers.cycle_route.spatial_index import distance_m, polyline_distance_m
+
+# ~100m east-west road per block at Bicester latitude
+BLOCK_DEG_LON = 0.0015
+BLOCK_DEG_LAT = 0.0009
+
+
+def _make_dense_corridor(blocks: int, seed: int = 1) -> tuple[list[RouteSegment], dict]:
+    """Roads on a grid, each with a cycleway alongside (10m) or a block away (~100m)."""
+    rng = random.Random(seed)
+    side = int(blocks**0.5) + 1
+    elements = []
+    segments = []
+    for i in range(blocks):
+        lat = 51.88 + (i // side) * BLOCK_DEG_LAT
+        lon = -1.18 + (i % side) * BLOCK_DEG_LON
+        road_id = 1_000_000 + i
+        elements.append({
+            "type": "way",
+            "id": road_id,
+            "tags": {"highway": "residential"},
+            "geometry": [{"lat": lat, "lon": lon}, {"lat": lat, "lon": lon + BLOCK_DEG_LON * 0.9}],
+        })
+        segments.append(
+            RouteSegment(road_id, "none", "residential", 30, "asphalt", True, 100, f"Road {i}")
+        )
+        offset = 0.00009 if rng.random() < 0.5 else BLOCK_DEG_LAT / 2
+        elements.append({
+            "type": "way",
+            "id": 2_000_000 + i,
+            "tags": {"highway": "cycleway"},
+            "geometry": [
+                {"lat": lat + offset, "lon": lon},
+                {"lat": lat + offset, "lon": lon + BLOCK_DEG_LON * 0.9},
+            ],
+        })
+    return segments, {"elements": elements}
+
+
+def _make_barrier_payload(count: int, seed: int = 2) -> dict:
+    """Barrier nodes ~20m apart with jitter, a third of them mapped twice 2m apart."""
+    rng = random.Random(seed)
+    side = int(count**0.5) + 1
+    elements = []
+    for i in range(count):
+        lat = 51.88 + (i // side) * 0.00018 + rng.uniform(-0.00003, 0.00003)
+        lon = -1.18 + (i % side) * 0.0003 + rng.uniform(-0.00004, 0.00004)
+        elements.append({
+            "type": "node", "id": i * 2, "lat": lat, "lon": lon,
+            "tags": {"barrier": "bollard"},
+        })
+        if i % 3 == 0:
+            elements.append({
+                "type": "node", "id": i * 2 + 1, "lat": lat + 0.000018, "lon": lon,
+                "tags": {"barrier": "bollard"},
+            })
+    return {"elements": elements}
+
+
+def _brute_force_upgrades(segments: list[RouteSegment], overpass: dict) -> dict[int, str]:
+    """Reference: compare every road with every cycleway."""
+    ways = {e["id"]: e for e in overpass["elements"]}
+    seg_ids = {s.way_id for s in segments}
+    cycleways = [e for e in overpass["elements"]
+                 if e["tags"]["highway"] == "cycleway" and e["id"] not in seg_ids]
+    upgrades = {}
+    for seg in segments:
+        road = ways[seg.way_id]["geometry"]
+        best = PROVISION_RANK[seg.provision]
+        for cand in cycleways:
+            diff = bearing_difference(
+                calculate_way_bearing(road), calculate_way_bearing(cand["geometry"])
+            )
+            if (diff <= PARALLEL_MAX_BEARING_DIFF
+                    and polyline_distance_m(road, cand["geometry"]) <= PARALLEL_MAX_DISTANCE_M
+                    and PROVISION_RANK["segregated"] > best):
+                upgrades[seg.way_id] = "segregated"
+                best = PROVISION_RANK["segregated"]
+    return upgrades
+
+
+class TestParallelDetectionPerformance:
+    def test_matches_brute_force(self):
+        """Indexed matching upgrades exactly the roads a full comparison would."""
+        segments, overpass = _make_dense_corridor(150)
+        expected = _brute_force_upgrades(segments, overpass)
+
+        detect_parallel_provision(segments, overpass)
+
+        upgraded = {s.way_id: s.provision for s in segments if s.original_provision}
+        assert upgraded == expected
+        assert 0 < len(upgraded) < len(segments)
+
+    def test_dense_corridor_near_linear(self):
+        """10,000 roads and 10,000 cycleways are matched well inside a second per 5,000."""
+        small_segments, small = _make_dense_corridor(1_000)
+        start = time.perf_counter()
+        detect_parallel_provision(small_segments, small)
+        small_elapsed = time.perf_counter() - start
+
+        segments, overpass = _make_dense_corridor(10_000)
+        start = time.perf_counter()
+        detect_parallel_provision(segments, overpass)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2.0, f"Parallel detection took {elapsed:.2f}s for 10,000 roads"
+        # Quadratic growth would be ~100x; allow generous noise over linear
+        assert elapsed < small_elapsed * 30 + 0.05
+
+
+class TestBarrierDedupPerformance:
+    def test_dedup_matches_pairwise(self):
+        overpass = _make_barrier_payload(600)
+        kept: list[dict] = []
+        for elem in overpass["elements"]:
+            if all(distance_m(elem["lat"], elem["lon"], b["lat"], b["lon"]) >= 5 for b in kept):
+                kept.append(elem)
+
+        result = analyse_transitions([], overpass)
+
+        assert [b["node_id"] for b in result["barriers"]] == [e["id"] for e in kept]
+
+    def test_many_barriers_near_linear(self):
+        overpass = _make_barrier_payload(20_000)
+
+        start = time.perf_counter()
+        result = analyse_transitions([], overpass)
+        elapsed = time.perf_counter() - start
+
+        assert result["barrier_count"] == 20_000
+        assert elapsed < 2.0, f"Barrier deduplication took {elapsed:.2f}s for 26,667 nodes"
+
+
+def _make_winding_ways(count: int, seed: int = 3) -> dict:
+    """Ways of 2-40 nodes wandering over a town, like residential streets and paths."""
+    rng = random.Random(seed)
+    elements = []
+    for i in range(count):
+        lat = 51.88 + rng.random() * 0.05
+        lon = -1.18 + rng.random() * 0.08
+        geometry = []
+        for _ in range(rng.randint(2, 40)):
+            geometry.append({"lat": lat, "lon": lon})
+            lat += rng.uniform(-0.0002, 0.0002)
+            lon += rng.uniform(-0.0003, 0.0003)
+        elements.append({
+            "type": "way",
+            "id": i,
+            "tags": {"highway": rng.choice(["residential", "cycleway", "secondary"])},
+            "geometry": geometry,
+        })
+    return {"elements": elements}
+
+
+class TestWayGeometryPerformance:
+    def test_lengths_match_scalar_haversine(self):
+        overpass = _make_winding_ways(500)
+
+        segments = parse_overpass_ways(overpass, 0)
+
+        for seg, way in zip(segments, overpass["elements"], strict=True):
+            geom = way["geometry"]
+            expected = sum(
+                _haversine_distance(a["lat"], a["lon"], b["lat"], b["lon"])
+                for a, b in zip(geom, geom[1:], strict=False)
+            )
+            assert seg.distance_m == pytest.approx(expected, abs=1e-6)
+            assert seg.geometry == [[pt["lon"], pt["lat"]] for pt in geom]
+
+    def test_large_payload(self):
+        """
+        20,000 ways (~400,000 nodes) against the scalar haversine sum.
+
+        Both are timed in the test, so the bounds are ratios that hold on a
+        slow runner rather than a fixed wall-clock budget.
+        """
+        overpass = _make_winding_ways(20_000)
+        geometries = [way["geometry"] for way in overpass["elements"]]
+
+        start = time.perf_counter()
+        for geom in geometries:
+            sum(
+                _haversine_distance(a["lat"], a["lon"], b["lat"], b["lon"])
+                for a, b in zip(geom, geom[1:], strict=False)
+            )
+        scalar_elapsed = time.perf_counter() - start
+
+        arrays = [coordinates_array(geom) for geom in geometries]
+        start = time.perf_counter()
+        path_lengths_m(arrays)
+        kernel_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        segments = parse_overpass_ways(overpass, 0)
+        elapsed = time.perf_counter() - start
+
+        assert len(segments) == 20_000
+        # ~10x faster in practice
+        assert kernel_elapsed < scalar_elapsed / 3, (
+            f"Vectorised lengths took {kernel_elapsed:.2f}s, scalar {scalar_elapsed:.2f}s"
+        )
+        # Parsing also builds every segment; ~2x the scalar length pass in practice
+        assert elapsed < scalar_elapsed * 5, (
+            f"Parsing took {elapsed:.2f}s, scalar lengths {scalar_elapsed:.2f}s"
+        )
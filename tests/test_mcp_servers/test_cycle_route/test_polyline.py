@@ -1,8 +1,16 @@
 """Tests for Valhalla encoded polyline decoder."""
 
+import random
+
+import numpy as np
 import pytest
 
-from src.mcp_servers.cycle_route.polyline import decode_polyline
+from src.mcp_servers.cycle_route.polyline import (
+    decode_polyline,
+    decode_polyline_array,
+    encode_polyline,
+    expand_route_geometry,
+)
 
 
 def _encode_polyline(coords: list[list[float]], precision: int = 6) -> str:
@@ -104,3 +112,99 @@ class TestDecodePolylineRoundTrip:
         assert len(result) == 1
         assert abs(result[0][0] - (-1.15340)) < 1e-5
         assert abs(result[0][1] - 51.89970) < 1e-5
+
+
+def _decode_scalar(encoded: str, precision: int = 6) -> list[list[float]]:
+    """Test helper: reference character-by-character decoder."""
+    factor = 10**precision
+    coords = []
+    index = lat = lon = 0
+    while index < len(encoded):
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while True:
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        lat += deltas[0]
+        lon += deltas[1]
+        coords.append([lon / factor, lat / factor])
+    return coords
+
+
+class TestVectorisedDecoder:
+    """The array decoder matches the scalar algorithm exactly."""
+
+    @pytest.mark.parametrize("precision", [5, 6, 7])
+    def test_matches_scalar_decoder(self, precision):
+        rng = random.Random(precision)
+        lon, lat = -1.15, 51.9
+        coords = []
+        for _ in range(2000):
+            lon += rng.uniform(-0.01, 0.01)
+            lat += rng.uniform(-0.01, 0.01)
+            coords.append([lon, lat])
+        coords += [[179.999999, -89.999999], [-179.5, 89.5]]
+        encoded = _encode_polyline(coords, precision)
+
+        assert decode_polyline(encoded, precision) == _decode_scalar(encoded, precision)
+
+    def test_array_shape_and_dtype(self):
+        result = decode_polyline_array(_encode_polyline([[-1.15, 51.9], [-1.14, 51.91]]))
+
+        assert result.shape == (2, 2)
+        assert result.dtype == np.float64
+        assert decode_polyline_array(None).shape == (0, 2)
+
+    @pytest.mark.parametrize("encoded", ["_p~iF", "_p~iF~ps|U_", "abc def"])
+    def test_malformed_rejected(self, encoded):
+        with pytest.raises(ValueError):
+            decode_polyline(encoded)
+
+
+class TestEncodePolyline:
+    def test_matches_reference_encoder(self):
+        coords = [[-1.1534, 51.8997], [-1.151, 51.901], [-1.145, 51.905], [-1.2, 51.8]]
+
+        assert encode_polyline(coords) == _encode_polyline(coords)
+        assert encode_polyline(coords, precision=5) == _encode_polyline(coords, precision=5)
+
+    def test_empty(self):
+        assert encode_polyline([]) == ""
+
+
+class TestExpandRouteGeometry:
+    def test_expands_polylines_to_geojson(self):
+        coords = [[-1.1534, 51.8997], [-1.151, 51.901], [-1.145, 51.905]]
+        shortest = [[-1.1534, 51.8997], [-1.145, 51.905]]
+        route = {
+            "destination": "Bicester North",
+            "distance_m": 2500,
+            "duration_minutes": 10.0,
+            "route_polyline": _encode_polyline(coords),
+            "polyline_precision": 6,
+            "shortest_route_polyline": _encode_polyline(shortest),
+        }
+
+        expanded = expand_route_geometry(route)
+
+        assert set(expanded) == {
+            "destination", "distance_m", "duration_minutes",
+            "route_geojson", "shortest_route_geometry",
+        }
+        feature = expanded["route_geojson"]["features"][0]
+        assert feature["geometry"] == {"type": "LineString", "coordinates": coords}
+        assert feature["properties"] == {"distance_m": 2500, "duration_minutes": 10.0}
+        assert expanded["shortest_route_geometry"] == shortest
+        # Input left untouched
+        assert "route_polyline" in route
+
+    def test_geojson_result_unchanged(self):
+        route = {"route_geojson": {"type": "FeatureCollection", "features": []}}
+
+        assert expand_route_geometry(route) is route
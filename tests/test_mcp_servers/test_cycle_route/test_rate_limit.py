@@ -0,0 +1,50 @@
+"""
+Tests for the shared external API rate limiter.
+
+Verifies [cycle-route-assessment:NFR-003] - Rate limiting for public services
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.mcp_servers.cycle_route.rate_limit import ExternalRateLimiter
+
+
+class TestExternalRateLimiter:
+    """Tests for concurrency bounds and start spacing."""
+
+    @pytest.mark.anyio
+    async def test_starts_spaced_by_min_interval(self):
+        """Concurrent callers start at least min_interval apart."""
+        limiter = ExternalRateLimiter(max_concurrent=3, min_interval=0.05)
+        starts: list[float] = []
+
+        async def call() -> None:
+            async with limiter:
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(call() for _ in range(3)))
+
+        gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    @pytest.mark.anyio
+    async def test_concurrency_bounded(self):
+        """No more than max_concurrent callers are inside at once."""
+        limiter = ExternalRateLimiter(max_concurrent=2, min_interval=0)
+        inside = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal inside, peak
+            async with limiter:
+                inside += 1
+                peak = max(peak, inside)
+                await asyncio.sleep(0.01)
+                inside -= 1
+
+        await asyncio.gather(*(call() for _ in range(5)))
+
+        assert peak == 2
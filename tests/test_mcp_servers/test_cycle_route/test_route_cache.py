@@ -0,0 +1,118 @@
+"""
+Tests for the route assessment result cache.
+
+Verifies [cycle-route-assessment:NFR-001] - Complete within 30s for 3 destinations (cached re-use)
+"""
+
+import pytest
+
+from src.mcp_servers.cycle_route.route_cache import RouteResultCache
+
+ORIGIN = (-1.1534, 51.8997)
+DESTINATION = (-1.1450, 51.9050)
+COSTING = [{"bicycle": {"shortest": True}}, {"bicycle": {"use_roads": 0.1}}]
+RESULT = {"status": "success", "destination": "Bicester North", "distance_m": 1200}
+
+
+def _key(cache: RouteResultCache, **overrides) -> str:
+    args = {
+        "origin": ORIGIN,
+        "destination": DESTINATION,
+        "destination_id": "bicester_north",
+        "costing_options": COSTING,
+        "data_version": "tiles:1700000000|osm:overpass",
+    }
+    args.update(overrides)
+    return cache.route_key(**args)
+
+
+class TestSnap:
+    def test_points_in_one_cell_share_it(self, tmp_path):
+        cache = RouteResultCache(tmp_path, cell_m=25)
+        row, col = cache.snap(*ORIGIN)
+        dlat = 25 / 111_320
+
+        # Points in the same cell as ORIGIN, a few metres apart
+        lat = (row + 0.2) * dlat
+        assert cache.snap(ORIGIN[0], lat) == cache.snap(ORIGIN[0], lat + 0.5 * dlat)
+        assert cache.snap(*ORIGIN) == (row, col)
+
+    def test_cells_roughly_square(self, tmp_path):
+        """Columns are cell_m wide at the row's latitude, not cell_m of longitude at the equator."""
+        cache = RouteResultCache(tmp_path, cell_m=100)
+        row, col = cache.snap(*ORIGIN)
+
+        # 100m east at 51.9N is about 0.00146 degrees of longitude
+        assert cache.snap(ORIGIN[0] + 0.00146 * 1.5, ORIGIN[1])[1] - col in (1, 2)
+        assert cache.snap(ORIGIN[0], ORIGIN[1] + 0.0009 * 1.5)[0] - row in (1, 2)
+
+
+class TestRouteKey:
+    def test_same_inputs_same_key(self, tmp_path):
+        cache = RouteResultCache(tmp_path)
+
+        assert _key(cache) == _key(cache)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"origin": (ORIGIN[0] + 0.01, ORIGIN[1])},
+            {"destination": (DESTINATION[0], DESTINATION[1] + 0.01)},
+            {"destination_id": "other"},
+            {"costing_options": COSTING[:1]},
+            {"data_version": "tiles:1800000000|osm:overpass"},
+        ],
+    )
+    def test_each_component_changes_key(self, tmp_path, overrides):
+        cache = RouteResultCache(tmp_path)
+
+        assert _key(cache, **overrides) != _key(cache)
+
+    def test_cell_size_changes_key(self, tmp_path):
+        assert _key(RouteResultCache(tmp_path, cell_m=25)) != _key(
+            RouteResultCache(tmp_path, cell_m=50)
+        )
+
+
+class TestGetPut:
+    @pytest.mark.anyio
+    async def test_round_trip_and_counters(self, tmp_path):
+        cache = RouteResultCache(tmp_path)
+        key = _key(cache)
+
+        assert await cache.get(key) is None
+        await cache.put(key, RESULT)
+        assert await cache.get(key) == RESULT
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.anyio
+    async def test_failed_write_is_not_raised(self, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        cache = RouteResultCache(blocker)
+
+        await cache.put(_key(cache), RESULT)
+
+        assert await cache.get(_key(cache)) is None
+
+
+class TestRouteResultCacheFromEnv:
+    def test_disabled_without_dir(self, monkeypatch):
+        monkeypatch.delenv("ROUTE_CACHE_DIR", raising=False)
+
+        assert RouteResultCache.from_env() is None
+
+    def test_settings_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ROUTE_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("ROUTE_CACHE_TTL", "3600")
+        monkeypatch.setenv("ROUTE_CACHE_MAX_MB", "8")
+        monkeypatch.setenv("ROUTE_CACHE_CELL_M", "50")
+
+        stats = RouteResultCache.from_env().stats()
+
+        assert stats["ttl_seconds"] == 3600.0
+        assert stats["max_bytes"] == 8 * 2**20
+        assert stats["cell_m"] == 50.0
@@ -10,14 +10,26 @@ Verifies [cycle-route-assessment:NFR-001] - Complete within 30s for 3 destinatio
 Verifies [cycle-route-assessment:NFR-002] - Graceful failure handling
 """
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs
 
 import httpx
 import pytest
-
-from src.mcp_servers.cycle_route.server import CycleRouteMCP
+from pydantic import ValidationError
+
+from src.mcp_servers.cycle_route.osm_store import LocalOSMStore, OSMStoreWriter
+from src.mcp_servers.cycle_route.overpass_cache import OverpassCache
+from src.mcp_servers.cycle_route.overpass_store import (
+    MERGED_QUERY_HTTP_TIMEOUT,
+    MERGED_QUERY_TIMEOUT,
+)
+from src.mcp_servers.cycle_route.polyline import expand_route_geometry
+from src.mcp_servers.cycle_route.rate_limit import ExternalRateLimiter
+from src.mcp_servers.cycle_route.route_cache import RouteResultCache
+from src.mcp_servers.cycle_route.server import VALHALLA_TIMEOUT_SECONDS, CycleRouteMCP
 
 FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "cycle_route"
 
@@ -705,6 +717,800 @@ class TestAssessCycleRoute:
         assert overpass_call_count[0] == 4
 
 
+# =============================================================================
+# assess_cycle_routes_batch
+# =============================================================================
+
+
+class TestAssessCycleRoutesBatch:
+    """Verifies [cycle-route-assessment:CycleRouteMCP/TS-06] and TS-07 - batch assessment."""
+
+    @pytest.mark.anyio
+    async def test_results_in_input_order_with_ids(self):
+        """Each destination gets its own result and ID; one failure does not sink the batch."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "overpass-api.de" in url:
+                return httpx.Response(200, json=_make_overpass_response())
+            if "/trace_attributes" in url:
+                return httpx.Response(200, json={"edges": []})
+            body = json.loads(request.content)
+            if body["locations"][1]["lon"] == -0.5:
+                return httpx.Response(400, json=_make_valhalla_error())
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mcp = CycleRouteMCP(
+            http_client=client,
+            overpass_limiter=ExternalRateLimiter(max_concurrent=2, min_interval=0),
+        )
+
+        result = await mcp._assess_cycle_routes_batch({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": [
+                {"id": "dest_001", "name": "Bicester North", "lon": -1.1450, "lat": 51.9050},
+                {"id": "dest_002", "name": "Faraway", "lon": -0.5, "lat": 52.5},
+                {"id": "dest_003", "name": "Bicester Village", "lon": -1.1467, "lat": 51.8899},
+            ],
+        })
+
+        assert result["status"] == "success"
+        assert (result["assessed"], result["failed"]) == (2, 1)
+        routes = result["routes"]
+        assert [r["destination_id"] for r in routes] == ["dest_001", "dest_002", "dest_003"]
+        assert [r["destination"] for r in routes] == [
+            "Bicester North", "Faraway", "Bicester Village",
+        ]
+        assert [r["status"] for r in routes] == ["success", "error", "success"]
+        assert routes[1]["error_type"] == "no_route"
+        assert routes[0]["distance_m"] == 2500
+
+    @pytest.mark.anyio
+    async def test_valhalla_concurrent_overpass_limited(self):
+        """
+        Given: Four destinations and an Overpass limiter allowing one call at a time
+        When: The batch is assessed
+        Then: Valhalla requests overlap but Overpass calls never do
+        """
+        in_flight = {"valhalla": 0, "overpass": 0}
+        peak = {"valhalla": 0, "overpass": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            service = "overpass" if "overpass-api.de" in url else "valhalla"
+            in_flight[service] += 1
+            peak[service] = max(peak[service], in_flight[service])
+            await asyncio.sleep(0.01)
+            in_flight[service] -= 1
+            if service == "overpass":
+                return httpx.Response(200, json=_make_overpass_response())
+            if "/trace_attributes" in url:
+                return httpx.Response(200, json={"edges": []})
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mcp = CycleRouteMCP(
+            http_client=client,
+            overpass_limiter=ExternalRateLimiter(max_concurrent=1, min_interval=0),
+        )
+
+        result = await mcp._assess_cycle_routes_batch({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": [
+                {"name": f"Destination {i}", "lon": -1.14 - i * 0.001, "lat": 51.905}
+                for i in range(4)
+            ],
+            "merge_overpass": False,
+        })
+
+        assert result["assessed"] == 4
+        assert peak["valhalla"] > 1
+        assert peak["overpass"] == 1
+
+    @pytest.mark.anyio
+    async def test_merged_overpass_single_call(self):
+        """
+        Given: Three destinations whose routes share a corridor
+        When: The batch is assessed with merged Overpass queries
+        Then: One Overpass call is made and results match per-route queries
+        """
+        overpass_queries: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "overpass-api.de" in url:
+                overpass_queries.append(request.content.decode())
+                return httpx.Response(200, json=_make_overpass_response())
+            if "/trace_attributes" in url:
+                return httpx.Response(200, json={"edges": []})
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        arguments = {
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": [
+                {"id": f"dest_{i}", "name": f"Destination {i}", "lon": -1.145, "lat": 51.905}
+                for i in range(3)
+            ],
+        }
+
+        def make_mcp() -> CycleRouteMCP:
+            return CycleRouteMCP(
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                overpass_limiter=ExternalRateLimiter(max_concurrent=2, min_interval=0),
+            )
+
+        merged = await make_mcp()._assess_cycle_routes_batch(arguments)
+        merged_calls = len(overpass_queries)
+        separate = await make_mcp()._assess_cycle_routes_batch(
+            {**arguments, "merge_overpass": False}
+        )
+
+        assert merged_calls == 1
+        assert len(overpass_queries) - merged_calls == 3
+        assert merged["assessed"] == 3
+        assert merged["routes"][0]["score"]["score"] > 0
+        for merged_route, separate_route in zip(
+            merged["routes"], separate["routes"], strict=True
+        ):
+            assert merged_route["score"] == separate_route["score"]
+            assert merged_route["provision_breakdown"] == separate_route["provision_breakdown"]
+
+    @pytest.mark.anyio
+    @patch(
+        "src.mcp_servers.cycle_route.infrastructure.asyncio.sleep",
+        new_callable=AsyncMock,
+    )
+    async def test_merged_overpass_failure_degrades_gracefully(self, mock_sleep):
+        """A failed merged query gives every route the empty assessment stub."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "overpass" in url:
+                return httpx.Response(504, text="Gateway Timeout")
+            if "/trace_attributes" in url:
+                return httpx.Response(200, json={"edges": []})
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        mcp = CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            overpass_limiter=ExternalRateLimiter(max_concurrent=2, min_interval=0),
+        )
+
+        result = await mcp._assess_cycle_routes_batch({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": [
+                {"name": "A", "lon": -1.145, "lat": 51.905},
+                {"name": "B", "lon": -1.146, "lat": 51.906},
+            ],
+        })
+
+        assert result["assessed"] == 2
+        assert [r["score"]["score"] for r in result["routes"]] == [0, 0]
+
+    @pytest.mark.anyio
+    @patch(
+        "src.mcp_servers.cycle_route.infrastructure.asyncio.sleep",
+        new_callable=AsyncMock,
+    )
+    async def test_failed_merged_tile_falls_back_to_route_queries(self, mock_sleep):
+        """
+        Given: The merged tile query fails but per-route queries succeed
+        When: The batch is assessed
+        Then: Each route is fetched on its own and scored, and the merged
+              query was sent with the merged query HTTP timeout
+        """
+        read_timeouts: dict[str, float] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "overpass" in url:
+                query = parse_qs(request.content.decode())["data"][0]
+                kind = "merged" if f"timeout:{MERGED_QUERY_TIMEOUT}" in query else "route"
+                read_timeouts[kind] = request.extensions["timeout"]["read"]
+                if kind == "merged":
+                    return httpx.Response(504, text="Gateway Timeout")
+                return httpx.Response(200, json=_make_overpass_response())
+            if "/trace_attributes" in url:
+                return httpx.Response(200, json={"edges": []})
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        mcp = CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler), timeout=20.0),
+            overpass_limiter=ExternalRateLimiter(max_concurrent=2, min_interval=0),
+        )
+
+        result = await mcp._assess_cycle_routes_batch({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": [
+                {"name": "A", "lon": -1.145, "lat": 51.905},
+                {"name": "B", "lon": -1.146, "lat": 51.906},
+            ],
+        })
+
+        assert result["assessed"] == 2
+        assert all(r["score"]["score"] > 0 for r in result["routes"])
+        assert read_timeouts == {"merged": MERGED_QUERY_HTTP_TIMEOUT, "route": 20.0}
+
+    @pytest.mark.anyio
+    async def test_empty_destinations_rejected(self):
+        """A batch must name at least one destination."""
+        mcp = CycleRouteMCP()
+
+        with pytest.raises(ValidationError):
+            await mcp._assess_cycle_routes_batch({
+                "origin_lon": -1.15, "origin_lat": 51.9, "destinations": [],
+            })
+
+
+class TestLocalInfrastructureBackend:
+    """Route assessment against the local OSM store instead of Overpass."""
+
+    @pytest.mark.anyio
+    async def test_local_store_replaces_overpass(self, tmp_path):
+        """The local backend makes no Overpass calls and scores like Overpass data."""
+        overpass_calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "overpass" in url:
+                overpass_calls.append(url)
+                return httpx.Response(200, json=_make_overpass_response())
+            if "/trace_attributes" in url:
+                return httpx.Response(200, json={"edges": []})
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        path = tmp_path / "osm.sqlite"
+        with OSMStoreWriter(path) as writer:
+            for way in _make_overpass_response()["elements"]:
+                writer.add_way(
+                    way["id"], way["tags"], [],
+                    [(pt["lat"], pt["lon"]) for pt in way["geometry"]],
+                )
+        arguments = {
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destination_lon": -1.1450,
+            "destination_lat": 51.9050,
+        }
+
+        local = await CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            osm_store=LocalOSMStore(path),
+        )._assess_cycle_route(arguments)
+        assert overpass_calls == []
+
+        remote = await CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            overpass_limiter=ExternalRateLimiter(max_concurrent=1, min_interval=0),
+        )._assess_cycle_route(arguments)
+
+        assert local["score"] == remote["score"]
+        assert local["score"]["score"] > 0
+        assert local["provision_breakdown"] == remote["provision_breakdown"]
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError, match="Unknown infrastructure backend"):
+            CycleRouteMCP(infrastructure_backend="postgis")
+
+
+class TestPolylineGeometryFormat:
+    """Results can carry Valhalla's encoded shapes instead of GeoJSON route lines."""
+
+    ARGUMENTS = {
+        "origin_lon": -1.1534,
+        "origin_lat": 51.8997,
+        "destination_lon": -1.1450,
+        "destination_lat": 51.9050,
+        "destination_name": "Bicester North",
+    }
+
+    def _make_mcp(self, shortest_coords: list[list[float]] | None = None) -> CycleRouteMCP:
+        transport = _make_valhalla_handler(
+            shortest_response=_make_valhalla_response(
+                distance_km=2.2, duration_s=550, coords=shortest_coords
+            ),
+        )
+        return CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=transport),
+            overpass_limiter=ExternalRateLimiter(max_concurrent=1, min_interval=0),
+        )
+
+    @pytest.mark.anyio
+    async def test_polyline_result_keeps_valhalla_shapes(self):
+        shortest = [[-1.1534, 51.8997], [-1.1450, 51.9050]]
+
+        result = await self._make_mcp(shortest)._assess_cycle_route(
+            {**self.ARGUMENTS, "geometry_format": "polyline"}
+        )
+
+        assert result["status"] == "success"
+        assert "route_geojson" not in result
+        assert "shortest_route_geometry" not in result
+        assert result["route_polyline"] == _encode_polyline(DEFAULT_COORDS)
+        assert result["shortest_route_polyline"] == _encode_polyline(shortest)
+        assert result["polyline_precision"] == 6
+
+    @pytest.mark.anyio
+    async def test_expanded_polyline_result_matches_geojson_result(self):
+        shortest = [[-1.1534, 51.8997], [-1.1450, 51.9050]]
+
+        geojson = await self._make_mcp(shortest)._assess_cycle_route(self.ARGUMENTS)
+        compact = await self._make_mcp(shortest)._assess_cycle_route(
+            {**self.ARGUMENTS, "geometry_format": "polyline"}
+        )
+
+        assert expand_route_geometry(compact) == geojson
+        assert len(json.dumps(compact)) < len(json.dumps(geojson))
+
+    @pytest.mark.anyio
+    async def test_batch_polyline_format(self):
+        result = await self._make_mcp()._assess_cycle_routes_batch({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": [
+                {"id": "dest_001", "name": "Bicester North", "lon": -1.1450, "lat": 51.9050},
+                {"id": "dest_002", "name": "Bicester Village", "lon": -1.1467, "lat": 51.8899},
+            ],
+            "geometry_format": "polyline",
+        })
+
+        for route in result["routes"]:
+            assert route["route_polyline"] == _encode_polyline(DEFAULT_COORDS)
+            assert "route_geojson" not in route
+
+    @pytest.mark.anyio
+    async def test_unknown_geometry_format_rejected(self):
+        with pytest.raises(ValidationError):
+            await self._make_mcp()._assess_cycle_routes_batch({
+                "origin_lon": -1.1534,
+                "origin_lat": 51.8997,
+                "destinations": [{"name": "Bicester North", "lon": -1.145, "lat": 51.905}],
+                "geometry_format": "wkt",
+            })
+
+
+class TestOverpassResponseCache:
+    """Repeat assessments of the same corridor are answered from the Overpass cache."""
+
+    @pytest.mark.anyio
+    async def test_repeat_assessment_skips_overpass(self, tmp_path):
+        overpass_calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "overpass" in url:
+                overpass_calls.append(url)
+                return httpx.Response(200, json=_make_overpass_response())
+            if "/trace_attributes" in url:
+                return httpx.Response(200, json={"edges": []})
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        cache = OverpassCache(tmp_path)
+        arguments = {
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destination_lon": -1.1450,
+            "destination_lat": 51.9050,
+        }
+
+        results = []
+        for _ in range(2):
+            mcp = CycleRouteMCP(
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                overpass_limiter=ExternalRateLimiter(max_concurrent=1, min_interval=0),
+                overpass_cache=cache,
+            )
+            results.append(await mcp._assess_cycle_route(arguments))
+
+        # Shortest and safest routes share a geometry, so one query covers both runs
+        assert len(overpass_calls) == 1
+        assert results[0]["score"] == results[1]["score"]
+        assert cache.stats()["hits"] >= 1
+
+    def test_health_reports_overpass_cache(self, monkeypatch, tmp_path):
+        """/health includes the Overpass cache statistics when enabled."""
+        from starlette.testclient import TestClient
+
+        from src.mcp_servers.cycle_route.server import create_app
+
+        monkeypatch.setenv("OVERPASS_CACHE_DIR", str(tmp_path))
+
+        response = TestClient(create_app()).get("/health")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ok"
+        assert body["overpass_cache"]["hit_rate"] == 0.0
+        assert body["overpass_cache"]["entries"] == 0
+
+
+def _make_matrix_response(cells: list[tuple[float, float] | None]) -> dict:
+    """Create a mock sources_to_targets response from (minutes, km) per target."""
+    return {
+        "sources_to_targets": [[
+            {
+                "from_index": 0,
+                "to_index": i,
+                "time": cell[0] * 60 if cell else None,
+                "distance": cell[1] if cell else None,
+            }
+            for i, cell in enumerate(cells)
+        ]],
+    }
+
+
+class TestScreenDestinations:
+    """
+    Verifies [cycle-route-assessment:CycleRouteMCP/TS-08] - screen_destinations
+    shortlists destinations by cycle time from one Valhalla matrix request.
+    """
+
+    DESTINATIONS = [
+        {"id": "far", "name": "Oxford", "lon": -1.2578, "lat": 51.7520},
+        {"id": "near", "name": "Bicester North", "lon": -1.1450, "lat": 51.9050},
+        {"id": "island", "name": "Nowhere", "lon": -1.0, "lat": 52.0},
+        {"id": "mid", "name": "Bicester Village", "lon": -1.1480, "lat": 51.8930},
+    ]
+
+    def _mcp(self, handler) -> CycleRouteMCP:
+        return CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    @pytest.mark.anyio
+    async def test_one_matrix_request_ranks_and_screens(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200, json=_make_matrix_response([(75.0, 21.3), (6.5, 1.9), None, (9.2, 2.6)])
+            )
+
+        result = await self._mcp(handler)._screen_destinations({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": self.DESTINATIONS,
+        })
+
+        assert len(requests) == 1
+        assert requests[0].url.path == "/sources_to_targets"
+        body = json.loads(requests[0].content)
+        assert len(body["sources"]) == 1
+        assert len(body["targets"]) == 4
+        assert body["costing"] == "bicycle"
+
+        assert result["status"] == "success"
+        assert [d["destination_id"] for d in result["destinations"]] == [
+            "near", "mid", "far", "island",
+        ]
+        assert [d["screen_reason"] for d in result["destinations"]] == [
+            None, None, "too_far", "unreachable",
+        ]
+        assert result["destinations"][0]["cycle_minutes"] == 6.5
+        assert result["destinations"][0]["distance_m"] == 1900
+        assert result["destinations"][0]["index"] == 1
+        assert (result["shortlisted"], result["screened_out"]) == (2, 2)
+
+    @pytest.mark.anyio
+    async def test_max_shortlist_keeps_nearest(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json=_make_matrix_response([(25.0, 7.0), (6.5, 1.9), (12.0, 3.1), (9.2, 2.6)])
+            )
+
+        result = await self._mcp(handler)._screen_destinations({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": self.DESTINATIONS,
+            "max_shortlist": 2,
+        })
+
+        shortlisted = [d["destination_id"] for d in result["destinations"] if d["shortlisted"]]
+        assert shortlisted == ["near", "mid"]
+        assert result["destinations"][2]["screen_reason"] == "beyond_shortlist"
+
+    @pytest.mark.anyio
+    async def test_matrix_failure_is_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"error": "Exceeded max locations"})
+
+        result = await self._mcp(handler)._screen_destinations({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": self.DESTINATIONS,
+        })
+
+        assert result["status"] == "error"
+        assert result["error_type"] == "matrix_unavailable"
+
+
+# Shortest route sharing the safest route's corridor but cutting the last corner
+SHORTEST_COORDS = [
+    [-1.1534, 51.8997],
+    [-1.1510, 51.9010],
+    [-1.1465, 51.9040],
+    [-1.1450, 51.9050],
+]
+
+
+class TestShortestRouteScoring:
+    """The shortest route is scored from the safest route's data when its ways are covered."""
+
+    def _handler(self, shortest_way_ids: list[int], calls: list[str], trace_bodies: list[dict]):
+        safest = _make_valhalla_response(distance_km=2.5)
+        shortest = _make_valhalla_response(distance_km=2.0, duration_s=480, coords=SHORTEST_COORDS)
+        way_ids_by_shape = {
+            safest["trip"]["legs"][0]["shape"]: [100, 101, 102],
+            shortest["trip"]["legs"][0]["shape"]: shortest_way_ids,
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "overpass" in url:
+                calls.append("overpass")
+                return httpx.Response(200, json=_make_overpass_response())
+            body = json.loads(request.content)
+            if "/trace_attributes" in url:
+                calls.append("trace_attributes")
+                trace_bodies.append(body)
+                edges = [{"way_id": i} for i in way_ids_by_shape[body["encoded_polyline"]]]
+                return httpx.Response(200, json={"edges": edges})
+            calls.append("route")
+            if body["costing_options"]["bicycle"].get("shortest"):
+                return httpx.Response(200, json=shortest)
+            return httpx.Response(200, json=safest)
+
+        return handler
+
+    def _mcp(self, handler) -> CycleRouteMCP:
+        return CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            overpass_limiter=ExternalRateLimiter(max_concurrent=1, min_interval=0),
+        )
+
+    @pytest.mark.anyio
+    async def test_covered_shortest_route_scored_without_extra_query(self):
+        calls: list[str] = []
+        trace_bodies: list[dict] = []
+        mcp = self._mcp(self._handler([100, 102], calls, trace_bodies))
+
+        result = await mcp._assess_cycle_route({
+            "origin_lon": -1.1534, "origin_lat": 51.8997,
+            "destination_lon": -1.1450, "destination_lat": 51.9050,
+        })
+
+        assert result["same_route"] is False
+        assert 0 <= result["shortest_route_score"]["score"] <= 100
+        assert result["shortest_route_provision_breakdown"]
+        assert calls.count("overpass") == 1
+        # One trace_attributes per route, each posting the encoded shape
+        assert calls.count("trace_attributes") == 2
+        assert all("encoded_polyline" in body and "shape" not in body for body in trace_bodies)
+
+    @pytest.mark.anyio
+    async def test_uncovered_shortest_route_not_scored(self):
+        calls: list[str] = []
+        mcp = self._mcp(self._handler([100, 555], calls, []))
+
+        result = await mcp._assess_cycle_route({
+            "origin_lon": -1.1534, "origin_lat": 51.8997,
+            "destination_lon": -1.1450, "destination_lat": 51.9050,
+        })
+
+        assert "shortest_route_score" not in result
+        assert calls.count("overpass") == 1
+
+    @pytest.mark.anyio
+    async def test_merged_batch_scores_shortest_from_store(self):
+        calls: list[str] = []
+        mcp = self._mcp(self._handler([101, 102], calls, []))
+
+        result = await mcp._assess_cycle_routes_batch({
+            "origin_lon": -1.1534,
+            "origin_lat": 51.8997,
+            "destinations": [{"id": "north", "name": "Bicester North", "lon": -1.1450, "lat": 51.9050}],
+        })
+
+        assert "shortest_route_score" in result["routes"][0]
+
+
+class TestValhallaClient:
+    """Valhalla requests use a pooled client and cache way IDs per route shape."""
+
+    def test_dedicated_pool_by_default(self):
+        mcp = CycleRouteMCP()
+
+        assert mcp.valhalla_http is not mcp.http
+        assert mcp.valhalla_http.timeout.read == VALHALLA_TIMEOUT_SECONDS
+
+    def test_shares_injected_client(self):
+        client = httpx.AsyncClient()
+
+        assert CycleRouteMCP(http_client=client).valhalla_http is client
+
+    @pytest.mark.anyio
+    async def test_way_ids_cached_per_shape(self):
+        trace_calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "/trace_attributes" in url:
+                trace_calls.append(url)
+                return httpx.Response(200, json={"edges": [{"way_id": 100}]})
+            if "overpass" in url:
+                return httpx.Response(200, json=_make_overpass_response())
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        mcp = CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            overpass_limiter=ExternalRateLimiter(max_concurrent=1, min_interval=0),
+        )
+        arguments = {
+            "origin_lon": -1.1534, "origin_lat": 51.8997,
+            "destination_lon": -1.1450, "destination_lat": 51.9050,
+        }
+
+        await mcp._assess_cycle_route(arguments)
+        await mcp._assess_cycle_route(arguments)
+
+        # Shortest and safest share a shape: one request, then cached
+        assert len(trace_calls) == 1
+
+    @pytest.mark.anyio
+    async def test_failed_way_id_lookup_not_cached(self):
+        trace_calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            trace_calls.append(str(request.url))
+            return httpx.Response(500)
+
+        mcp = CycleRouteMCP(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        shape = _encode_polyline(DEFAULT_COORDS)
+
+        assert await mcp._get_way_ids(shape) is None
+        assert await mcp._get_way_ids(shape) is None
+        assert len(trace_calls) == 2
+
+
+class TestRouteResultCache:
+    """Whole assessments are reused for nearby origins until the data version changes."""
+
+    ARGUMENTS = {
+        "origin_lon": -1.1534,
+        "origin_lat": 51.8997,
+        "destination_lon": -1.1450,
+        "destination_lat": 51.9050,
+        "destination_name": "Bicester North",
+    }
+
+    def _handler(self, calls: list[str], tileset: dict[str, int | None]):
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if "overpass" in url:
+                calls.append("overpass")
+                return httpx.Response(200, json=_make_overpass_response())
+            if url.endswith("/status"):
+                if tileset["value"] is None:
+                    return httpx.Response(503)
+                return httpx.Response(200, json={"tileset_last_modified": tileset["value"]})
+            if "/trace_attributes" in url:
+                calls.append("trace_attributes")
+                return httpx.Response(200, json={"edges": []})
+            calls.append("route")
+            return httpx.Response(200, json=_make_valhalla_response())
+
+        return handler
+
+    def _mcp(self, handler, cache: RouteResultCache) -> CycleRouteMCP:
+        return CycleRouteMCP(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            overpass_limiter=ExternalRateLimiter(max_concurrent=1, min_interval=0),
+            route_cache=cache,
+        )
+
+    @pytest.mark.anyio
+    async def test_nearby_origin_served_from_cache(self, tmp_path):
+        """A second site a few metres away reuses the result without any requests."""
+        calls: list[str] = []
+        handler = self._handler(calls, {"value": 1700000000})
+        cache = RouteResultCache(tmp_path, cell_m=1000)
+
+        first = await self._mcp(handler, cache)._assess_cycle_route(self.ARGUMENTS)
+        calls.clear()
+        nearby = {**self.ARGUMENTS, "origin_lat": 51.89975, "destination_name": "Station"}
+        second = await self._mcp(handler, cache)._assess_cycle_route(nearby)
+
+        assert calls == []
+        assert second["destination"] == "Station"
+        assert second["score"] == first["score"]
+        assert second["route_geojson"] == first["route_geojson"]
+        assert second["shortest_route_geometry"] == first["shortest_route_geometry"]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.anyio
+    async def test_cached_result_in_polyline_format(self, tmp_path):
+        calls: list[str] = []
+        handler = self._handler(calls, {"value": 1700000000})
+        cache = RouteResultCache(tmp_path)
+
+        await self._mcp(handler, cache)._assess_cycle_route(self.ARGUMENTS)
+        result = await self._mcp(handler, cache)._assess_cycle_route(
+            {**self.ARGUMENTS, "geometry_format": "polyline"}
+        )
+
+        assert "route_geojson" not in result
+        assert result["route_polyline"] == _make_valhalla_response()["trip"]["legs"][0]["shape"]
+
+    @pytest.mark.anyio
+    async def test_tileset_refresh_invalidates(self, tmp_path):
+        calls: list[str] = []
+        tileset = {"value": 1700000000}
+        handler = self._handler(calls, tileset)
+        cache = RouteResultCache(tmp_path)
+
+        await self._mcp(handler, cache)._assess_cycle_route(self.ARGUMENTS)
+        tileset["value"] = 1800000000
+        calls.clear()
+        await self._mcp(handler, cache)._assess_cycle_route(self.ARGUMENTS)
+
+        assert calls.count("route") == 2
+        assert cache.misses == 2
+
+    @pytest.mark.anyio
+    async def test_unknown_data_version_bypasses_cache(self, tmp_path):
+        calls: list[str] = []
+        handler = self._handler(calls, {"value": None})
+        cache = RouteResultCache(tmp_path)
+
+        for _ in range(2):
+            result = await self._mcp(handler, cache)._assess_cycle_route(self.ARGUMENTS)
+            assert result["status"] == "success"
+
+        assert calls.count("route") == 4
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.anyio
+    async def test_merged_batch_plans_only_misses(self, tmp_path):
+        calls: list[str] = []
+        handler = self._handler(calls, {"value": 1700000000})
+        cache = RouteResultCache(tmp_path)
+        destinations = [
+            {"id": "bicester_north", "name": "Bicester North", "lon": -1.1450, "lat": 51.9050},
+            {"id": "village", "name": "Bicester Village", "lon": -1.1480, "lat": 51.8930},
+        ]
+        origin = {"origin_lon": -1.1534, "origin_lat": 51.8997}
+
+        mcp = self._mcp(handler, cache)
+        await mcp._assess_cycle_routes_batch({**origin, "destinations": destinations[:1]})
+        calls.clear()
+        result = await mcp._assess_cycle_routes_batch({**origin, "destinations": destinations})
+
+        # Only the new destination is routed
+        assert calls.count("route") == 2
+        assert [r["destination_id"] for r in result["routes"]] == ["bicester_north", "village"]
+        assert result["assessed"] == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_health_reports_route_cache(self, monkeypatch, tmp_path):
+        from starlette.testclient import TestClient
+
+        from src.mcp_servers.cycle_route.server import create_app
+
+        monkeypatch.setenv("ROUTE_CACHE_DIR", str(tmp_path))
+
+        body = TestClient(create_app()).get("/health").json()
+
+        assert body["route_cache"]["entries"] == 0
+        assert body["route_cache"]["cell_m"] == RouteResultCache.DEFAULT_CELL_M
+
+
 # =============================================================================
 # MCP tool listing
 # =============================================================================
@@ -826,6 +1632,22 @@ class TestRequestTraceAttributes:
         result = await mcp._request_trace_attributes(DEFAULT_COORDS)
         assert result == {300}
 
+    @pytest.mark.anyio
+    async def test_posts_encoded_polyline(self):
+        """An encoded shape is posted as encoded_polyline rather than a point list."""
+        captured = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured.append(json.loads(request.content))
+            return httpx.Response(200, json=_make_trace_attributes_response([{"way_id": 100}]))
+
+        mcp = CycleRouteMCP(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        shape = _encode_polyline(DEFAULT_COORDS)
+
+        assert await mcp._request_trace_attributes(shape) == {100}
+        assert captured[0]["encoded_polyline"] == shape
+        assert "shape" not in captured[0]
+
     @pytest.mark.anyio
     async def test_sends_correct_request_body(self):
         """Sends correct shape, costing, and filters to trace_attributes."""
@@ -0,0 +1,68 @@
+"""
+Tests for the grid spatial index and distance helpers.
+
+Verifies [cycle-route-assessment:FR-002] - Route infrastructure analysis (spatial lookups)
+"""
+
+import pytest
+
+from src.mcp_servers.cycle_route.spatial_index import (
+    GridIndex,
+    bounding_box,
+    distance_m,
+    point_segment_distance_m,
+    polyline_distance_m,
+)
+
+
+class TestDistances:
+    def test_distance_one_millidegree_lat(self):
+        assert distance_m(51.9, -1.15, 51.901, -1.15) == pytest.approx(111.2, abs=0.5)
+
+    def test_point_segment_uses_perpendicular(self):
+        a = {"lat": 51.9, "lon": -1.16}
+        b = {"lat": 51.9, "lon": -1.14}
+        # 0.0001 deg north of the middle of an east-west segment
+        assert point_segment_distance_m(51.9001, -1.15, a, b) == pytest.approx(11.1, abs=0.2)
+
+    def test_point_segment_clamps_to_end(self):
+        a = {"lat": 51.9, "lon": -1.16}
+        b = {"lat": 51.9, "lon": -1.15}
+        assert point_segment_distance_m(51.9, -1.14, a, b) == pytest.approx(
+            distance_m(51.9, -1.14, 51.9, -1.15)
+        )
+
+    def test_polyline_distance_side_by_side(self):
+        road = [{"lat": 51.9, "lon": -1.16}, {"lat": 51.9, "lon": -1.14}]
+        # Cycleway along the middle stretch only
+        path = [{"lat": 51.9002, "lon": -1.155}, {"lat": 51.9002, "lon": -1.145}]
+        assert polyline_distance_m(road, path) == pytest.approx(22.2, abs=0.3)
+
+    def test_bounding_box(self):
+        points = [{"lat": 51.9, "lon": -1.1}, {"lat": 51.8, "lon": -1.2}]
+        assert bounding_box(points) == (51.8, -1.2, 51.9, -1.1)
+        assert bounding_box([]) is None
+
+
+class TestGridIndex:
+    def test_query_point_finds_neighbours_only(self):
+        index = GridIndex(0.0005)
+        index.insert_point(0, 51.9, -1.15)
+        index.insert_point(1, 51.95, -1.15)
+
+        assert index.query_point(51.90001, -1.15, 10) == {0}
+        assert index.query_point(51.92, -1.15, 10) == set()
+
+    def test_query_across_cell_boundary(self):
+        """Padding reaches items just over a cell edge."""
+        index = GridIndex(0.001)
+        index.insert_point(7, 51.9010001, -1.15)
+
+        assert 7 in index.query_point(51.9009999, -1.15, 1)
+
+    def test_bbox_item_found_from_any_covered_cell(self):
+        index = GridIndex(0.001)
+        index.insert(3, 51.900, -1.160, 51.900, -1.140)
+
+        for lon in (-1.1595, -1.15, -1.1405):
+            assert index.query_point(51.9, lon, 5) == {3}
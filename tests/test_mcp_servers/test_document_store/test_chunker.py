@@ -215,6 +215,75 @@ class TestIncludePageContext:
                 assert pn in [1, 2, 3]
 
 
+class TestStreamingChunkPages:
+    """Tests for iter_chunk_pages() streaming chunking."""
+
+    def test_streaming_matches_page_tracking(self, small_chunker: TextChunker) -> None:
+        """
+        Given: Many pages fed through a generator
+        When: Call iter_chunk_pages()
+        Then: Chunks have sequential indices and only valid page numbers
+        """
+        pages = [(n, f"Paragraph on page {n}. " * 30) for n in range(1, 41)]
+
+        chunks = list(small_chunker.iter_chunk_pages(iter(pages)))
+
+        assert len(chunks) > 40
+        assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+        for chunk in chunks:
+            assert chunk.page_numbers
+            assert all(1 <= pn <= 40 for pn in chunk.page_numbers)
+        # Every page contributes to at least one chunk
+        seen = {pn for c in chunks for pn in c.page_numbers}
+        assert seen == set(range(1, 41))
+
+    def test_streaming_yields_before_input_exhausted(self, small_chunker: TextChunker) -> None:
+        """
+        Given: A page generator that records how far it has been consumed
+        When: The first chunk is taken from iter_chunk_pages()
+        Then: Only a bounded window of pages has been read
+        """
+        consumed: list[int] = []
+
+        def pages():
+            for n in range(1, 201):
+                consumed.append(n)
+                yield n, f"Sentence number {n} about cycle parking. " * 20
+
+        stream = small_chunker.iter_chunk_pages(pages())
+        first = next(stream)
+
+        assert first.chunk_index == 0
+        assert first.page_numbers == [1]
+        assert len(consumed) < 200
+
+    def test_streaming_covers_same_text_as_chunk_pages(self, small_chunker: TextChunker) -> None:
+        """
+        Given: The same pages
+        When: Chunked with chunk_pages() and iter_chunk_pages()
+        Then: Every word of the document appears in the streamed chunks
+        """
+        pages = [(n, " ".join(f"w{n}_{i}" for i in range(150))) for n in range(1, 11)]
+
+        streamed = list(small_chunker.iter_chunk_pages(pages))
+        streamed_words = {w for c in streamed for w in c.text.split()}
+
+        assert streamed_words == {w for _, text in pages for w in text.split()}
+
+    def test_streaming_skips_blank_pages(self, small_chunker: TextChunker) -> None:
+        """
+        Given: Pages including blank ones
+        When: Call iter_chunk_pages()
+        Then: Blank pages are never attributed to chunks
+        """
+        pages = [(1, "Real content here."), (2, "   "), (3, "More content.")]
+
+        chunks = list(small_chunker.iter_chunk_pages(pages))
+
+        assert all(2 not in c.page_numbers for c in chunks)
+        assert list(small_chunker.iter_chunk_pages([(1, "  ")])) == []
+
+
 class TestTextChunkDataclass:
     """Tests for TextChunk dataclass."""
 
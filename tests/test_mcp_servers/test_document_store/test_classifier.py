@@ -182,6 +182,31 @@ class TestClassifyByContent:
         assert result.document_type == DocumentType.PLANNING_STATEMENT
 
 
+class TestCombinedMatching:
+    """Tests that single-pass matching keeps per-pattern semantics."""
+
+    def test_filename_pattern_priority_preserved(self, classifier: DocumentClassifier) -> None:
+        """The earliest pattern in FILENAME_PATTERNS wins, not the leftmost match."""
+        result = classifier.classify("Site_Plan_and_Transport_Assessment.pdf")
+
+        assert result.document_type == DocumentType.TRANSPORT_ASSESSMENT
+        assert result.matched_pattern == r"transport[_\s-]*(assessment|statement)"
+
+    def test_overlapping_keywords_all_counted(self, classifier: DocumentClassifier) -> None:
+        """Keywords that overlap in the text are each counted."""
+        result = classifier.classify("Report.pdf", content="Background noise levels were measured.")
+
+        assert result.document_type == DocumentType.NOISE_ASSESSMENT
+        assert result.matched_pattern == "2 keyword matches"
+
+    def test_content_beyond_sample_ignored(self, classifier: DocumentClassifier) -> None:
+        """Only the first CONTENT_SAMPLE_CHARS characters are scanned."""
+        padding = "x" * classifier.CONTENT_SAMPLE_CHARS
+        result = classifier.classify("Report.pdf", content=padding + " flood zone drainage")
+
+        assert result.document_type == DocumentType.OTHER
+
+
 class TestClassifyFallback:
     """Tests for fallback classification."""
 
@@ -4,6 +4,12 @@ Tests for EmbeddingService.
 Implements test scenarios from [document-processing:EmbeddingService/TS-01] through [TS-06]
 """
 
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
 
@@ -210,6 +216,35 @@ class TestModelLoading:
         """Test embedding dimension property."""
         assert service.embedding_dim == 384
 
+    def test_concurrent_first_use_loads_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Given: Service created without model
+        When: Several threads embed at the same time
+        Then: The model is loaded once and shared
+        """
+        loads: list[str] = []
+        start = threading.Barrier(4)
+
+        def slow_model(name: str) -> MockEmbeddingModel:
+            loads.append(name)
+            time.sleep(0.05)
+            return MockEmbeddingModel()
+
+        monkeypatch.setitem(
+            sys.modules, "sentence_transformers", SimpleNamespace(SentenceTransformer=slow_model)
+        )
+        service = EmbeddingService()
+
+        def embed() -> list[float]:
+            start.wait()
+            return service.embed("cycle lane width")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: embed(), range(4)))
+
+        assert loads == [EmbeddingService.MODEL_NAME]
+        assert all(result == results[0] for result in results)
+
 
 class TestMockEmbeddingModel:
     """Tests for the MockEmbeddingModel itself."""
@@ -0,0 +1,143 @@
+"""
+Tests for ExtractionCache and cached extraction in DocumentProcessor.
+
+Implements [document-processing:FR-001] - PDF text extraction (cached re-use)
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import fitz  # PyMuPDF
+import pytest
+
+from src.mcp_servers.document_store.extraction_cache import ExtractionCache
+from src.mcp_servers.document_store.processor import DocumentProcessor, PageExtraction
+
+
+def _page(number: int, text: str = "Cycle parking") -> PageExtraction:
+    return PageExtraction(
+        page_number=number,
+        text=f"{text} {number}",
+        extraction_method="text_layer",
+        char_count=len(text) + 2,
+        word_count=3,
+        image_ratio=0.25,
+    )
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ExtractionCache:
+    """Create an ExtractionCache in a temporary directory."""
+    return ExtractionCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def sample_pdf(tmp_path: Path) -> Path:
+    """Create a three-page PDF with a text layer."""
+    pdf_path = tmp_path / "transport_assessment.pdf"
+    doc = fitz.open()
+    for number in range(1, 4):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {number}: Cycle parking provision.", fontsize=12)
+    doc.save(str(pdf_path))
+    doc.close()
+    return pdf_path
+
+
+class TestExtractionCache:
+    """Tests for the on-disk cache format."""
+
+    def test_roundtrip_across_row_groups(self, cache: ExtractionCache) -> None:
+        """Pages written through are read back unchanged and in order."""
+        cache.ROW_GROUP_SIZE = 4
+        pages = [_page(n) for n in range(1, 11)]
+
+        passed = list(cache.write_through("ab" * 32, "v1", iter(pages)))
+
+        assert passed == pages
+        assert cache.contains("ab" * 32, "v1")
+        cached = cache.iter_pages("ab" * 32, "v1")
+        assert cached is not None
+        assert list(cached) == pages
+
+    def test_miss_returns_none(self, cache: ExtractionCache) -> None:
+        """Unknown hashes and fingerprints miss."""
+        list(cache.write_through("cd" * 32, "v1", [_page(1)]))
+
+        assert cache.iter_pages("ef" * 32, "v1") is None
+        assert cache.iter_pages("cd" * 32, "v2") is None
+        assert cache.stats()["misses"] == 2
+
+    def test_partial_consumption_not_committed(self, cache: ExtractionCache) -> None:
+        """An entry is only written when every page has been consumed."""
+        stream = cache.write_through("12" * 32, "v1", iter([_page(n) for n in range(1, 5)]))
+        next(stream)
+        stream.close()
+
+        assert not cache.contains("12" * 32, "v1")
+        assert list((cache.cache_dir / "12").iterdir()) == []
+
+    def test_failed_extraction_not_committed(self, cache: ExtractionCache) -> None:
+        """An extraction error leaves no entry behind."""
+
+        def failing_pages():
+            yield _page(1)
+            raise RuntimeError("page 2 is corrupt")
+
+        with pytest.raises(RuntimeError):
+            list(cache.write_through("34" * 32, "v1", failing_pages()))
+
+        assert not cache.contains("34" * 32, "v1")
+
+    def test_from_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Cache is configured by EXTRACTION_CACHE_DIR and disabled when unset."""
+        monkeypatch.delenv("EXTRACTION_CACHE_DIR", raising=False)
+        assert ExtractionCache.from_env() is None
+
+        monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(tmp_path))
+        cache = ExtractionCache.from_env()
+        assert cache is not None
+        assert cache.cache_dir == tmp_path
+
+
+class TestCachedExtraction:
+    """Tests for DocumentProcessor using the extraction cache."""
+
+    def test_second_extraction_served_from_cache(
+        self, cache: ExtractionCache, sample_pdf: Path
+    ) -> None:
+        """Re-extracting a known file does not open the PDF again."""
+        processor = DocumentProcessor(enable_ocr=False, extraction_cache=cache)
+        file_hash = cache.hash_file(sample_pdf)
+
+        first = processor.extract_text(sample_pdf, file_hash=file_hash)
+
+        with patch("src.mcp_servers.document_store.processor.fitz.open") as mock_open:
+            second = list(processor.iter_pages(sample_pdf, file_hash=file_hash))
+
+        mock_open.assert_not_called()
+        assert second == first.pages
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_hash_computed_when_not_supplied(
+        self, cache: ExtractionCache, sample_pdf: Path
+    ) -> None:
+        """Callers without a hash still populate the cache."""
+        processor = DocumentProcessor(enable_ocr=False, extraction_cache=cache)
+
+        processor.extract_text(sample_pdf)
+
+        fingerprint = processor.extraction_fingerprint(sample_pdf)
+        assert cache.contains(cache.hash_file(sample_pdf), fingerprint)
+
+    def test_fingerprint_changes_with_settings(self, sample_pdf: Path) -> None:
+        """Processor version and image threshold are part of the cache key."""
+        processor = DocumentProcessor(enable_ocr=False)
+        baseline = processor.extraction_fingerprint(sample_pdf)
+
+        processor.IMAGE_HEAVY_THRESHOLD = 0.5
+        assert processor.extraction_fingerprint(sample_pdf) != baseline
+
+        processor.IMAGE_HEAVY_THRESHOLD = DocumentProcessor.IMAGE_HEAVY_THRESHOLD
+        processor.EXTRACTION_VERSION = DocumentProcessor.EXTRACTION_VERSION + 1
+        assert processor.extraction_fingerprint(sample_pdf) != baseline
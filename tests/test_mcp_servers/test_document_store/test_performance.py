@@ -12,6 +12,12 @@ from pathlib import Path
 import fitz
 import pytest
 
+from src.mcp_servers.document_store.classifier import (
+    CONTENT_PATTERNS,
+    FILENAME_PATTERNS,
+    DocumentClassifier,
+    DocumentType,
+)
 from src.mcp_servers.document_store.embeddings import EmbeddingService, MockEmbeddingModel
 from src.mcp_servers.document_store.server import (
     DocumentStoreMCP,
@@ -215,6 +221,65 @@ class TestIngestionPerformance:
         assert elapsed < 10, f"Ingestion took {elapsed:.1f}s, expected <10s"
 
 
+def _legacy_classify(filename: str, content: str) -> str:
+    """Per-pattern classifier used before single-pass matching, for comparison."""
+    for pattern, doc_type in FILENAME_PATTERNS:
+        if pattern.search(filename):
+            return doc_type
+    content_lower = content.lower()
+    best_type, best_score = DocumentType.OTHER, 0
+    for keywords, doc_type, min_matches in CONTENT_PATTERNS:
+        matches = sum(1 for kw in keywords if kw.lower() in content_lower)
+        if matches >= min_matches and matches > best_score:
+            best_type, best_score = doc_type, matches
+    return best_type
+
+
+class TestClassificationPerformance:
+    """Benchmark of single-pass classification against per-pattern scanning."""
+
+    SAMPLES = [
+        ("Document_001.pdf", "Trip generation has been calculated using TRICS data. Cycle parking is provided."),
+        ("Report.pdf", "The site is within Flood Zone 1. Surface water drainage will use SuDS."),
+        ("Survey.pdf", "A habitat survey found no protected species."),
+        ("Statement.pdf", "The Local Plan and the NPPF support the development plan."),
+        ("Appendix_B.pdf", "Background noise levels and sound insulation were assessed."),
+        ("Random.pdf", "This document contains no matching keywords at all."),
+        ("Site_Plan_and_Transport_Assessment.pdf", ""),
+        ("EIA_Chapter_3.pdf", ""),
+    ]
+
+    def test_matches_legacy_classifier(self) -> None:
+        """Single-pass classification agrees with per-pattern scanning."""
+        classifier = DocumentClassifier()
+        for filename, content in self.SAMPLES:
+            result = classifier.classify(filename, content=content)
+            assert result.document_type == _legacy_classify(filename, content), filename
+
+    def test_large_document_classification_time(self) -> None:
+        """A multi-megabyte document is classified much faster than by full scans."""
+        classifier = DocumentClassifier()
+        opening = "Transport Assessment. Trip generation and junction capacity were modelled. "
+        body = "The proposed development provides new homes and landscaping. " * 40_000
+        content = opening + body
+
+        start = time.perf_counter()
+        legacy = _legacy_classify("Appendix.pdf", content)
+        legacy_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = classifier.classify("Appendix.pdf", content=content)
+        elapsed = time.perf_counter() - start
+
+        print("\nClassification performance:")
+        print(f"  Content: {len(content) / 1e6:.1f}M chars")
+        print(f"  Per-pattern: {legacy_elapsed * 1000:.1f}ms")
+        print(f"  Single-pass: {elapsed * 1000:.1f}ms")
+
+        assert result.document_type == legacy == DocumentType.TRANSPORT_ASSESSMENT
+        assert elapsed < legacy_elapsed
+
+
 @pytest.mark.integration
 class TestScalability:
     """Scalability tests for document storage."""
@@ -224,6 +224,253 @@ class TestIngestDocument:
         assert result["error_type"] == "no_content"
 
 
+class TestStreamingIngest:
+    """Tests for batched, streaming ingestion of large documents."""
+
+    @pytest.fixture
+    def long_pdf(self, tmp_path: Path) -> Path:
+        """Create a PDF with many text-heavy pages."""
+        pdf_path = tmp_path / "long_document.pdf"
+        doc = fitz.open()
+        for n in range(1, 31):
+            page = doc.new_page()
+            text = "\n".join(
+                f"Page {n} line {i}: cycle track widths and junction design." for i in range(40)
+            )
+            page.insert_text((36, 36), text, fontsize=8)
+        doc.save(str(pdf_path))
+        doc.close()
+        return pdf_path
+
+    @pytest.mark.asyncio
+    async def test_chunks_stored_in_batches(
+        self, mcp_server: DocumentStoreMCP, long_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Given: A long PDF and a small ingest batch size
+        When: Call ingest_document
+        Then: Chunks are upserted in several bounded batches with consistent metadata
+        """
+        from src.mcp_servers.document_store.server import IngestDocumentInput
+
+        monkeypatch.setattr(mcp_server, "INGEST_BATCH_SIZE", 8)
+        chroma = mcp_server._get_chroma_client()
+        batch_sizes: list[int] = []
+        original_upsert = chroma.upsert_chunks
+
+        def recording_upsert(chunks):
+            batch_sizes.append(len(chunks))
+            original_upsert(chunks)
+
+        monkeypatch.setattr(chroma, "upsert_chunks", recording_upsert)
+
+        result = await mcp_server._ingest_document(
+            IngestDocumentInput(file_path=str(long_pdf), application_ref="25/00001/F")
+        )
+
+        assert result["status"] == "success"
+        assert len(batch_sizes) > 1
+        assert sum(batch_sizes) == result["chunks_created"]
+
+        chunks = chroma.get_document_chunks(result["document_id"])
+        assert len(chunks) == result["chunks_created"]
+        assert [c.metadata["chunk_index"] for c in chunks] == list(range(len(chunks)))
+        assert all(c.metadata["total_chunks"] == len(chunks) for c in chunks)
+        assert all(c.metadata["extraction_method"] == "text_layer" for c in chunks)
+
+    @pytest.mark.asyncio
+    async def test_classification_uses_bounded_sample(
+        self, mcp_server: DocumentStoreMCP, long_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Given: No document_type and a small classification sample limit
+        When: Call ingest_document
+        Then: The classifier only sees the bounded sample
+        """
+        from src.mcp_servers.document_store.server import IngestDocumentInput
+
+        monkeypatch.setattr(mcp_server, "CLASSIFICATION_SAMPLE_CHARS", 1000)
+        seen_lengths: list[int] = []
+        classifier = mcp_server._get_classifier()
+        original_classify = classifier.classify
+
+        def recording_classify(filename, content=None):
+            seen_lengths.append(len(content or ""))
+            return original_classify(filename, content=content)
+
+        monkeypatch.setattr(classifier, "classify", recording_classify)
+
+        result = await mcp_server._ingest_document(
+            IngestDocumentInput(file_path=str(long_pdf), application_ref="25/00002/F")
+        )
+
+        assert result["status"] == "success"
+        assert seen_lengths and max(seen_lengths) <= 1000
+
+    @pytest.mark.asyncio
+    async def test_partial_chunks_removed_on_failure(
+        self, mcp_server: DocumentStoreMCP, long_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Given: Extraction fails part-way through a document
+        When: Call ingest_document
+        Then: extraction_failed is returned and no chunks are left behind
+        """
+        from src.mcp_servers.document_store.processor import ExtractionError
+        from src.mcp_servers.document_store.server import IngestDocumentInput
+
+        monkeypatch.setattr(mcp_server, "INGEST_BATCH_SIZE", 4)
+        processor = mcp_server._get_processor()
+        original_iter = processor.iter_pages
+
+        def failing_iter(file_path, file_hash=None):
+            for page in original_iter(file_path, file_hash=file_hash):
+                if page.page_number == 20:
+                    raise ExtractionError("Error extracting page 20: boom")
+                yield page
+
+        monkeypatch.setattr(processor, "iter_pages", failing_iter)
+
+        result = await mcp_server._ingest_document(
+            IngestDocumentInput(
+                file_path=str(long_pdf),
+                application_ref="25/00003/F",
+                document_type="transport_assessment",
+            )
+        )
+
+        assert result["status"] == "error"
+        assert result["error_type"] == "extraction_failed"
+        file_hash = ChromaClient.compute_file_hash(long_pdf)
+        collection = mcp_server._get_chroma_client()._get_collection()
+        assert collection.get(where={"file_hash": file_hash})["ids"] == []
+
+
+class TestCrossApplicationDeduplication:
+    """Tests for sharing content-addressed chunks across applications."""
+
+    @pytest.mark.asyncio
+    async def test_identical_document_linked_not_reingested(
+        self, mcp_server: DocumentStoreMCP, sample_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Given: A PDF already ingested for one application
+        When: The same file is ingested for another application
+        Then: Existing chunks are linked without extraction or embedding
+        """
+        from src.mcp_servers.document_store.server import IngestDocumentInput
+
+        first = await mcp_server._ingest_document(
+            IngestDocumentInput(file_path=str(sample_pdf), application_ref="25/00001/F")
+        )
+        assert first["status"] == "success"
+
+        processor = mcp_server._get_processor()
+
+        def fail_iter(file_path, file_hash=None):
+            raise AssertionError("content should not be re-extracted")
+
+        monkeypatch.setattr(processor, "iter_pages", fail_iter)
+        second = await mcp_server._ingest_document(
+            IngestDocumentInput(file_path=str(sample_pdf), application_ref="25/00002/REM")
+        )
+
+        assert second["status"] == "success"
+        assert second["chunks_created"] == 0
+        assert second["chunks_linked"] == first["chunks_created"]
+        assert second["deduplicated_from"] == first["document_id"]
+        assert second["document_id"] != first["document_id"]
+
+        chroma = mcp_server._get_chroma_client()
+        assert chroma.get_collection_stats()["total_chunks"] == first["chunks_created"]
+        chunks = chroma.get_document_chunks(second["document_id"])
+        assert len(chunks) == first["chunks_created"]
+        assert all(c.metadata["application_ref"] == "25/00002/REM" for c in chunks)
+
+    @pytest.mark.asyncio
+    async def test_supplied_file_hash_not_recomputed(
+        self, mcp_server: DocumentStoreMCP, sample_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Given: The caller passes the hash computed at download time
+        When: The document is ingested
+        Then: The file is not hashed again and the hash keys the content
+        """
+        from src.mcp_servers.document_store.server import IngestDocumentInput
+
+        file_hash = ChromaClient.compute_file_hash(sample_pdf)
+
+        def fail_hash(file_path):
+            raise AssertionError("file should not be rehashed")
+
+        monkeypatch.setattr(ChromaClient, "compute_file_hash", staticmethod(fail_hash))
+        result = await mcp_server._ingest_document(
+            IngestDocumentInput(
+                file_path=str(sample_pdf), application_ref="25/00001/F", file_hash=file_hash
+            )
+        )
+
+        assert result["status"] == "success"
+        assert mcp_server._get_chroma_client().find_content_record(file_hash) is not None
+
+    @pytest.mark.asyncio
+    async def test_search_attributes_shared_chunks_to_filtered_application(
+        self, mcp_server: DocumentStoreMCP, sample_pdf: Path
+    ) -> None:
+        """
+        Given: The same PDF referenced by two applications
+        When: Searching with an application filter
+        Then: Results carry that application's document metadata
+        """
+        from src.mcp_servers.document_store.server import IngestDocumentInput, SearchInput
+
+        for ref in ["25/00001/F", "25/00002/REM"]:
+            await mcp_server._ingest_document(
+                IngestDocumentInput(file_path=str(sample_pdf), application_ref=ref)
+            )
+
+        result = await mcp_server._search_documents(
+            SearchInput(query="cycle parking", application_ref="25/00002/REM", max_results=5)
+        )
+
+        assert result["results_count"] > 0
+        for r in result["results"]:
+            assert r["metadata"]["application_ref"] == "25/00002/REM"
+            assert r["metadata"]["document_id"].startswith("25_00002_REM_")
+            assert r["metadata"]["source_file"] == sample_pdf.name
+
+        other = await mcp_server._search_documents(
+            SearchInput(query="cycle parking", application_ref="25/99999/F", max_results=5)
+        )
+        assert other["results_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_chunks_kept_until_last_reference_deleted(
+        self, mcp_server: DocumentStoreMCP, sample_pdf: Path
+    ) -> None:
+        """
+        Given: The same PDF referenced by two applications
+        When: Each application's document is deleted in turn
+        Then: Chunks survive until the final reference is removed
+        """
+        from src.mcp_servers.document_store.server import IngestDocumentInput
+
+        results = [
+            await mcp_server._ingest_document(
+                IngestDocumentInput(file_path=str(sample_pdf), application_ref=ref)
+            )
+            for ref in ["25/00001/F", "25/00002/REM"]
+        ]
+        chroma = mcp_server._get_chroma_client()
+        total = results[0]["chunks_created"]
+
+        assert chroma.delete_document(results[0]["document_id"]) == 0
+        assert len(chroma.get_document_chunks(results[1]["document_id"])) == total
+
+        assert chroma.delete_document(results[1]["document_id"]) == total
+        assert chroma.get_collection_stats()["total_chunks"] == 0
+
+
 class TestImageBasedDocumentSkip:
     """
     Tests for image-based document skip during ingestion.
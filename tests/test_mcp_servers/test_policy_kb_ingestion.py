@@ -0,0 +1,230 @@
+"""
+Tests for non-blocking policy ingestion in the Policy KB MCP server.
+
+Implements [policy-knowledge-base:PolicyKBMCP/TS-10] - Ingest policy revision (non-blocking)
+"""
+
+import asyncio
+import contextlib
+import statistics
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import chromadb
+import pytest
+from chromadb.config import Settings
+
+from src.api.schemas.policy import PolicyRevisionRecord, RevisionStatus
+from src.mcp_servers.document_store.chunker import TextChunk
+from src.mcp_servers.document_store.embeddings import EmbeddingService, MockEmbeddingModel
+from src.mcp_servers.policy_kb.server import (
+    GetIngestionStatusInput,
+    IngestPolicyRevisionInput,
+    PolicyKBMCP,
+    SearchPolicyInput,
+)
+from src.shared.policy_chroma_client import PolicyChromaClient, PolicyChunkRecord
+
+# p95 latency search_policy must keep while an ingest is running
+SEARCH_P95_SLO_SECONDS = 0.25
+
+
+@pytest.fixture
+def chroma_client() -> PolicyChromaClient:
+    """Create an in-memory policy ChromaDB client with one searchable chunk."""
+    client = chromadb.Client(settings=Settings(anonymized_telemetry=False))
+    for name in (PolicyChromaClient.COLLECTION_NAME, PolicyChromaClient.CURRENT_COLLECTION_NAME):
+        with contextlib.suppress(Exception):
+            client.delete_collection(name)
+    chroma = PolicyChromaClient(client=client)
+    text = "Segregated cycle tracks should be 2.0m wide."
+    chroma.upsert_chunks(
+        [
+            PolicyChunkRecord(
+                chunk_id="NPPF__rev_NPPF_2024_12__Para_116__000",
+                text=text,
+                embedding=EmbeddingService(model=MockEmbeddingModel()).embed(text),
+                metadata={
+                    "source": "NPPF",
+                    "revision_id": "rev_NPPF_2024_12",
+                    "version_label": "December 2024",
+                    "effective_from": 20241212,
+                    "effective_to": 99991231,
+                    "section_ref": "Para 116",
+                    "page_number": 35,
+                    "chunk_index": 0,
+                },
+            )
+        ]
+    )
+    return chroma
+
+
+@pytest.fixture
+def mock_registry() -> AsyncMock:
+    """Create a mock registry that knows the LTN 1/20 revision."""
+    from datetime import UTC, date, datetime
+
+    registry = AsyncMock()
+    registry.get_generation = AsyncMock(return_value=0)
+    registry.get_revision = AsyncMock(
+        return_value=PolicyRevisionRecord(
+            revision_id="rev_LTN_1_20_2020_07",
+            source="LTN_1_20",
+            version_label="July 2020",
+            effective_from=date(2020, 7, 27),
+            status=RevisionStatus.PROCESSING,
+            created_at=datetime.now(UTC),
+        )
+    )
+    return registry
+
+
+def make_processor(work) -> MagicMock:
+    """Create a processor whose extraction runs `work` before returning one page."""
+
+    def extract_text(_path: str) -> MagicMock:
+        work()
+        return MagicMock(
+            total_pages=1,
+            pages=[MagicMock(page_number=1, text="Chapter 5: Cycle Lane Design")],
+            extraction_method="text_layer",
+            total_char_count=28,
+        )
+
+    processor = MagicMock()
+    processor.extract_text.side_effect = extract_text
+    return processor
+
+
+def make_mcp(mock_registry, chroma_client, processor) -> PolicyKBMCP:
+    """Create a PolicyKBMCP with mock extraction and a one-chunk chunker."""
+    chunker = MagicMock()
+    chunker.chunk_pages.return_value = [
+        TextChunk(
+            text="Chapter 5: Cycle Lane Design",
+            chunk_index=0,
+            char_count=28,
+            word_count=5,
+            page_numbers=[1],
+        )
+    ]
+    return PolicyKBMCP(
+        registry=mock_registry,
+        chroma_client=chroma_client,
+        embedder=EmbeddingService(model=MockEmbeddingModel()),
+        processor=processor,
+        chunker=chunker,
+        use_current_view=False,
+    )
+
+
+def ingest_input(pdf_path) -> IngestPolicyRevisionInput:
+    return IngestPolicyRevisionInput(
+        source="LTN_1_20", revision_id="rev_LTN_1_20_2020_07", file_path=str(pdf_path)
+    )
+
+
+class TestNonBlockingIngestion:
+    """Tests for job handles and status reporting."""
+
+    async def test_returns_job_handle_before_work_finishes(
+        self, mock_registry, chroma_client, tmp_path
+    ) -> None:
+        """The tool returns while extraction is still running; a repeat joins the job."""
+        pdf_path = tmp_path / "ltn.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 test")
+        release = threading.Event()
+        mcp = make_mcp(mock_registry, chroma_client, make_processor(lambda: release.wait(5)))
+
+        accepted = await mcp._ingest_policy_revision(ingest_input(pdf_path))
+        repeat = await mcp._ingest_policy_revision(ingest_input(pdf_path))
+        await asyncio.sleep(0.05)
+        running = await mcp._get_ingestion_status(
+            GetIngestionStatusInput(job_id=accepted["job_id"])
+        )
+
+        assert accepted["status"] == "accepted"
+        assert repeat["job_id"] == accepted["job_id"]
+        assert running["status"] == "success"
+        assert running["job"]["status"] == "running"
+        assert running["job"]["finished_at"] is None
+        assert running["job"]["result"] is None
+
+        release.set()
+        job = await mcp.wait_for_ingestion(accepted["job_id"])
+
+        assert job["status"] == "complete"
+        assert job["result"]["chunks_created"] == 1
+        assert chroma_client.get_chunk_count("LTN_1_20", "rev_LTN_1_20_2020_07") == 1
+        mock_registry.set_section_index.assert_awaited_once()
+
+    async def test_failure_is_reported_on_the_job(
+        self, mock_registry, chroma_client, tmp_path
+    ) -> None:
+        """An extraction error fails the job instead of the tool call."""
+        pdf_path = tmp_path / "ltn.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 test")
+
+        def explode() -> None:
+            raise RuntimeError("corrupt PDF")
+
+        mcp = make_mcp(mock_registry, chroma_client, make_processor(explode))
+
+        accepted = await mcp._ingest_policy_revision(ingest_input(pdf_path))
+        job = await mcp.wait_for_ingestion(accepted["job_id"])
+
+        assert job["status"] == "failed"
+        assert job["result"]["error_type"] == "ingestion_failed"
+        assert "corrupt PDF" in job["result"]["message"]
+
+    async def test_unknown_job(self, mock_registry, chroma_client) -> None:
+        """Unknown job IDs return job_not_found."""
+        mcp = make_mcp(mock_registry, chroma_client, MagicMock())
+
+        result = await mcp._get_ingestion_status(GetIngestionStatusInput(job_id="ingest_nope"))
+
+        assert result["error_type"] == "job_not_found"
+
+
+class TestSearchLatencyDuringIngest:
+    """Load test: search_policy keeps its latency SLO while an ingest runs."""
+
+    async def test_search_p95_within_slo_during_ingest(
+        self, mock_registry, chroma_client, tmp_path
+    ) -> None:
+        """
+        Given: An ingest whose extraction is CPU-bound for about a second
+        When: search_policy is called repeatedly while it runs
+        Then: p95 search latency stays within SEARCH_P95_SLO_SECONDS
+        """
+        pdf_path = tmp_path / "ltn.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 test")
+
+        def busy_extraction() -> None:
+            deadline = time.perf_counter() + 1.0
+            while time.perf_counter() < deadline:
+                sum(i * i for i in range(1000))
+
+        mcp = make_mcp(mock_registry, chroma_client, make_processor(busy_extraction))
+        # Distinct queries so every call embeds and queries ChromaDB
+        mcp.search_cache.clear()
+
+        accepted = await mcp._ingest_policy_revision(ingest_input(pdf_path))
+        latencies = []
+        i = 0
+        while mcp._ingestion_jobs.get(accepted["job_id"]).status in ("queued", "running"):
+            started = time.perf_counter()
+            result = await mcp._search_policy(SearchPolicyInput(query=f"cycle track width {i}"))
+            latencies.append(time.perf_counter() - started)
+            assert result["status"] == "success"
+            i += 1
+            await asyncio.sleep(0.01)
+
+        job = await mcp.wait_for_ingestion(accepted["job_id"])
+
+        assert job["status"] == "complete"
+        assert len(latencies) >= 20
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        assert p95 < SEARCH_P95_SLO_SECONDS, f"search p95 {p95:.3f}s during ingest"
@@ -0,0 +1,187 @@
+"""
+Tests for the policy search result cache.
+
+Implements [policy-knowledge-base:FR-005] - search_policy (cached re-use)
+"""
+
+import contextlib
+from datetime import date
+from unittest.mock import patch
+
+import chromadb
+import fakeredis.aioredis
+import pytest
+from chromadb.config import Settings
+
+from src.api.schemas.policy import PolicyCategory, RevisionStatus
+from src.mcp_servers.document_store.embeddings import EmbeddingService, MockEmbeddingModel
+from src.mcp_servers.policy_kb.search_cache import SearchResultCache
+from src.mcp_servers.policy_kb.server import (
+    PolicyKBMCP,
+    RemovePolicyRevisionInput,
+    SearchPolicyInput,
+)
+from src.shared.policy_chroma_client import PolicyChromaClient, PolicyChunkRecord
+from src.shared.policy_registry import PolicyRegistry
+
+
+@pytest.fixture
+def chroma_client() -> PolicyChromaClient:
+    """Create an in-memory policy ChromaDB client with two chunks."""
+    client = chromadb.Client(settings=Settings(anonymized_telemetry=False))
+    with contextlib.suppress(Exception):
+        client.delete_collection(PolicyChromaClient.COLLECTION_NAME)
+    chroma = PolicyChromaClient(client=client)
+    embedder = EmbeddingService(model=MockEmbeddingModel())
+    chroma.upsert_chunks(
+        [
+            PolicyChunkRecord(
+                chunk_id=f"LTN_1_20__rev_2020__Chapter_5__{i:03d}",
+                text=text,
+                embedding=embedder.embed(text),
+                metadata={
+                    "source": "LTN_1_20",
+                    "revision_id": "rev_2020",
+                    "version_label": "July 2020",
+                    "effective_from": 20200727,
+                    "effective_to": 99991231,
+                    "section_ref": "Chapter 5",
+                    "page_number": 40 + i,
+                    "chunk_index": i,
+                },
+            )
+            for i, text in enumerate(
+                ["Segregated cycle tracks should be 2.0m wide.", "Cycle parking at stations."]
+            )
+        ]
+    )
+    return chroma
+
+
+@pytest.fixture
+async def mcp(
+    fake_redis: fakeredis.aioredis.FakeRedis, chroma_client: PolicyChromaClient
+) -> PolicyKBMCP:
+    """Create a PolicyKBMCP with a real registry and a small cache."""
+    registry = PolicyRegistry(fake_redis)
+    await registry.create_policy("LTN_1_20", "LTN 1/20", PolicyCategory.NATIONAL_GUIDANCE)
+    await registry.create_revision("LTN_1_20", "rev_2020", "July 2020", date(2020, 7, 27))
+    await registry.update_revision("LTN_1_20", "rev_2020", status=RevisionStatus.ACTIVE)
+    return PolicyKBMCP(
+        registry=registry,
+        chroma_client=chroma_client,
+        embedder=EmbeddingService(model=MockEmbeddingModel()),
+        search_cache=SearchResultCache(max_entries=8, ttl_seconds=60),
+    )
+
+
+class TestSearchResultCache:
+    """Tests for key normalisation, TTL and LRU eviction."""
+
+    def test_key_normalisation(self) -> None:
+        """Case, whitespace and source order do not change the key."""
+        a = SearchResultCache.make_key("Cycle  lane width ", ["NPPF", "LTN_1_20"], None, 10, (1,))
+        b = SearchResultCache.make_key("cycle lane width", ["LTN_1_20", "NPPF"], None, 10, (1,))
+        c = SearchResultCache.make_key("cycle lane width", ["LTN_1_20", "NPPF"], None, 10, (2,))
+
+        assert a == b
+        assert a != c
+
+    def test_ttl_expiry(self) -> None:
+        """Expired entries miss."""
+        cache = SearchResultCache(ttl_seconds=10)
+        with patch("src.mcp_servers.policy_kb.search_cache.time.monotonic", return_value=100.0):
+            cache.put(("q",), {"results": []})
+        with patch("src.mcp_servers.policy_kb.search_cache.time.monotonic", return_value=105.0):
+            assert cache.get(("q",)) == {"results": []}
+        with patch("src.mcp_servers.policy_kb.search_cache.time.monotonic", return_value=111.0):
+            assert cache.get(("q",)) is None
+
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used entry is evicted first."""
+        cache = SearchResultCache(max_entries=2)
+        cache.put(("a",), {"n": 1})
+        cache.put(("b",), {"n": 2})
+        cache.get(("a",))
+        cache.put(("c",), {"n": 3})
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == {"n": 1}
+        assert cache.stats()["evictions"] == 1
+
+    def test_returns_copies(self) -> None:
+        """Callers cannot mutate cached responses."""
+        cache = SearchResultCache()
+        cache.put(("a",), {"results": [{"text": "x"}]})
+
+        cache.get(("a",))["results"].clear()  # type: ignore[index]
+
+        assert cache.get(("a",)) == {"results": [{"text": "x"}]}
+
+
+class TestCachedSearch:
+    """Tests for search_policy served from the cache."""
+
+    async def test_repeat_search_served_from_cache(self, mcp: PolicyKBMCP) -> None:
+        """A repeated (normalised) query is not embedded or queried again."""
+        first = await mcp._search_policy(SearchPolicyInput(query="Cycle track width"))
+
+        with patch.object(PolicyChromaClient, "search") as mock_search:
+            second = await mcp._search_policy(SearchPolicyInput(query="cycle  track WIDTH"))
+
+        mock_search.assert_not_called()
+        assert second["results"] == first["results"]
+        assert second["query"] == "cycle  track WIDTH"
+        assert mcp.search_cache.stats()["hit_rate"] == 0.5
+
+    async def test_removal_invalidates(self, mcp: PolicyKBMCP) -> None:
+        """Removing a revision changes the corpus generation and the next search misses."""
+        before = await mcp._search_policy(SearchPolicyInput(query="cycle parking"))
+        assert before["results_count"] == 2
+
+        await mcp._remove_policy_revision(
+            RemovePolicyRevisionInput(source="LTN_1_20", revision_id="rev_2020")
+        )
+        after = await mcp._search_policy(SearchPolicyInput(query="cycle parking"))
+
+        assert after["results_count"] == 0
+        assert mcp.search_cache.stats()["hits"] == 0
+
+    async def test_registry_change_elsewhere_invalidates(
+        self, fake_redis: fakeredis.aioredis.FakeRedis, mcp: PolicyKBMCP
+    ) -> None:
+        """A registry write by another process (e.g. the worker) misses the cache."""
+        await mcp._search_policy(SearchPolicyInput(query="cycle parking"))
+
+        await PolicyRegistry(fake_redis).notify_change("LTN_1_20", "rev_2020")
+        await mcp._search_policy(SearchPolicyInput(query="cycle parking"))
+
+        assert mcp.search_cache.stats()["misses"] == 2
+
+    async def test_invalid_date_not_cached(self, mcp: PolicyKBMCP) -> None:
+        """Validation errors are returned without touching the cache."""
+        result = await mcp._search_policy(
+            SearchPolicyInput(query="cycle parking", effective_date="not-a-date")
+        )
+
+        assert result["error_type"] == "invalid_date"
+        assert mcp.search_cache.stats()["entries"] == 0
+
+
+class TestHealth:
+    """Tests for cache statistics on the health endpoint."""
+
+    def test_health_reports_search_cache(self) -> None:
+        """/health includes the search cache hit rate."""
+        from starlette.testclient import TestClient
+
+        from src.mcp_servers.policy_kb.server import create_app
+
+        response = TestClient(create_app()).get("/health")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ok"
+        assert body["search_cache"]["hit_rate"] == 0.0
@@ -5,6 +5,7 @@ Implements test scenarios from [policy-knowledge-base:PolicyKBMCP/TS-01] through
 """
 
 import contextlib
+import threading
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
@@ -23,14 +24,21 @@ from src.shared.policy_chroma_client import PolicyChromaClient, PolicyChunkRecor
 
 
 @pytest.fixture
-def mock_registry():
+def mock_registry(sample_revisions):
     """Create mock PolicyRegistry."""
     registry = AsyncMock()
+    registry.get_all_effective_for_date = AsyncMock(return_value={
+        "LTN_1_20": sample_revisions[0],
+        "NPPF": MagicMock(revision_id="rev_NPPF_2024_12"),
+    })
     registry.list_policies = AsyncMock(return_value=[])
     registry.get_policy = AsyncMock(return_value=None)
     registry.list_revisions = AsyncMock(return_value=[])
     registry.get_revision = AsyncMock(return_value=None)
     registry.get_effective_revision = AsyncMock(return_value=None)
+    registry.get_current_revision = AsyncMock(return_value=None)
+    registry.get_section_chunk_ids = AsyncMock(return_value=None)
+    registry.get_generation = AsyncMock(return_value=0)
     return registry
 
 
@@ -40,6 +48,8 @@ def chroma_client():
     client = chromadb.Client(settings=Settings(anonymized_telemetry=False))
     with contextlib.suppress(Exception):
         client.delete_collection(PolicyChromaClient.COLLECTION_NAME)
+    with contextlib.suppress(Exception):
+        client.delete_collection(PolicyChromaClient.CURRENT_COLLECTION_NAME)
     return PolicyChromaClient(client=client)
 
 
@@ -210,7 +220,7 @@ class TestSearchPolicy:
 
         Given: Policy chunks exist in ChromaDB
         When: search_policy("cycle lane width") without effective_date
-        Then: Returns relevant chunks from all revisions
+        Then: Returns relevant chunks from the revisions in force today
         """
         from src.mcp_servers.policy_kb.server import PolicyKBMCP, SearchPolicyInput
 
@@ -276,6 +286,133 @@ class TestSearchPolicy:
             assert r["revision_id"] == "rev_NPPF_2023_09", \
                 f"Expected 2023 revision, got {r['revision_id']}"
 
+    @pytest.mark.asyncio
+    async def test_present_day_search_uses_current_view(
+        self,
+        mock_registry,
+        chroma_client,
+        mock_embedder,
+        sample_chunks,
+        nppf_chunks,
+        sample_revisions,
+    ):
+        """
+        Today's searches are served from the current-in-force collection.
+
+        Given: Registry says LTN 1/20 and NPPF 2024 are in force today
+        When: search_policy with today's date, before and after a registry change
+        Then: Only in-force revisions are returned, and the view is refreshed
+              only when the registry generation changes
+        """
+        from src.mcp_servers.policy_kb.server import PolicyKBMCP, SearchPolicyInput
+
+        chroma_client.upsert_chunks(sample_chunks + nppf_chunks)
+        nppf_2024 = MagicMock(revision_id="rev_NPPF_2024_12")
+        mock_registry.get_all_effective_for_date = AsyncMock(
+            return_value={"LTN_1_20": sample_revisions[0], "NPPF": nppf_2024, "LCWIP": None}
+        )
+
+        mcp = PolicyKBMCP(
+            registry=mock_registry,
+            chroma_client=chroma_client,
+            embedder=mock_embedder,
+            use_current_view=True,
+        )
+        today = date.today().isoformat()
+
+        result = await mcp._search_policy(SearchPolicyInput(
+            query="pedestrian and cycle", effective_date=today, sources=["NPPF"],
+        ))
+        await mcp._search_policy(SearchPolicyInput(query="cycle lanes", effective_date=today))
+
+        assert {r["revision_id"] for r in result["results"]} == {"rev_NPPF_2024_12"}
+        assert mock_registry.get_all_effective_for_date.await_count == 1
+        assert chroma_client.get_current_view().members == {
+            ("LTN_1_20", "rev_LTN_1_20_2020_07"),
+            ("NPPF", "rev_NPPF_2024_12"),
+        }
+
+        mock_registry.get_generation.return_value = 1
+        await mcp._search_policy(SearchPolicyInput(query="cycle lanes", effective_date=today))
+
+        assert mock_registry.get_all_effective_for_date.await_count == 2
+        assert chroma_client.get_current_view().generation == 1
+
+    @pytest.mark.asyncio
+    async def test_undated_search_uses_current_view(
+        self,
+        mock_registry,
+        chroma_client,
+        mock_embedder,
+        sample_chunks,
+        nppf_chunks,
+    ):
+        """
+        Searches without effective_date are present-day and use the current view.
+
+        Given: Registry says NPPF 2024 is in force today
+        When: search_policy without effective_date
+        Then: The view is built for today and only the in-force revision is returned
+        """
+        from src.mcp_servers.policy_kb.server import PolicyKBMCP, SearchPolicyInput
+
+        chroma_client.upsert_chunks(sample_chunks + nppf_chunks)
+
+        mcp = PolicyKBMCP(
+            registry=mock_registry,
+            chroma_client=chroma_client,
+            embedder=mock_embedder,
+            use_current_view=True,
+        )
+
+        result = await mcp._search_policy(SearchPolicyInput(
+            query="pedestrian and cycle", sources=["NPPF"],
+        ))
+
+        assert result["status"] == "success"
+        assert {r["revision_id"] for r in result["results"]} == {"rev_NPPF_2024_12"}
+        mock_registry.get_all_effective_for_date.assert_awaited_once_with(date.today())
+        assert chroma_client.get_current_view().as_of == date.today()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_current_view", [True, False])
+    async def test_undated_search_fallback_is_present_day(
+        self,
+        mock_registry,
+        chroma_client,
+        mock_embedder,
+        sample_chunks,
+        nppf_chunks,
+        use_current_view,
+    ):
+        """
+        The filtered fallback answers undated searches as of today too.
+
+        Given: NPPF 2023 (superseded) and 2024 chunks, and a current view that
+               is either disabled or fails to refresh
+        When: search_policy without effective_date
+        Then: Only the revision in force today is returned, as on the view path
+        """
+        from src.mcp_servers.policy_kb.server import PolicyKBMCP, SearchPolicyInput
+
+        chroma_client.upsert_chunks(sample_chunks + nppf_chunks)
+        mock_registry.get_all_effective_for_date.side_effect = ConnectionError("redis down")
+
+        mcp = PolicyKBMCP(
+            registry=mock_registry,
+            chroma_client=chroma_client,
+            embedder=mock_embedder,
+            use_current_view=use_current_view,
+        )
+
+        result = await mcp._search_policy(SearchPolicyInput(
+            query="pedestrian and cycle", sources=["NPPF"],
+        ))
+
+        assert result["status"] == "success"
+        assert {r["revision_id"] for r in result["results"]} == {"rev_NPPF_2024_12"}
+        assert chroma_client.get_current_view() is None
+
     @pytest.mark.asyncio
     async def test_search_filtered_by_sources(
         self,
@@ -386,6 +523,38 @@ class TestSearchPolicy:
             assert "relevance_score" in r
             assert 0 <= r["relevance_score"] <= 1
 
+    @pytest.mark.asyncio
+    async def test_query_embedded_off_event_loop(
+        self,
+        mock_registry,
+        chroma_client,
+        mock_embedder,
+        sample_chunks,
+    ):
+        """The query embedding runs in a worker thread, not on the event loop."""
+        from src.mcp_servers.policy_kb.server import PolicyKBMCP, SearchPolicyInput
+
+        chroma_client.upsert_chunks(sample_chunks)
+        embed = mock_embedder.embed
+        threads = []
+
+        def recording_embed(text):
+            threads.append(threading.get_ident())
+            return embed(text)
+
+        mock_embedder.embed = recording_embed
+        mcp = PolicyKBMCP(
+            registry=mock_registry,
+            chroma_client=chroma_client,
+            embedder=mock_embedder,
+        )
+
+        result = await mcp._search_policy(SearchPolicyInput(query="cycle lane width"))
+
+        assert result["status"] == "success"
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
 
 class TestGetPolicySection:
     """
@@ -500,6 +669,75 @@ class TestGetPolicySection:
         assert "priority" in result["text"].lower()  # 2023 version uses "priority"
 
 
+    @pytest.mark.asyncio
+    async def test_section_lookup_uses_index(
+        self,
+        fake_redis,
+        chroma_client,
+        mock_embedder,
+    ):
+        """
+        Given: A revision whose section spans 40 of 60 chunks, indexed at ingest
+        When: get_policy_section is called without a revision_id
+        Then: Every chunk of the section is returned in chunk order without a vector search
+        """
+        from src.mcp_servers.policy_kb.server import GetPolicySectionInput, PolicyKBMCP
+        from src.shared.policy_registry import PolicyRegistry
+        from src.worker.policy_jobs import PolicyIngestionService
+
+        registry = PolicyRegistry(fake_redis)
+        await registry.create_policy("LTN_1_20", "LTN 1/20", PolicyCategory.NATIONAL_GUIDANCE)
+        await registry.create_revision("LTN_1_20", "rev_2020", "July 2020", date(2020, 7, 27))
+        await registry.update_revision("LTN_1_20", "rev_2020", status=RevisionStatus.ACTIVE)
+
+        records = []
+        for i in range(60):
+            section_ref = "Chapter 5" if i % 3 else "Chapter 6"
+            records.append(
+                PolicyChunkRecord(
+                    chunk_id=PolicyChromaClient.generate_chunk_id(
+                        "LTN_1_20", "rev_2020", section_ref, i
+                    ),
+                    text=f"chunk {i}",
+                    embedding=mock_embedder.embed(f"chunk {i}"),
+                    metadata={
+                        "source": "LTN_1_20",
+                        "revision_id": "rev_2020",
+                        "version_label": "July 2020",
+                        "effective_from": 20200727,
+                        "effective_to": 99991231,
+                        "section_ref": section_ref,
+                        "page_number": 10 + i // 4,
+                        "chunk_index": i,
+                    },
+                )
+            )
+        chroma_client.upsert_chunks(records)
+        await registry.set_section_index(
+            "LTN_1_20", "rev_2020", PolicyIngestionService.build_section_index(records)
+        )
+
+        mcp = PolicyKBMCP(registry=registry, chroma_client=chroma_client, embedder=mock_embedder)
+        chroma_client.search = MagicMock(side_effect=AssertionError("vector search used"))
+
+        result = await mcp._get_policy_section(GetPolicySectionInput(
+            source="LTN_1_20",
+            section_ref="Chapter 5",
+        ))
+
+        expected = [i for i in range(60) if i % 3]
+        assert result["status"] == "success"
+        assert result["revision_id"] == "rev_2020"
+        assert result["text"] == "\n\n".join(f"chunk {i}" for i in expected)
+        assert result["page_numbers"] == sorted({10 + i // 4 for i in expected})
+
+        missing = await mcp._get_policy_section(GetPolicySectionInput(
+            source="LTN_1_20",
+            section_ref="Chapter 9",
+        ))
+        assert missing["error_type"] == "section_not_found"
+
+
 class TestListPolicyDocuments:
     """
     Tests for list_policy_documents tool.
@@ -640,7 +878,11 @@ class TestIngestPolicyRevision:
         When: ingest_policy_revision(...)
         Then: Chunks created with correct metadata
         """
-        from src.mcp_servers.policy_kb.server import IngestPolicyRevisionInput, PolicyKBMCP
+        from src.mcp_servers.policy_kb.server import (
+            GetIngestionStatusInput,
+            IngestPolicyRevisionInput,
+            PolicyKBMCP,
+        )
 
         # Create a mock PDF file
         pdf_path = tmp_path / "test_policy.pdf"
@@ -686,13 +928,84 @@ class TestIngestPolicyRevision:
             file_path=str(pdf_path),
         ))
 
-        assert result["status"] == "success"
-        assert result["chunks_created"] > 0
+        assert result["status"] == "accepted"
+        job = await mcp.wait_for_ingestion(result["job_id"])
+        assert job["status"] == "complete"
+        assert job["result"]["chunks_created"] > 0
+
+        status = await mcp._get_ingestion_status(GetIngestionStatusInput(job_id=result["job_id"]))
+        assert status["status"] == "success"
+        assert status["job"]["status"] == "complete"
 
         # Verify chunks in ChromaDB
         chunks = chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
         assert len(chunks) > 0
 
+    @pytest.mark.asyncio
+    async def test_ingestion_components_created_on_event_loop(
+        self,
+        monkeypatch,
+        mock_registry,
+        chroma_client,
+        sample_revisions,
+        tmp_path,
+    ):
+        """
+        Lazily created components are built before work moves to the executor.
+
+        Given: A server with no embedder, processor or chunker injected
+        When: An ingestion job runs
+        Then: Each component is created once, on the event loop thread
+        """
+        from src.mcp_servers.policy_kb import server as server_module
+        from src.mcp_servers.policy_kb.server import IngestPolicyRevisionInput, PolicyKBMCP
+
+        pdf_path = tmp_path / "test_policy.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 test content")
+        mock_registry.get_revision.return_value = sample_revisions[0]
+
+        created: list[tuple[str, int]] = []
+
+        def factory(name, instance):
+            def create(*args, **kwargs):
+                created.append((name, threading.get_ident()))
+                return instance
+            return create
+
+        processor = MagicMock()
+        processor.extract_text.return_value = MagicMock(
+            total_pages=1,
+            pages=[MagicMock(page_number=1, text="Chapter 5: Cycle Lane Design")],
+            extraction_method="text_layer",
+            total_char_count=30,
+        )
+        chunker = MagicMock()
+        chunker.chunk_pages.return_value = [
+            MagicMock(
+                text="Chapter 5: Cycle Lane Design",
+                chunk_index=0,
+                page_numbers=[1],
+                char_count=30,
+                word_count=5,
+            ),
+        ]
+        embedder = EmbeddingService(model=MockEmbeddingModel())
+        monkeypatch.setattr(server_module, "EmbeddingService", factory("embedder", embedder))
+        monkeypatch.setattr(server_module, "DocumentProcessor", factory("processor", processor))
+        monkeypatch.setattr(server_module, "TextChunker", factory("chunker", chunker))
+
+        mcp = PolicyKBMCP(registry=mock_registry, chroma_client=chroma_client)
+        result = await mcp._ingest_policy_revision(IngestPolicyRevisionInput(
+            source="LTN_1_20",
+            revision_id="rev_LTN_1_20_2020_07",
+            file_path=str(pdf_path),
+        ))
+        job = await mcp.wait_for_ingestion(result["job_id"])
+
+        assert job["status"] == "complete"
+        assert sorted(name for name, _ in created) == ["chunker", "embedder", "processor"]
+        assert {thread for _, thread in created} == {threading.get_ident()}
+
 
 class TestRemovePolicyRevision:
     """
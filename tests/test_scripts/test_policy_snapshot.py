@@ -0,0 +1,212 @@
+"""
+Tests for policy corpus snapshot export and import.
+
+Implements [policy-knowledge-base:FR-013] - Seed policies (from a snapshot)
+"""
+
+import contextlib
+import json
+import zipfile
+from dataclasses import replace
+from datetime import date
+
+import chromadb
+import fakeredis.aioredis
+import pytest
+from chromadb.config import Settings
+
+from src.api.schemas.policy import PolicyCategory, RevisionStatus
+from src.mcp_servers.document_store.embeddings import EmbeddingService, MockEmbeddingModel
+from src.scripts.policy_snapshot import (
+    SnapshotError,
+    export_snapshot,
+    import_snapshot,
+)
+from src.shared.policy_chroma_client import PolicyChromaClient, PolicyChunkRecord
+from src.shared.policy_registry import PolicyRegistry
+
+TEXTS = {
+    "rev_2023": ["Para 116 Cycle routes should be direct.", "Para 117 Parking standards."],
+    "rev_2024": ["Para 116 Cycle routes should be direct and safe."],
+}
+
+
+def fresh_chroma() -> PolicyChromaClient:
+    """Create an empty in-memory policy ChromaDB client."""
+    client = chromadb.Client(settings=Settings(anonymized_telemetry=False))
+    for name in (PolicyChromaClient.COLLECTION_NAME, PolicyChromaClient.CURRENT_COLLECTION_NAME):
+        with contextlib.suppress(Exception):
+            client.delete_collection(name)
+    return PolicyChromaClient(client=client)
+
+
+@pytest.fixture
+async def corpus(
+    fake_redis: fakeredis.aioredis.FakeRedis,
+) -> tuple[PolicyRegistry, PolicyChromaClient]:
+    """A registry and vector store holding two NPPF revisions."""
+    registry = PolicyRegistry(fake_redis)
+    chroma = fresh_chroma()
+    embedder = EmbeddingService(model=MockEmbeddingModel())
+
+    await registry.create_policy("NPPF", "NPPF", PolicyCategory.NATIONAL_POLICY, "Framework")
+    await registry.create_revision("NPPF", "rev_2023", "Sept 2023", date(2023, 9, 5))
+    await registry.create_revision("NPPF", "rev_2024", "Dec 2024", date(2024, 12, 12))
+    for revision_id, texts in TEXTS.items():
+        records = [
+            PolicyChunkRecord(
+                chunk_id=f"NPPF__{revision_id}__Para_{116 + i}__{i:03d}",
+                text=text,
+                embedding=embedder.embed(text),
+                metadata={"source": "NPPF", "revision_id": revision_id, "chunk_index": i},
+            )
+            for i, text in enumerate(texts)
+        ]
+        chroma.upsert_chunks(records)
+        await registry.set_section_index(
+            "NPPF", revision_id, {"Para 116": [records[0].chunk_id]}
+        )
+        await registry.update_revision(
+            "NPPF", revision_id, status=RevisionStatus.ACTIVE, chunk_count=len(records)
+        )
+    return registry, chroma
+
+
+class TestPolicySnapshot:
+    """Round trip and verification of policy snapshots."""
+
+    async def test_round_trip(self, corpus, tmp_path) -> None:
+        """
+        Given: A corpus exported to a snapshot
+        When: The snapshot is imported into an empty registry and vector store
+        Then: Policies, revisions, section indexes, chunks and embeddings match
+        """
+        registry, chroma = corpus
+        path = tmp_path / "corpus.zip"
+
+        exported = await export_snapshot(registry, chroma, path)
+        source_chunks = chroma.get_revision_chunks("NPPF", "rev_2023")
+
+        target_redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        target_registry = PolicyRegistry(target_redis)
+        target_chroma = fresh_chroma()
+        imported = await import_snapshot(target_registry, target_chroma, path)
+
+        assert (exported.policy_count, exported.revision_count, exported.chunk_count) == (1, 2, 3)
+        assert imported.chunk_count == 3
+        assert await target_registry.get_policy("NPPF") == await registry.get_policy("NPPF")
+        for revision_id in TEXTS:
+            assert await target_registry.get_revision(
+                "NPPF", revision_id
+            ) == await registry.get_revision("NPPF", revision_id)
+        assert await target_registry.get_section_chunk_ids(
+            "NPPF", "rev_2024", "Para 116"
+        ) == ["NPPF__rev_2024__Para_116__000"]
+        restored = target_chroma.get_revision_chunks("NPPF", "rev_2023")
+        assert [c.text for c in restored] == [c.text for c in source_chunks]
+        assert restored[0].embedding == pytest.approx(source_chunks[0].embedding, abs=1e-6)
+        await target_redis.aclose()
+
+    async def test_import_replaces_existing_policy(self, corpus, tmp_path) -> None:
+        """Revisions and chunks the snapshot does not contain are removed for its policies."""
+        registry, chroma = corpus
+        path = tmp_path / "corpus.zip"
+        await export_snapshot(registry, chroma, path)
+
+        await registry.create_revision("NPPF", "rev_2025", "2025", date(2025, 6, 1))
+        chroma.upsert_chunks(
+            [
+                PolicyChunkRecord(
+                    chunk_id="NPPF__rev_2025__doc__000",
+                    text="Draft text.",
+                    embedding=[0.0] * 384,
+                    metadata={"source": "NPPF", "revision_id": "rev_2025", "chunk_index": 0},
+                )
+            ]
+        )
+        generation = await registry.get_generation()
+
+        await import_snapshot(registry, chroma, path)
+
+        assert await registry.get_revision("NPPF", "rev_2025") is None
+        assert chroma.get_chunk_count("NPPF", "rev_2025") == 0
+        assert chroma.get_chunk_count("NPPF") == 3
+        assert await registry.get_generation() > generation
+
+    async def test_checksum_mismatch_rejected(self, corpus, tmp_path) -> None:
+        """A tampered snapshot fails verification before anything is written."""
+        registry, chroma = corpus
+        path = tmp_path / "corpus.zip"
+        await export_snapshot(registry, chroma, path)
+
+        tampered = tmp_path / "tampered.zip"
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(tampered, "w") as dst:
+            for name in src.namelist():
+                data = src.read(name)
+                if name == "chunks.jsonl":
+                    data = data.replace(b"direct", b"indirect")
+                dst.writestr(name, data)
+
+        target_chroma = fresh_chroma()
+        with pytest.raises(SnapshotError, match="Checksum mismatch for chunks.jsonl"):
+            await import_snapshot(registry, target_chroma, tampered)
+
+        assert target_chroma.get_chunk_count() == 0
+
+    async def test_export_rejects_chunks_without_embeddings(
+        self, corpus, tmp_path, monkeypatch
+    ) -> None:
+        """A chunk with no stored embedding fails the export, naming the chunk."""
+        registry, chroma = corpus
+        path = tmp_path / "corpus.zip"
+        read_chunks = chroma.get_revision_chunks
+
+        def drop_first_embedding(source: str, revision_id: str) -> list[PolicyChunkRecord]:
+            chunks = read_chunks(source, revision_id)
+            if revision_id == "rev_2024":
+                chunks[0] = replace(chunks[0], embedding=[])
+            return chunks
+
+        monkeypatch.setattr(chroma, "get_revision_chunks", drop_first_embedding)
+
+        with pytest.raises(
+            SnapshotError, match=r"1 chunk\(s\) have no embedding.*NPPF__rev_2024__Para_116__000"
+        ):
+            await export_snapshot(registry, chroma, path)
+
+        assert not path.exists()
+
+    async def test_manifest_missing_member_rejected(self, corpus, tmp_path) -> None:
+        """A manifest without a checksum for a required member is a SnapshotError."""
+        registry, chroma = corpus
+        path = tmp_path / "corpus.zip"
+        await export_snapshot(registry, chroma, path)
+
+        broken = tmp_path / "broken.zip"
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(broken, "w") as dst:
+            for name in src.namelist():
+                data = src.read(name)
+                if name == "manifest.json":
+                    manifest = json.loads(data)
+                    del manifest["checksums"]["registry.jsonl"]
+                    data = json.dumps(manifest).encode()
+                dst.writestr(name, data)
+
+        target_chroma = fresh_chroma()
+        with pytest.raises(SnapshotError, match="no checksum for registry.jsonl"):
+            await import_snapshot(registry, target_chroma, broken)
+
+        assert target_chroma.get_chunk_count() == 0
+
+    async def test_manifest(self, corpus, tmp_path) -> None:
+        """The manifest records counts, embedding dimension and member checksums."""
+        registry, chroma = corpus
+        path = tmp_path / "corpus.zip"
+        await export_snapshot(registry, chroma, path)
+
+        with zipfile.ZipFile(path) as zf:
+            manifest = json.loads(zf.read("manifest.json"))
+
+        assert manifest["format"] == "policy-kb-snapshot"
+        assert manifest["embedding_dim"] == 384
+        assert set(manifest["checksums"]) == {"registry.jsonl", "chunks.jsonl", "embeddings.npy"}
@@ -9,6 +9,7 @@ from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock
 
 import pytest
+from structlog.testing import capture_logs
 
 from src.api.schemas.policy import PolicyCategory, RevisionStatus
 
@@ -389,3 +390,151 @@ class TestConfigParsing:
 
         with pytest.raises(SeedError, match="Config file not found"):
             await seeder.seed()
+
+
+def _test_components():
+    """Worker component factory for parallel seeding (module-level so it pickles)."""
+    from src.mcp_servers.document_store.chunker import TextChunker
+    from src.mcp_servers.document_store.embeddings import EmbeddingService, MockEmbeddingModel
+    from src.mcp_servers.document_store.processor import DocumentProcessor
+
+    return (
+        DocumentProcessor(enable_ocr=False),
+        TextChunker(),
+        EmbeddingService(model=MockEmbeddingModel()),
+    )
+
+
+@pytest.fixture
+def real_seed_config(sample_seed_config):
+    """Replace the dummy seed PDFs with real text PDFs."""
+    import fitz
+
+    config_path, seed_dir = sample_seed_config
+    for name, heading in [
+        ("ltn_1_20.pdf", "Cycle Infrastructure Design"),
+        ("nppf_2024.pdf", "National Planning Policy Framework 2024"),
+        ("nppf_2023.pdf", "National Planning Policy Framework 2023"),
+    ]:
+        doc = fitz.open()
+        for page_no in range(2):
+            page = doc.new_page()
+            page.insert_text(
+                (72, 72), f"{heading} page {page_no + 1}. Cycle tracks should be segregated."
+            )
+        doc.save(seed_dir / name)
+        doc.close()
+    return config_path, seed_dir
+
+
+class TestResumableSeeding:
+    """Tests for resuming an interrupted seed and parallel seeding."""
+
+    @pytest.mark.asyncio
+    async def test_incomplete_revision_is_resumed(
+        self,
+        mock_registry,
+        mock_ingestion_service,
+        sample_seed_config,
+    ):
+        """A revision left PROCESSING is re-ingested with reindex, not skipped."""
+        from src.api.schemas.policy import PolicyRevisionRecord
+        from src.scripts.seed_policies import PolicySeeder
+
+        config_path, seed_dir = sample_seed_config
+
+        def revision(source, revision_id):
+            status = (
+                RevisionStatus.PROCESSING
+                if revision_id == "rev_NPPF_2023_09"
+                else RevisionStatus.ACTIVE
+            )
+            return PolicyRevisionRecord(
+                revision_id=revision_id,
+                source=source,
+                version_label="x",
+                effective_from=date(2020, 1, 1),
+                status=status,
+                created_at=datetime.now(UTC),
+            )
+
+        mock_registry.get_revision.side_effect = revision
+
+        result = await PolicySeeder(
+            registry=mock_registry,
+            ingestion_service=mock_ingestion_service,
+            config_path=config_path,
+            seed_dir=seed_dir,
+        ).seed()
+
+        assert result.revisions_skipped == 2
+        assert result.revisions_resumed == 1
+        assert result.revisions_created == 0
+        mock_registry.create_revision.assert_not_called()
+        mock_ingestion_service.ingest_revision.assert_called_once_with(
+            source="NPPF",
+            revision_id="rev_NPPF_2023_09",
+            file_path=seed_dir / "nppf_2023.pdf",
+            reindex=True,
+        )
+        assert [t.revision_id for t in result.timings] == ["rev_NPPF_2023_09"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_seed_matches_sequential(self, fake_redis, real_seed_config):
+        """Process-pool seeding stores every revision and reports timings in order."""
+        import contextlib
+
+        import chromadb
+        from chromadb.config import Settings
+
+        from src.scripts.seed_policies import PolicySeeder
+        from src.shared.policy_chroma_client import PolicyChromaClient
+        from src.shared.policy_registry import PolicyRegistry
+        from src.worker.policy_jobs import PolicyIngestionService
+
+        config_path, seed_dir = real_seed_config
+        client = chromadb.Client(settings=Settings(anonymized_telemetry=False))
+        with contextlib.suppress(Exception):
+            client.delete_collection(PolicyChromaClient.COLLECTION_NAME)
+        chroma = PolicyChromaClient(client=client)
+        registry = PolicyRegistry(fake_redis)
+        processor, chunker, embedder = _test_components()
+        service = PolicyIngestionService(
+            registry=registry,
+            chroma_client=chroma,
+            processor=processor,
+            chunker=chunker,
+            embedder=embedder,
+        )
+
+        result = await PolicySeeder(
+            registry=registry,
+            ingestion_service=service,
+            config_path=config_path,
+            seed_dir=seed_dir,
+            workers=2,
+            component_factory=_test_components,
+        ).seed()
+
+        assert result.errors == []
+        assert result.files_processed == 3
+        assert [t.file for t in result.timings] == [
+            "ltn_1_20.pdf",
+            "nppf_2024.pdf",
+            "nppf_2023.pdf",
+        ]
+        assert all(t.status == "ok" and t.page_count == 2 for t in result.timings)
+
+        nppf_2023 = await registry.get_revision("NPPF", "rev_NPPF_2023_09")
+        assert nppf_2023.status == RevisionStatus.ACTIVE
+        assert nppf_2023.chunk_count > 0
+
+        with capture_logs() as logs:
+            result.log_timings()
+        assert [(log["event"], log["file"], log["status"]) for log in logs] == [
+            ("Seed file timing", "ltn_1_20.pdf", "ok"),
+            ("Seed file timing", "nppf_2024.pdf", "ok"),
+            ("Seed file timing", "nppf_2023.pdf", "ok"),
+        ]
+        assert logs[2]["revision_id"] == "rev_NPPF_2023_09"
+        assert logs[2]["pages"] == 2
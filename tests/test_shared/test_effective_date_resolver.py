@@ -4,7 +4,9 @@ Tests for EffectiveDateResolver.
 Implements test scenarios [policy-knowledge-base:EffectiveDateResolver/TS-01] through [TS-08]
 """
 
-from datetime import date
+import asyncio
+import random
+from datetime import date, timedelta
 
 import fakeredis.aioredis
 import pytest
@@ -607,3 +609,114 @@ class TestPolicyNotFound:
         result = await resolver.resolve_for_policy("NONEXISTENT", date(2024, 1, 1))
 
         assert result is None
+
+
+class TestRevisionIndex:
+    """In-process index reuse and invalidation."""
+
+    @pytest.fixture
+    async def populated(self, registry: PolicyRegistry) -> PolicyRegistry:
+        """Registry with NPPF superseded in December 2024."""
+        await registry.create_policy("NPPF", "NPPF", PolicyCategory.NATIONAL_POLICY)
+        await registry.create_revision("NPPF", "rev_2023", "Sep 2023", date(2023, 9, 5))
+        await registry.update_revision("NPPF", "rev_2023", status=RevisionStatus.ACTIVE)
+        return registry
+
+    async def test_index_reused_until_change(
+        self, populated: PolicyRegistry, resolver: EffectiveDateResolver
+    ) -> None:
+        """Repeated queries are served from one index build."""
+        for _ in range(5):
+            await resolver.resolve_snapshot(date(2024, 1, 1))
+            await resolver.get_revision_ids_for_date(date(2024, 1, 1))
+
+        assert resolver.rebuilds == 1
+
+    async def test_own_write_invalidates(
+        self, populated: PolicyRegistry, resolver: EffectiveDateResolver
+    ) -> None:
+        """Writes through the same registry are visible to the next query."""
+        await resolver.resolve_snapshot(date(2025, 1, 1))
+
+        await populated.create_revision("NPPF", "rev_2024", "Dec 2024", date(2024, 12, 12))
+        await populated.update_revision("NPPF", "rev_2024", status=RevisionStatus.ACTIVE)
+
+        ids = await resolver.get_revision_ids_for_date(date(2025, 1, 1))
+        assert ids == {"NPPF": "rev_2024"}
+        assert resolver.rebuilds == 2
+
+    async def test_other_process_write_detected_by_generation(
+        self,
+        fake_redis: fakeredis.aioredis.FakeRedis,
+        populated: PolicyRegistry,
+        resolver: EffectiveDateResolver,
+    ) -> None:
+        """A write by another registry instance bumps the generation and forces a rebuild."""
+        await resolver.resolve_snapshot(date(2025, 1, 1))
+        other = PolicyRegistry(fake_redis)
+
+        await other.create_policy("LTN_1_20", "LTN 1/20", PolicyCategory.NATIONAL_GUIDANCE)
+
+        snapshot = await resolver.resolve_snapshot(date(2025, 1, 1))
+        assert [p.source for p in snapshot.policies] == ["LTN_1_20", "NPPF"]
+
+    async def test_subscribed_resolver_invalidated_by_pubsub(
+        self, fake_redis: fakeredis.aioredis.FakeRedis, populated: PolicyRegistry
+    ) -> None:
+        """A subscribed resolver skips generation checks and is invalidated by messages."""
+        resolver = EffectiveDateResolver(populated, subscribe=True)
+        try:
+            await resolver.resolve_snapshot(date(2025, 1, 1))
+            for _ in range(50):
+                if resolver._subscribed:
+                    break
+                await asyncio.sleep(0.01)
+            await resolver.resolve_snapshot(date(2025, 1, 1))
+            assert resolver._index is not None
+
+            other = PolicyRegistry(fake_redis)
+            await other.update_revision("NPPF", "rev_2023", version_label="September 2023")
+            for _ in range(50):
+                if resolver._index is None:
+                    break
+                await asyncio.sleep(0.01)
+
+            result = await resolver.resolve_for_policy("NPPF", date(2025, 1, 1))
+        finally:
+            await resolver.close()
+
+        assert result is not None
+        assert result.effective_revision is not None
+        assert result.effective_revision.version_label == "September 2023"
+
+    async def test_bisect_matches_registry(
+        self, registry: PolicyRegistry, resolver: EffectiveDateResolver
+    ) -> None:
+        """Index lookups agree with the registry for every date across gaps and statuses."""
+        rng = random.Random(42)
+        statuses = [RevisionStatus.ACTIVE, RevisionStatus.SUPERSEDED, RevisionStatus.FAILED]
+        for p in range(5):
+            source = f"POLICY_{p}"
+            await registry.create_policy(source, source, PolicyCategory.LOCAL_PLAN)
+            start = date(2018, 1, 1) + timedelta(days=rng.randint(0, 200))
+            for r in range(6):
+                end = start + timedelta(days=rng.randint(30, 300))
+                revision_id = f"rev_{p}_{r}"
+                await registry.create_revision(source, revision_id, str(r), start, end)
+                await registry.update_revision(source, revision_id, status=rng.choice(statuses))
+                start = end + timedelta(days=rng.randint(1, 60))
+
+        day = date(2017, 12, 1)
+        while day < date(2022, 6, 1):
+            for p in range(5):
+                source = f"POLICY_{p}"
+                expected = await registry.get_effective_revision_for_date(source, day)
+                result = await resolver.resolve_for_policy(source, day)
+                assert result is not None
+                actual = result.effective_revision
+                assert (actual.revision_id if actual else None) == (
+                    expected.revision_id if expected else None
+                ), (source, day)
+            day += timedelta(days=11)
+
+        assert resolver.rebuilds == 1
@@ -0,0 +1,33 @@
+"""
+Tests for shared file hashing.
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from src.shared import hashing
+from src.shared.hashing import sha256_file
+
+
+class TestSha256File:
+    """Tests for sha256_file."""
+
+    @pytest.mark.parametrize("size", [0, 1, 4096, 3 * 1024 + 7])
+    def test_matches_hashlib(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, size: int
+    ) -> None:
+        """Digest matches hashlib for empty, small and multi-buffer files."""
+        monkeypatch.setattr(hashing, "HASH_BUFFER_SIZE", 1024)
+        data = bytes(range(256)) * (size // 256 + 1)
+        data = data[:size]
+        path = tmp_path / "document.pdf"
+        path.write_bytes(data)
+
+        assert sha256_file(path) == hashlib.sha256(data).hexdigest()
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """Missing files raise OSError."""
+        with pytest.raises(OSError):
+            sha256_file(tmp_path / "missing.pdf")
@@ -0,0 +1,174 @@
+"""
+Tests for the policy ingestion progress stream.
+
+Implements [policy-knowledge-base:PolicyIngestionJob/TS-05] - Progress updates
+"""
+
+import gc
+import json
+from datetime import UTC, date, datetime
+
+import fakeredis.aioredis
+import pytest
+
+from src.api.schemas.policy import PolicyCategory, PolicyRevisionRecord, RevisionStatus
+from src.shared.ingestion_progress import (
+    ProgressStreamLimiter,
+    revision_progress,
+    stream_ingestion_progress,
+)
+from src.shared.policy_registry import PolicyRegistry
+
+
+@pytest.fixture
+async def registry(fake_redis: fakeredis.aioredis.FakeRedis) -> PolicyRegistry:
+    """Registry with two processing NPPF revisions and an active LTN 1/20 one."""
+    registry = PolicyRegistry(fake_redis)
+    await registry.create_policy("NPPF", "NPPF", PolicyCategory.NATIONAL_POLICY)
+    await registry.create_revision("NPPF", "rev_2023", "2023", date(2023, 9, 5))
+    await registry.create_revision("NPPF", "rev_2024", "2024", date(2024, 12, 12))
+    await registry.create_policy("LTN_1_20", "LTN 1/20", PolicyCategory.NATIONAL_GUIDANCE)
+    await registry.create_revision("LTN_1_20", "rev_2020", "2020", date(2020, 7, 27))
+    await registry.update_revision("LTN_1_20", "rev_2020", status=RevisionStatus.ACTIVE)
+    return registry
+
+
+def parse(event: str) -> tuple[str, dict]:
+    """Split an encoded Server-Sent Event into its name and data."""
+    name, data = event.strip().split("\n")
+    return name.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+def make_revision(status: RevisionStatus, chunk_count: int | None = None) -> PolicyRevisionRecord:
+    return PolicyRevisionRecord(
+        revision_id="rev_2024",
+        source="NPPF",
+        version_label="2024",
+        effective_from=date(2024, 12, 12),
+        status=status,
+        chunk_count=chunk_count,
+        created_at=datetime.now(UTC),
+    )
+
+
+class TestRevisionProgress:
+    """Tests for combining revision status with published progress."""
+
+    def test_running_snapshot_used(self) -> None:
+        """A processing revision reports the worker's latest progress."""
+        progress = revision_progress(
+            make_revision(RevisionStatus.PROCESSING),
+            {"source": "NPPF", "revision_id": "rev_2024", "phase": "embedding"},
+        )
+
+        assert progress == {"phase": "embedding"}
+
+    def test_finished_snapshot_from_earlier_run_ignored(self) -> None:
+        """A revision queued for reindex does not report the last run's completion."""
+        progress = revision_progress(
+            make_revision(RevisionStatus.PROCESSING), {"phase": "complete"}
+        )
+
+        assert progress is not None
+        assert progress["phase"] == "pending"
+
+    def test_active_without_snapshot(self) -> None:
+        """An active revision ingested before progress was published is complete."""
+        progress = revision_progress(make_revision(RevisionStatus.ACTIVE, chunk_count=12), None)
+
+        assert progress == {"phase": "complete", "percent_complete": 100, "chunks_processed": 12}
+
+
+class TestStreamIngestionProgress:
+    """Tests for the multi-revision progress stream."""
+
+    async def test_stream_forwards_covered_revisions_until_done(
+        self, registry: PolicyRegistry
+    ) -> None:
+        """
+        Given: Two processing revisions and one active revision
+        When: The worker publishes progress for them and for another revision
+        Then: The stream sends snapshots, the covered updates, and ends once both finish
+        """
+        keys = [("NPPF", "rev_2023"), ("NPPF", "rev_2024"), ("LTN_1_20", "rev_2020")]
+        stream = stream_ingestion_progress(registry, keys, heartbeat_seconds=0.05)
+
+        snapshots = [parse(await anext(stream)) for _ in keys]
+
+        await registry.publish_ingestion_progress(
+            "NPPF", "rev_2024", {"phase": "embedding", "chunks_processed": 64}
+        )
+        await registry.publish_ingestion_progress("OTHER", "rev_x", {"phase": "complete"})
+        await registry.publish_ingestion_progress("NPPF", "rev_2024", {"phase": "complete"})
+        await registry.publish_ingestion_progress(
+            "NPPF", "rev_2023", {"phase": "failed", "error": "corrupt"}
+        )
+        rest = [parse(event) async for event in stream if not event.startswith(":")]
+
+        assert [(name, data["status"]) for name, data in snapshots] == [
+            ("snapshot", "processing"),
+            ("snapshot", "processing"),
+            ("snapshot", "active"),
+        ]
+        assert snapshots[0][1]["progress"]["phase"] == "pending"
+        assert [(name, data["revision_id"], data["phase"]) for name, data in rest[:-1]] == [
+            ("progress", "rev_2024", "embedding"),
+            ("progress", "rev_2024", "complete"),
+            ("progress", "rev_2023", "failed"),
+        ]
+        assert rest[-1] == ("done", {"revisions": 3})
+
+    async def test_finished_revisions_end_immediately(self, registry: PolicyRegistry) -> None:
+        """A stream over finished or unknown revisions sends snapshots and done."""
+        keys = [("LTN_1_20", "rev_2020"), ("NPPF", "rev_nope")]
+
+        events = [
+            parse(event)
+            async for event in stream_ingestion_progress(registry, keys, heartbeat_seconds=0.05)
+        ]
+
+        assert [name for name, _ in events] == ["snapshot", "snapshot", "done"]
+        assert events[1][1]["status"] is None
+
+
+class _Owner:
+    """Stands in for the response holding a stream slot."""
+
+
+class TestProgressStreamLimiter:
+    """Tests for the open stream limit."""
+
+    def test_limit(self) -> None:
+        """Slots are refused at the limit and reusable after release."""
+        limiter = ProgressStreamLimiter(max_streams=1)
+
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is False
+        limiter.release()
+        assert limiter.try_acquire() is True
+
+    def test_held_slot_released_once(self) -> None:
+        """Calling a hold's release more than once frees only its own slot."""
+        limiter = ProgressStreamLimiter(max_streams=2)
+        owner = _Owner()
+        limiter.try_acquire()
+        limiter.try_acquire()
+        release = limiter.hold(owner)
+
+        release()
+        release()
+
+        assert limiter.open_streams == 1
+
+    def test_held_slot_released_when_owner_dropped(self) -> None:
+        """A response discarded before it is sent does not keep its slot."""
+        limiter = ProgressStreamLimiter(max_streams=1)
+        owner = _Owner()
+        limiter.try_acquire()
+        limiter.hold(owner)
+
+        del owner
+        gc.collect()
+
+        assert limiter.open_streams == 0
+        assert limiter.try_acquire() is True
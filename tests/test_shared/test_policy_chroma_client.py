@@ -5,6 +5,7 @@ Implements test scenarios from [policy-knowledge-base:ChromaDBSchema/TS-01] thro
 """
 
 from datetime import date
+from unittest.mock import patch
 
 import chromadb
 import pytest
@@ -24,6 +25,8 @@ def chroma_client():
     import contextlib
     with contextlib.suppress(Exception):
         client.delete_collection(PolicyChromaClient.COLLECTION_NAME)
+    with contextlib.suppress(Exception):
+        client.delete_collection(PolicyChromaClient.CURRENT_COLLECTION_NAME)
     return PolicyChromaClient(client=client)
 
 
@@ -307,6 +310,124 @@ class TestRevisionOperations:
         deleted_count = chroma_client.delete_revision_chunks("NONEXISTENT", "rev_none")
         assert deleted_count == 0
 
+    def test_sync_revision_chunks(self, chroma_client, sample_chunks):
+        """Sync writes only changed chunks, deletes orphans and leaves other revisions."""
+        from dataclasses import replace
+
+        from src.shared.hashing import sha256_text
+
+        chroma_client.upsert_chunks(sample_chunks)
+        ltn = chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
+        changed = replace(ltn[1], text="Cycle tracks should be 2.2m wide.")
+
+        with patch.object(chroma_client, "upsert_chunks", wraps=chroma_client.upsert_chunks) as up:
+            result = chroma_client.sync_revision_chunks(
+                "LTN_1_20", "rev_LTN_1_20_2020_07", [changed]
+            )
+
+        assert (result.upserted, result.unchanged, result.deleted) == (1, 0, 1)
+        assert [c.chunk_id for c in up.call_args.args[0]] == [changed.chunk_id]
+        remaining = chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
+        assert [c.text for c in remaining] == ["Cycle tracks should be 2.2m wide."]
+        assert chroma_client.get_collection_stats()["total_chunks"] == 3
+
+        embeddings = chroma_client.get_revision_embeddings("LTN_1_20", "rev_LTN_1_20_2020_07")
+        assert list(embeddings) == [sha256_text("Cycle tracks should be 2.2m wide.")]
+
+    def test_sync_fails_when_existing_chunks_unreadable(self, chroma_client, sample_chunks):
+        """A failed read of the old chunks aborts the sync instead of leaving orphans."""
+        chroma_client.upsert_chunks(sample_chunks)
+        ltn = chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
+        collection = chroma_client._get_collection()
+
+        with (
+            patch.object(collection, "get", side_effect=RuntimeError("read failed")),
+            patch.object(chroma_client, "upsert_chunks") as up,
+            pytest.raises(RuntimeError, match="read failed"),
+        ):
+            chroma_client.sync_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07", ltn[:1])
+
+        up.assert_not_called()
+        assert len(chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")) == 2
+
+
+class TestCurrentView:
+    """Tests for the materialised current-in-force collection."""
+
+    CURRENT = {("LTN_1_20", "rev_LTN_1_20_2020_07"), ("NPPF", "rev_NPPF_2024_12")}
+
+    def test_no_view_until_refreshed(self, chroma_client, sample_chunks):
+        """A fresh store has no current view and writes are not mirrored."""
+        chroma_client.upsert_chunks(sample_chunks)
+
+        assert chroma_client.get_current_view() is None
+
+    def test_refresh_adds_and_removes_members(self, chroma_client, sample_chunks):
+        """Refreshing copies joining revisions and drops leaving ones."""
+        chroma_client.upsert_chunks(sample_chunks)
+
+        view = chroma_client.refresh_current_view(self.CURRENT, date(2025, 1, 1), generation=3)
+        assert view == chroma_client.get_current_view()
+        assert view.as_of == date(2025, 1, 1)
+        assert view.generation == 3
+
+        chroma_client.refresh_current_view(
+            {("NPPF", "rev_NPPF_2024_12")}, date(2025, 1, 2), generation=4
+        )
+
+        results = chroma_client.search(sample_chunks[0].embedding, use_current_view=True)
+        assert {r.revision_id for r in results} == {"rev_NPPF_2024_12"}
+
+    def test_current_search_ignores_stale_temporal_metadata(self, chroma_client, sample_chunks):
+        """Membership comes from the caller, not chunk effective_to metadata."""
+        # Superseded chunks still marked open-ended, as if ingested before supersession
+        stale = [c for c in sample_chunks if c.metadata["revision_id"] == "rev_NPPF_2023_09"]
+        for chunk in stale:
+            chunk.metadata["effective_to"] = 99991231
+        chroma_client.upsert_chunks(sample_chunks)
+        chroma_client.refresh_current_view(self.CURRENT, date(2025, 1, 1), generation=1)
+
+        filtered = chroma_client.search(
+            stale[0].embedding, effective_date=date(2025, 1, 1), sources=["NPPF"]
+        )
+        current = chroma_client.search(
+            stale[0].embedding,
+            effective_date=date(2025, 1, 1),
+            sources=["NPPF"],
+            use_current_view=True,
+        )
+
+        assert {r.revision_id for r in filtered} == {"rev_NPPF_2023_09", "rev_NPPF_2024_12"}
+        assert [r.revision_id for r in current] == ["rev_NPPF_2024_12"]
+
+    def test_writes_to_members_are_mirrored(self, chroma_client, sample_chunks):
+        """Upserts and deletes of member revisions reach the current collection."""
+        from dataclasses import replace
+
+        chroma_client.upsert_chunks(sample_chunks)
+        chroma_client.refresh_current_view(self.CURRENT, date(2025, 1, 1), generation=1)
+
+        updated = replace(sample_chunks[0], text="Cycle tracks should be 2.2m wide.")
+        chroma_client.upsert_chunks([updated])
+        results = chroma_client.search(updated.embedding, n_results=1, use_current_view=True)
+        assert results[0].text == "Cycle tracks should be 2.2m wide."
+
+        chroma_client.delete_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
+        results = chroma_client.search(updated.embedding, use_current_view=True)
+        assert {r.source for r in results} == {"NPPF"}
+
+    def test_missing_view_falls_back_to_filtered_search(self, chroma_client, sample_chunks):
+        """use_current_view without a materialised collection uses policy_docs."""
+        chroma_client.upsert_chunks(sample_chunks)
+
+        results = chroma_client.search(
+            sample_chunks[2].embedding,
+            effective_date=date(2024, 1, 1),
+            use_current_view=True,
+        )
+
+        assert {r.revision_id for r in results} == {"rev_LTN_1_20_2020_07", "rev_NPPF_2023_09"}
+
 
 class TestChunkIdGeneration:
     """Tests for chunk ID generation."""
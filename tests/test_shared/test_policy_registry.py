@@ -4,6 +4,9 @@ Tests for PolicyRegistry Redis operations.
 Implements test scenarios [policy-knowledge-base:PolicyRegistry/TS-01] through [TS-12]
 """
 
+import asyncio
+import json
+import time
 from datetime import date, datetime
 
 import fakeredis.aioredis
@@ -11,6 +14,8 @@ import pytest
 
 from src.api.schemas.policy import PolicyCategory, RevisionStatus
 from src.shared.policy_registry import (
+    INVALIDATION_CHANNEL,
+    PROGRESS_CHANNEL,
     CannotDeleteSoleRevisionError,
     PolicyAlreadyExistsError,
     PolicyNotFoundError,
@@ -639,6 +644,279 @@ class TestEffectiveDateResolution:
         assert result.revision_id == "rev_NPPF_2020_07"
 
 
+class TestBulkReads:
+    """Round trips and latency of the pipelined multi-policy reads."""
+
+    POLICY_COUNT = 50
+    REVISIONS_PER_POLICY = 10
+    ROUND_TRIP_LATENCY = 0.001  # simulated network latency in seconds
+
+    @pytest.fixture
+    async def populated(self, registry: PolicyRegistry) -> PolicyRegistry:
+        """Registry with 50 policies of 10 yearly revisions each."""
+        for p in range(self.POLICY_COUNT):
+            source = f"POLICY_{p:02d}"
+            await registry.create_policy(
+                source=source,
+                title=f"Policy {p}",
+                category=PolicyCategory.LOCAL_PLAN if p % 2 else PolicyCategory.NATIONAL_POLICY,
+            )
+            for r in range(self.REVISIONS_PER_POLICY):
+                revision_id = f"rev_{source}_{2015 + r}"
+                await registry.create_revision(
+                    source=source,
+                    revision_id=revision_id,
+                    version_label=str(2015 + r),
+                    effective_from=date(2015 + r, 1, 1),
+                )
+                status = RevisionStatus.ACTIVE if r == self.REVISIONS_PER_POLICY - 1 else RevisionStatus.SUPERSEDED
+                await registry.update_revision(source, revision_id, status=status)
+        return registry
+
+    @pytest.fixture
+    def round_trips(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Record (and add simulated latency to) every Redis round trip."""
+        from redis.asyncio.client import Pipeline, Redis
+
+        calls: list[str] = []
+        execute_command = Redis.execute_command
+        execute_pipeline = Pipeline.execute
+        latency = self.ROUND_TRIP_LATENCY
+
+        async def command(self, *args, **kwargs):
+            calls.append(str(args[0]))
+            await asyncio.sleep(latency)
+            return await execute_command(self, *args, **kwargs)
+
+        async def pipeline(self, *args, **kwargs):
+            calls.append("PIPELINE")
+            await asyncio.sleep(latency)
+            return await execute_pipeline(self, *args, **kwargs)
+
+        monkeypatch.setattr(Redis, "execute_command", command)
+        monkeypatch.setattr(Pipeline, "execute", pipeline)
+        return calls
+
+    async def test_list_policies_round_trips(
+        self, populated: PolicyRegistry, round_trips: list[str]
+    ) -> None:
+        """
+        Given: 50 policies x 10 revisions
+        When: list_policies is called
+        Then: Three round trips are made and current revisions match per-policy lookups
+        """
+        start = time.perf_counter()
+        summaries = await populated.list_policies()
+        elapsed = time.perf_counter() - start
+        trips = len(round_trips)
+
+        print(f"\nlist_policies: {trips} round trips, {elapsed * 1000:.1f}ms")
+        assert trips == 3
+        assert len(summaries) == self.POLICY_COUNT
+        for summary in summaries:
+            assert summary.revision_count == self.REVISIONS_PER_POLICY
+            expected = await populated.get_current_revision(summary.source)
+            assert summary.current_revision == expected
+
+    async def test_list_policies_filters(self, populated: PolicyRegistry) -> None:
+        """Category and source filters apply to the pipelined listing."""
+        local = await populated.list_policies(category=PolicyCategory.LOCAL_PLAN)
+        single = await populated.list_policies(source_filter="POLICY_07")
+
+        assert len(local) == self.POLICY_COUNT // 2
+        assert all(s.category == PolicyCategory.LOCAL_PLAN for s in local)
+        assert [s.source for s in single] == ["POLICY_07"]
+
+    async def test_get_all_effective_for_date_round_trips(
+        self, populated: PolicyRegistry, round_trips: list[str]
+    ) -> None:
+        """
+        Given: 50 policies x 10 revisions
+        When: get_all_effective_for_date is called
+        Then: Three round trips are made and results match per-policy resolution
+        """
+        on = date(2019, 6, 1)
+
+        start = time.perf_counter()
+        result = await populated.get_all_effective_for_date(on)
+        elapsed = time.perf_counter() - start
+        trips = len(round_trips)
+
+        round_trips.clear()
+        start = time.perf_counter()
+        per_source = {
+            source: await populated.get_effective_revision_for_date(source, on)
+            for source in result
+        }
+        per_source_elapsed = time.perf_counter() - start
+
+        print(
+            f"\nget_all_effective_for_date: {trips} round trips, {elapsed * 1000:.1f}ms "
+            f"(per-source: {len(round_trips)} round trips, {per_source_elapsed * 1000:.1f}ms)"
+        )
+        assert trips == 3
+        assert len(result) == self.POLICY_COUNT
+        assert result == per_source
+        assert all(rev is not None and rev.version_label == "2019" for rev in result.values())
+
+
+class TestChangeNotification:
+    """Generation counter and invalidation messages on registry writes."""
+
+    async def test_every_write_bumps_generation(self, registry: PolicyRegistry) -> None:
+        """Policy and revision writes each increment the generation and notify listeners."""
+        notified: list[int] = []
+        registry.add_change_listener(lambda: notified.append(1))
+        assert await registry.get_generation() == 0
+
+        await registry.create_policy(
+            "LTN_1_20", "Cycle Infrastructure Design", PolicyCategory.NATIONAL_GUIDANCE
+        )
+        await registry.update_policy("LTN_1_20", title="LTN 1/20")
+        await registry.create_revision("LTN_1_20", "rev_a", "2020", date(2020, 7, 27))
+        await registry.update_revision("LTN_1_20", "rev_a", status=RevisionStatus.SUPERSEDED)
+        await registry.delete_revision("LTN_1_20", "rev_a")
+        await registry.delete_policy("LTN_1_20")
+
+        assert await registry.get_generation() == 6
+        assert len(notified) == 6
+
+    async def test_failed_write_does_not_notify(self, registry: PolicyRegistry) -> None:
+        """Rejected writes leave the generation unchanged."""
+        with pytest.raises(PolicyNotFoundError):
+            await registry.create_revision("MISSING", "rev_a", "2020", date(2020, 1, 1))
+
+        assert await registry.get_generation() == 0
+
+    async def test_revision_change_published(self, registry: PolicyRegistry) -> None:
+        """Subscribers on the invalidation channel receive the changed source and revision."""
+        await registry.create_policy("NPPF", "NPPF", PolicyCategory.NATIONAL_POLICY)
+        pubsub = await registry.subscribe_to_changes()
+        try:
+            await pubsub.get_message(timeout=1.0)  # subscribe confirmation
+
+            await registry.create_revision(
+                "NPPF", "rev_NPPF_2024_12", "Dec 2024", date(2024, 12, 12)
+            )
+
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+        finally:
+            await pubsub.aclose()
+
+        assert message is not None
+        assert message["channel"] == INVALIDATION_CHANNEL
+        assert json.loads(message["data"]) == {"source": "NPPF", "revision_id": "rev_NPPF_2024_12"}
+
+    async def test_load_all_returns_generation_and_ordered_revisions(
+        self, registry: PolicyRegistry
+    ) -> None:
+        """get_all_policies_with_revisions returns revisions ordered by effective_from."""
+        await registry.create_policy("NPPF", "NPPF", PolicyCategory.NATIONAL_POLICY)
+        await registry.create_policy("LTN_1_20", "LTN 1/20", PolicyCategory.NATIONAL_GUIDANCE)
+        await registry.create_revision(
+            "NPPF", "rev_2023", "2023", date(2023, 9, 5), date(2024, 12, 11)
+        )
+        await registry.create_revision(
+            "NPPF", "rev_2020", "2020", date(2020, 7, 20), date(2023, 9, 4)
+        )
+
+        generation, policies = await registry.get_all_policies_with_revisions()
+
+        assert generation == await registry.get_generation()
+        assert [policy.source for policy, _ in policies] == ["LTN_1_20", "NPPF"]
+        assert [rev.revision_id for rev in policies[1][1]] == ["rev_2020", "rev_2023"]
+        assert policies[0][1] == []
+
+
+class TestIngestionProgress:
+    """Progress snapshots and messages published during ingestion."""
+
+    async def test_publish_stores_snapshot_and_announces(self, registry: PolicyRegistry) -> None:
+        """Progress is kept per revision, published on PROGRESS_CHANNEL, and not a write."""
+        pubsub = await registry.subscribe_to_ingestion_progress()
+        try:
+            await pubsub.get_message(timeout=1.0)  # subscribe confirmation
+
+            await registry.publish_ingestion_progress(
+                "NPPF", "rev_2024", {"phase": "embedding", "chunks_processed": 32}
+            )
+
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+        finally:
+            await pubsub.aclose()
+
+        assert message is not None
+        assert message["channel"] == PROGRESS_CHANNEL
+        published = json.loads(message["data"])
+        assert published["source"] == "NPPF"
+        assert published["chunks_processed"] == 32
+        assert await registry.get_ingestion_progress("NPPF", "rev_2024") == published
+        assert await registry.get_generation() == 0
+
+    async def test_bulk_statuses_in_one_round_trip(self, registry: PolicyRegistry) -> None:
+        """Revisions and their progress are read together, keeping key order."""
+        await registry.create_policy("NPPF", "NPPF", PolicyCategory.NATIONAL_POLICY)
+        await registry.create_revision("NPPF", "rev_2023", "2023", date(2023, 9, 5))
+        await registry.create_revision("NPPF", "rev_2024", "2024", date(2024, 12, 12))
+        await registry.publish_ingestion_progress("NPPF", "rev_2024", {"phase": "storing"})
+
+        keys = await registry.list_revision_keys(["NPPF", "MISSING"])
+        statuses = await registry.get_ingestion_statuses([*keys, ("NPPF", "rev_nope")])
+
+        assert keys == [("NPPF", "rev_2023"), ("NPPF", "rev_2024")]
+        assert [rev.revision_id if rev else None for rev, _ in statuses] == [
+            "rev_2023",
+            "rev_2024",
+            None,
+        ]
+        assert [progress["phase"] if progress else None for _, progress in statuses] == [
+            None,
+            "storing",
+            None,
+        ]
+
+    async def test_delete_revision_clears_progress(self, registry: PolicyRegistry) -> None:
+        """A deleted revision's progress snapshot goes with it."""
+        await registry.create_policy("NPPF", "NPPF", PolicyCategory.NATIONAL_POLICY)
+        await registry.create_revision("NPPF", "rev_2023", "2023", date(2023, 9, 5))
+        await registry.create_revision("NPPF", "rev_2024", "2024", date(2024, 12, 12))
+        await registry.publish_ingestion_progress("NPPF", "rev_2024", {"phase": "failed"})
+
+        await registry.delete_revision("NPPF", "rev_2024")
+
+        assert await registry.get_ingestion_progress("NPPF", "rev_2024") is None
+
+
+class TestSectionIndex:
+    """Section reference to chunk ID index."""
+
+    async def test_index_roundtrip_and_replace(self, registry: PolicyRegistry) -> None:
+        """Indexed sections return chunk IDs in order; unknown sections return []."""
+        assert await registry.get_section_chunk_ids("NPPF", "rev_a", "Para 116") is None
+
+        await registry.set_section_index(
+            "NPPF", "rev_a", {"Para 116": ["c_003", "c_004"], "Para 117": ["c_005"]}
+        )
+        assert await registry.get_section_chunk_ids("NPPF", "rev_a", "Para 116") == [
+            "c_003",
+            "c_004",
+        ]
+        assert await registry.get_section_chunk_ids("NPPF", "rev_a", "Para 999") == []
+
+        await registry.set_section_index("NPPF", "rev_a", {"Para 117": ["c_009"]})
+        assert await registry.get_section_chunk_ids("NPPF", "rev_a", "Para 116") == []
+
+    async def test_deleted_with_revision(self, registry: PolicyRegistry) -> None:
+        """Deleting a revision removes its section index."""
+        await registry.create_policy("NPPF", "NPPF", PolicyCategory.NATIONAL_POLICY)
+        await registry.create_revision("NPPF", "rev_a", "2023", date(2023, 9, 5))
+        await registry.set_section_index("NPPF", "rev_a", {"Para 116": ["c_003"]})
+
+        await registry.delete_revision("NPPF", "rev_a")
+
+        assert await registry.get_section_chunk_ids("NPPF", "rev_a", "Para 116") is None
+
+
 class TestKeyGeneration:
     """Tests for Redis key generation methods."""
 
@@ -16,7 +16,7 @@ from src.api.schemas.policy import PolicyRevisionRecord, RevisionStatus
 from src.mcp_servers.document_store.chunker import TextChunk
 from src.mcp_servers.document_store.embeddings import MockEmbeddingModel
 from src.mcp_servers.document_store.processor import DocumentExtraction, PageExtraction
-from src.shared.policy_chroma_client import PolicyChromaClient
+from src.shared.policy_chroma_client import PolicyChromaClient, PolicyChunkRecord
 from src.worker.policy_jobs import PolicyIngestionService
 
 
@@ -200,6 +200,15 @@ class TestSuccessfulIngestion:
         chunks = chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
         assert len(chunks) == 3
 
+        # Verify the section index covers every chunk with a section reference
+        mock_registry.set_section_index.assert_awaited_once()
+        source, revision_id, sections = mock_registry.set_section_index.call_args[0]
+        assert (source, revision_id) == ("LTN_1_20", "rev_LTN_1_20_2020_07")
+        indexed = [chunk_id for ids in sections.values() for chunk_id in ids]
+        assert sorted(indexed) == sorted(
+            c.chunk_id for c in chunks if c.metadata["section_ref"]
+        )
+
 
 class TestIngestionFailure:
     """
@@ -429,6 +438,239 @@ class TestReindex:
         final_chunks = chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
         assert len(final_chunks) == 2
 
+    @pytest.mark.asyncio
+    async def test_reindex_reembeds_only_changed_chunks(
+        self,
+        mock_registry,
+        chroma_client,
+        mock_processor,
+        mock_chunker,
+        mock_embedder,
+        sample_revision,
+        sample_extraction,
+        sample_chunks,
+    ):
+        """
+        Reindex embeds only new text and never empties the revision.
+
+        Given: An ingested revision with three chunks
+        When: Reindexed after one chunk's text changes and one is dropped
+        Then: Only the changed chunk is embedded, and chunks are swapped in place
+        """
+        from dataclasses import replace
+
+        mock_registry.get_revision.return_value = sample_revision
+        mock_processor.extract_text.return_value = sample_extraction
+        mock_chunker.chunk_pages.return_value = sample_chunks
+
+        service = PolicyIngestionService(
+            registry=mock_registry,
+            chroma_client=chroma_client,
+            processor=mock_processor,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+        )
+        await service.ingest_revision(
+            source="LTN_1_20",
+            revision_id="rev_LTN_1_20_2020_07",
+            file_path="/data/policy/LTN_1_20/ltn_1_20.pdf",
+        )
+
+        mock_chunker.chunk_pages.return_value = [
+            sample_chunks[0],
+            replace(sample_chunks[1], text="Protected cycle tracks are much safer."),
+        ]
+        embed_batch = MagicMock(wraps=mock_embedder.embed_batch)
+        mock_embedder.embed_batch = embed_batch
+        chroma_client.delete_revision_chunks = MagicMock()
+
+        result = await service.ingest_revision(
+            source="LTN_1_20",
+            revision_id="rev_LTN_1_20_2020_07",
+            file_path="/data/policy/LTN_1_20/ltn_1_20.pdf",
+            reindex=True,
+        )
+
+        assert result.success
+        assert result.chunks_embedded == 1
+        embed_batch.assert_called_once_with(["Protected cycle tracks are much safer."])
+        chroma_client.delete_revision_chunks.assert_not_called()
+        final_chunks = chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
+        assert [c.text for c in final_chunks] == [
+            sample_chunks[0].text,
+            "Protected cycle tracks are much safer.",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reindex_fails_when_existing_chunks_unreadable(
+        self,
+        mock_registry,
+        chroma_client,
+        mock_processor,
+        mock_chunker,
+        mock_embedder,
+        sample_revision,
+        sample_extraction,
+        sample_chunks,
+    ):
+        """
+        A reindex that cannot read the old chunks fails rather than leaving them stale.
+
+        Given: An ingested revision with three chunks
+        When: Reindexed with two chunks while reading the existing chunks fails
+        Then: The revision is marked failed and the old chunks are untouched
+        """
+        from unittest.mock import patch
+
+        mock_registry.get_revision.return_value = sample_revision
+        mock_processor.extract_text.return_value = sample_extraction
+        mock_chunker.chunk_pages.return_value = sample_chunks
+
+        service = PolicyIngestionService(
+            registry=mock_registry,
+            chroma_client=chroma_client,
+            processor=mock_processor,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+        )
+        await service.ingest_revision(
+            source="LTN_1_20",
+            revision_id="rev_LTN_1_20_2020_07",
+            file_path="/data/policy/LTN_1_20/ltn_1_20.pdf",
+        )
+
+        mock_chunker.chunk_pages.return_value = sample_chunks[:2]
+        collection = chroma_client._get_collection()
+        read = collection.get
+
+        def fail_chunk_read(*args, **kwargs):
+            if kwargs.get("include") == ["documents", "metadatas"]:
+                raise RuntimeError("chroma read timed out")
+            return read(*args, **kwargs)
+
+        with patch.object(collection, "get", side_effect=fail_chunk_read):
+            result = await service.ingest_revision(
+                source="LTN_1_20",
+                revision_id="rev_LTN_1_20_2020_07",
+                file_path="/data/policy/LTN_1_20/ltn_1_20.pdf",
+                reindex=True,
+            )
+
+        assert result.success is False
+        assert "chroma read timed out" in result.error
+        assert mock_registry.update_revision.call_args.kwargs["status"] == RevisionStatus.FAILED
+        final_chunks = chroma_client.get_revision_chunks("LTN_1_20", "rev_LTN_1_20_2020_07")
+        assert len(final_chunks) == 3
+
+
+class TestProgressUpdates:
+    """
+    Tests for progress published during ingestion.
+
+    Implements [policy-knowledge-base:PolicyIngestionJob/TS-05] - Progress updates
+    """
+
+    @staticmethod
+    def published(mock_registry) -> list[dict]:
+        return [c.args[2] for c in mock_registry.publish_ingestion_progress.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_progress_published_in_order(
+        self,
+        monkeypatch,
+        mock_registry,
+        chroma_client,
+        mock_processor,
+        mock_chunker,
+        mock_embedder,
+        sample_revision,
+        sample_extraction,
+        sample_chunks,
+    ):
+        """
+        Verifies [policy-knowledge-base:PolicyIngestionJob/TS-05] - Progress updates
+
+        Given: A 3-page PDF producing 3 chunks, embedded and stored 2 at a time
+        When: Job processes
+        Then: Pages extracted, chunks embedded and chunks stored are published in order
+        """
+        monkeypatch.setattr("src.worker.policy_jobs.EMBED_PROGRESS_BATCH", 2)
+        monkeypatch.setattr("src.worker.policy_jobs.STORE_PROGRESS_BATCH", 2)
+        mock_registry.get_revision.return_value = sample_revision
+        mock_processor.extract_text.return_value = sample_extraction
+        mock_chunker.chunk_pages.return_value = sample_chunks
+
+        service = PolicyIngestionService(
+            registry=mock_registry,
+            chroma_client=chroma_client,
+            processor=mock_processor,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+        )
+        await service.ingest_revision(
+            source="LTN_1_20",
+            revision_id="rev_LTN_1_20_2020_07",
+            file_path="/data/policy/LTN_1_20/ltn_1_20.pdf",
+        )
+
+        progress = self.published(mock_registry)
+        assert [(p["phase"], p["chunks_processed"]) for p in progress] == [
+            ("extracting", None),
+            ("chunking", None),
+            ("embedding", 0),
+            ("embedding", 2),
+            ("embedding", 3),
+            ("storing", 0),
+            ("storing", 2),
+            ("complete", 3),
+        ]
+        assert progress[1]["pages_processed"] == 3
+        percents = [p["percent_complete"] for p in progress]
+        assert percents == sorted(percents)
+        assert percents[-1] == 100
+
+    @pytest.mark.asyncio
+    async def test_failure_published_and_publish_errors_ignored(
+        self,
+        mock_registry,
+        chroma_client,
+        mock_processor,
+        mock_chunker,
+        mock_embedder,
+        sample_revision,
+        sample_extraction,
+        sample_chunks,
+    ):
+        """A failed ingestion publishes its error; a Redis error on publish is not fatal."""
+        from src.mcp_servers.document_store.processor import ExtractionError
+
+        mock_registry.get_revision.return_value = sample_revision
+        mock_processor.extract_text.side_effect = ExtractionError("corrupted file")
+        service = PolicyIngestionService(
+            registry=mock_registry,
+            chroma_client=chroma_client,
+            processor=mock_processor,
+            chunker=mock_chunker,
+            embedder=mock_embedder,
+        )
+
+        await service.ingest_revision("LTN_1_20", "rev_LTN_1_20_2020_07", "/data/bad.pdf")
+
+        failed = self.published(mock_registry)[-1]
+        assert failed["phase"] == "failed"
+        assert "corrupted file" in failed["error"]
+
+        mock_processor.extract_text.side_effect = None
+        mock_processor.extract_text.return_value = sample_extraction
+        mock_chunker.chunk_pages.return_value = sample_chunks
+        mock_registry.publish_ingestion_progress.side_effect = ConnectionError("Redis down")
+
+        result = await service.ingest_revision(
+            "LTN_1_20", "rev_LTN_1_20_2020_07", "/data/policy/LTN_1_20/ltn_1_20.pdf"
+        )
+
+        assert result.success is True
+
 
 class TestSectionRefExtraction:
     """Tests for section reference extraction from text."""
@@ -463,6 +705,18 @@ class TestSectionRefExtraction:
         ref = PolicyIngestionService._extract_section_ref(text)
         assert ref == ""
 
+    def test_build_section_index(self):
+        """Sections map to chunk IDs in chunk order; unreferenced chunks are skipped."""
+        records = [
+            PolicyChunkRecord(chunk_id=f"c_{i}", text="", embedding=[], metadata={"section_ref": ref})
+            for i, ref in enumerate(["Chapter 5", "", "Chapter 6", "Chapter 5"])
+        ]
+
+        assert PolicyIngestionService.build_section_index(records) == {
+            "Chapter 5": ["c_0", "c_3"],
+            "Chapter 6": ["c_2"],
+        }
+
 
 class TestRevisionNotFound:
     """Tests for handling missing revision."""
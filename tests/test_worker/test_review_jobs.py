@@ -644,6 +644,42 @@ class TestReviewOutputUpload:
         routes_data = json.loads(backend.uploads[routes_key])
         assert routes_data == [{"route": "A", "score": 85}]
 
+    def test_routes_json_expands_encoded_polylines(self):
+        """
+        Given: A route assessment with encoded route polylines
+        When: _upload_review_output is called
+        Then: The routes.json file has GeoJSON route geometry instead
+        """
+        from src.agent.orchestrator import ReviewResult
+        from src.shared.storage import InMemoryStorageBackend
+
+        result = ReviewResult(
+            review_id="rev_poly_test",
+            application_ref="25/00284/F",
+            success=True,
+            review={"overall_rating": "green"},
+        )
+        backend = InMemoryStorageBackend()
+        route = {
+            "destination": "Bicester North",
+            "distance_m": 2500,
+            "duration_minutes": 10.0,
+            # [-1.1534, 51.8997] -> [-1.145, 51.905] at precision 6
+            "route_polyline": "gru~aBnvkeAgjI_lO",
+            "polyline_precision": 6,
+            "shortest_route_polyline": "gru~aBnvkeAgjI_lO",
+        }
+
+        _upload_review_output(result, {"review": result.review}, backend, [route])
+
+        import json
+        routes_data = json.loads(backend.uploads["25_00284_F/output/rev_poly_test_routes.json"])
+        assert "route_polyline" not in routes_data[0]
+        feature = routes_data[0]["route_geojson"]["features"][0]
+        assert feature["geometry"]["coordinates"] == [[-1.1534, 51.8997], [-1.145, 51.905]]
+        assert feature["properties"] == {"distance_m": 2500, "duration_minutes": 10.0}
+        assert routes_data[0]["shortest_route_geometry"] == [[-1.1534, 51.8997], [-1.145, 51.905]]
+
     def test_review_json_does_not_contain_route_assessments(self):
         """
         Given: review_data with no route_assessments, route data passed separately